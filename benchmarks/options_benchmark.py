@@ -0,0 +1,45 @@
+"""Benchmark for rendering commands with and without cached options.
+
+Run this script from the root of the repository with the package installed or on
+the Python path:
+
+.. code-block:: shell
+
+    python benchmarks/options_benchmark.py 100000
+"""
+from __future__ import print_function
+
+import sys
+import timeit
+
+from honeybee_radiance_command.rcontrib import Rcontrib
+from honeybee_radiance_command.options import optionbase
+from honeybee_radiance_command.options.rcontrib import RcontribOptions
+
+
+def render(cmd):
+    return cmd.to_radiance()
+
+
+def render_uncached(cmd):
+    # the caches are cleared for each call to render the options from scratch
+    optionbase._SLOTS.clear()
+    cmd.options._reset_rendered()
+    return cmd.to_radiance()
+
+
+def main(count=100000):
+    cmd = Rcontrib(octree='scene.oct', sensors='grid.pts')
+    cmd.options.update_from_string('-ab 2 -ad 5000 -lw 2e-05 -c 1 -M suns.mod')
+    cmd.output = 'results.ill'
+    for name, func in (('uncached', render_uncached), ('cached', render)):
+        seconds = timeit.timeit(lambda: func(cmd), number=count)
+        print('%-10s %d commands: %.2f s (%.1f us per command)' % (
+            name, count, seconds, seconds / count * 1e6))
+    seconds = timeit.timeit(RcontribOptions, number=count)
+    print('%-10s %d options: %.2f s (%.1f us per options)' % (
+        'create', count, seconds, seconds / count * 1e6))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -60,14 +60,46 @@ print(rtrace.to_radiance())
 rtrace.run(env)
 ```
 
+Commands that share the same options can use a frozen options preset. Each command
+gets a derived copy of the preset which only stores the options that are changed for
+that command.
+
+```
+preset = RtraceOptions.preset('-ab 5 -ad 2048 -lw 2e-05')
+commands = [Rtrace(options=preset, octree='scene.oct', sensors=grid) for grid in grids]
+```
+
+Commands with the same inputs and the same options are equal and have the same hash
+regardless of the order that the options are set in. This can be used to remove the
+duplicate commands in a batch or as a key for caching the results.
+
+```
+unique_commands = list(set(commands))
+```
+
+Commands can be pickled to be sent to other processes. Use `to_dict` and `from_dict` to
+convert a command to a dictionary that can be saved as JSON.
+
+```
+data = rtrace.to_dict()
+rtrace = Command.from_dict(data)
+```
+
 """
 
+import copy
+import importlib
+import shlex
 import warnings
 import os
 
 from .options import OptionCollection
 from ._command_util import run_command
 import honeybee_radiance_command._typing as typing
+try:
+    basestring
+except NameError:
+    basestring = str
 
 
 class Command(object):
@@ -160,6 +192,59 @@ class Command(object):
         else:
             return command.replace('\\', '/')
 
+    def to_argv(self, stdin_input=False):
+        """Command as lists of arguments.
+
+        Use this method to run the command without a shell. Each command in the pipeline
+        is a separate list of arguments and the quotes are removed from the paths and
+        the option values.
+
+        Args:
+            stdin_input: A boolean that indicates if the input for this command
+                comes from stdin (default: False).
+
+        Returns:
+            A dictionary with the following keys.
+
+            -   argv: A list of argument lists. One for each command in the pipeline.
+            -   stdin: Path to the file that is redirected to stdin of the first
+                command or None.
+            -   stdout: Path to the file that the output of the last command is
+                redirected to or None.
+        """
+        argv, stdin = self._argv(stdin_input)
+        stages = [argv]
+        command = self
+        while command.pipe_to is not None:
+            command = command.pipe_to
+            stages.append(command._argv(stdin_input=True)[0])
+        stdout = typing.unquote(command.output) if command.output else None
+        return {'argv': stages, 'stdin': stdin, 'stdout': stdout}
+
+    def _argv(self, stdin_input=False):
+        """Get the list of arguments and stdin for this command without the pipes.
+
+        This implementation translates the command to Radiance format and splits the
+        string. Overwrite this method in subclasses to create the arguments directly.
+
+        Returns:
+            A tuple of the argument list and the path to stdin file or None.
+        """
+        command = copy.copy(self)
+        object.__setattr__(command, '_pipe_to_command', None)
+        object.__setattr__(command, '_output', None)
+        if stdin_input:
+            cmd = command.to_radiance(stdin_input=True)
+        else:
+            cmd = command.to_radiance()
+        argv = shlex.split(cmd.replace('\\', '/'))
+        stdin = None
+        if '<' in argv:
+            index = argv.index('<')
+            stdin = argv[index + 1]
+            del argv[index:index + 2]
+        return argv, stdin
+
     def validate(self):
         """Overwrite this method to add extra specific checks for the command.
         For instance for rcontrib you want to make sure there is at least one
@@ -189,6 +274,87 @@ class Command(object):
         self.after_run()
         return rc
 
+    @property
+    def canonical(self):
+        """Command in a canonical format.
+
+        The canonical format is a tuple of the command name, the options in canonical
+        format and the values for inputs and output sorted by name. Commands that are
+        piped to this command are included in the same format. See
+        OptionCollection.canonical for more information.
+        """
+        inputs = tuple(
+            (name, _canonical_value(getattr(self, name, None)))
+            for name in _input_slots(self.__class__)
+        )
+        pipe_to = self.pipe_to.canonical if self.pipe_to is not None else None
+        options = self.options.canonical if self.options is not None else None
+        return (self.command, options, inputs, pipe_to)
+
+    def __eq__(self, other):
+        return self.__class__ is other.__class__ and self.canonical == other.canonical
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        # commands are mutable and the hash changes when the command changes
+        return hash(self.canonical)
+
+    def to_dict(self):
+        """Translate command to a dictionary.
+
+        Input values are stored as they are and options are translated using the
+        to_dict method of the options.
+        """
+        options = self.options.to_dict() if self.options is not None else None
+        pipe_to = self.pipe_to.to_dict() if self.pipe_to is not None else None
+        inputs = dict(
+            (name[1:], getattr(self, name, None)) for name in _input_slots(self.__class__)
+        )
+        return {
+            'type': self.__class__.__name__,
+            'options': options,
+            'inputs': inputs,
+            'pipe_to': pipe_to
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a command from a dictionary.
+
+        Args:
+            data: A dictionary in the format of the to_dict output. If this method is
+                called on Command the class is found based on the type key.
+        """
+        command_type = data['type']
+        if command_type != cls.__name__:
+            module = importlib.import_module(
+                'honeybee_radiance_command.%s' % command_type.lower()
+            )
+            cls = getattr(module, command_type)
+        values = dict(('_%s' % k, v) for k, v in data['inputs'].items())
+        if data.get('options') is not None:
+            values['_options'] = OptionCollection.from_dict(data['options'])
+        if data.get('pipe_to') is not None:
+            values['_pipe_to_command'] = Command.from_dict(data['pipe_to'])
+        return _restore_command(cls, values)
+
+    def __reduce__(self):
+        values = dict(
+            (name, getattr(self, name, None)) for name in _input_slots(self.__class__)
+        )
+        values['_options'] = self._options
+        values['_pipe_to_command'] = self._pipe_to_command
+        return (_restore_command, (self.__class__, values))
+
+    def __setattr__(self, name, value):
+        if name == '_options' and isinstance(value, OptionCollection) \
+                and value.is_frozen:
+            # commands get their own copy of the options from a frozen preset
+            value = value.derive()
+        object.__setattr__(self, name, value)
+
     def after_run(self):
         """After run script.
 
@@ -198,3 +364,52 @@ class Command(object):
 
     def __repr__(self):
         return self.to_radiance()
+
+
+# input slots for each Command class - see _input_slots
+_INPUT_SLOTS = {}
+
+
+def _input_slots(cls):
+    """Get sorted slot names for inputs and output of a Command class."""
+    try:
+        return _INPUT_SLOTS[cls]
+    except KeyError:
+        pass
+    slots = set()
+    for klass in cls.__mro__:
+        klass_slots = klass.__dict__.get('__slots__', ())
+        if isinstance(klass_slots, basestring):
+            klass_slots = (klass_slots,)
+        slots.update(klass_slots)
+    slots.difference_update(('_options', '_pipe_to_command'))
+    slots = tuple(sorted(slots))
+    _INPUT_SLOTS[cls] = slots
+    return slots
+
+
+def _restore_command(cls, values):
+    """Create a command from the output of __reduce__ or to_dict.
+
+    Values are assigned without validation since they are already validated when the
+    command was created.
+    """
+    command = cls.__new__(cls)
+    for name in _input_slots(cls):
+        object.__setattr__(command, name, values.get(name))
+    object.__setattr__(command, '_options', values.get('_options'))
+    object.__setattr__(command, '_pipe_to_command', values.get('_pipe_to_command'))
+    return command
+
+
+def _canonical_value(value):
+    """Convert an input value to a hashable value in canonical format."""
+    if isinstance(value, (Command, OptionCollection)):
+        return value.canonical
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical_value(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _canonical_value(v)) for k, v in value.items()))
+    if isinstance(value, basestring):
+        return value.replace('\\', '/')
+    return value
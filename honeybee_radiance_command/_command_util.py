@@ -15,6 +15,25 @@ else:
     STDOUT_CHECK = b''
 
 
+def environment(env=None):
+    """Get a copy of the global environment updated with additional variables.
+
+    Args:
+        env: Additional environmental variable that will be added to global environment.
+            The value for PATH is added to the start of the global PATH.
+    """
+    g_env = os.environ.copy()
+    if env:
+        for k, v in env.items():
+            if k.strip().upper() == 'PATH':
+                g_env['PATH'] = os.pathsep.join((v, g_env['PATH']))
+            else:
+                g_env[k] = v
+
+    g_env['PYTHONUNBUFFERED'] = '1'  # ensure stdout will not be buffered
+    return g_env
+
+
 def run_command(input_command, env=None, cwd=None, mute=True):
     """Run a shell command.
     This function prints both STDOUT and STDERR to the same PIPE. Use shell piping
@@ -35,16 +54,7 @@ def run_command(input_command, env=None, cwd=None, mute=True):
     if cwd:
         os.chdir(cwd)
 
-    # update environmental variable
-    g_env = os.environ.copy()
-    if env:
-        for k, v in env.items():
-            if k.strip().upper() == 'PATH':
-                g_env['PATH'] = os.pathsep.join((v, g_env['PATH']))
-            else:
-                g_env[k] = v
-
-    g_env['PYTHONUNBUFFERED'] = '1'  # ensure stdout will not be buffered
+    g_env = environment(env)
 
     command = command.replace('\\', '/')
     if not mute:
@@ -59,3 +59,21 @@ class NoDirectValueError(Exception):
     def __init__(self, name):
         message = 'Direct values are not available for {} simulation.'.format(name)
         super(NoDirectValueError, self).__init__(message)
+
+
+class FrozenOptionsError(Exception):
+    """User tried to change the options in a preset."""
+
+    def __init__(self, command):
+        message = \
+            '{}: options preset is frozen and cannot be changed. Use derive method' \
+            ' to create a copy that can be changed.'.format(command)
+        super(FrozenOptionsError, self).__init__(message)
+
+
+class MatrixShapeError(ValueError):
+    """Matrices with shapes that are not compatible with the operations."""
+
+    def __init__(self, command, message):
+        message = '{}: fatal - {}'.format(command, message)
+        super(MatrixShapeError, self).__init__(message)
@@ -0,0 +1,127 @@
+"""Utility functions to check the shape of matrices before running a command.
+
+The shapes are found from the header of matrix files and from the angle basis of BSDF
+files. A shape is a tuple of the number of rows, columns and components. Values that
+are not known are None and are not checked. This is the case for matrices without a
+header, for tensor tree BSDFs and for inputs that are created by other commands.
+"""
+import os
+
+from .native.header import read_header
+from .native.bsdf import bsdf_shape
+from ._exception import MatrixShapeError
+import honeybee_radiance_command._typing as typing
+
+UNKNOWN = (None, None, None)
+
+
+def matrix_shape(path, cwd=None):
+    """Get the shape of a matrix file.
+
+    Args:
+        path: Path to a matrix, picture or BSDF file. The path can be in quotes.
+        cwd: The folder that relative paths are relative to (Default: '.').
+
+    Returns:
+        A tuple of number of rows, columns and components.
+    """
+    path = typing.unquote(path.strip())
+    if path == '-' or path.startswith('!'):
+        # stdin or the output of a command
+        return UNKNOWN
+    if cwd:
+        path = os.path.join(cwd, path)
+    if path.lower().endswith('.xml'):
+        shape = bsdf_shape(path)
+        return UNKNOWN if shape is None else (shape[0], shape[1], None)
+    return read_header(path).shape
+
+
+def _differ(a, b):
+    """Check if two values are known and are not the same."""
+    return a is not None and b is not None and a != b
+
+
+def _merge(a, b):
+    """Get the known value of two values that are the same."""
+    return a if a is not None else b
+
+
+def concatenate(command, first, second, names):
+    """Check the shapes for concatenation (matrix multiplication) of two matrices.
+
+    Args:
+        command: Command name for the error message.
+        first: Shape of the first matrix.
+        second: Shape of the second matrix.
+        names: A tuple of names for the two matrices for the error message.
+
+    Returns:
+        Shape of the result.
+    """
+    if _differ(first[1], second[0]):
+        raise MatrixShapeError(
+            command, '%s has %d columns but %s has %d rows.'
+            % (names[0], first[1], names[1], second[0])
+        )
+    if _differ(first[2], second[2]):
+        raise MatrixShapeError(
+            command, '%s has %d components but %s has %d components.'
+            % (names[0], first[2], names[1], second[2])
+        )
+    return first[0], second[1], _merge(first[2], second[2])
+
+
+def elementwise(command, first, second, names, single_component=False):
+    """Check the shapes for element-wise operations between two matrices.
+
+    Args:
+        command: Command name for the error message.
+        first: Shape of the first matrix.
+        second: Shape of the second matrix.
+        names: A tuple of names for the two matrices for the error message.
+        single_component: A boolean to accept a second matrix with a single component
+            which is applied to all the components of the first matrix.
+
+    Returns:
+        Shape of the result.
+    """
+    if _differ(first[0], second[0]) or _differ(first[1], second[1]):
+        raise MatrixShapeError(
+            command, '%s (%s x %s) and %s (%s x %s) have different sizes.'
+            % (names[0], first[0], first[1], names[1], second[0], second[1])
+        )
+    if _differ(first[2], second[2]) and not (single_component and second[2] == 1):
+        raise MatrixShapeError(
+            command, '%s has %d components but %s has %d components.'
+            % (names[0], first[2], names[1], second[2])
+        )
+    return (
+        _merge(first[0], second[0]), _merge(first[1], second[1]),
+        first[2] if first[2] is not None else
+        (None if single_component else second[2])
+    )
+
+
+def concatenate_all(command, inputs, cwd=None):
+    """Check the shapes for concatenation of a list of matrix files.
+
+    Args:
+        command: Command name for the error message.
+        inputs: A list of (name, path) tuples for the matrices in the order of
+            multiplication.
+        cwd: The folder that relative paths are relative to (Default: '.').
+
+    Returns:
+        Shape of the result.
+    """
+    shape = None
+    name = None
+    for input_name, path in inputs:
+        input_shape = matrix_shape(path, cwd)
+        if shape is None:
+            shape = input_shape
+        else:
+            shape = concatenate(command, shape, input_shape, (name, input_name))
+        name = input_name
+    return shape
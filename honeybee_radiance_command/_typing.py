@@ -147,6 +147,16 @@ def normpath(value):
     return value
 
 
+def unquote(value):
+    """Remove the quotes that are added to a path with white space by normpath.
+
+    Use this method to get the path as a single argument in an argument list.
+    """
+    if len(value) > 1 and value[0] == value[-1] and value[0] in ('"', "'"):
+        return value[1:-1]
+    return value
+
+
 def path_checker(file_path, extn_list=None, file_descr=''):
     """A utility method to check for input file path and normalize the path if present.
     If extension list and file_descr are provided, then do additional checks to
@@ -0,0 +1,224 @@
+"""Binary data format for piped commands.
+
+Radiance commands are much faster to read and write binary floats than ASCII values.
+Matching the binary options between the commands in a pipeline is error-prone and most
+pipelines use ASCII for the intermediate results. binary_links finds the commands in a
+pipeline that can send binary data to the next command and sets the options for both
+commands. The format of the final output doesn't change.
+
+The following commands are supported.
+
+-   Output: Rtrace and Rcontrib (-fio), Rcalc (-o), Rmtxop (-f), Dctimestep (-o) and
+    Gendaymtx (-o).
+-   Input: Rcalc (-i) for data without a header, Rmtxop for data with a header and
+    Rcollate (-ff, -fd) when the output of rcollate is also piped to a command that
+    accepts binary data.
+
+Rcalc and rcollate need the number of values in each record to read binary data. The
+number is found from the producer (e.g. the -o option of rtrace) and the link is not
+changed if it can't be found.
+
+Usage:
+
+.. code-block:: python
+
+    from honeybee_radiance_command.binary import binary_links
+
+    rtrace.pipe_to = rcalc
+    # rtrace -faf ... | rcalc -if3 ...
+    command = binary_links(rtrace)
+    command.run()
+"""
+import copy
+
+from .rtrace import Rtrace
+from .rcontrib import Rcontrib
+from .rcalc import Rcalc
+from .rcollate import Rcollate
+from .rmtxop import Rmtxop
+from .dctimestep import Dctimestep
+from .gendaymtx import Gendaymtx
+import honeybee_radiance_command._typing as typing
+
+# number of values for each rtrace output. Outputs that are not in this dictionary are
+# text (e.g. the modifier name) and can't be written as binary data.
+_RTRACE_VALUES = {
+    'o': 3, 'd': 3, 'v': 3, 'V': 3, 'w': 1, 'W': 3, 'l': 1, 'L': 1, 'c': 2, 'p': 3,
+    'n': 3, 'N': 3, 'r': 3, 'x': 3, 'R': 1, 'X': 1
+}
+
+
+def _output_format(command):
+    """Get the output format of a command.
+
+    Returns:
+        A tuple of the format character and a boolean for the header. The format is
+        None if the output format of the command cannot be changed.
+    """
+    options = command.options
+    if isinstance(command, Rtrace):
+        if isinstance(command, Rcontrib) and options.o.is_set:
+            # the results are written to files
+            return None, False
+        fio = options.fio.value or 'a'
+        # if the output character is missing, the input format is used
+        return fio[-1], not options.h.is_set
+    if isinstance(command, Rcalc):
+        return options.o.value or 'a', False
+    if isinstance(command, Gendaymtx):
+        return options.o.value or 'a', not options.h.is_set
+    if isinstance(command, Dctimestep):
+        if options.o.is_set:
+            return None, False
+        return options.op_fmt.value or 'a', not options.h.is_set
+    if isinstance(command, Rmtxop):
+        return options.f.value or 'a', True
+    return None, False
+
+
+def _record_size(command):
+    """Get the number of values in each output record of a command or None."""
+    options = command.options
+    if isinstance(command, Rcontrib):
+        # 3 values for each bin of each modifier. The number of modifiers in a -M file
+        # and the number of bins from an expression are not known.
+        if options.M.is_set or not options.m.is_set:
+            return None
+        if not options.bn.is_set:
+            return 3
+        try:
+            return 3 * int(typing.unquote(str(options.bn.value)))
+        except ValueError:
+            return None
+    if isinstance(command, Rtrace):
+        outputs = options.o.value or 'v'
+        try:
+            return sum(_RTRACE_VALUES[output] for output in outputs)
+        except KeyError:
+            return None
+    if isinstance(command, (Rmtxop, Dctimestep, Gendaymtx)):
+        return 3
+    return None
+
+
+def _set_output_format(command, fmt):
+    """Set the output format of a command that is supported in _output_format."""
+    options = command.options
+    if isinstance(command, Rtrace):
+        fio = options.fio.value or 'a'
+        options.fio = fio[0] + fmt
+    elif isinstance(command, (Rcalc, Gendaymtx)):
+        options.o = fmt
+    elif isinstance(command, Dctimestep):
+        options.op_fmt = fmt
+    elif isinstance(command, Rmtxop):
+        options.f = fmt
+
+
+def _accepts(command, fmt, header, size):
+    """Check if a command can read binary data in a format from stdin.
+
+    size is the number of values in each record or None if it is not known.
+    """
+    if isinstance(command, Rcalc):
+        # rcalc doesn't read the header and needs the number of values in each record
+        return not header and size is not None and \
+            command.options.i.value in (None, fmt, '%s%d' % (fmt, size))
+    if isinstance(command, Rmtxop):
+        # rmtxop finds the format from the header
+        return header
+    if isinstance(command, Rcollate):
+        options = command.options
+        if options.fd.is_set or options.ff.is_set or options.fb.is_set:
+            return False
+        return options.fa.value is not None or size is not None
+    return False
+
+
+def _set_input_format(command, fmt, size):
+    """Set the input format of a command that accepts binary data."""
+    options = command.options
+    if isinstance(command, Rcalc):
+        options.i = '%s%d' % (fmt, size)
+    elif isinstance(command, Rcollate):
+        # keep the number of words in each record
+        words = options.fa.value or str(size)
+        options.fa = None
+        setattr(options, 'f%s' % fmt, words)
+
+
+def _size_after(command, size):
+    """Get the number of values in each record after a command that passes the format.
+    """
+    words = command.options.fa.value
+    return int(words) if words else size
+
+
+def _passes_format(command):
+    """Check if the output of a command is in the same format as its input."""
+    return isinstance(command, Rcollate)
+
+
+def _header_after(command, header):
+    """Get the header state after a command that passes the format."""
+    value = command.options.h.value
+    if value is None:
+        return header
+    # -h and -ho turn off the output header
+    return header and value == 'i'
+
+
+def binary_links(command):
+    """Use binary data between the commands in a chain of piped commands.
+
+    A link is changed to binary float if the producer can write binary data and the
+    consumer can read it. Producers that already write binary data keep their format
+    and the consumer is set to read the same format. The output of the last command
+    and the format of the input files are not changed.
+
+    Args:
+        command: A command that pipes to other commands using pipe_to.
+
+    Returns:
+        A copy of the input command with updated options. The input command is not
+        changed.
+    """
+    command = copy.deepcopy(command)
+    chain = [command]
+    while chain[-1].pipe_to is not None:
+        chain.append(chain[-1].pipe_to)
+
+    index = 0
+    while index < len(chain) - 1:
+        producer = chain[index]
+        fmt, header = _output_format(producer)
+        size = _record_size(producer)
+        if fmt == 'a':
+            fmt = 'f'
+        elif fmt not in ('f', 'd'):
+            index += 1
+            continue
+        # find the consumer that uses the format. Commands that pass the format need
+        # another consumer.
+        consumers = []
+        sizes = []
+        for consumer in chain[index + 1:]:
+            if not _accepts(consumer, fmt, header, size):
+                consumers = []
+                break
+            consumers.append(consumer)
+            sizes.append(size)
+            if not _passes_format(consumer):
+                break
+            header = _header_after(consumer, header)
+            size = _size_after(consumer, size)
+        if not consumers or _passes_format(consumers[-1]):
+            index += 1
+            continue
+        if _output_format(producer)[0] != fmt:
+            _set_output_format(producer, fmt)
+        for consumer, size in zip(consumers, sizes):
+            _set_input_format(consumer, fmt, size)
+        index += len(consumers)
+
+    return command
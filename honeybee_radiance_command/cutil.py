@@ -2,6 +2,7 @@
 import re
 import collections
 import os
+import string as _string
 import sys
 
 if (sys.version_info < (3, 0)):
@@ -14,40 +15,90 @@ else:
     writemode = 'w'
 
 
-_rad_opt_pattern = r'-[a-zA-Z]+'
-_rad_opt_compiled_pattern = re.compile(_rad_opt_pattern)
+# single pattern to split an options string into tokens. Each match is either an
+# option or a value. An option is a - followed by letters at the start of a token. The
+# rest of the token is the value for the option for cases like -I+ or -ld-. Negative
+# numbers are values. Values can be quoted text which can include white spaces.
+_token_pattern = re.compile(
+    r'''(?<!\S)-([a-zA-Z]+)(\S*)|((?:[^\s"']+|"[^"]*"|'[^']*'|["'])+)'''
+)
+
+
+_LETTERS = frozenset(_string.ascii_letters)
+
+
+def _split_token(token):
+    """Split a token without quotes to the same groups as _token_pattern."""
+    if len(token) > 1 and token[0] == '-' and token[1] in _LETTERS:
+        index = 2
+        while index < len(token) and token[index] in _LETTERS:
+            index += 1
+        return token[1:index], token[index:], ''
+    return '', '', token
+
+
+def _unquote(token):
+    """Remove the quotes around a token if the whole token is quoted."""
+    if len(token) > 1 and token[0] == token[-1] and token[0] in ('"', "'"):
+        return token[1:-1]
+    return token
 
 
 def parse_radiance_options(string):
     """Parse a radiance options string (e.g. '-ab 4 -ad 256').
 
-    The string should start with a '-' otherwise it will be trimmed to the first '-' in
-    string.
+    The string should start with a '-' otherwise it will be trimmed to the first option
+    in string.
+
+    The string is split into tokens in a single pass. Joined options like -faf, -vtv
+    and -I+ are supported, negative numbers are parsed as values and quoted values
+    (e.g. file paths with white space) are kept together and are returned without the
+    quotes.
+
+    Returns:
+        An ordered dictionary with option names as keys. Values are an empty string for
+        options without a value, a string for options with one value and a list of
+        strings for options with several values.
     """
-    try:
-        index = string.index('-')
-    except ValueError:
-        if not ' '.join(string.split()).replace('"', '').replace("'", '').strip():
-            return {}
+    if '"' in string or "'" in string:
+        tokens = _token_pattern.findall(string)
+    else:
+        # strings without quotes are most of the options strings. Splitting them with
+        # str.split is faster than the full pattern and keeps the parser as fast as it
+        # was before options had to start a token
+        tokens = [_split_token(token) for token in string.split()]
+
+    options = collections.OrderedDict()
+    key = None
+    values = None
+    for option, joined, value in tokens:
+        if option:
+            if key is not None:
+                options[key] = _join_values(values)
+            key = option
+            values = [joined] if joined else []
+        elif key is not None:
+            values.append(_unquote(value) if value[0] in '"\'' else value)
+        # values before the first option are ignored
+
+    if key is None:
+        if not string.replace('"', '').replace("'", '').strip():
+            return options
         raise ValueError(
             'Invalid Radiance options string input. Failed to find - in input string.'
         )
+    options[key] = _join_values(values)
+    return options
 
-    sub_string = ' '.join(string[index:].split())
-    value = re.split(_rad_opt_compiled_pattern, sub_string)[1:]
-    key = re.findall(_rad_opt_pattern, sub_string)
-
-    options = collections.OrderedDict()
-    for k, v in zip(key, value):
-        values = v.split()
-        count = len(values)
-        if count == 0:
-            values = ''
-        elif count == 1:
-            values = values[0]
-        options[k[1:]] = values
 
-    return options
+def _join_values(values):
+    """Convert a list of values to the output format of parse_radiance_options."""
+    count = len(values)
+    if count == 0:
+        return ''
+    elif count == 1:
+        return values[0]
+    return values
 
 
 def nukedir(target_dir, rmdir=False):
@@ -4,6 +4,7 @@ from .options.dcglare import DcglareOptions
 from ._command import Command
 import honeybee_radiance_command._exception as exceptions
 import honeybee_radiance_command._typing as typing
+import honeybee_radiance_command._matrix_util as matrix_util
 
 
 class Dcglare(Command):
@@ -188,3 +189,39 @@ class Dcglare(Command):
             raise exceptions.MissingArgumentError(self.command, 'dmtx')
         if not stdin_input and not self.sky_matrix:
             raise exceptions.MissingArgumentError(self.command, 'sky_matrix')
+
+    def validate_shapes(self, cwd=None):
+        """Check the shape of the input matrices before running the command.
+
+        The number of rows, columns and components of each matrix is read from the
+        header of the matrix files and the size of the transmission matrix is found from
+        the angle basis of the BSDF file. The direct and the total daylight coefficient
+        matrices must have the same size and their number of columns must match the
+        number of rows of the sky matrix. The sky matrix is not checked if it is read
+        from stdin. A MatrixShapeError is raised if the shapes are not compatible.
+
+        Args:
+            cwd: The folder that relative paths are relative to (Default: '.').
+
+        Returns:
+            A tuple of number of rows, columns and components of the result. Values that
+            cannot be found from the headers are None.
+        """
+        # the sky matrix is optional here since it can be piped to the command
+        self.validate(stdin_input=True)
+        if self.tmtx:
+            total = [('vmtx', self.vmtx), ('tmtx', self.tmtx), ('dmtx', self.dmtx)]
+        else:
+            total = [('dc_total', self.dc_total)]
+        total_shape = matrix_util.concatenate_all(self.command, total, cwd)
+        direct_shape = matrix_util.matrix_shape(self.dc_direct, cwd)
+        dc_shape = matrix_util.elementwise(
+            self.command, direct_shape, total_shape,
+            ('dc_direct', 'dc_total' if not self.tmtx else 'the three-phase matrices')
+        )
+        if not self.sky_matrix:
+            return dc_shape[0], None, dc_shape[2]
+        sky_shape = matrix_util.matrix_shape(self.sky_matrix, cwd)
+        return matrix_util.concatenate(
+            self.command, dc_shape, sky_shape, ('the daylight coefficients', 'sky_matrix')
+        )
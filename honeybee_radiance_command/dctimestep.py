@@ -3,6 +3,7 @@
 from honeybee_radiance_command.options.dctimestep import DctimestepOptions
 from honeybee_radiance_command._command import Command
 import honeybee_radiance_command._typing as typing
+import honeybee_radiance_command._matrix_util as matrix_util
 
 
 class Dctimestep(Command):
@@ -250,6 +251,35 @@ class Dctimestep(Command):
                             ' as well as the "o"(i.e. -o) option. Only one of these '
                             'options can be specified at a time. ')
 
+    def validate_shapes(self, cwd=None):
+        """Check the shape of the input matrices before running the command.
+
+        The number of rows, columns and components of each matrix is read from the
+        header of the matrix files and the size of the transmission matrix is found from
+        the angle basis of the BSDF file. The matrices are multiplied in the order of
+        the study type and the number of columns of each matrix must match the number
+        of rows of the next one. Matrices without a header and tensor tree BSDFs are
+        not checked. A MatrixShapeError is raised if the shapes are not compatible.
+
+        Args:
+            cwd: The folder that relative paths are relative to (Default: '.').
+
+        Returns:
+            A tuple of number of rows, columns and components of the result. Values that
+            cannot be found from the headers are None.
+        """
+        self.validate()
+        inputs = {
+            'daylight_coef': ('day_coef_matrix', 'sky_vector'),
+            'direct_sun': ('sun_coef_matrix', 'sun_vector'),
+            'three_phase': ('view_matrix', 't_matrix', 'daylight_matrix', 'sky_vector'),
+            'four_phase': ('view_matrix', 't_matrix', 'facade_matrix',
+                           'daylight_matrix', 'sky_vector')
+        }[self._study_type]
+        return matrix_util.concatenate_all(
+            self.command, [(name, getattr(self, name)) for name in inputs], cwd
+        )
+
     def to_radiance(self, stdin_input=False):
         """Command in Radiance format."""
         self.validate()
@@ -25,6 +25,9 @@ class Evalglare(Command):
     everyone. Values lower than 0.2 are out of the range of the user assessment
     tests, where the program is based on and should be interpreted carefully.
 
+    Use honeybee_radiance_command.native.evalglare to calculate the DGP for many
+    pictures in-process. The results are close to evalglare but are not identical.
+
     Args:
         options: Command options. It will be set to Radiance default values
             if unspecified.
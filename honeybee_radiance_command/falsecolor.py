@@ -2,8 +2,11 @@
 
 from .options.falsecolor import FalsecolorOptions
 from ._command import Command
+from .native import falsecolor
+from .native.rgbe import Picture
 import honeybee_radiance_command._exception as exceptions
 import honeybee_radiance_command._typing as typing
+import os
 
 
 class Falsecolor(Command):
@@ -12,6 +15,11 @@ class Falsecolor(Command):
     Falsecolor produces a false color picture for lighting analysis. Input is a
     rendered Radiance picture.
 
+    Use run(native=True) to create the falsecolor picture in-process when the output
+    is written to a file. The native picture is close to the falsecolor script but not
+    identical. See honeybee_radiance_command.native.falsecolor for the supported
+    options.
+
     Args:
         options: Command options. It will be set to Radiance default values
             if unspecified.
@@ -88,3 +96,39 @@ class Falsecolor(Command):
         Command.validate(self)
         if not stdin_input and not self.input:
             raise exceptions.MissingArgumentError(self.command, 'input')
+
+    def run(self, env=None, cwd=None, native=False):
+        """Run command.
+
+        Args:
+            env: Environmental variables (default: None).
+            cwd: Working directory (Default: '.').
+            native: Set to True to create the falsecolor picture in-process. falsecolor
+                is still run as a subprocess if the options are not supported by the
+                native implementation (Default: False).
+
+        Returns:
+            - int: Command return code.
+        """
+        if native and self._run_native(cwd):
+            self.after_run()
+            return 0
+        return Command.run(self, env, cwd)
+
+    def _run_native(self, cwd=None):
+        """Run falsecolor in-process and return False if it is not supported."""
+        self.validate()
+        if self.pipe_to is not None or not self.output \
+                or not falsecolor.is_supported(self.options):
+            return False
+
+        def _path(path):
+            path = typing.unquote(path)
+            return os.path.join(cwd, path) if cwd else path
+
+        picture = Picture.from_file(_path(self.input))
+        result = falsecolor.falsecolor(
+            picture, self.options, [' '.join(self._argv()[0])]
+        )
+        result.to_file(_path(self.output))
+        return True
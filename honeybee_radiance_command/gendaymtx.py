@@ -77,6 +77,11 @@ class Gendaymtx(Command):
 
         return ' '.join(cmd.split())
 
+    def _argv(self, stdin_input=False):
+        self.validate()
+        argv = [self.command] + self.options.to_argv() + [typing.unquote(self.wea)]
+        return argv, None
+
     def validate(self):
         Command.validate(self)
         if self.wea is None:
@@ -221,12 +221,8 @@ class Gensky(Command):
             options: Command options. It will be set to Radiance default values if not
                 provided by user.
         """
-        cls_from_ang = cls()
-
-        if not options:
-            options = cls_from_ang.options
-
-        options.ang = tuple_with_length(angles, length=2)
+        cls_from_ang = cls(options=options)
+        cls_from_ang.options.ang = tuple_with_length(angles, length=2)
 
         return cls_from_ang
 
@@ -2,9 +2,13 @@
 
 from .options.getinfo import GetinfoOptions
 from ._command import Command
+from .native import header
 
 import honeybee_radiance_command._exception as exceptions
 import honeybee_radiance_command._typing as typing
+import os
+import shlex
+import sys
 import warnings
 
 
@@ -18,6 +22,10 @@ class Getinfo(Command):
     The end of the header information and the start of the data is indicated
     by an empty line.
 
+    Getinfo is run in-process using the native header module unless the output is
+    piped to another command or the dimensions of an octree are requested. See
+    honeybee_radiance_command.native.header for more information.
+
     Args:
         options: Command options. It will be set to Radiance default values
             if unspecified.
@@ -121,3 +129,72 @@ class Getinfo(Command):
             warnings.warn('getinfo: option a will be ignored when using remove_header')
         if self._remove_header and self.options.d:
             warnings.warn('getinfo: option d will be ignored when using remove_header')
+
+    def run(self, env=None, cwd=None):
+        """Run command.
+
+        The header is read in-process if possible and getinfo is only run as a
+        subprocess if the output is piped to another command or for the dimensions of
+        an octree.
+
+        Args:
+            env: Environmental variables (default: None).
+            cwd: Working directory (Default: '.').
+
+        Returns:
+            - int: Command return code.
+        """
+        if self.pipe_to is None:
+            try:
+                native = self._run_native(cwd)
+            except (IOError, OSError) as error:
+                # same as getinfo when a file can't be read
+                sys.stderr.write('getinfo: %s\n' % error)
+                self.after_run()
+                return 1
+            if native:
+                self.after_run()
+                return 0
+        return Command.run(self, env, cwd)
+
+    def _run_native(self, cwd=None):
+        """Run getinfo in-process and return False if it is not supported."""
+        self.validate()
+        names = self.input
+        if not isinstance(names, (list, tuple)):
+            # posix=False keeps the backslashes in Windows paths
+            names = shlex.split(names, posix=False)
+        names = [typing.unquote(name) for name in names]
+        inputs = [os.path.join(cwd, name) if cwd else name for name in names]
+        output = typing.unquote(self.output) if self.output else None
+        if output and cwd:
+            output = os.path.join(cwd, output)
+
+        if self._remove_header:
+            header.strip_header(inputs[0], output)
+            return True
+        if self.options.a.is_set:
+            header.add_header_lines(
+                inputs[0], [typing.unquote(self.options.a.value)], output
+            )
+            return True
+        if self.options.d.is_set:
+            lines = []
+            for name, path in zip(names, inputs):
+                resolution = header.read_header(path).resolution
+                if resolution is None:
+                    # octrees
+                    return False
+                lines.append('%s: %s\n' % (name, resolution))
+            text = ''.join(lines)
+        else:
+            text = ''.join(
+                header.info(path, name) for name, path in zip(names, inputs)
+            )
+
+        if output:
+            with open(output, 'w') as outf:
+                outf.write(text)
+        else:
+            sys.stdout.write(text)
+        return True
@@ -0,0 +1,7 @@
+"""In-process implementations of selected Radiance commands.
+
+The modules in this package reproduce the calculations of a handful of Radiance
+programs in pure Python so they can be used without spawning a subprocess. They are
+meant for batch workflows where the same calculation is repeated many times with small
+changes to the inputs.
+"""
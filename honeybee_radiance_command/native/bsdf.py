@@ -0,0 +1,78 @@
+"""Reader for the angle basis of BSDF files in the LBNL WINDOW XML format.
+
+Matrix based calculations use the transmission data of a BSDF as a matrix. The size of
+the matrix is the number of patches in the angle basis of the outgoing (rows) and the
+incident (columns) directions. The basis is defined before the scattering data in the
+XML file which means the shape can be found without parsing the data itself.
+
+Usage:
+
+.. code-block:: python
+
+    from honeybee_radiance_command.native.bsdf import bsdf_shape
+
+    print(bsdf_shape('blinds.xml'))  # (145, 145)
+"""
+try:
+    import xml.etree.cElementTree as ElementTree
+except ImportError:  # cElementTree is removed in Python 3.9
+    import xml.etree.ElementTree as ElementTree
+
+KLEMS_BASIS = {
+    'LBNL/Klems Full': 145,
+    'LBNL/Klems Half': 73,
+    'LBNL/Klems Quarter': 41
+}
+"""Number of patches in the standard Klems bases."""
+
+
+def _name(tag):
+    """Remove the namespace from an XML tag."""
+    return tag.rsplit('}', 1)[-1]
+
+
+def bsdf_shape(file_path):
+    """Get the shape of the transmission matrix of a BSDF file.
+
+    Args:
+        file_path: Path to a BSDF file in XML format.
+
+    Returns:
+        A tuple of the number of rows and columns. The rows are the outgoing directions
+        and the columns are the incident directions. None is returned for BSDFs that
+        are not defined with an angle basis (e.g. tensor tree BSDFs).
+    """
+    bases = dict(KLEMS_BASIS)
+    basis_name = None
+    basis_size = 0
+    direction = None
+    column = row = None
+    with open(file_path, 'rb') as inf:
+        for event, element in ElementTree.iterparse(inf, events=('start', 'end')):
+            tag = _name(element.tag)
+            if event == 'start':
+                if tag == 'AngleBasis':
+                    basis_name, basis_size = None, 0
+                elif tag == 'WavelengthDataBlock':
+                    direction = column = row = None
+                elif tag == 'ScatteringData' and direction \
+                        and direction.startswith('Transmission') and column and row:
+                    # the basis names are always before the data
+                    if column in bases and row in bases:
+                        return bases[row], bases[column]
+                    return None
+                continue
+            if tag == 'AngleBasisName':
+                basis_name = (element.text or '').strip()
+            elif tag == 'nPhis':
+                basis_size += int(element.text)
+            elif tag == 'AngleBasis' and basis_name and basis_size:
+                bases[basis_name] = basis_size
+            elif tag == 'WavelengthDataDirection':
+                direction = (element.text or '').strip()
+            elif tag == 'ColumnAngleBasis':
+                column = (element.text or '').strip()
+            elif tag == 'RowAngleBasis':
+                row = (element.text or '').strip()
+            element.clear()
+    return None
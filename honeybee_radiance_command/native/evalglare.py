@@ -0,0 +1,568 @@
+"""In-process glare evaluation of fisheye pictures similar to evalglare.
+
+Annual glare studies run evalglare on thousands of fisheye pictures that are rendered
+from the same view. This module calculates the vertical eye illuminance, detects the
+glare sources and calculates the daylight glare probability (DGP) and related indices
+for pictures that are loaded with honeybee_radiance_command.native.rgbe.
+
+The direction, solid angle and position index of each pixel only depend on the
+resolution and the view of the picture. These values are calculated once for each
+resolution and view type and are reused for all the pictures.
+
+The following evalglare options are supported.
+
+-   b: Threshold for glare sources. Values larger than 100 are used as a luminance in
+    cd/m2 and smaller values are multiplied by the average luminance of the picture.
+-   r: Search radius in radians to merge glare source pixels to the same source.
+-   x, y and Y: Peak extraction. Pixels above the peak threshold (Default: 50000
+    cd/m2) are merged to separate glare sources.
+-   i: Externally measured vertical illuminance in lux.
+-   C: Low light correction of the DGP.
+
+The -vta, -vth, -vts and -vtv view types are supported.
+
+Differences to evalglare:
+
+-   The vertical eye illuminance and the average luminance are integrated over the
+    same pixels as evalglare, but the solid angle of each pixel is calculated from the
+    projection instead of the corners of the pixel. The two agree to within about 1%
+    for pictures of 400x400 pixels or more.
+-   Glare source pixels are merged in a single pass. Each pixel is added to the first
+    source whose average direction is within the search radius and the sources are not
+    merged again afterwards. evalglare merges sources again and uses its own peak
+    extraction, so the number of sources and their solid angles can differ for large
+    or uneven sources such as a window with a bright sky. Uniform sources that are
+    smaller than the search radius match. The DGP can differ by a few hundredths where
+    sources are split differently, and DGI and UGR can differ more because they
+    depend on every single source.
+-   Smoothing (-s), the task area (-t and -T), pixel weighting and the detailed output
+    options are not supported. Use the Evalglare command for those options.
+
+test_evalglare_binary in tests/native/evalglare_test.py compares the DGP (within 0.02)
+and the vertical illuminance (within 2%) with evalglare when it is on the PATH.
+
+The module is pure Python. For a 1024x1024 picture the view table takes about 1.5 s
+and is reused for all the pictures with the same resolution and view; reading the
+picture takes about 0.6 s and the evaluation takes from 0.5 s to 2 s depending on the
+number of glare source pixels (CPython 3.10). Use evaluate_files to spread many
+pictures over several processes.
+
+Usage:
+
+.. code-block:: python
+
+    from honeybee_radiance_command.native.evalglare import evaluate_files
+    from honeybee_radiance_command.options.evalglare import EvalglareOptions
+
+    options = EvalglareOptions()
+    options.b = 2000
+    files = ['view_%d.hdr' % hour for hour in range(8, 18)]
+    for path, glare in zip(files, evaluate_files(files, options)):
+        print(path, glare.dgp, glare.ev)
+"""
+from __future__ import division
+
+import math
+import multiprocessing
+from array import array
+
+from ..options.evalglare import EvalglareOptions
+from .rgbe import Picture
+from .pcomb import CONSTANTS, LUMINANCE
+
+VIEW_TYPES = ('vta', 'vth', 'vts', 'vtv')
+"""View types that are supported for glare evaluation."""
+
+PEAK_THRESHOLD = 50000
+"""Default luminance in cd/m2 for peak extraction."""
+
+# slots of the evalglare options that are supported by the native implementation
+_SUPPORTED_SLOTS = ('_b', '_r', '_x', '_y', '_Y', '_i', '_C', '_d')
+# cache for the view tables
+_TABLES = {}
+
+# projection functions from the angle to the view direction to the distance from the
+# center of the picture and the ratio between the solid angle and the picture area
+_PROJECTIONS = {
+    'vta': (lambda a: a, lambda r: r, lambda t, r: math.sin(t) / t),
+    'vth': (math.sin, math.asin, lambda t, r: 1 / math.cos(t)),
+    'vts': (
+        lambda a: 2 * math.tan(a / 2), lambda r: 2 * math.atan(r / 2),
+        lambda t, r: math.cos(t / 2) ** 4
+    ),
+    'vtv': (math.tan, math.atan, lambda t, r: math.cos(t) ** 3)
+}
+
+
+def _parse_view(view):
+    """Get the view type and the horizontal and vertical angles from view options."""
+    values = view.split()
+    view_type, vh, vv = 'vtv', 45.0, 45.0
+    for index, value in enumerate(values):
+        if value.startswith('-vt') and len(value) == 4:
+            view_type = value[1:]
+        elif value in ('-vh', '-vv', '-vs', '-vl'):
+            number = float(values[index + 1])
+            if value == '-vh':
+                vh = number
+            elif value == '-vv':
+                vv = number
+            elif number != 0:
+                raise ValueError('Shifted views are not supported: %s' % view)
+    if view_type not in VIEW_TYPES:
+        raise ValueError(
+            'Unsupported view type for glare evaluation: -%s' % view_type
+        )
+    return view_type, vh, vv
+
+
+def position_index(x, y, z):
+    """Get the position index for a direction in view coordinates.
+
+    The Guth position index is used above the line of sight and the Iwata model is
+    used below the line of sight. The values are limited to 16.
+
+    Args:
+        x: Horizontal component of the direction (positive to the right).
+        y: Vertical component of the direction (positive to the top).
+        z: Component of the direction along the view direction.
+    """
+    if z <= 0:
+        return 16.0
+    if y < 0:
+        r = math.sqrt(x * x + y * y) / z
+        factor = 1.2 if r > 0.6 else 0.8
+        value = 1 + factor * min(r, 3.0)
+    else:
+        sigma = math.degrees(math.acos(min(z, 1.0)))
+        tau = math.degrees(math.atan2(abs(x), y))
+        value = math.exp(
+            (35.2 - 0.31889 * tau - 1.22 * math.exp(-2 * tau / 9)) / 1000 * sigma +
+            (21 + 0.26667 * tau - 0.002963 * tau * tau) / 100000 * sigma * sigma
+        )
+    return min(value, 16.0)
+
+
+class ViewTable(object):
+    """Direction, solid angle and position index of the pixels of a picture.
+
+    Use the view_table function to get a cached table for a resolution and view.
+
+    Args:
+        width: Number of pixels in each scanline.
+        height: Number of scanlines.
+        view: View options (e.g. -vta -vh 180 -vv 180).
+
+    Properties:
+        * width
+        * height
+        * view_type
+        * pixels
+        * directions
+        * solid_angles
+        * weights
+        * position_indices
+    """
+
+    __slots__ = ('_width', '_height', '_view_type', '_pixels', '_directions',
+                 '_solid_angles', '_weights', '_position_indices')
+
+    def __init__(self, width, height, view):
+        view_type, vh, vv = _parse_view(view)
+        forward, inverse, ratio = _PROJECTIONS[view_type]
+        size_x = forward(math.radians(vh) / 2)
+        size_y = forward(math.radians(vv) / 2)
+        area = (2 * size_x / width) * (2 * size_y / height)
+
+        pixels = []
+        directions = []
+        solid_angles = array('d')
+        weights = array('d')
+        for row in range(height):
+            # scanlines go from the top to the bottom of the picture
+            v = (1 - 2 * (row + 0.5) / height) * size_y
+            for column in range(width):
+                u = (2 * (column + 0.5) / width - 1) * size_x
+                r = math.sqrt(u * u + v * v)
+                if r == 0:
+                    theta, direction, omega = 0.0, (0.0, 0.0, 1.0), area
+                else:
+                    if view_type == 'vth' and r >= 1:
+                        continue
+                    theta = inverse(r)
+                    if theta >= math.pi / 2:
+                        # behind the viewer or outside the fisheye circle
+                        continue
+                    s = math.sin(theta) / r
+                    direction = (u * s, v * s, math.cos(theta))
+                    omega = area * ratio(theta, r)
+                pixels.append(row * width + column)
+                directions.append(direction)
+                solid_angles.append(omega)
+                weights.append(omega * direction[2])
+
+        self._width = width
+        self._height = height
+        self._view_type = view_type
+        self._pixels = array('l', pixels)
+        self._directions = directions
+        self._solid_angles = solid_angles
+        self._weights = weights
+        self._position_indices = None
+
+    @property
+    def width(self):
+        """Number of pixels in each scanline."""
+        return self._width
+
+    @property
+    def height(self):
+        """Number of scanlines."""
+        return self._height
+
+    @property
+    def view_type(self):
+        """View type (e.g. vta)."""
+        return self._view_type
+
+    @property
+    def pixels(self):
+        """Indices of the pixels inside the view.
+
+        The other properties have one value for each of these pixels.
+        """
+        return self._pixels
+
+    @property
+    def directions(self):
+        """A list of (x, y, z) directions in view coordinates.
+
+        x is to the right, y is to the top and z is the view direction.
+        """
+        return self._directions
+
+    @property
+    def solid_angles(self):
+        """Solid angle of each pixel in steradians."""
+        return self._solid_angles
+
+    @property
+    def weights(self):
+        """Solid angle of each pixel multiplied by the cosine to the view direction."""
+        return self._weights
+
+    @property
+    def position_indices(self):
+        """Position index of each pixel."""
+        if self._position_indices is None:
+            self._position_indices = array(
+                'd', (position_index(*d) for d in self._directions)
+            )
+        return self._position_indices
+
+    def __repr__(self):
+        return 'ViewTable: %d x %d -%s' % (self._width, self._height, self._view_type)
+
+
+def view_table(width, height, view):
+    """Get the cached ViewTable for a resolution and view.
+
+    Args:
+        width: Number of pixels in each scanline.
+        height: Number of scanlines.
+        view: View options (e.g. -vta -vh 180 -vv 180).
+    """
+    key = (width, height) + _parse_view(view)
+    try:
+        return _TABLES[key]
+    except KeyError:
+        table = ViewTable(width, height, view)
+        _TABLES[key] = table
+        return table
+
+
+class Glare(object):
+    """Result of a glare evaluation.
+
+    Args:
+        ev: Vertical eye illuminance in lux.
+        average_luminance: Average luminance of the view in cd/m2.
+        sources: A list of (luminance, solid_angle, direction, position_index) tuples
+            for each glare source.
+        correction: Set to True to apply the low light correction to the DGP.
+
+    Properties:
+        * ev
+        * average_luminance
+        * background_luminance
+        * sources
+        * dgp
+        * dgp_s
+        * dgi
+        * ugr
+    """
+
+    __slots__ = ('_ev', '_average_luminance', '_sources', '_correction')
+
+    def __init__(self, ev, average_luminance, sources, correction=True):
+        self._ev = ev
+        self._average_luminance = average_luminance
+        self._sources = sources
+        self._correction = correction
+
+    @property
+    def ev(self):
+        """Vertical eye illuminance in lux."""
+        return self._ev
+
+    @property
+    def average_luminance(self):
+        """Average luminance of the view in cd/m2."""
+        return self._average_luminance
+
+    @property
+    def background_luminance(self):
+        """Luminance of the background in cd/m2.
+
+        The background luminance is calculated from the illuminance of the view
+        without the glare sources.
+        """
+        direct = sum(lum * omega * d[2] for lum, omega, d, _ in self._sources)
+        return max(self._ev - direct, 0) / math.pi
+
+    @property
+    def sources(self):
+        """A list of (luminance, solid_angle, direction, position_index) tuples."""
+        return self._sources
+
+    @property
+    def dgp(self):
+        """Daylight glare probability."""
+        ev = self._ev
+        if ev <= 0:
+            return 0.0
+        glare = sum(
+            lum * lum * omega / (ev ** 1.87 * index * index)
+            for lum, omega, _, index in self._sources
+        )
+        dgp = 5.87e-5 * ev + 9.18e-2 * math.log10(1 + glare) + 0.16
+        if self._correction and ev < 1000:
+            factor = math.exp(0.024 * ev - 4)
+            dgp *= factor / (1 + factor)
+        return min(dgp, 1.0)
+
+    @property
+    def dgp_s(self):
+        """Simplified daylight glare probability from the vertical eye illuminance."""
+        return min(6.22e-5 * self._ev + 0.184, 1.0)
+
+    @property
+    def dgi(self):
+        """Daylight glare index.
+
+        The solid angle of each source is divided by the square of the position index
+        for the solid angle modified by the position of the source.
+        """
+        background = self.background_luminance
+        glare = sum(
+            lum ** 1.6 * (omega / (index * index)) ** 0.8 /
+            (background + 0.07 * omega ** 0.5 * lum)
+            for lum, omega, _, index in self._sources
+        )
+        return 10 * math.log10(0.478 * glare) if glare > 0 else 0.0
+
+    @property
+    def ugr(self):
+        """Unified glare rating."""
+        background = self.background_luminance
+        glare = sum(
+            lum * lum * omega / (index * index)
+            for lum, omega, _, index in self._sources
+        )
+        if glare <= 0 or background <= 0:
+            return 0.0
+        return 8 * math.log10(0.25 / background * glare)
+
+    def __repr__(self):
+        return 'Glare: DGP %.3f Ev %.1f lux %d sources' % (
+            self.dgp, self._ev, len(self._sources)
+        )
+
+
+def is_supported(options):
+    """Check if all the options that are set can be used with the native evalglare."""
+    if options.additional_options:
+        return False
+    for name in options.slots:
+        option = options._created_option(name)
+        if name not in _SUPPORTED_SLOTS and option is not None and option.is_set:
+            return False
+    return True
+
+
+def _value(options, name, default):
+    option = options._created_option('_%s' % name)
+    return option.value if option is not None and option.is_set else default
+
+
+def _merge_sources(pixels, table, radius):
+    """Merge glare source pixels to glare sources.
+
+    Each pixel is added to the first source whose average direction is within the
+    search radius. A new source is created if there is no such source.
+
+    Returns:
+        A list of [sum of luminance * solid angle, solid angle, x, y, z] lists.
+    """
+    limit = math.cos(radius)
+    directions = table.directions
+    solid_angles = table.solid_angles
+    sources = []
+    for index, lum in pixels:
+        x, y, z = directions[index]
+        omega = solid_angles[index]
+        for source in sources:
+            sx, sy, sz = source[2:]
+            length = math.sqrt(sx * sx + sy * sy + sz * sz)
+            if (x * sx + y * sy + z * sz) >= limit * length:
+                source[0] += lum * omega
+                source[1] += omega
+                source[2] += x * omega
+                source[3] += y * omega
+                source[4] += z * omega
+                break
+        else:
+            sources.append([lum * omega, omega, x * omega, y * omega, z * omega])
+    return sources
+
+
+def evaluate(picture, options=None, view=None):
+    """Evaluate the glare of a fisheye picture.
+
+    Args:
+        picture: A Picture.
+        options: EvalglareOptions. See the module documentation for the supported
+            options.
+        view: View options. By default the view in the header of the picture is used.
+
+    Returns:
+        A Glare object.
+    """
+    options = options or EvalglareOptions()
+    if not is_supported(options):
+        raise ValueError(
+            'The evalglare options are not supported: %s' % options.to_radiance()
+        )
+    view = view or picture.view
+    if not view:
+        raise ValueError('The picture has no view. Use the view argument.')
+    if picture.orientation != ('-Y', '+X'):
+        raise ValueError(
+            'Unsupported picture orientation: %s' % ' '.join(picture.orientation)
+        )
+    table = view_table(picture.width, picture.height, view)
+
+    # luminance of the pixels in the view
+    data = picture.data
+    factor = CONSTANTS['WE'] / picture.exposure
+    l_r, l_g, l_b = (c * factor for c in LUMINANCE)
+    luminance = [
+        l_r * data[3 * i] + l_g * data[3 * i + 1] + l_b * data[3 * i + 2]
+        for i in table.pixels
+    ]
+    ev = _value(options, 'i', None)
+    if ev is None:
+        ev = sum(lum * w for lum, w in zip(luminance, table.weights))
+    total_omega = sum(table.solid_angles)
+    average = sum(lum * omega for lum, omega in zip(luminance, table.solid_angles)) \
+        / total_omega if total_omega else 0.0
+
+    threshold = _value(options, 'b', 2000)
+    if threshold <= 100:
+        threshold *= average
+    peak = None
+    if not _value(options, 'x', False):
+        peak = _value(options, 'Y', PEAK_THRESHOLD)
+    radius = _value(options, 'r', 0.2)
+
+    pixels = [(i, lum) for i, lum in enumerate(luminance) if lum > threshold]
+    if peak is not None:
+        groups = (
+            [p for p in pixels if p[1] <= peak], [p for p in pixels if p[1] > peak]
+        )
+    else:
+        groups = (pixels,)
+    sources = []
+    for group in groups:
+        for lum_omega, omega, x, y, z in _merge_sources(group, table, radius):
+            length = math.sqrt(x * x + y * y + z * z)
+            direction = (x / length, y / length, z / length)
+            sources.append(
+                (lum_omega / omega, omega, direction, position_index(*direction))
+            )
+    correction = _value(options, 'C', 'l+') == 'l+'
+    return Glare(ev, average, sources, correction)
+
+
+def evaluate_pictures(pictures, options=None, view=None):
+    """Evaluate the glare of several pictures.
+
+    The view tables are only calculated once for pictures with the same resolution
+    and view.
+
+    Args:
+        pictures: A list of Pictures.
+        options: EvalglareOptions that are used for all the pictures.
+        view: View options. By default the view in the header of each picture is used.
+
+    Returns:
+        A list of Glare objects.
+    """
+    return [evaluate(picture, options, view) for picture in pictures]
+
+
+def evaluate_file(file_path, options=None, view=None):
+    """Evaluate the glare of a picture file.
+
+    Args:
+        file_path: Path to a fisheye picture.
+        options: EvalglareOptions. See the module documentation for the supported
+            options.
+        view: View options. By default the view in the header of the picture is used.
+
+    Returns:
+        A Glare object.
+    """
+    return evaluate(Picture.from_file(file_path), options, view)
+
+
+def _evaluate_file(args):
+    """Call evaluate_file with a tuple of arguments for multiprocessing."""
+    return evaluate_file(*args)
+
+
+def evaluate_files(files, options=None, view=None, processes=None):
+    """Evaluate the glare of several picture files in parallel.
+
+    Each process calculates the view tables once and uses them for all of its
+    pictures.
+
+    Args:
+        files: A list of paths to fisheye pictures.
+        options: EvalglareOptions that are used for all the pictures.
+        view: View options. By default the view in the header of each picture is used.
+        processes: Number of processes. By default the number of CPUs is used. Use 1
+            to evaluate the pictures one after the other in this process.
+
+    Returns:
+        A list of Glare objects.
+    """
+    jobs = [(file_path, options, view) for file_path in files]
+    if processes == 1 or len(jobs) < 2:
+        return [_evaluate_file(job) for job in jobs]
+    pool = multiprocessing.Pool(processes)
+    try:
+        return pool.map(_evaluate_file, jobs, chunksize=max(len(jobs) // 64, 1))
+    finally:
+        pool.close()
+        pool.join()
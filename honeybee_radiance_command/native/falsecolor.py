@@ -0,0 +1,373 @@
+"""In-process falsecolor pictures.
+
+The falsecolor script runs pcomb, psign and pcompos several times for each picture.
+This module maps the luminance of pictures that are loaded with
+honeybee_radiance_command.native.rgbe to a color palette with a lookup table and adds a
+legend. Legends are cached for each scale and are only drawn once for a batch of
+pictures with the same options. Legends for an auto scale depend on each picture and
+are not cached.
+
+The following falsecolor options are supported.
+
+-   pal: Color palette (def, spec, hot or pm3d).
+-   s, m and log: Scale of the legend, multiplier and number of decades for a
+    logarithmic scale. If the scale starts with "a" the maximum value is used.
+-   n, cl and cb: Number of contours and contour lines or bands.
+-   l, lw and lh: Label and size of the legend. A legend size of 0 removes the
+    legend.
+
+The palettes follow the shape of the Radiance palettes but the colors are not an exact
+match. The legend text is drawn with a small bitmap font.
+
+Usage:
+
+.. code-block:: python
+
+    from honeybee_radiance_command.native.falsecolor import falsecolor
+    from honeybee_radiance_command.native.rgbe import Picture
+    from honeybee_radiance_command.options.falsecolor import FalsecolorOptions
+
+    options = FalsecolorOptions()
+    options.s = 2000
+    options.l = 'cd/m2'
+    for hour in range(8, 18):
+        picture = Picture.from_file('view_%d.hdr' % hour)
+        falsecolor(picture, options).to_file('view_%d_falsecolor.hdr' % hour)
+"""
+from __future__ import division
+
+import math
+from array import array
+
+from ..options.falsecolor import FalsecolorOptions
+from .rgbe import Picture
+from .pcomb import LUMINANCE
+from . import _font
+
+TABLE_SIZE = 1024
+"""Number of colors in the lookup table of each palette."""
+
+GAMMA = 2.2
+"""Display gamma. Palette colors are converted to radiance values with this gamma."""
+
+# slots of the falsecolor options that are supported by the native implementation
+_SUPPORTED_SLOTS = (
+    '_pal', '_s', '_m', '_log', '_l', '_cl', '_cb', '_n', '_lw', '_lh'
+)
+# cache for lookup tables and legends
+_TABLES = {}
+_LEGENDS = {}
+
+
+def _clip(value):
+    return 0.0 if value < 0 else 1.0 if value > 1 else value
+
+
+def _interpolate(points):
+    """Create a palette function that interpolates between (value, color) points."""
+    def palette(x):
+        for (x0, c0), (x1, c1) in zip(points[:-1], points[1:]):
+            if x <= x1:
+                t = (x - x0) / (x1 - x0)
+                return tuple(a + (b - a) * t for a, b in zip(c0, c1))
+        return points[-1][1]
+    return palette
+
+
+def _spec(x):
+    return (
+        _clip(1.6 * x - 0.6),
+        _clip(1.6 - 1.6 * x if x > 0.375 else 8 / 3.0 * x),
+        _clip(1 - 8 / 3.0 * x)
+    )
+
+
+def _hot(x):
+    return _clip(3 * x), _clip(3 * x - 1), _clip(3 * x - 2)
+
+
+def _pm3d(x):
+    return _clip(math.sqrt(x)), _clip(x ** 3), _clip(math.sin(2 * math.pi * x))
+
+
+PALETTES = {
+    'def': _interpolate([
+        (0.0, (0.18, 0.0, 0.25)), (0.15, (0.0, 0.14, 0.7)),
+        (0.3, (0.0, 0.45, 0.6)), (0.45, (0.05, 0.6, 0.2)),
+        (0.6, (0.5, 0.7, 0.0)), (0.75, (0.95, 0.65, 0.0)),
+        (0.9, (1.0, 0.25, 0.0)), (1.0, (0.95, 0.35, 0.5))
+    ]),
+    'spec': _spec,
+    'hot': _hot,
+    'pm3d': _pm3d
+}
+"""Palette functions that map a value between 0 and 1 to display RGB values."""
+
+
+def palette_table(name='def', size=TABLE_SIZE):
+    """Get the lookup table for a palette.
+
+    Args:
+        name: Palette name (def, spec, hot or pm3d).
+        size: Number of colors in the table.
+
+    Returns:
+        A list of (r, g, b) radiance values. The first color is for 0 and the last color
+        is for 1.
+    """
+    key = (name, size)
+    try:
+        return _TABLES[key]
+    except KeyError:
+        pass
+    function = PALETTES[name]
+    table = []
+    for i in range(size):
+        color = function(i / (size - 1))
+        table.append(tuple(c ** GAMMA for c in color))
+    _TABLES[key] = table
+    return table
+
+
+class _Settings(object):
+    """Settings for a falsecolor picture from FalsecolorOptions."""
+
+    __slots__ = ('palette', 'scale', 'auto', 'multiplier', 'decades', 'label',
+                 'divisions', 'lines', 'bands', 'legend_width', 'legend_height')
+
+    def __init__(self, options, maximum=None):
+        def _value(name, default):
+            option = options._created_option('_%s' % name)
+            return option.value if option is not None and option.is_set else default
+
+        self.palette = _value('pal', 'def')
+        self.multiplier = _value('m', 179.0)
+        scale = str(_value('s', 1000))
+        self.auto = scale.lower().startswith('a')
+        if self.auto:
+            scale = (maximum or 0) * self.multiplier or 1.0
+        self.scale = float(scale)
+        self.decades = _value('log', 0) or 0
+        self.label = _value('l', 'Nits').strip('\'"')
+        self.divisions = _value('n', 8)
+        self.lines = _value('cl', False)
+        self.bands = _value('cb', False)
+        self.legend_width = _value('lw', 100)
+        self.legend_height = _value('lh', 200)
+
+    def normalize(self, value):
+        """Map a value to the 0-1 range of the palette."""
+        value = value / self.scale
+        if self.decades > 0:
+            value = math.log10(value) / self.decades + 1 if value > 0 else 0.0
+        return 0.0 if value < 0 else 1.0 if value > 1 else value
+
+    def value(self, x):
+        """Get the value for a point on the 0-1 range of the palette."""
+        if self.decades > 0:
+            return self.scale * 10 ** ((x - 1) * self.decades)
+        return self.scale * x
+
+
+def is_supported(options):
+    """Check if all the options that are set can be used with the native falsecolor."""
+    if options.additional_options:
+        return False
+    for name in options.slots:
+        option = options._created_option(name)
+        if name not in _SUPPORTED_SLOTS and option is not None and option.is_set:
+            return False
+    return True
+
+
+def _band_colors(settings, table):
+    """Get the color for each band."""
+    n = settings.divisions
+    size = len(table)
+    return [table[int((b + 0.5) / n * (size - 1) + 0.5)] for b in range(n)]
+
+
+def _draw_text(data, width, height, x, y, text, scale, color):
+    """Draw a text on a picture data array with three values for each pixel.
+
+    x and y are the position of the top left corner of the text in pixels from the
+    top left corner of the picture. The text is clipped at the edges of the picture.
+    """
+    for index, character in enumerate(text):
+        rows = _font.glyph(character)
+        left = x + index * (_font.WIDTH + 1) * scale
+        for row, bits in enumerate(rows):
+            for column in range(_font.WIDTH):
+                if not bits >> (_font.WIDTH - 1 - column) & 1:
+                    continue
+                start_x = left + column * scale
+                count = min(scale, width - start_x)
+                if count <= 0:
+                    continue
+                for dy in range(scale):
+                    line = y + row * scale + dy
+                    if line >= height:
+                        break
+                    start = 3 * (line * width + start_x)
+                    data[start:start + 3 * count] = array('f', color * count)
+
+
+def _format(value):
+    """Format a legend value."""
+    if value >= 1e5 or 0 < value < 1e-2:
+        return '%.1e' % value
+    return '%.3g' % value
+
+
+def legend(options=None, maximum=None):
+    """Get the legend for a set of falsecolor options.
+
+    Args:
+        options: FalsecolorOptions.
+        maximum: Maximum radiance value of the picture. This is only used if the scale
+            is set to auto.
+
+    Returns:
+        A new Picture or None if the legend width or height is 0.
+    """
+    settings = _Settings(options or FalsecolorOptions(), maximum)
+    key = _legend(settings)
+    if key is None:
+        return None
+    return Picture(key.width, key.height, array('f', key.data))
+
+
+def _legend(settings):
+    """Get the legend for falsecolor settings.
+
+    Legends that don't use an auto scale are cached and the same Picture is returned
+    for the same settings. The Picture must not be changed.
+    """
+    width, height = settings.legend_width, settings.legend_height
+    if width <= 0 or height <= 0:
+        return None
+    key = tuple(getattr(settings, name) for name in _Settings.__slots__)
+    try:
+        return _LEGENDS[key]
+    except KeyError:
+        pass
+
+    n = settings.divisions
+    table = palette_table(settings.palette)
+    labels = [_format(settings.value((n - b - 0.5) / n)) for b in range(n)]
+    # find the largest text scale that fits the labels and the bands
+    title_height = max(height // (n + 1), 1)
+    band_height = (height - title_height) / n
+    longest = max(len(text) for text in labels + [settings.label])
+    scale = max(
+        1, min(
+            (width - 4) // max(_font.text_width('0' * longest), 1),
+            int(min(band_height, title_height) - 2) // _font.HEIGHT
+        )
+    )
+
+    data = array('f', [0.0]) * (3 * width * height)
+    if settings.bands or settings.lines:
+        colors = _band_colors(settings, table)
+    for row in range(title_height, height):
+        band = min(int((row - title_height) / band_height), n - 1)
+        if settings.bands or settings.lines:
+            color = colors[n - 1 - band]
+        else:
+            x = 1 - (row - title_height + 0.5) / (height - title_height)
+            color = table[int(x * (len(table) - 1) + 0.5)]
+        data[3 * row * width:3 * (row + 1) * width] = array('f', color * width)
+
+    text_height = _font.HEIGHT * scale
+    white = (1.0, 1.0, 1.0)
+    _draw_text(
+        data, width, height, 2, max((title_height - text_height) // 2, 0),
+        settings.label, scale, white
+    )
+    for band, text in enumerate(labels):
+        top = int(title_height + band * band_height)
+        y = top + max(int((band_height - text_height) / 2), 0)
+        color = table[int((n - band - 0.5) / n * (len(table) - 1) + 0.5)]
+        dark = sum(c ** (1 / GAMMA) * l for c, l in zip(color, LUMINANCE)) < 0.5
+        _draw_text(
+            data, width, height, 2, y, text, scale,
+            white if dark else (0.0, 0.0, 0.0)
+        )
+
+    picture = Picture(width, height, data)
+    if not settings.auto:
+        _LEGENDS[key] = picture
+    return picture
+
+
+def falsecolor(picture, options=None, header=None):
+    """Create a falsecolor picture.
+
+    Args:
+        picture: A Picture. The values are divided by the exposure of the picture to
+            get the original radiance values.
+        options: FalsecolorOptions. See the module documentation for the supported
+            options.
+        header: An optional list of lines for the header of the output picture.
+
+    Returns:
+        A new Picture with the legend on the bottom left corner.
+    """
+    options = options or FalsecolorOptions()
+    if not is_supported(options):
+        raise ValueError(
+            'The falsecolor options are not supported: %s' % options.to_radiance()
+        )
+    data = picture.data
+    factor = 1.0 / picture.exposure
+    l_r, l_g, l_b = (c * factor for c in LUMINANCE)
+    values = [
+        l_r * r + l_g * g + l_b * b
+        for r, g, b in zip(data[0::3], data[1::3], data[2::3])
+    ]
+    maximum = max(values) if values else 0
+    settings = _Settings(options, maximum)
+    multiplier = settings.multiplier
+    table = palette_table(settings.palette)
+    last = len(table) - 1
+    normalize = settings.normalize
+    indices = [int(normalize(v * multiplier) * last + 0.5) for v in values]
+
+    width, height = picture.width, picture.height
+    colors = array('f', [0.0]) * (3 * width * height)
+    if settings.bands or settings.lines:
+        n = settings.divisions
+        band_colors = _band_colors(settings, table)
+        bands = [min(i * n // (last + 1), n - 1) for i in indices]
+        if settings.lines:
+            for y in range(height):
+                for x in range(width):
+                    i = y * width + x
+                    band = bands[i]
+                    if (x + 1 < width and bands[i + 1] != band) or \
+                            (y + 1 < height and bands[i + width] != band):
+                        colors[3 * i:3 * i + 3] = array('f', band_colors[band])
+        else:
+            for c in range(3):
+                channel = [color[c] for color in band_colors]
+                colors[c::3] = array('f', [channel[b] for b in bands])
+    else:
+        for c in range(3):
+            channel = [color[c] for color in table]
+            colors[c::3] = array('f', [channel[i] for i in indices])
+
+    key = _legend(settings)
+    if key is None:
+        return Picture(width, height, colors, header, orientation=picture.orientation)
+
+    # place the legend on the left side of the picture at the bottom
+    total_width = width + key.width
+    total_height = max(height, key.height)
+    output = array('f', [0.0]) * (3 * total_width * total_height)
+    for y in range(height):
+        start = 3 * ((total_height - height + y) * total_width + key.width)
+        output[start:start + 3 * width] = colors[3 * y * width:3 * (y + 1) * width]
+    for y in range(key.height):
+        start = 3 * (total_height - key.height + y) * total_width
+        output[start:start + 3 * key.width] = key.scanline(y)
+    return Picture(total_width, total_height, output, header)
@@ -0,0 +1,403 @@
+"""Batch generation of point-in-time sky descriptions.
+
+SkyBatch takes a series of sun positions (or dates and times) and irradiance values
+and generates the sky descriptions for all of them at once. The skies can either be
+evaluated in-process using the Perez all-weather model in the same format that
+gendaylit generates or be generated by gendaylit and gensky commands which are executed
+in a handful of shell calls instead of one subprocess for each sky.
+
+Usage:
+
+.. code-block:: python
+
+    from honeybee_radiance_command.native.gendaylit import SkyBatch
+    from honeybee_radiance_command.native.wea import Wea
+
+    batch = SkyBatch.from_wea(Wea.from_file('weather.wea'))
+    # write all the skies to a folder - one file for each sky
+    batch.to_folder('skies')
+    # or write them to a single file
+    batch.to_file('skies.sky')
+"""
+from __future__ import division
+
+import math
+import os
+
+from ..gendaylit import Gendaylit
+from ..gensky import Gensky
+from ..options.gendaylit import GendaylitOptions
+from ..options.gensky import GenskyOptions
+from .._command_util import run_command
+from .gendaymtx import sky_patches, SUN_ANGLE
+from .sun import solar_positions, sun_vectors
+from . import perez
+
+# maximum length of the command line in each shell call
+_MAX_COMMAND_LENGTH = 4000
+
+
+def perez_sky(altitude, azimuth, direct, diffuse, julian_date=1, options=None,
+              photometric=False):
+    """Get a gendaylit sky description using the Perez all-weather model.
+
+    The sky uses perezlum.cal from Radiance library in the same way as gendaylit. The
+    diffuse normalization is integrated over the Tregenza sky patches.
+
+    Args:
+        altitude: Solar altitude in degrees.
+        azimuth: Solar azimuth in degrees west of south.
+        direct: Direct normal irradiance in W/m2 (or illuminance in lux if
+            photometric is True).
+        diffuse: Diffuse horizontal irradiance in W/m2 (or illuminance in lux if
+            photometric is True).
+        julian_date: Day of the year (Default: 1).
+        options: GendaylitOptions. Only -g, -s and -O are used. The -s option
+            excludes the sun from the sky as it does in gendaylit.
+        photometric: Set to True if input values are illuminance values
+            (Default: False).
+
+    Returns:
+        Sky description as a string.
+    """
+    if options is None:
+        options = GendaylitOptions()
+    ground_reflectance = options.g.value if options.g.is_set else 0.2
+    output_type = options.O.value or 0
+    alt = math.radians(altitude)
+    sun_vector = sun_vectors([alt], [math.radians(azimuth)])[0]
+    zenith = perez.sun_zenith(alt)
+    if direct + diffuse <= 1e-4:
+        brightness, clearness, dir_ill, dif_ill, dir_irr, dif_irr = \
+            0.01, 1.0, 0, 0, 0, 0
+    else:
+        brightness, clearness, dir_ill, dif_ill, dir_irr, dif_irr = \
+            perez.sky_condition(
+                direct, diffuse, zenith, julian_date, photometric
+            )
+    if output_type == 1:
+        # solar radiance
+        dir_ill = dir_irr * perez.WHITE_EFFICACY
+        dif_ill = dif_irr * perez.WHITE_EFFICACY
+    factor = 1 if output_type == 2 else 1 / perez.WHITE_EFFICACY
+
+    params = perez.perez_parameters(clearness, brightness, zenith)
+    alts, azis, doms = sky_patches(1)
+    sx, sy, sz = sun_vector
+    total = 0
+    for p_alt, p_azi, p_dom in zip(alts[1:], azis[1:], doms[1:]):
+        cos_alt = math.cos(p_alt)
+        cos_gamma = min(max(
+            cos_alt * math.sin(p_azi) * sx + cos_alt * math.cos(p_azi) * sy +
+            math.sin(p_alt) * sz, -1.0), 1.0)
+        lum = perez.relative_luminance(params, math.acos(cos_gamma), math.pi / 2 - p_alt)
+        if lum > 0:
+            total += lum * math.sin(p_alt) * p_dom
+    diffuse_norm = dif_ill * factor / total if total > 1e-6 else 0
+    ground = dif_ill + (dir_ill * math.sin(alt) if alt > 0 else 0)
+    ground = ground * ground_reflectance / math.pi * factor
+
+    lines = [
+        '# solar altitude and azimuth: %.2f %.2f' % (altitude, azimuth),
+        '# Perez sky clearness and brightness: %.4f %.4f' % (clearness, brightness),
+        ''
+    ]
+    if not options.s.value and alt > 0 and dir_ill >= 1e-4:
+        sun_sa = 2 * math.pi * (1 - math.cos(math.radians(SUN_ANGLE / 2)))
+        radiance = dir_ill * factor / sun_sa
+        lines.extend([
+            'void light solar', '0', '0',
+            '3 %.3e %.3e %.3e' % (radiance, radiance, radiance), '',
+            'solar source sun', '0', '0',
+            '4 %f %f %f %.3f' % (sx, sy, sz, SUN_ANGLE), ''
+        ])
+    lines.extend([
+        'void brightfunc skyfunc', '2 skybright perezlum.cal', '0',
+        '10 %.3e %.3e %f %f %f %f %f %f %f %f' % (
+            (diffuse_norm, ground) + tuple(params) + (sx, sy, sz)
+        ), ''
+    ])
+    return '\n'.join(lines)
+
+
+class SkyBatch(object):
+    """A batch of point-in-time skies.
+
+    Args:
+        angles: A list of (altitude, azimuth) tuples in degrees. Azimuth is measured
+            west of south.
+        direct: An optional list of direct normal irradiance values. Direct and
+            diffuse values are required for in-process evaluation and gendaylit
+            commands. Skies with no irradiance values are generated by gensky.
+        diffuse: An optional list of diffuse horizontal irradiance values.
+        julian_dates: An optional list of days of the year for each sky. These values
+            are used to correct the extraterrestrial irradiance in the Perez model.
+        labels: An optional list of labels for each sky. Labels are used to name the
+            files in to_folder. By default the index of the sky is used.
+        photometric: Set to True if direct and diffuse values are illuminance values
+            in lux (Default: False).
+
+    Properties:
+        * angles
+        * direct
+        * diffuse
+        * julian_dates
+        * labels
+        * photometric
+        * count
+    """
+
+    __slots__ = (
+        '_angles', '_direct', '_diffuse', '_julian_dates', '_labels', '_photometric'
+    )
+
+    def __init__(self, angles, direct=None, diffuse=None, julian_dates=None,
+                 labels=None, photometric=False):
+        self._angles = [tuple(float(v) for v in ang) for ang in angles]
+        count = len(self._angles)
+        if (direct is None) != (diffuse is None):
+            raise ValueError('Both direct and diffuse values must be provided.')
+        if direct is not None:
+            direct, diffuse = list(direct), list(diffuse)
+            assert len(direct) == len(diffuse) == count, \
+                'Number of irradiance values must match the number of angles.'
+        self._direct = direct
+        self._diffuse = diffuse
+        self._julian_dates = list(julian_dates) if julian_dates else [1] * count
+        assert len(self._julian_dates) == count, \
+            'Number of Julian dates must match the number of angles.'
+        self._labels = [str(lb) for lb in labels] if labels \
+            else [str(i) for i in range(count)]
+        assert len(self._labels) == count, \
+            'Number of labels must match the number of angles.'
+        self._photometric = bool(photometric)
+
+    @classmethod
+    def from_dates(cls, months, days, hours, latitude, longitude, time_zone,
+                   direct=None, diffuse=None, solar_time=False, photometric=False):
+        """Create a batch of skies from dates and times.
+
+        Args:
+            months: A list of months.
+            days: A list of days.
+            hours: A list of hours in local standard time.
+            latitude: Site latitude in degrees.
+            longitude: Site longitude in degrees (positive to the west).
+            time_zone: Standard meridian in degrees (positive to the west).
+            direct: An optional list of direct normal irradiance values.
+            diffuse: An optional list of diffuse horizontal irradiance values.
+            solar_time: Set to True if input hours are in local solar time
+                (Default: False).
+            photometric: Set to True if direct and diffuse values are illuminance
+                values in lux (Default: False).
+        """
+        jds, alts, azis = solar_positions(
+            months, days, hours, latitude, longitude, time_zone, solar_time
+        )
+        angles = [(math.degrees(alt), math.degrees(azi)) for alt, azi in zip(alts, azis)]
+        labels = [
+            '%02d_%02d_%s' % (int(m), int(d), ('%05.2f' % h).replace('.', ''))
+            for m, d, h in zip(months, days, hours)
+        ]
+        return cls(angles, direct, diffuse, jds, labels, photometric)
+
+    @classmethod
+    def from_wea(cls, wea, sun_up_hours=True):
+        """Create a batch of skies from a Wea object.
+
+        Args:
+            wea: A Wea object.
+            sun_up_hours: Set to False to include the time steps when the sun is below
+                the horizon (Default: True).
+        """
+        batch = cls.from_dates(
+            wea.months, wea.days, wea.hours, wea.latitude, wea.longitude,
+            wea.time_zone, wea.direct, wea.diffuse, photometric=wea.units == 3
+        )
+        if wea.units == 2:
+            # convert direct horizontal to direct normal irradiance
+            batch._direct = [
+                dr / math.sin(math.radians(alt)) if alt > 0 else 0
+                for dr, (alt, _) in zip(batch._direct, batch._angles)
+            ]
+        if sun_up_hours:
+            indices = [i for i, ang in enumerate(batch._angles) if ang[0] > 0]
+            batch = cls(
+                [batch._angles[i] for i in indices],
+                [batch._direct[i] for i in indices],
+                [batch._diffuse[i] for i in indices],
+                [batch._julian_dates[i] for i in indices],
+                [batch._labels[i] for i in indices],
+                batch._photometric
+            )
+        return batch
+
+    @property
+    def angles(self):
+        """List of (altitude, azimuth) tuples in degrees."""
+        return self._angles
+
+    @property
+    def direct(self):
+        """List of direct normal values or None."""
+        return self._direct
+
+    @property
+    def diffuse(self):
+        """List of diffuse horizontal values or None."""
+        return self._diffuse
+
+    @property
+    def julian_dates(self):
+        """List of days of the year."""
+        return self._julian_dates
+
+    @property
+    def labels(self):
+        """List of sky labels."""
+        return self._labels
+
+    @property
+    def photometric(self):
+        """Boolean for whether direct and diffuse values are illuminance values."""
+        return self._photometric
+
+    @property
+    def count(self):
+        """Number of skies."""
+        return len(self._angles)
+
+    def commands(self, options=None):
+        """Get a list of Radiance commands for generating the skies.
+
+        Gendaylit commands are returned if irradiance values are available. Otherwise
+        Gensky commands are returned.
+
+        Args:
+            options: Optional GendaylitOptions or GenskyOptions that will be applied to
+                all the commands. -ang and -W (or -L) will be set for each command.
+        """
+        use_gendaylit = self._direct is not None
+        if use_gendaylit:
+            cmd_class, opt_class = Gendaylit, GendaylitOptions
+        else:
+            cmd_class, opt_class = Gensky, GenskyOptions
+        base = options.to_radiance() if options else ''
+        commands = []
+        for i, angle in enumerate(self._angles):
+            opt = opt_class()
+            if base:
+                opt.update_from_string(base)
+            if use_gendaylit:
+                values = (self._direct[i], self._diffuse[i])
+                if self._photometric:
+                    opt.L = values
+                else:
+                    opt.W = values
+            commands.append(cmd_class.from_ang(angle, opt))
+        return commands
+
+    def descriptions(self, options=None):
+        """Evaluate all the skies in-process and return the sky descriptions.
+
+        This method requires direct and diffuse values.
+
+        Args:
+            options: GendaylitOptions. Only -g, -s and -O are used.
+        """
+        if self._direct is None:
+            raise ValueError(
+                'Direct and diffuse values are required for in-process evaluation.'
+            )
+        return [
+            perez_sky(alt, azi, dr, df, jd, options, self._photometric)
+            for (alt, azi), dr, df, jd in zip(
+                self._angles, self._direct, self._diffuse, self._julian_dates)
+        ]
+
+    def to_file(self, output, options=None, native=True, env=None):
+        """Write all the skies to a single file.
+
+        Each sky starts with a comment line with its label.
+
+        Args:
+            output: Path to output file.
+            options: GendaylitOptions or GenskyOptions.
+            native: Set to False to generate the skies by running gendaylit or gensky
+                instead of in-process evaluation (Default: True).
+            env: Environmental variables for running the commands when native is set
+                to False.
+
+        Returns:
+            Path to output file.
+        """
+        output = os.path.abspath(output)
+        if native:
+            with open(output, 'w') as outf:
+                for label, desc in zip(self._labels, self.descriptions(options)):
+                    outf.write('# sky %s\n%s\n' % (label, desc))
+            return output
+
+        with open(output, 'w') as outf:
+            outf.write('')
+        out_path = '"%s"' % output.replace('\\', '/')
+        commands = []
+        for label, cmd in zip(self._labels, self.commands(options)):
+            commands.append('echo "# sky %s" >> %s' % (label, out_path))
+            commands.append('%s >> %s' % (cmd.to_radiance(), out_path))
+        self._run(commands, env)
+        return output
+
+    def to_folder(self, folder, options=None, native=True, extension='.sky',
+                  env=None):
+        """Write each sky to a separate file in a folder.
+
+        Files are named after sky labels.
+
+        Args:
+            folder: Path to target folder. It will be created if it doesn't exist.
+            options: GendaylitOptions or GenskyOptions.
+            native: Set to False to generate the skies by running gendaylit or gensky
+                instead of in-process evaluation (Default: True).
+            extension: File extension (Default: .sky).
+            env: Environmental variables for running the commands when native is set
+                to False.
+
+        Returns:
+            A list of paths to sky files.
+        """
+        folder = os.path.abspath(folder)
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        files = [os.path.join(folder, label + extension) for label in self._labels]
+        if native:
+            for fp, desc in zip(files, self.descriptions(options)):
+                with open(fp, 'w') as outf:
+                    outf.write(desc)
+            return files
+
+        commands = []
+        for fp, cmd in zip(files, self.commands(options)):
+            cmd.output = fp
+            commands.append(cmd.to_radiance())
+        self._run(commands, env)
+        return files
+
+    @staticmethod
+    def _run(commands, env=None):
+        """Run commands in as few shell calls as possible."""
+        chunk, length = [], 0
+        for cmd in commands:
+            if chunk and length + len(cmd) > _MAX_COMMAND_LENGTH:
+                run_command(' && '.join(chunk), env)
+                chunk, length = [], 0
+            chunk.append(cmd)
+            length += len(cmd) + 4
+        if chunk:
+            run_command(' && '.join(chunk), env)
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return 'SkyBatch: %d skies' % self.count
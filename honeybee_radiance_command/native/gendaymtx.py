@@ -0,0 +1,604 @@
+"""In-process Perez sky matrix generator.
+
+This module reproduces the calculation of Radiance's gendaymtx. Solar positions and the
+weather data are computed once when a SkyMatrix is created and reused for every matrix
+that is generated from it. This makes generating variations of the same sky (e.g.
+rotations or different ground reflectance) much faster than running gendaymtx for each
+variation.
+
+If NumPy is installed all the time steps are computed at once as array operations.
+Otherwise, the sky patches are computed one time step at a time in pure Python which
+is about 7 times slower for a Tregenza sky and should only be used for short periods or
+where NumPy is not available (e.g. IronPython).
+
+Usage:
+
+.. code-block:: python
+
+    from honeybee_radiance_command.native.gendaymtx import SkyMatrix
+    from honeybee_radiance_command.options.gendaymtx import GendaymtxOptions
+
+    sky = SkyMatrix.from_wea('weather.wea')
+    options = GendaymtxOptions()
+    options.m = 1
+    for angle in range(0, 360, 30):
+        options.r = angle
+        sky.to_file('sky_%d.mtx' % angle, options)
+"""
+from __future__ import division
+
+import heapq
+import math
+import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional and is not available in IronPython
+    np = None
+
+from ..options.gendaymtx import GendaymtxOptions
+import honeybee_radiance_command._typing as typing
+from .wea import Wea
+from .sun import solar_positions, sun_vectors
+from . import perez
+
+SKY_COLOR = (0.960, 1.004, 1.118)
+"""Default sky color."""
+
+GROUND_COLOR = (0.2, 0.2, 0.2)
+"""Default ground color."""
+
+SUN_ANGLE = 0.533
+"""Apparent sun diameter in degrees."""
+
+# number of sky patches that share the direct solar contribution
+_SUN_PATCHES = 4
+# maximum number of patch values for each block of time steps that NumPy computes at once
+_BLOCK_SIZE = 1 << 18
+# number of patches in each Tregenza row
+_TREGENZA_ROWS = (30, 30, 24, 24, 18, 12, 6)
+# patch tables for each subdivision
+_PATCHES = {}
+
+
+def sky_patches(m=1):
+    """Get altitude, azimuth and solid angle for Reinhart sky patches.
+
+    The first patch is the ground, followed by the sky patches row by row starting
+    from the horizon and ending with the zenith patch. Azimuth is measured from north
+    towards east. The values are computed once for each subdivision and cached.
+
+    Args:
+        m: Reinhart subdivision. Use 1 for Tregenza sky (Default: 1).
+
+    Returns:
+        A tuple of three lists for altitudes, azimuths and solid angles in radians and
+        steradians.
+    """
+    try:
+        return _PATCHES[m]
+    except KeyError:
+        pass
+    alpha = (math.pi / 2) / (len(_TREGENZA_ROWS) * m + 0.5)
+    # gendaymtx stores patch angles as single precision floats
+    alt = array('f', [-math.pi / 2])
+    azi = array('f', [0])
+    dom = array('f', [2 * math.pi])
+    for i in range(len(_TREGENZA_ROWS) * m):
+        ninrow = _TREGENZA_ROWS[i // m] * m
+        row_alt = alpha * (i + 0.5)
+        row_dom = 2 * math.pi * (math.sin(alpha * (i + 1)) - math.sin(alpha * i)) / \
+            ninrow
+        for j in range(ninrow):
+            alt.append(row_alt)
+            azi.append(2 * math.pi * j / ninrow)
+            dom.append(row_dom)
+    alt.append(math.pi / 2)
+    azi.append(0)
+    dom.append(2 * math.pi * (1 - math.cos(alpha * 0.5)))
+    patches = (alt.tolist(), azi.tolist(), dom.tolist())
+    _PATCHES[m] = patches
+    return patches
+
+
+def _vector(altitude, azimuth):
+    """Direction vector from altitude and azimuth (from north towards east)."""
+    cos_alt = math.cos(altitude)
+    return cos_alt * math.sin(azimuth), cos_alt * math.cos(azimuth), \
+        math.sin(altitude)
+
+
+class SkyMatrix(object):
+    """Perez all-weather sky matrix generator.
+
+    Args:
+        wea: A Wea object.
+
+    Properties:
+        * wea
+        * altitudes
+        * azimuths
+    """
+
+    __slots__ = ('_wea', '_julian_dates', '_altitudes', '_azimuths')
+
+    def __init__(self, wea):
+        if not isinstance(wea, Wea):
+            raise ValueError('Expected Wea not {}'.format(type(wea)))
+        self._wea = wea
+        self._julian_dates, self._altitudes, self._azimuths = solar_positions(
+            wea.months, wea.days, wea.hours, wea.latitude, wea.longitude, wea.time_zone
+        )
+
+    @classmethod
+    def from_wea(cls, wea_file, cache=False):
+        """Create a sky matrix generator from a wea file.
+
+        Args:
+            wea_file: Path to a wea file.
+            cache: Set to True to use a binary cache of the wea file values. This is
+                useful when several sky matrices are generated from the same weather
+                file (Default: False).
+        """
+        return cls(Wea.from_file(wea_file, cache))
+
+    @property
+    def wea(self):
+        """Input weather data."""
+        return self._wea
+
+    @property
+    def altitudes(self):
+        """Solar altitudes in radians for each time step."""
+        return self._altitudes
+
+    @property
+    def azimuths(self):
+        """Solar azimuths in radians for each time step.
+
+        Azimuth is measured from south with positive values to the west.
+        """
+        return self._azimuths
+
+    def compute(self, options=None):
+        """Compute sky patch values for all the time steps.
+
+        Options -m, -d, -s, -u, -A, -c, -g, -r and -O are used from the input options.
+        All the other options are ignored.
+
+        Args:
+            options: GendaymtxOptions. It will be set to Radiance default values if
+                unspecified.
+
+        Returns:
+            A list of columns, one for each time step. Each column is an array of
+            RGB values for each sky patch starting from the ground.
+        """
+        values = self._compute(options)
+        if np is None:
+            return values
+        return [_float_array(row) for row in values]
+
+    def _compute(self, options=None):
+        """Compute sky patch values as a NumPy array with a row for each time step.
+
+        A list of columns is returned if NumPy is not available.
+        """
+        if options is None:
+            options = GendaymtxOptions()
+        elif not isinstance(options, GendaymtxOptions):
+            raise ValueError('Expected GendaymtxOptions not {}'.format(type(options)))
+
+        m = options.m.value or 1
+        sky_color = options.c.value or SKY_COLOR
+        ground_color = options.g.value or GROUND_COLOR
+        sun_color = (1.0, 1.0, 1.0)
+        if options.d.value:
+            sky_color = ground_color = (0, 0, 0)
+        if options.s.value:
+            sun_color = (0, 0, 0)
+        sky_on = 0.265074126 * sky_color[0] + 0.670114631 * sky_color[1] + \
+            0.064811243 * sky_color[2] > 1e-4
+        conditions = self._conditions(options)
+        colors = (sky_color if sky_on else None, ground_color, sun_color)
+
+        if np is not None:
+            values = _compute_numpy(conditions, m, *colors)
+            if options.A.value and len(values):
+                values = values.mean(axis=0, dtype=np.float64, keepdims=True)
+                values = values.astype(np.float32)
+            return values
+
+        columns = _compute_python(conditions, m, *colors)
+        if options.A.value and columns:
+            count = len(columns[0])
+            average = [0.0] * count
+            for column in columns:
+                for i, v in enumerate(column):
+                    average[i] += v
+            columns = [array('f', [v / len(columns) for v in average])]
+        return columns
+
+    def _conditions(self, options):
+        """Yield sky conditions for the time steps that are included in the output.
+
+        Each item is a tuple of time step index, solar altitude, rotated solar azimuth,
+        sun zenith angle for the Perez model, sky brightness, sky clearness, direct
+        normal illuminance and diffuse horizontal illuminance. The last five values are
+        None for time steps with no daylight.
+        """
+        wea = self._wea
+        rotation = math.radians(options.r.value or 0)
+        solar_radiance = options.O.value == '1'
+        photometric = wea.units == 3
+        horizontal = wea.units == 2
+        sun_up_only = bool(options.u.value)
+        half_sun = math.radians(SUN_ANGLE / 2)
+        for count, (jd, altitude, s_azimuth, direct, diffuse) in enumerate(zip(
+                self._julian_dates, self._altitudes, self._azimuths, wea.direct,
+                wea.diffuse)):
+            if sun_up_only and altitude <= -half_sun:
+                continue
+            azimuth = s_azimuth + math.pi - rotation
+            if direct + diffuse <= 1e-4:
+                yield count, altitude, azimuth, None, None, None, None, None
+                continue
+            if horizontal and altitude > 0:
+                direct /= math.sin(altitude)
+            zenith = perez.sun_zenith(altitude)
+            brightness, clearness, dir_ill, dif_ill, dir_irr, dif_irr = \
+                perez.sky_condition(direct, diffuse, zenith, jd, photometric)
+            if solar_radiance:
+                dif_ill = dif_irr * perez.WHITE_EFFICACY
+                dir_ill = dir_irr * perez.WHITE_EFFICACY
+            yield count, altitude, azimuth, zenith, brightness, clearness, dir_ill, \
+                dif_ill
+
+    def suns(self, options=None):
+        """Get the position and radiance of the sun for each time step.
+
+        This is the equivalent of the sun descriptions that gendaymtx writes with the
+        -D option. Only the time steps where some portion of the sun is above the
+        horizon are included. Options -d, -s, -u, -r and -O are used from the input
+        options.
+
+        Args:
+            options: GendaymtxOptions. It will be set to Radiance default values if
+                unspecified.
+
+        Returns:
+            A list of (minute, vector, radiance) tuples. The minute is counted from
+            midnight of January 1st and can be used to name the sun. Vector is the
+            direction towards the sun and radiance is a single value for the solar
+            radiance. Radiance will be zero if there is no direct value in weather data.
+        """
+        if options is None:
+            options = GendaymtxOptions()
+        half_sun = math.radians(SUN_ANGLE / 2)
+        sun_sa = 2 * math.pi * (1 - math.cos(half_sun))
+        factor = 0 if options.s.value else 1 / (perez.WHITE_EFFICACY * sun_sa)
+        suns = []
+        for count, altitude, azimuth, zenith, _, _, dir_ill, _ in \
+                self._conditions(options):
+            if altitude <= -half_sun:
+                continue
+            minute = int(round(
+                ((self._julian_dates[count] - 1) * 24 + self._wea.hours[count]) * 60
+            ))
+            radiance = 0 if zenith is None or dir_ill < 1e-4 else dir_ill * factor
+            suns.append((minute, _vector(altitude, azimuth), radiance))
+        return suns
+
+    def write_suns(self, sun_file, modifier_file=None, options=None):
+        """Write sun descriptions and sun modifiers to files.
+
+        This is the equivalent of the -D and -M options of gendaymtx. The sun file can
+        be used together with the modifier file in rcontrib to generate sun matrices.
+
+        Args:
+            sun_file: Path to output file for sun descriptions.
+            modifier_file: Optional path to output file for the list of sun modifiers.
+            options: GendaymtxOptions. It will be set to Radiance default values if
+                unspecified.
+
+        Returns:
+            Path to sun file.
+        """
+        suns = self.suns(options)
+        with open(sun_file, 'w') as outf:
+            for minute, (x, y, z), rad in suns:
+                outf.write(
+                    '\nvoid light solar%d\n0\n0\n3 %.3e %.3e %.3e\n'
+                    '\nsolar%d source sun%d\n0\n0\n4 %.6f %.6f %.6f %.4f\n'
+                    % (minute, rad, rad, rad, minute, minute, x, y, z, SUN_ANGLE)
+                )
+        if modifier_file:
+            with open(modifier_file, 'w') as outf:
+                outf.write(''.join('solar%d\n' % sun[0] for sun in suns))
+        return sun_file
+
+    def to_file(self, output, options=None):
+        """Write the sky matrix to a file.
+
+        The output matches the output of gendaymtx and respects -h and -o options. If
+        -D is set the sun descriptions are also written to file. See write_suns for
+        more information.
+
+        Args:
+            output: Path to output file.
+            options: GendaymtxOptions. It will be set to Radiance default values if
+                unspecified.
+
+        Returns:
+            Path to output file or None if -n option is set.
+        """
+        if options is None:
+            options = GendaymtxOptions()
+        if options.D.is_set:
+            self.write_suns(
+                typing.unquote(options.D.value),
+                typing.unquote(options.M.value) if options.M.is_set else None, options
+            )
+        if options.n.value:
+            return None
+        values = self._compute(options)
+        count = len(sky_patches(options.m.value or 1)[0])
+        steps = len(values)
+        fmt = options.o.value
+        fmt_name = {'f': 'float', 'd': 'double'}.get(fmt, 'ascii')
+
+        with open(output, 'wb') as outf:
+            if not options.h.value:
+                header = [
+                    '#?RADIANCE',
+                    ' '.join(('gendaymtx', options.to_radiance())).strip(),
+                    'LATLONG= %.8f %.8f' % (self._wea.latitude, -self._wea.longitude),
+                    'NROWS=%d' % count,
+                    'NCOLS=%d' % steps,
+                    'NCOMP=3'
+                ]
+                if fmt_name != 'ascii':
+                    header.append(
+                        'BYTEORDER=%s' % (
+                            'LittleEndian' if sys.byteorder == 'little'
+                            else 'BigEndian'
+                        )
+                    )
+                header.append('FORMAT=%s' % fmt_name)
+                outf.write(('\n'.join(header) + '\n\n').encode('ascii'))
+
+            # each row of the output is a sky patch with a column for each time step
+            row_format = '%.3g %.3g %.3g\n' * steps
+            if steps > 1:
+                row_format += '\n'
+            if np is not None:
+                rows = values.reshape(steps, count, 3).transpose(1, 0, 2)
+                if fmt_name != 'ascii':
+                    rows.astype(np.float32 if fmt == 'f' else np.float64).tofile(outf)
+                    return output
+                rows = (row.ravel().tolist() for row in rows)
+            else:
+                rows = (_patch_row(values, i) for i in range(count))
+            for row in rows:
+                if fmt_name == 'ascii':
+                    outf.write((row_format % tuple(row)).encode('ascii'))
+                else:
+                    array('f' if fmt == 'f' else 'd', row).tofile(outf)
+        return output
+
+
+def _compute_python(conditions, m, sky_color, ground_color, sun_color):
+    """Compute sky patch values for each time step in pure Python.
+
+    sky_color is None if the sky is turned off. See SkyMatrix._conditions for the
+    format of the conditions.
+    """
+    alts, azis, doms = sky_patches(m)
+    count = len(alts)
+    # pre-compute patch values that don't change between time steps. The patches in
+    # each row have the same altitude and share the gradation term of the Perez
+    # model.
+    sky_alts = alts[1:]
+    cos_zen = [math.sin(a) for a in sky_alts]
+    sin_zen = [math.cos(a) for a in sky_alts]
+    zen_x = [s * math.cos(z) for s, z in zip(sin_zen, azis[1:])]
+    zen_y = [s * math.sin(z) for s, z in zip(sin_zen, azis[1:])]
+    rows = []
+    for alt in sky_alts:
+        if rows and rows[-1][0] == alt:
+            rows[-1][1] += 1
+        else:
+            rows.append([alt, 1])
+    rows = [(1 / math.sin(alt), n) for alt, n in rows]
+    h_weight = [c * d for c, d in zip(cos_zen, doms[1:])]
+    patch_vectors = [_vector(a, z) for a, z in zip(alts, azis)]
+    zeros = [0.0] * (3 * count)
+    exp, acos = math.exp, math.acos
+
+    columns = []
+    for _, altitude, azimuth, zenith, brightness, clearness, dir_ill, dif_ill \
+            in conditions:
+        if zenith is None:
+            columns.append(array('f', zeros))
+            continue
+        values = list(zeros)
+        if sky_color is not None:
+            # ground patch including the solar contribution
+            ground = dif_ill
+            if altitude > 0:
+                ground += dir_ill * math.sin(altitude)
+            ground *= 1 / math.pi / perez.WHITE_EFFICACY
+            values[0] = ground * ground_color[0]
+            values[1] = ground * ground_color[1]
+            values[2] = ground * ground_color[2]
+
+            # relative luminance for sky patches
+            a, b, c, d, e = perez.perez_parameters(clearness, brightness, zenith)
+            cos_sz, sin_sz = math.cos(zenith), math.sin(zenith)
+            sun_x, sun_y = sin_sz * math.cos(azimuth), sin_sz * math.sin(azimuth)
+            gradation = []
+            for inv_cos_zen, n in rows:
+                gradation += [1.0 + a * exp(b * inv_cos_zen)] * n
+            gammas = [
+                cos_sz * cz + sun_x * x + sun_y * y
+                for cz, x, y in zip(cos_zen, zen_x, zen_y)
+            ]
+            if max(gammas) > 1 or min(gammas) < -1:
+                gammas = [1.0 if g > 1 else -1.0 if g < -1 else g for g in gammas]
+            lum = [
+                f * (1.0 + c * exp(d * acos(g)) + e * g * g)
+                for f, g in zip(gradation, gammas)
+            ]
+            if min(lum) < 0:
+                lum = [v if v > 0 else 0.0 for v in lum]
+            total = sum(v * w for v, w in zip(lum, h_weight))
+            if total <= 1e-6:
+                # zero sky - make it uniform
+                lum = [1.0] * (count - 1)
+                total = math.pi
+            norm = dif_ill / total / perez.WHITE_EFFICACY
+            for k in range(3):
+                factor = norm * sky_color[k]
+                values[3 + k::3] = [v * factor for v in lum]
+
+        if dir_ill >= 1e-4:
+            _add_direct(
+                values, dir_ill, _vector(altitude, azimuth), patch_vectors, doms,
+                sun_color
+            )
+        columns.append(array('f', values))
+    return columns
+
+
+def _compute_numpy(conditions, m, sky_color, ground_color, sun_color):
+    """Compute sky patch values for all the time steps with NumPy.
+
+    The time steps are computed in blocks to limit the memory use. See _compute_python
+    for the inputs.
+
+    Returns:
+        A float32 array with a row of RGB values for each time step.
+    """
+    alts, azis, doms = (np.array(v) for v in sky_patches(m))
+    count = len(alts)
+    conditions = list(conditions)
+    values = np.zeros((len(conditions), count, 3), dtype=np.float32)
+    days = [i for i, c in enumerate(conditions) if c[3] is not None]
+
+    cos_zen = np.sin(alts[1:])
+    sin_zen = np.cos(alts[1:])
+    zen_x = sin_zen * np.cos(azis[1:])
+    zen_y = sin_zen * np.sin(azis[1:])
+    inv_cos_zen = 1 / cos_zen
+    h_weight = cos_zen * doms[1:]
+    cos_alts = np.cos(alts)
+    patch_vectors = np.stack(
+        (cos_alts * np.sin(azis), cos_alts * np.cos(azis), np.sin(alts)), axis=1
+    )
+    step = max(_BLOCK_SIZE // count, 1)
+    for start in range(0, len(days), step):
+        block = np.array(days[start:start + step])
+        altitude, azimuth, zenith, brightness, clearness, dir_ill, dif_ill = \
+            np.array([conditions[i][1:] for i in block], dtype=np.float64).T
+        block_values = np.zeros((len(block), count, 3))
+        if sky_color is not None:
+            # ground patch including the solar contribution
+            ground = dif_ill + np.where(altitude > 0, dir_ill * np.sin(altitude), 0.0)
+            ground *= 1 / math.pi / perez.WHITE_EFFICACY
+            block_values[:, 0] = ground[:, None] * ground_color
+
+            # relative luminance for sky patches
+            a, b, c, d, e = np.array([
+                perez.perez_parameters(cl, br, ze) for cl, br, ze
+                in zip(clearness.tolist(), brightness.tolist(), zenith.tolist())
+            ]).T[:, :, None]
+            sin_sz = np.sin(zenith)
+            gammas = np.cos(zenith)[:, None] * cos_zen + \
+                (sin_sz * np.cos(azimuth))[:, None] * zen_x + \
+                (sin_sz * np.sin(azimuth))[:, None] * zen_y
+            np.clip(gammas, -1.0, 1.0, out=gammas)
+            lum = (1.0 + a * np.exp(b * inv_cos_zen)) * \
+                (1.0 + c * np.exp(d * np.arccos(gammas)) + e * gammas * gammas)
+            lum[lum < 0] = 0.0
+            total = lum.dot(h_weight)
+            # zero sky - make it uniform
+            zero = total <= 1e-6
+            lum[zero] = 1.0
+            total[zero] = math.pi
+            norm = dif_ill / total / perez.WHITE_EFFICACY
+            block_values[:, 1:] = lum[:, :, None] * \
+                (norm[:, None] * np.array(sky_color))[:, None, :]
+
+        # direct solar component for the sky patches closest to the sun
+        sun = np.nonzero(dir_ill >= 1e-4)[0]
+        if len(sun):
+            cos_alt = np.cos(altitude[sun])
+            sun_vectors = np.stack((
+                cos_alt * np.sin(azimuth[sun]), cos_alt * np.cos(azimuth[sun]),
+                np.sin(altitude[sun])
+            ), axis=1)
+            dots = sun_vectors.dot(patch_vectors.T)
+            # the first patch is the ground
+            dots[:, 0] = -2.0
+            nearest = np.argpartition(-dots, _SUN_PATCHES - 1, axis=1)[:, :_SUN_PATCHES]
+            weights = 1.0 / (1.002 - np.take_along_axis(dots, nearest, axis=1))
+            total = weights.sum(axis=1)
+            direct = weights * (dir_ill[sun] / (perez.WHITE_EFFICACY * total))[:, None] \
+                / doms[nearest]
+            block_values[sun[:, None], nearest] += direct[:, :, None] * sun_color
+        values[block] = block_values
+    return values.reshape(len(conditions), 3 * count)
+
+
+def _float_array(values):
+    """Convert a row of a float32 NumPy array to an array of floats."""
+    column = array('f')
+    column.frombytes(values.tobytes())
+    return column
+
+
+def _patch_row(columns, index):
+    """Get the RGB values of a sky patch for all the time steps."""
+    row = [0.0] * (3 * len(columns))
+    s = 3 * index
+    for k in range(3):
+        row[k::3] = [col[s + k] for col in columns]
+    return row
+
+
+def _add_direct(values, dir_ill, sun_vector, patch_vectors, doms, sun_color):
+    """Add the direct solar component to the sky patches closest to the sun."""
+    sx, sy, sz = sun_vector
+    dots = [px * sx + py * sy + pz * sz for px, py, pz in patch_vectors]
+    # the first patch is the ground
+    dots[0] = -2.0
+    nearest = heapq.nlargest(_SUN_PATCHES, range(len(dots)), key=dots.__getitem__)
+    weights = [1.0 / (1.002 - dots[p]) for p in nearest]
+    total = sum(weights)
+    for wt, p in zip(weights, nearest):
+        value = wt * dir_ill / (perez.WHITE_EFFICACY * total) / doms[p]
+        values[3 * p] += value * sun_color[0]
+        values[3 * p + 1] += value * sun_color[1]
+        values[3 * p + 2] += value * sun_color[2]
+
+
+def gendaymtx(wea_file, output, options=None, cache=False):
+    """Generate a sky matrix from a wea file in-process.
+
+    This function is the in-process equivalent of
+    ``gendaymtx [options] wea_file > output``.
+
+    Args:
+        wea_file: Path to a wea file.
+        output: Path to output file.
+        options: GendaymtxOptions. It will be set to Radiance default values if
+            unspecified.
+        cache: Set to True to use a binary cache of the wea file values
+            (Default: False).
+
+    Returns:
+        Path to output file.
+    """
+    return SkyMatrix.from_wea(wea_file, cache).to_file(output, options)
@@ -0,0 +1,344 @@
+"""Reader for the text header of Radiance files.
+
+Radiance pictures, matrices and octrees start with a few lines of text that describe
+the content of the file. The header starts with a line like ``#?RADIANCE`` and ends
+with an empty line. Lines in the ``NAME=value`` format are fields (e.g. ``NROWS=145``
+or ``FORMAT=float``) and the other lines are usually the commands that created the
+file. Pictures also have a resolution string right after the header.
+
+.. code-block:: shell
+
+    #?RADIANCE
+    rfluxmtx -ab 3 -ad 5000 -lw 2e-05 -c 1000 ...
+    NROWS=145
+    NCOLS=146
+    NCOMP=3
+    FORMAT=float
+
+The header is read with a bounded read and the body of the file is not loaded. The
+functions in this module also replace the most common uses of getinfo. The body of a
+file is copied to the output by the operating system (copy_file_range or sendfile)
+when it is supported.
+
+Usage:
+
+.. code-block:: python
+
+    from honeybee_radiance_command.native.header import read_header, strip_header
+
+    header = read_header('daylight.mtx')
+    print(header.fields['NROWS'])
+    print(header.shape)  # (145, 146, 3)
+
+    # same as getinfo - < daylight.mtx > daylight.dat
+    strip_header('daylight.mtx', 'daylight.dat')
+"""
+import os
+import re
+import shutil
+import sys
+
+try:
+    basestring
+except NameError:
+    basestring = str
+
+MAX_HEADER_SIZE = 1 << 20
+"""Maximum number of bytes that are read to find the end of a header."""
+
+PICTURE_FORMATS = ('32-bit_rle_rgbe', '32-bit_rle_xyze')
+"""Format of Radiance pictures."""
+
+_CHUNK_SIZE = 8192
+_FIELD_PATTERN = re.compile(r'^\s*([A-Za-z][\w-]*)\s*=(.*)$')
+_RESOLUTION_PATTERN = re.compile(r'^([-+][XY]) (\d+) ([-+][XY]) (\d+)$')
+
+
+class Header(object):
+    """Header of a Radiance file.
+
+    Args:
+        lines: A list of header lines without the line breaks. The first line is the
+            magic line (e.g. #?RADIANCE) if the file has one.
+        size: Number of bytes in the header including the empty line at the end. The
+            body of the file starts at this offset.
+        resolution: Resolution string of a picture (e.g. -Y 480 +X 640) or None.
+
+    Properties:
+        * lines
+        * magic
+        * size
+        * fields
+        * resolution
+        * format
+        * shape
+    """
+
+    __slots__ = ('_lines', '_size', '_resolution', '_fields')
+
+    def __init__(self, lines, size, resolution=None):
+        self._lines = tuple(lines)
+        self._size = size
+        self._resolution = resolution
+        fields = []
+        for line in self._lines:
+            match = _FIELD_PATTERN.match(line)
+            if match:
+                fields.append((match.group(1), match.group(2).strip()))
+        self._fields = tuple(fields)
+
+    @property
+    def lines(self):
+        """A tuple of header lines."""
+        return self._lines
+
+    @property
+    def magic(self):
+        """The magic line that identifies the file (e.g. #?RADIANCE) or None."""
+        if self._lines and self._lines[0].startswith('#?'):
+            return self._lines[0]
+        return None
+
+    @property
+    def size(self):
+        """Number of bytes in the header. The body of the file starts at this offset."""
+        return self._size
+
+    @property
+    def fields(self):
+        """A dictionary of header fields.
+
+        If a field is repeated in the header the last value is used. Use the values
+        method to get all the values for a field.
+        """
+        return dict(self._fields)
+
+    @property
+    def resolution(self):
+        """Resolution string of a picture or None."""
+        return self._resolution
+
+    @property
+    def format(self):
+        """Value of the FORMAT field or None."""
+        return self.get('FORMAT')
+
+    @property
+    def shape(self):
+        """A tuple of number of rows, columns and components.
+
+        The values that are not in the header are None. For pictures the number of
+        rows is the number of scanlines and the number of columns is the length of each
+        scanline with three components.
+        """
+        if self.format in PICTURE_FORMATS and self._resolution:
+            values = self._resolution.split()
+            return int(values[1]), int(values[3]), 3
+        return tuple(
+            _int(self.get(key)) for key in ('NROWS', 'NCOLS', 'NCOMP')
+        )
+
+    def get(self, key, default=None):
+        """Get the last value of a header field.
+
+        Args:
+            key: Field name (e.g. NROWS).
+            default: The value that is returned if the field is not in the header.
+        """
+        for name, value in reversed(self._fields):
+            if name == key:
+                return value
+        return default
+
+    def values(self, key):
+        """Get all the values of a header field in the order they appear."""
+        return [value for name, value in self._fields if name == key]
+
+    def __repr__(self):
+        return '\n'.join(self._lines)
+
+
+def _int(value):
+    """Convert a header value to an integer or None if the value is missing."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _read_header(stream, max_size=MAX_HEADER_SIZE):
+    """Read a header from a binary stream.
+
+    The stream must be at the start of the file. The bytes after the header are not
+    guaranteed to be read which means the position of the stream after this function is
+    not defined.
+    """
+    data = stream.read(2)
+    if data != b'#?':
+        # files without a header such as ascii matrices
+        return Header([], 0)
+    end = -1
+    while end == -1:
+        chunk = stream.read(_CHUNK_SIZE)
+        if not chunk:
+            raise ValueError('The end of the header was not found.')
+        start = max(len(data) - 1, 0)
+        data += chunk
+        end = data.find(b'\n\n', start)
+        if end == -1 and len(data) > max_size:
+            raise ValueError(
+                'The header is larger than the maximum size: %d bytes.' % max_size
+            )
+    size = end + 2
+    lines = data[:end].decode('latin-1').split('\n')
+    lines = [line.rstrip('\r') for line in lines]
+
+    # look for the resolution string of pictures
+    resolution = None
+    body = data[size:size + 64]
+    if len(body) < 64:
+        body += stream.read(64 - len(body))
+    line = body.split(b'\n', 1)[0].decode('latin-1')
+    if _RESOLUTION_PATTERN.match(line):
+        resolution = line
+    return Header(lines, size, resolution)
+
+
+def read_header(file_path, max_size=MAX_HEADER_SIZE):
+    """Read the header of a Radiance file.
+
+    Args:
+        file_path: Path to a Radiance picture, matrix or octree.
+        max_size: Maximum number of bytes that are read to find the end of the header.
+            A ValueError is raised for larger headers (Default: 1 MB).
+
+    Returns:
+        A Header. The header is empty for files without a header.
+    """
+    with open(file_path, 'rb') as inf:
+        return _read_header(inf, max_size)
+
+
+def info(file_path, name=None, max_size=MAX_HEADER_SIZE):
+    """Get the header of a file in the same format as getinfo.
+
+    Args:
+        file_path: Path to a Radiance picture, matrix or octree.
+        name: Name of the file in the output. By default file_path is used.
+        max_size: Maximum number of bytes that are read to find the end of the header.
+
+    Returns:
+        The name of the file and the header lines indented with a tab. The text ends
+        with an empty line.
+    """
+    header = read_header(file_path, max_size)
+    lines = ['%s:' % (name or file_path)] + ['\t%s' % line for line in header.lines]
+    return '\n'.join(lines) + '\n\n'
+
+
+def _copy_body(inf, outf, offset):
+    """Copy the content of a file from an offset to the end to another file.
+
+    The content is copied by the operating system if possible and is copied in chunks
+    otherwise. Both files must be opened in binary mode.
+    """
+    outf.flush()
+    try:
+        in_fd = inf.fileno()
+        out_fd = outf.fileno()
+        count = os.fstat(in_fd).st_size - offset
+    except (AttributeError, OSError, IOError, ValueError):
+        # file-like objects without a file descriptor
+        in_fd = None
+    if in_fd is not None:
+        for name in ('copy_file_range', 'sendfile'):
+            method = getattr(os, name, None)
+            if method is None:
+                continue
+            copied = 0
+            try:
+                while copied < count:
+                    if name == 'sendfile':
+                        sent = method(out_fd, in_fd, offset + copied, count - copied)
+                    else:
+                        sent = method(in_fd, out_fd, count - copied, offset + copied)
+                    if sent == 0:
+                        break
+                    copied += sent
+            except OSError:
+                if copied:
+                    raise
+                # not supported for these files (e.g. sendfile to a file on Mac)
+                continue
+            return
+    inf.seek(offset)
+    shutil.copyfileobj(inf, outf)
+
+
+def _output_file(output):
+    """Open an output file or use the stdout if output is None."""
+    if output is None:
+        stdout = sys.stdout
+        stdout.flush()
+        return getattr(stdout, 'buffer', stdout), False
+    if isinstance(output, basestring):
+        return open(output, 'wb'), True
+    return output, False
+
+
+def strip_header(file_path, output=None, max_size=MAX_HEADER_SIZE):
+    """Copy the body of a file without the header.
+
+    This function is the same as getinfo - < file_path > output. The resolution string
+    of pictures is part of the body and is not removed.
+
+    Args:
+        file_path: Path to a Radiance file.
+        output: Path to the output file or a file object in binary mode. The output is
+            written to stdout if output is None (Default: None).
+        max_size: Maximum number of bytes that are read to find the end of the header.
+
+    Returns:
+        The header of the input file.
+    """
+    with open(file_path, 'rb') as inf:
+        header = _read_header(inf, max_size)
+        outf, close = _output_file(output)
+        try:
+            _copy_body(inf, outf, header.size)
+        finally:
+            if close:
+                outf.close()
+    return header
+
+
+def add_header_lines(file_path, lines, output=None, max_size=MAX_HEADER_SIZE):
+    """Copy a file and add lines to the end of its header.
+
+    This function is the same as getinfo -a lines < file_path > output.
+
+    Args:
+        file_path: Path to a Radiance file.
+        lines: A list of lines to add to the header.
+        output: Path to the output file or a file object in binary mode. The output is
+            written to stdout if output is None (Default: None).
+        max_size: Maximum number of bytes that are read to find the end of the header.
+    """
+    with open(file_path, 'rb') as inf:
+        header = _read_header(inf, max_size)
+        inf.seek(0)
+        head = inf.read(max(header.size - 1, 0))
+        if not header.size:
+            head = b'#?RADIANCE\n'
+        outf, close = _output_file(output)
+        try:
+            outf.write(head)
+            for line in lines:
+                outf.write(('%s\n' % line).encode('latin-1'))
+            outf.write(b'\n')
+            _copy_body(inf, outf, header.size)
+        finally:
+            if close:
+                outf.close()
@@ -0,0 +1,335 @@
+"""In-process evaluator for common pcomb calculations.
+
+Pcomb is mostly used to scale pictures, to add or subtract them and to get the
+luminance of a picture. This module runs these calculations on pictures that are loaded
+with honeybee_radiance_command.native.rgbe without starting a pcomb process for each
+picture.
+
+Expressions are translated to Python once and are evaluated for all the pixels in a
+single pass. The supported expressions are assignments to the output channels (ro, go
+and bo) and to intermediate variables using numbers, the WE and PI constants, the input
+channels (ri(n), gi(n), bi(n) and li(n)), parentheses and the + - * / ^ operators. A
+ValueError is raised for other expressions and the pcomb command should be used
+instead.
+
+Usage:
+
+.. code-block:: python
+
+    from honeybee_radiance_command.native.pcomb import combine
+    from honeybee_radiance_command.native.rgbe import Picture
+
+    pictures = [Picture.from_file(f) for f in ('total.hdr', 'direct.hdr')]
+    # subtract the direct contribution and convert to luminance
+    result = combine(
+        pictures, 'l=li(1)-li(2);ro=l*WE;go=l*WE;bo=l*WE'
+    )
+    result.to_file('diffuse_luminance.hdr')
+"""
+import re
+from array import array
+
+from .rgbe import Picture
+
+CONSTANTS = {'WE': 179.0, 'PI': 3.14159265358979323846}
+"""Constants that can be used in expressions."""
+
+LUMINANCE = (0.265074126, 0.670114631, 0.064811243)
+"""RGB coefficients for luminance which are used for li(n)."""
+
+_OUTPUTS = ('ro', 'go', 'bo')
+_CHANNELS = ('r', 'g', 'b')
+_TOKEN_PATTERN = re.compile(
+    r'\s*(?:(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)'
+    r'|(?P<name>[A-Za-z_][\w.]*)|(?P<operator>[-+*/^(),]))'
+)
+
+
+def _div(a, b):
+    """Division that returns 0 for division by zero similar to pcomb with -w."""
+    return a / b if b else 0.0
+
+
+def _pow(a, b):
+    """Power that returns 0 for invalid results similar to the warnings of pcomb."""
+    try:
+        result = a ** b
+    except (OverflowError, ZeroDivisionError, ValueError):
+        return 0.0
+    # negative numbers to a fractional power are complex numbers in Python 3
+    return 0.0 if isinstance(result, complex) else result
+
+
+def _tokens(expression):
+    """Split an expression to a list of (kind, value) tuples."""
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN_PATTERN.match(expression, position)
+        if not match:
+            raise ValueError(
+                'Unsupported pcomb expression: %s' % expression[position:].strip()
+            )
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return tokens
+
+
+class _Parser(object):
+    """Translate the tokens of a pcomb expression to a Python expression."""
+
+    __slots__ = ('tokens', 'index', 'variables', 'inputs')
+
+    def __init__(self, tokens, variables):
+        self.tokens = tokens
+        self.index = 0
+        self.variables = variables
+        self.inputs = set()
+
+    def peek(self):
+        if self.index < len(self.tokens):
+            return self.tokens[self.index][1]
+        return None
+
+    def take(self, value=None):
+        if self.index >= len(self.tokens):
+            raise ValueError('Unexpected end of the pcomb expression.')
+        token = self.tokens[self.index]
+        if value is not None and token[1] != value:
+            raise ValueError('Expected "%s" but got "%s".' % (value, token[1]))
+        self.index += 1
+        return token
+
+    def parse(self):
+        result = self.sum()
+        if self.index != len(self.tokens):
+            raise ValueError('Unsupported pcomb expression near: %s' % self.peek())
+        return result
+
+    def sum(self):
+        result = self.product()
+        while self.peek() in ('+', '-'):
+            operator = self.take()[1]
+            result = '(%s %s %s)' % (result, operator, self.product())
+        return result
+
+    def product(self):
+        result = self.unary()
+        while self.peek() in ('*', '/'):
+            operator = self.take()[1]
+            value = self.unary()
+            if operator == '*':
+                result = '(%s * %s)' % (result, value)
+            else:
+                result = '_div(%s, %s)' % (result, value)
+        return result
+
+    def unary(self):
+        if self.peek() in ('+', '-'):
+            operator = self.take()[1]
+            return '(%s%s)' % (operator, self.unary())
+        return self.power()
+
+    def power(self):
+        base = self.atom()
+        if self.peek() == '^':
+            self.take()
+            # the power operator is right associative
+            return '_pow(%s, %s)' % (base, self.unary())
+        return base
+
+    def atom(self):
+        kind, value = self.take()
+        if kind == 'number':
+            return repr(float(value))
+        if value == '(':
+            result = self.sum()
+            self.take(')')
+            return result
+        if kind != 'name':
+            raise ValueError('Unsupported pcomb expression near: %s' % value)
+        if self.peek() == '(':
+            return self.function(value)
+        if value in self.variables:
+            code, inputs = self.variables[value]
+            self.inputs.update(inputs)
+            return '(%s)' % code
+        if value in CONSTANTS:
+            return repr(CONSTANTS[value])
+        raise ValueError('Unsupported name in pcomb expression: %s' % value)
+
+    def function(self, name):
+        if name not in ('ri', 'gi', 'bi', 'li'):
+            raise ValueError('Unsupported function in pcomb expression: %s' % name)
+        self.take('(')
+        kind, value = self.take()
+        self.take(')')
+        if kind != 'number' or not value.isdigit() or int(value) < 1:
+            raise ValueError('Unsupported input for %s in pcomb expression.' % name)
+        index = int(value)
+        if name == 'li':
+            self.inputs.update([('r', index), ('g', index), ('b', index)])
+            return '(%r * r%d + %r * g%d + %r * b%d)' % (
+                LUMINANCE[0], index, LUMINANCE[1], index, LUMINANCE[2], index
+            )
+        self.inputs.add((name[0], index))
+        return '%s%d' % (name[0], index)
+
+
+class Expression(object):
+    """A pcomb expression that is translated to Python.
+
+    Args:
+        expression: A pcomb expression (e.g. ro=ri(1)*2;go=gi(1)*2;bo=bi(1)*2). Output
+            channels that are not assigned in the expression are calculated as the sum
+            of the inputs similar to pcomb.
+
+    Properties:
+        * expression
+        * outputs
+        * inputs
+    """
+
+    __slots__ = ('_expression', '_outputs', '_inputs', '_functions')
+
+    def __init__(self, expression):
+        self._expression = expression
+        variables = {}
+        outputs = {}
+        inputs = set()
+        for statement in expression.split(';'):
+            if not statement.strip():
+                continue
+            if statement.count('=') != 1:
+                raise ValueError('Unsupported pcomb statement: %s' % statement)
+            name, value = (v.strip() for v in statement.split('='))
+            if not re.match(r'^[A-Za-z_][\w.]*$', name) or name in CONSTANTS:
+                raise ValueError('Unsupported pcomb statement: %s' % statement)
+            parser = _Parser(_tokens(value), variables)
+            variables[name] = (parser.parse(), parser.inputs)
+            inputs.update(parser.inputs)
+            if name in _OUTPUTS:
+                outputs[name] = variables[name]
+        self._outputs = outputs
+        self._inputs = tuple(sorted(set(index for _, index in inputs)))
+        self._functions = {}
+        for name, (code, channels) in outputs.items():
+            self._functions[name] = self._compile(code, channels)
+
+    @staticmethod
+    def _compile(code, channels):
+        """Compile the code for an output channel to a function.
+
+        The function takes a dictionary of input channels (e.g. {'r1': array}) and
+        returns a list of values.
+        """
+        names = sorted('%s%d' % channel for channel in channels)
+        if not names:
+            # constant value
+            source = 'lambda channels, count: [%s] * count' % code
+        else:
+            source = 'lambda channels, count: [%s for %s in zip(%s)]' % (
+                code, ', '.join(names) + ',',
+                ', '.join('channels[%r]' % name for name in names)
+            )
+        return eval(
+            source, {'_div': _div, '_pow': _pow, '__builtins__': {'zip': zip}}
+        )
+
+    @property
+    def expression(self):
+        """The original pcomb expression."""
+        return self._expression
+
+    @property
+    def outputs(self):
+        """A tuple of output channels that are assigned in the expression."""
+        return tuple(name for name in _OUTPUTS if name in self._outputs)
+
+    @property
+    def inputs(self):
+        """A tuple of input numbers that are used in the expression (starting from 1)."""
+        return self._inputs
+
+    def evaluate(self, channels, count):
+        """Evaluate the expression.
+
+        Args:
+            channels: A dictionary of input channels. The keys are the channel and the
+                number of the input (e.g. r1, g1, b1) and the values are lists of
+                values.
+            count: Number of values in each channel.
+
+        Returns:
+            A dictionary of lists of values for the output channels in the expression.
+        """
+        return dict(
+            (name, function(channels, count))
+            for name, function in self._functions.items()
+        )
+
+
+def compile_expression(expression):
+    """Translate a pcomb expression to an Expression.
+
+    A ValueError is raised if the expression is not supported.
+    """
+    return Expression(expression)
+
+
+def combine(pictures, expression=None, coefficients=None, header=None):
+    """Combine pictures similar to pcomb.
+
+    Args:
+        pictures: A list of pictures with the same resolution.
+        expression: An optional pcomb expression or Expression. The sum of the inputs
+            is used for the output channels that are not in the expression.
+        coefficients: An optional list of RGB coefficients for each picture. The input
+            values are multiplied by the coefficients before they are used. This is the
+            same as the -s and -c options of pcomb.
+        header: An optional list of lines for the header of the output picture.
+
+    Returns:
+        A Picture.
+    """
+    if not pictures:
+        raise ValueError('At least one picture is needed for pcomb.')
+    width, height = pictures[0].width, pictures[0].height
+    for picture in pictures:
+        if picture.width != width or picture.height != height:
+            raise ValueError('Pictures must have the same resolution for pcomb.')
+    if expression is not None and not isinstance(expression, Expression):
+        expression = Expression(expression)
+    if expression is not None and expression.inputs \
+            and expression.inputs[-1] > len(pictures):
+        raise ValueError(
+            'The expression uses input %d but there are only %d pictures.'
+            % (expression.inputs[-1], len(pictures))
+        )
+    coefficients = coefficients or [None] * len(pictures)
+    count = width * height
+
+    channels = {}
+    for index, (picture, coef) in enumerate(zip(pictures, coefficients)):
+        for c, channel in enumerate(_CHANNELS):
+            values = picture.data[c::3]
+            if coef is not None and coef[c] != 1:
+                values = array('f', [v * coef[c] for v in values])
+            channels['%s%d' % (channel, index + 1)] = values
+
+    results = expression.evaluate(channels, count) if expression is not None else {}
+    data = array('f', [0.0]) * (3 * count)
+    for c, (name, channel) in enumerate(zip(_OUTPUTS, _CHANNELS)):
+        values = results.get(name)
+        if values is None:
+            # linear combination of the inputs
+            values = channels['%s1' % channel]
+            for index in range(2, len(pictures) + 1):
+                other = channels['%s%d' % (channel, index)]
+                values = [a + b for a, b in zip(values, other)]
+        data[c::3] = values if isinstance(values, array) else array('f', values)
+    return Picture(
+        width, height, data, header=header, orientation=pictures[0].orientation
+    )
@@ -0,0 +1,239 @@
+"""Perez all-weather sky model.
+
+Coefficients and equations follow the implementation in Radiance's gendaymtx.c which in
+turn is based on:
+
+    Perez, R., Seals, R. and Michalsky, J., 1993. All-weather model for sky luminance
+    distribution - preliminary configuration and validation. Solar Energy 50(3).
+
+    Perez, R., Ineichen, P., Seals, R., Michalsky, J. and Stewart, R., 1990. Modeling
+    daylight availability and irradiance components from direct and global irradiance.
+    Solar Energy 44(5).
+
+All angles are in radians.
+"""
+from __future__ import division
+
+import math
+
+SOLAR_CONSTANT_E = 1367.0
+"""Solar constant in W/m2."""
+
+SOLAR_CONSTANT_L = 127.5
+"""Solar constant in klux."""
+
+WHITE_EFFICACY = 179.0
+"""Luminous efficacy of white light used by Radiance in lm/W."""
+
+DEW_POINT = 11.0
+"""Default dew point temperature in C used to estimate precipitable water."""
+
+# upper bound of the sky clearness categories
+_CLEARNESS_BINS = (1.065, 1.230, 1.500, 1.950, 2.800, 4.500, 6.200, 12.01)
+
+# a1..a4, b1..b4, c1..c4, d1..d4, e1..e4 for each sky clearness category
+_PEREZ_COEFFICIENTS = (
+    (1.3525, -0.2576, -0.2690, -1.4366, -0.7670, 0.0007, 1.2734, -0.1233,
+     2.8000, 0.6004, 1.2375, 1.0000, 1.8734, 0.6297, 0.9738, 0.2809,
+     0.0356, -0.1246, -0.5718, 0.9938),
+    (-1.2219, -0.7730, 1.4148, 1.1016, -0.2054, 0.0367, -3.9128, 0.9156,
+     6.9750, 0.1774, 6.4477, -0.1239, -1.5798, -0.5081, -1.7812, 0.1080,
+     0.2624, 0.0672, -0.2190, -0.4285),
+    (-1.1000, -0.2515, 0.8952, 0.0156, 0.2782, -0.1812, -4.5000, 1.1766,
+     24.7219, -13.0812, -37.7000, 34.8438, -5.0000, 1.5218, 3.9229, -2.6204,
+     -0.0156, 0.1597, 0.4199, -0.5562),
+    (-0.5484, -0.6654, -0.2672, 0.7117, 0.7234, -0.6219, -5.6812, 2.6297,
+     33.3389, -18.3000, -62.2500, 52.0781, -3.5000, 0.0016, 1.1477, 0.1062,
+     0.4659, -0.3296, -0.0876, -0.0329),
+    (-0.6000, -0.3566, -2.5000, 2.3250, 0.2937, 0.0496, -5.6812, 1.8415,
+     21.0000, -4.7656, -21.5906, 7.2492, -3.5000, -0.1554, 1.4062, 0.3988,
+     0.0032, 0.0766, -0.0656, -0.1294),
+    (-1.0156, -0.3670, 1.0078, 1.4051, 0.2875, -0.5328, -3.8500, 3.3750,
+     14.0000, -0.9999, -7.1406, 7.5469, -3.4000, -0.1078, -1.0750, 1.5702,
+     -0.0672, 0.4016, 0.3017, -0.4844),
+    (-1.0000, 0.0211, 0.5025, -0.5119, -0.3000, 0.1922, 0.7023, -1.6317,
+     19.0000, -5.0000, 1.2438, -1.9094, -4.0000, 0.0250, 0.3844, 0.2656,
+     1.0468, -0.3788, -2.4517, 1.4656),
+    (-1.0500, 0.0289, 0.4260, 0.3590, -0.3250, 0.1156, 0.7781, 0.0025,
+     31.0625, -14.5000, -46.1148, 55.3750, -7.2312, 0.4050, 13.3500, 0.6234,
+     1.5000, -0.6426, 1.8564, 0.5636)
+)
+
+# luminous efficacy coefficients (a, b, c, d) for each sky clearness category
+_DIFFUSE_EFFICACY = (
+    (97.24, -0.46, 12.00, -8.91),
+    (107.22, 1.15, 0.59, -3.95),
+    (104.97, 2.96, -5.53, -8.77),
+    (102.39, 5.59, -13.95, -13.90),
+    (100.71, 5.94, -22.75, -23.74),
+    (106.42, 3.83, -36.15, -28.83),
+    (141.88, 1.90, -53.24, -14.03),
+    (152.23, 0.35, -45.27, -7.98)
+)
+
+_DIRECT_EFFICACY = (
+    (57.20, -4.55, -2.98, 117.12),
+    (98.99, -3.46, -1.21, 12.38),
+    (109.83, -4.90, -1.71, -8.81),
+    (110.34, -5.84, -1.99, -4.56),
+    (106.36, -3.97, -1.75, -6.16),
+    (107.19, -1.25, -1.51, -26.73),
+    (105.75, 0.77, -1.26, -34.44),
+    (101.18, 1.58, -1.10, -8.29)
+)
+
+
+def sun_zenith(altitude):
+    """Sun zenith angle used by the Perez model.
+
+    The sun is not allowed to dip below the horizon and is kept at least 3 degrees
+    away from the zenith to keep the circumsolar region off the zenith.
+    """
+    if altitude <= 0:
+        return math.pi / 2
+    if altitude >= math.radians(87.0):
+        return math.radians(3.0)
+    return math.pi / 2 - altitude
+
+
+def clearness_category(clearness):
+    """Sky clearness category index (0 for overcast to 7 for clear)."""
+    for index, upper in enumerate(_CLEARNESS_BINS):
+        if clearness < upper:
+            return index
+    return len(_CLEARNESS_BINS) - 1
+
+
+def air_mass(zenith):
+    """Relative optical air mass."""
+    return 1.0 / (
+        math.cos(zenith) + 0.15 * math.exp(math.log(93.885 - math.degrees(zenith))
+                                           * -1.253)
+    )
+
+
+def eccentricity(julian_date):
+    """Eccentricity correction of the Earth's orbit."""
+    day_angle = (julian_date - 1.0) * (2.0 * math.pi / 365.0)
+    return 1.00011 + 0.034221 * math.cos(day_angle) + 0.00128 * math.sin(day_angle) \
+        + 0.000719 * math.cos(2.0 * day_angle) + 0.000077 * math.sin(2.0 * day_angle)
+
+
+def precipitable_water(dew_point=DEW_POINT):
+    """Atmospheric precipitable water content in cm from dew point temperature."""
+    return math.exp(0.07 * dew_point - 0.075)
+
+
+def sky_brightness(diffuse_irradiance, zenith, julian_date):
+    """Perez sky brightness (delta)."""
+    return diffuse_irradiance * air_mass(zenith) / \
+        (SOLAR_CONSTANT_E * eccentricity(julian_date))
+
+
+def sky_clearness(diffuse_irradiance, direct_irradiance, zenith):
+    """Perez sky clearness (epsilon)."""
+    sz_cubed = zenith * zenith * zenith
+    if diffuse_irradiance <= 0:
+        return float('inf')
+    return ((diffuse_irradiance + direct_irradiance) / diffuse_irradiance
+            + 1.041 * sz_cubed) / (1.0 + 1.041 * sz_cubed)
+
+
+def diffuse_efficacy(index, zenith, brightness, water=None):
+    """Luminous efficacy of diffuse radiation in lm/W."""
+    water = precipitable_water() if water is None else water
+    a, b, c, d = _DIFFUSE_EFFICACY[index]
+    return a + b * water + c * math.cos(zenith) + d * math.log(brightness)
+
+
+def direct_efficacy(index, zenith, brightness, water=None):
+    """Luminous efficacy of direct radiation in lm/W."""
+    water = precipitable_water() if water is None else water
+    a, b, c, d = _DIRECT_EFFICACY[index]
+    return a + b * water + c * math.exp(5.73 * zenith - 5.0) + d * brightness
+
+
+def sky_condition(direct, diffuse, zenith, julian_date, photometric=False):
+    """Get Perez sky brightness and clearness and the illuminance values.
+
+    Args:
+        direct: Direct normal irradiance in W/m2 or illuminance in lux if photometric
+            is set to True.
+        diffuse: Diffuse horizontal irradiance in W/m2 or illuminance in lux if
+            photometric is set to True.
+        zenith: Sun zenith angle. Use sun_zenith to get a value from solar altitude.
+        julian_date: Day of the year.
+        photometric: Set to True if input values are illuminance values.
+
+    Returns:
+        A tuple with six values for sky brightness, sky clearness, direct normal
+        illuminance, diffuse horizontal illuminance, direct normal irradiance and
+        diffuse horizontal irradiance.
+    """
+    water = precipitable_water()
+    if not photometric:
+        direct_irr, diffuse_irr = direct, diffuse
+        brightness = max(sky_brightness(diffuse_irr, zenith, julian_date), 0.01)
+        clearness = min(max(sky_clearness(diffuse_irr, direct_irr, zenith), 1.0), 11.9)
+        index = clearness_category(clearness)
+        diffuse_ill = diffuse_irr * diffuse_efficacy(index, zenith, brightness, water)
+        direct_ill = direct_irr * direct_efficacy(index, zenith, brightness, water)
+        return brightness, clearness, direct_ill, diffuse_ill, direct_irr, diffuse_irr
+
+    # estimate irradiance values from illuminance iteratively
+    direct_ill, diffuse_ill = direct, diffuse
+    factor = SOLAR_CONSTANT_E / (SOLAR_CONSTANT_L * 1000.0)
+    diffuse_irr, direct_irr = diffuse_ill * factor, direct_ill * factor
+    brightness = max(sky_brightness(diffuse_irr, zenith, julian_date), 0.01)
+    clearness = min(sky_clearness(diffuse_irr, direct_irr, zenith), 12.0)
+    test_1 = test_2 = 0.1
+    counter = 0
+    while (abs(diffuse_irr - test_1) > 10.0 or abs(direct_irr - test_2) > 10.0) \
+            and counter != 5:
+        test_1, test_2 = diffuse_irr, direct_irr
+        counter += 1
+        index = clearness_category(clearness)
+        diffuse_irr = diffuse_ill / diffuse_efficacy(index, zenith, brightness, water)
+        direct_irr = direct_ill / direct_efficacy(index, zenith, brightness, water)
+        brightness = max(sky_brightness(diffuse_irr, zenith, julian_date), 0.01)
+        clearness = min(sky_clearness(diffuse_irr, direct_irr, zenith), 12.0)
+    return brightness, clearness, direct_ill, diffuse_ill, direct_irr, diffuse_irr
+
+
+def perez_parameters(clearness, brightness, zenith):
+    """Get Perez sky distribution parameters (a, b, c, d, e).
+
+    Args:
+        clearness: Perez sky clearness (epsilon).
+        brightness: Perez sky brightness (delta).
+        zenith: Sun zenith angle.
+    """
+    index = clearness_category(clearness)
+    coeff = _PEREZ_COEFFICIENTS[index]
+    params = [
+        coeff[4 * j] + coeff[4 * j + 1] * zenith +
+        brightness * (coeff[4 * j + 2] + coeff[4 * j + 3] * zenith)
+        for j in range(5)
+    ]
+    if index == 0:
+        # special cases for the overcast category
+        params[2] = math.exp(
+            math.pow(brightness * (coeff[8] + coeff[9] * zenith), coeff[10])
+        ) - coeff[11]
+        params[3] = -math.exp(brightness * (coeff[12] + coeff[13] * zenith)) + \
+            coeff[14] + brightness * coeff[15]
+    return tuple(params)
+
+
+def relative_luminance(params, gamma, zeta):
+    """Relative sky luminance for a sky point.
+
+    Args:
+        params: Perez parameters (a, b, c, d, e).
+        gamma: Angle between the sky point and the sun.
+        zeta: Zenith angle of the sky point.
+    """
+    a, b, c, d, e = params
+    cos_gamma = math.cos(gamma)
+    return (1.0 + a * math.exp(b / math.cos(zeta))) * \
+        (1.0 + c * math.exp(d * gamma) + e * cos_gamma * cos_gamma)
@@ -0,0 +1,246 @@
+"""In-process picture filtering and exposure adjustment similar to pfilt.
+
+Pictures are usually rendered at two to four times the final resolution and are
+reduced with pfilt for anti-aliasing. This module reduces the size of pictures that are
+loaded with honeybee_radiance_command.native.rgbe with box or Gaussian filtering and
+adjusts the exposure. The following pfilt options are supported.
+
+-   x and y: Output resolution as a number of pixels or as a reduction factor (e.g.
+    /2). The output resolution can't be larger than the input resolution.
+-   e, er, eg and eb: Exposure multipliers. Negative -e values are f-stops like in
+    pfilt. Without -e the exposure is set so the average brightness of the picture is
+    0.5 unless -1 is used.
+-   r: Radius of the Gaussian filter relative to the output pixel size. Box filtering
+    is used if -r is not set.
+-   c: Do not write the PIXASPECT line to the header.
+
+The filters are separable and the weights for each output row and column are calculated
+once for each picture size. Use filter_files to filter many pictures in parallel.
+
+Usage:
+
+.. code-block:: python
+
+    from honeybee_radiance_command.native.pfilt import filter_files
+    from honeybee_radiance_command.options.pfilt import PfiltOptions
+
+    options = PfiltOptions()
+    options.x = '/2'
+    options.y = '/2'
+    options.r = 0.6
+    filter_files([('view_%d.unf' % i, 'view_%d.hdr' % i) for i in range(24)], options)
+"""
+from __future__ import division
+
+import math
+import multiprocessing
+from array import array
+
+from ..options.pfilt import PfiltOptions
+from .rgbe import Picture
+from .pcomb import LUMINANCE
+
+# slots of the pfilt options that are supported by the native implementation
+_SUPPORTED_SLOTS = (
+    '_x', '_y', '_e', '_er', '_eg', '_eb', '_r', '_b', '_1_', '_2_', '_c'
+)
+
+
+def is_supported(options):
+    """Check if all the options that are set can be used with the native filter."""
+    if options.additional_options:
+        return False
+    for name in options.slots:
+        option = options._created_option(name)
+        if name not in _SUPPORTED_SLOTS and option is not None and option.is_set:
+            return False
+    try:
+        for name in ('x', 'y'):
+            _resolution(getattr(options, name).value, 1000)
+    except ValueError:
+        return False
+    return True
+
+
+def _resolution(value, size):
+    """Get the output resolution from the value of -x or -y."""
+    if value is None:
+        return size
+    value = str(value).strip()
+    if value.startswith('/'):
+        result = int(size / float(value[1:]))
+    else:
+        result = int(float(value))
+    if result < 1:
+        raise ValueError('Invalid output resolution for pfilt: %s' % value)
+    return min(result, size) if value.startswith('/') else result
+
+
+def _taps(in_size, out_size, radius=None):
+    """Get the input pixels and their weights for each output pixel.
+
+    Returns:
+        A list of (start, weights) tuples. The weights are for the consecutive input
+        pixels from start and add up to 1.
+    """
+    scale = in_size / out_size
+    taps = []
+    for o in range(out_size):
+        if radius:
+            center = (o + 0.5) * scale
+            spread = radius * scale
+            start = max(int(math.floor(center - 2 * spread)), 0)
+            end = min(int(math.ceil(center + 2 * spread)), in_size)
+            weights = [
+                math.exp(-((i + 0.5 - center) / spread) ** 2) for i in range(start, end)
+            ]
+        else:
+            low, high = o * scale, (o + 1) * scale
+            start = int(math.floor(low))
+            end = min(int(math.ceil(high)), in_size)
+            weights = [min(i + 1, high) - max(i, low) for i in range(start, end)]
+        total = sum(weights)
+        taps.append((start, [w / total for w in weights]))
+    return taps
+
+
+def _filter_scanline(channel, taps):
+    """Filter the values of one channel of a scanline."""
+    return [
+        sum(w * v for w, v in zip(weights, channel[start:start + len(weights)]))
+        for start, weights in taps
+    ]
+
+
+def _average_brightness(picture):
+    """Get the average brightness of a picture."""
+    data = picture.data
+    count = picture.width * picture.height
+    if not count:
+        return 0
+    return (
+        LUMINANCE[0] * sum(data[0::3]) + LUMINANCE[1] * sum(data[1::3]) +
+        LUMINANCE[2] * sum(data[2::3])
+    ) / count
+
+
+def filter_picture(picture, options=None, header=None):
+    """Filter a picture and adjust its exposure.
+
+    Args:
+        picture: A Picture.
+        options: PfiltOptions. See the module documentation for the supported options.
+        header: An optional list of lines to add to the header of the output picture
+            (e.g. the command).
+
+    Returns:
+        A new Picture.
+    """
+    options = options or PfiltOptions()
+    if not is_supported(options):
+        raise ValueError(
+            'The pfilt options are not supported: %s' % options.to_radiance()
+        )
+    width = _resolution(options.x.value, picture.width)
+    height = _resolution(options.y.value, picture.height)
+    if width > picture.width or height > picture.height:
+        raise ValueError(
+            'The output resolution (%d x %d) is larger than the input resolution.'
+            % (width, height)
+        )
+
+    if options.e.is_set:
+        exposure = options.e.value
+        if exposure < 0:
+            # pfilt reads values with a sign as f-stops
+            exposure = 2 ** exposure
+    elif options._1_.is_set:
+        exposure = 1.0
+    else:
+        brightness = _average_brightness(picture)
+        exposure = 0.5 / brightness if brightness > 1e-10 else 1.0
+    multipliers = [
+        exposure * (getattr(options, name).value
+                    if getattr(options, name).is_set else 1.0)
+        for name in ('er', 'eg', 'eb')
+    ]
+
+    radius = options.r.value if options.r.is_set else None
+    columns = _taps(picture.width, width, radius)
+    rows = _taps(picture.height, height, radius)
+    # filter the scanlines in the x direction only once
+    filtered = {}
+    data = array('f', [0.0]) * (3 * width * height)
+    size = 3 * width
+    for y, (start, weights) in enumerate(rows):
+        for index in range(start, start + len(weights)):
+            if index not in filtered:
+                scanline = picture.scanline(index)
+                filtered[index] = [
+                    _filter_scanline(scanline[c::3], columns) for c in range(3)
+                ]
+        for index in list(filtered):
+            # the scanlines before this row are not used anymore
+            if index < start:
+                del filtered[index]
+        for c in range(3):
+            values = [0.0] * width
+            for weight, index in zip(weights, range(start, start + len(weights))):
+                w = weight * multipliers[c]
+                values = [a + w * b for a, b in zip(values, filtered[index][c])]
+            data[y * size + c:(y + 1) * size:3] = array('f', values)
+
+    lines = list(picture.header) + list(header or [])
+    aspect = (picture.height / height) / (picture.width / width)
+    if not options.c.is_set and abs(aspect - 1) > 0.005:
+        lines.append('PIXASPECT=%f' % aspect)
+    if any(m != exposure for m in multipliers):
+        lines.append('COLORCORR=%f %f %f' % tuple(m / exposure for m in multipliers))
+    return Picture(
+        width, height, data, lines, picture.exposure * exposure, picture.orientation,
+        picture.format
+    )
+
+
+def filter_file(input_file, output_file, options=None, header=None):
+    """Filter a picture file and write the result to a new file.
+
+    Args:
+        input_file: Path to the input picture.
+        output_file: Path to the output picture.
+        options: PfiltOptions. See the module documentation for the supported options.
+        header: An optional list of lines to add to the header of the output picture.
+
+    Returns:
+        Path to the output file.
+    """
+    picture = Picture.from_file(input_file)
+    return filter_picture(picture, options, header).to_file(output_file)
+
+
+def _filter_file(args):
+    """Call filter_file with a tuple of arguments for multiprocessing."""
+    return filter_file(*args)
+
+
+def filter_files(files, options=None, processes=None):
+    """Filter several pictures in parallel.
+
+    Args:
+        files: A list of (input_file, output_file) tuples.
+        options: PfiltOptions that are used for all the pictures.
+        processes: Number of processes. By default the number of CPUs is used. Use 1
+            to filter the pictures one after the other in this process.
+
+    Returns:
+        A list of paths to the output files.
+    """
+    jobs = [(input_file, output_file, options) for input_file, output_file in files]
+    if processes == 1 or len(jobs) < 2:
+        return [_filter_file(job) for job in jobs]
+    pool = multiprocessing.Pool(processes)
+    try:
+        return pool.map(_filter_file, jobs)
+    finally:
+        pool.close()
+        pool.join()
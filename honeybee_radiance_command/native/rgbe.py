@@ -0,0 +1,547 @@
+"""Reader and writer for Radiance pictures in RGBE format (.hdr and .pic files).
+
+A Radiance picture has a text header, a resolution string and the pixel data. Each pixel
+is stored in four bytes: three mantissas and a shared exponent. Pictures are usually run
+length encoded for each scanline, with a separate run for each of the four bytes (new
+style). Pictures from older programs may be stored flat or with the old style run length
+encoding. The reader supports all three and the writer uses the new style encoding.
+
+Pixel values are stored as arrays of single precision floats with three values per
+pixel. The values are decoded one scanline at a time with lookup tables for the
+exponents, which means very large pictures can be processed one scanline at a time
+without loading the whole picture.
+
+The codec is written in pure Python and is much slower than the Radiance programs. A
+1024x1024 picture takes about 0.6 s to read and 1.1 s to write (CPython 3.10), which is
+more than the cost of starting pcomb, pfilt or falsecolor in a subprocess. For that
+reason the commands never use this module by default; Pcomb, Pfilt and Falsecolor only
+read and write pictures in process with ``run(native=True)``, which is meant for
+environments where Radiance is not installed.
+
+Usage:
+
+.. code-block:: python
+
+    from honeybee_radiance_command.native.rgbe import Picture, PictureReader
+
+    picture = Picture.from_file('render.hdr')
+    print(picture.width, picture.height, picture.exposure)
+    picture.to_file('copy.hdr')
+
+    # read a large picture one scanline at a time
+    with PictureReader('large.hdr') as reader:
+        for scanline in reader:
+            print(max(scanline[1::3]))
+"""
+import math
+import re
+from array import array
+
+from .header import _read_header
+
+RGBE_FORMAT = '32-bit_rle_rgbe'
+"""Format of pictures with RGB values."""
+
+XYZE_FORMAT = '32-bit_rle_xyze'
+"""Format of pictures with CIE XYZ values."""
+
+# minimum and maximum scanline length for new style run length encoding
+_MIN_ELEN = 8
+_MAX_ELEN = 0x7fff
+# minimum number of repeated bytes that are written as a run
+_MIN_RUN = 4
+# multiplier for each exponent value. The mantissa is at the center of its range.
+_SCALE = [0.0] + [math.ldexp(1.0, e - 136) for e in range(1, 256)]
+_RUN_PATTERN = re.compile(b'(.)\\1{%d,126}' % (_MIN_RUN - 1), re.S)
+_RESOLUTION_PATTERN = re.compile(r'^([-+][XY]) (\d+) ([-+][XY]) (\d+)$')
+
+
+def _decode(red, green, blue, exponent):
+    """Convert the bytes of a scanline to a float array with three values per pixel."""
+    scale = _SCALE
+    count = len(exponent)
+    values = array('f', [0.0]) * (3 * count)
+    values[0::3] = array('f', [(m + 0.5) * scale[e] for m, e in zip(red, exponent)])
+    values[1::3] = array('f', [(m + 0.5) * scale[e] for m, e in zip(green, exponent)])
+    values[2::3] = array('f', [(m + 0.5) * scale[e] for m, e in zip(blue, exponent)])
+    return values
+
+
+def _encode(values):
+    """Convert a scanline with three values per pixel to a bytearray for each byte."""
+    frexp = math.frexp
+    count = len(values) // 3
+    red = bytearray(count)
+    green = bytearray(count)
+    blue = bytearray(count)
+    exponent = bytearray(count)
+    for i, r, g, b in zip(range(count), values[0::3], values[1::3], values[2::3]):
+        v = r if r > g else g
+        if b > v:
+            v = b
+        if v <= 1e-32:
+            continue
+        m, e = frexp(v)
+        d = m * 256.0 / v
+        red[i] = int(r * d) if r > 0 else 0
+        green[i] = int(g * d) if g > 0 else 0
+        blue[i] = int(b * d) if b > 0 else 0
+        exponent[i] = e + 128
+    return red, green, blue, exponent
+
+
+def _encode_component(data):
+    """Run length encode the values of one byte of a scanline."""
+    output = bytearray()
+    start = 0
+    for match in _RUN_PATTERN.finditer(data):
+        begin, end = match.span()
+        # values that are not in a run are written in chunks of up to 128 values
+        for i in range(start, begin, 128):
+            chunk = data[i:min(i + 128, begin)]
+            output.append(len(chunk))
+            output.extend(chunk)
+        output.append(128 + end - begin)
+        output.append(data[begin])
+        start = end
+    for i in range(start, len(data), 128):
+        chunk = data[i:i + 128]
+        output.append(len(chunk))
+        output.extend(chunk)
+    return output
+
+
+class PictureReader(object):
+    """Read a Radiance picture one scanline at a time.
+
+    The header and the resolution string are read when the reader is created. Iterate
+    over the reader to get the scanlines in the order that they are stored in the file.
+    Each scanline is an array of floats with three values per pixel.
+
+    Args:
+        file_path: Path to a Radiance picture.
+        chunk_size: Number of bytes that are read from the file at a time
+            (Default: 1 MB).
+
+    Properties:
+        * header
+        * format
+        * resolution
+        * orientation
+        * width
+        * height
+        * exposure
+        * view
+    """
+
+    __slots__ = ('_file', '_header', '_resolution', '_width', '_height', '_buffer',
+                 '_position', '_chunk_size', '_eof')
+
+    def __init__(self, file_path, chunk_size=1 << 20):
+        self._file = open(file_path, 'rb')
+        try:
+            self._header = _read_header(self._file)
+            self._file.seek(self._header.size)
+            line = self._file.readline().decode('latin-1').strip()
+            match = _RESOLUTION_PATTERN.match(line)
+            if not match:
+                raise ValueError(
+                    'Invalid resolution string in %s: %s' % (file_path, line)
+                )
+        except Exception:
+            self._file.close()
+            raise
+        self._resolution = line
+        # the first axis is the scanlines and the second one is the pixels
+        self._height = int(match.group(2))
+        self._width = int(match.group(4))
+        self._buffer = bytearray()
+        self._position = 0
+        self._chunk_size = chunk_size
+        self._eof = False
+
+    @property
+    def header(self):
+        """Picture header as a honeybee_radiance_command.native.header.Header."""
+        return self._header
+
+    @property
+    def format(self):
+        """Picture format (e.g. 32-bit_rle_rgbe)."""
+        return self._header.format or RGBE_FORMAT
+
+    @property
+    def resolution(self):
+        """Resolution string (e.g. -Y 480 +X 640)."""
+        return self._resolution
+
+    @property
+    def orientation(self):
+        """A tuple of the axis for the scanlines and the axis for the pixels.
+
+        The standard orientation is ('-Y', '+X') which means the scanlines are stored
+        from top to bottom and the pixels in each scanline from left to right.
+        """
+        values = self._resolution.split()
+        return values[0], values[2]
+
+    @property
+    def width(self):
+        """Number of pixels in each scanline."""
+        return self._width
+
+    @property
+    def height(self):
+        """Number of scanlines."""
+        return self._height
+
+    @property
+    def exposure(self):
+        """Exposure of the picture which is the product of all the EXPOSURE values.
+
+        The values in the picture are divided by the exposure to get the original
+        radiance values.
+        """
+        return _product(self._header.values('EXPOSURE'))
+
+    @property
+    def view(self):
+        """View options from the VIEW lines in the header or None."""
+        views = self._header.values('VIEW')
+        return ' '.join(views) if views else None
+
+    def _fill(self, size):
+        """Make sure there are at least size bytes in the buffer unless the file ends."""
+        available = len(self._buffer) - self._position
+        if available >= size or self._eof:
+            return
+        # drop the bytes that are already read
+        del self._buffer[:self._position]
+        self._position = 0
+        while len(self._buffer) < size:
+            chunk = self._file.read(max(self._chunk_size, size))
+            if not chunk:
+                self._eof = True
+                break
+            self._buffer.extend(chunk)
+
+    def _take(self, size):
+        """Get the next bytes in the buffer."""
+        start = self._position
+        end = start + size
+        if end > len(self._buffer):
+            raise ValueError('Unexpected end of the picture data.')
+        self._position = end
+        return self._buffer[start:end]
+
+    def read_scanline(self):
+        """Read the next scanline.
+
+        Returns:
+            An array of floats with three values for each pixel.
+        """
+        width = self._width
+        # the longest scanline is the flat format with runs of a single byte
+        self._fill(5 * width + 16)
+        buf = self._buffer
+        pos = self._position
+        if _MIN_ELEN <= width <= _MAX_ELEN and len(buf) - pos >= 4 \
+                and buf[pos] == 2 and buf[pos + 1] == 2 and not buf[pos + 2] & 128:
+            if (buf[pos + 2] << 8 | buf[pos + 3]) != width:
+                raise ValueError('Scanline length does not match the resolution.')
+            self._position += 4
+            components = [self._read_component() for _ in range(4)]
+            return _decode(*components)
+        return self._read_flat()
+
+    def _read_component(self):
+        """Read one byte of all the pixels in a new style run length encoded scanline."""
+        width = self._width
+        data = bytearray()
+        buf = self._buffer
+        while len(data) < width:
+            if self._position >= len(buf):
+                raise ValueError('Unexpected end of the picture data.')
+            code = buf[self._position]
+            self._position += 1
+            if code > 128:
+                count = code & 127
+                data.extend(self._take(1) * count)
+            else:
+                if code == 0:
+                    raise ValueError('Invalid run length code in the picture data.')
+                data.extend(self._take(code))
+        if len(data) != width:
+            raise ValueError('Run length overflow in the picture data.')
+        return data
+
+    def _read_flat(self):
+        """Read a scanline in the flat format or the old style run length encoding."""
+        width = self._width
+        red = bytearray()
+        green = bytearray()
+        blue = bytearray()
+        exponent = bytearray()
+        shift = 0
+        while len(exponent) < width:
+            r, g, b, e = self._take(4)
+            if r == 1 and g == 1 and b == 1:
+                if not exponent:
+                    raise ValueError('Invalid run at the start of a scanline.')
+                count = e << shift
+                red.extend(red[-1:] * count)
+                green.extend(green[-1:] * count)
+                blue.extend(blue[-1:] * count)
+                exponent.extend(exponent[-1:] * count)
+                shift += 8
+            else:
+                red.append(r)
+                green.append(g)
+                blue.append(b)
+                exponent.append(e)
+                shift = 0
+        if len(exponent) != width:
+            raise ValueError('Run length overflow in the picture data.')
+        return _decode(red, green, blue, exponent)
+
+    def __iter__(self):
+        for _ in range(self._height):
+            yield self.read_scanline()
+
+    def close(self):
+        """Close the picture file."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class PictureWriter(object):
+    """Write a Radiance picture one scanline at a time.
+
+    Args:
+        file_path: Path to the output picture.
+        width: Number of pixels in each scanline.
+        height: Number of scanlines.
+        header: An optional list of lines that are added to the header (e.g. the
+            commands that created the picture or VIEW= lines).
+        exposure: Exposure of the picture. An EXPOSURE line is added to the header if
+            the exposure is not 1 (Default: 1).
+        orientation: A tuple of the axis for the scanlines and the axis for the pixels
+            (Default: ('-Y', '+X')).
+        format: Picture format. Use XYZE_FORMAT for pictures with CIE XYZ values
+            (Default: RGBE_FORMAT).
+        rle: A boolean to use run length encoding (Default: True).
+    """
+
+    __slots__ = ('_file', '_width', '_height', '_rle', '_count')
+
+    def __init__(self, file_path, width, height, header=None, exposure=1,
+                 orientation=('-Y', '+X'), format=RGBE_FORMAT, rle=True):
+        lines = ['#?RADIANCE']
+        lines.extend(header or [])
+        lines.append('FORMAT=%s' % format)
+        if exposure != 1:
+            lines.append('EXPOSURE=%g' % exposure)
+        text = '\n'.join(lines) + '\n\n%s %d %s %d\n' % (
+            orientation[0], height, orientation[1], width
+        )
+        self._width = width
+        self._height = height
+        self._rle = rle and _MIN_ELEN <= width <= _MAX_ELEN
+        self._count = 0
+        self._file = open(file_path, 'wb')
+        self._file.write(text.encode('latin-1'))
+
+    def write_scanline(self, values):
+        """Write the next scanline.
+
+        Args:
+            values: A list or an array of floats with three values for each pixel.
+        """
+        if len(values) != 3 * self._width:
+            raise ValueError(
+                'Expected %d values in a scanline but got %d.'
+                % (3 * self._width, len(values))
+            )
+        if self._count == self._height:
+            raise ValueError('All the scanlines of the picture are already written.')
+        components = _encode(values)
+        if self._rle:
+            data = bytearray((2, 2, self._width >> 8, self._width & 255))
+            for component in components:
+                data.extend(_encode_component(component))
+        else:
+            data = bytearray(4 * self._width)
+            for i, component in enumerate(components):
+                data[i::4] = component
+        self._file.write(data)
+        self._count += 1
+
+    def close(self):
+        """Close the picture file."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class Picture(object):
+    """A Radiance picture.
+
+    Args:
+        width: Number of pixels in each scanline.
+        height: Number of scanlines.
+        data: An array of floats with three values for each pixel. The scanlines are in
+            the order that they are stored in the file which is from top to bottom for
+            the standard orientation. By default all the values are zero.
+        header: An optional list of header lines. FORMAT and EXPOSURE lines are
+            ignored and are set from the format and exposure.
+        exposure: Exposure of the picture (Default: 1).
+        orientation: A tuple of the axis for the scanlines and the axis for the pixels
+            (Default: ('-Y', '+X')).
+        format: Picture format (Default: RGBE_FORMAT).
+
+    Properties:
+        * width
+        * height
+        * data
+        * header
+        * exposure
+        * view
+        * orientation
+        * format
+    """
+
+    __slots__ = ('_width', '_height', '_data', '_header', '_exposure', '_orientation',
+                 '_format')
+
+    def __init__(self, width, height, data=None, header=None, exposure=1,
+                 orientation=('-Y', '+X'), format=RGBE_FORMAT):
+        if data is None:
+            data = array('f', [0.0]) * (3 * width * height)
+        elif not isinstance(data, array) or data.typecode != 'f':
+            data = array('f', data)
+        if len(data) != 3 * width * height:
+            raise ValueError(
+                'Expected %d values for a %d x %d picture but got %d.'
+                % (3 * width * height, width, height, len(data))
+            )
+        self._width = width
+        self._height = height
+        self._data = data
+        self._header = [
+            line for line in (header or [])
+            if not line.startswith(('#?', 'FORMAT=', 'EXPOSURE='))
+        ]
+        self._exposure = exposure
+        self._orientation = tuple(orientation)
+        self._format = format
+
+    @classmethod
+    def from_file(cls, file_path):
+        """Load a picture from a file.
+
+        Args:
+            file_path: Path to a Radiance picture.
+        """
+        with PictureReader(file_path) as reader:
+            data = array('f')
+            for scanline in reader:
+                data.extend(scanline)
+            return cls(
+                reader.width, reader.height, data, list(reader.header.lines),
+                reader.exposure, reader.orientation, reader.format
+            )
+
+    @property
+    def width(self):
+        """Number of pixels in each scanline."""
+        return self._width
+
+    @property
+    def height(self):
+        """Number of scanlines."""
+        return self._height
+
+    @property
+    def data(self):
+        """An array of floats with three values for each pixel."""
+        return self._data
+
+    @property
+    def header(self):
+        """A list of header lines without the FORMAT and EXPOSURE lines."""
+        return self._header
+
+    @property
+    def exposure(self):
+        """Exposure of the picture."""
+        return self._exposure
+
+    @property
+    def view(self):
+        """View options from the VIEW lines in the header or None."""
+        views = [line[5:].strip() for line in self._header if line.startswith('VIEW=')]
+        return ' '.join(views) if views else None
+
+    @property
+    def orientation(self):
+        """A tuple of the axis for the scanlines and the axis for the pixels."""
+        return self._orientation
+
+    @property
+    def format(self):
+        """Picture format."""
+        return self._format
+
+    def scanline(self, index):
+        """Get the values of a scanline as an array of floats."""
+        size = 3 * self._width
+        return self._data[index * size:(index + 1) * size]
+
+    def pixel(self, x, y):
+        """Get the values of a pixel as a tuple.
+
+        Args:
+            x: Index of the pixel in the scanline.
+            y: Index of the scanline.
+        """
+        index = 3 * (y * self._width + x)
+        return tuple(self._data[index:index + 3])
+
+    def to_file(self, file_path, rle=True):
+        """Write the picture to a file.
+
+        Args:
+            file_path: Path to the output picture.
+            rle: A boolean to use run length encoding (Default: True).
+        """
+        writer = PictureWriter(
+            file_path, self._width, self._height, self._header, self._exposure,
+            self._orientation, self._format, rle
+        )
+        with writer:
+            for index in range(self._height):
+                writer.write_scanline(self.scanline(index))
+        return file_path
+
+    def __repr__(self):
+        return 'Picture: %d x %d' % (self._width, self._height)
+
+
+def _product(values):
+    """Get the product of a list of header values."""
+    result = 1.0
+    for value in values:
+        try:
+            result *= float(value)
+        except ValueError:
+            pass
+    return result
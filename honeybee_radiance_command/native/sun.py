@@ -0,0 +1,173 @@
+"""Solar position functions.
+
+These functions are a port of the solar position routines in Radiance's sun.c which
+are shared by gensky, gendaylit and gendaymtx. Angles are in radians. Following the
+Radiance convention longitude and standard meridian are positive to the west of
+Greenwich and solar azimuth is measured from south with positive values to the west.
+
+Use solar_positions, sky_angles and sun_vectors to calculate the sun position for a
+whole series of time steps at once. This is considerably faster than calculating each
+time step separately and avoids running gensky or gendaylit only to find the position
+of the sun.
+"""
+from __future__ import division
+
+import math
+
+_MONTH_DAYS = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+
+def jdate(month, day):
+    """Julian date (days into the year) from month and day."""
+    return _MONTH_DAYS[month - 1] + day
+
+
+def stadj(jd, longitude, meridian):
+    """Solar time adjustment in hours from Julian date.
+
+    Args:
+        jd: Julian date.
+        longitude: Site longitude in radians (positive to the west).
+        meridian: Standard meridian in radians (positive to the west).
+    """
+    return 0.170 * math.sin((4 * math.pi / 373) * (jd - 80)) - \
+        0.129 * math.sin((2 * math.pi / 355) * (jd - 8)) + \
+        12 * (meridian - longitude) / math.pi
+
+
+def sdec(jd):
+    """Solar declination angle in radians from Julian date."""
+    return 0.4093 * math.sin((2 * math.pi / 368) * (jd - 81))
+
+
+def salt(latitude, sd, st):
+    """Solar altitude in radians from solar declination and solar time.
+
+    Args:
+        latitude: Site latitude in radians.
+        sd: Solar declination in radians.
+        st: Solar time in hours.
+    """
+    return math.asin(
+        math.sin(latitude) * math.sin(sd) -
+        math.cos(latitude) * math.cos(sd) * math.cos(st * (math.pi / 12))
+    )
+
+
+def sazi(latitude, sd, st):
+    """Solar azimuth in radians from solar declination and solar time.
+
+    The azimuth is measured from south with positive values to the west.
+
+    Args:
+        latitude: Site latitude in radians.
+        sd: Solar declination in radians.
+        st: Solar time in hours.
+    """
+    return -math.atan2(
+        math.cos(sd) * math.sin(st * (math.pi / 12)),
+        -math.cos(latitude) * math.sin(sd) -
+        math.sin(latitude) * math.cos(sd) * math.cos(st * (math.pi / 12))
+    )
+
+
+def solar_positions(months, days, hours, latitude, longitude, time_zone,
+                    solar_time=False):
+    """Calculate solar altitude and azimuth for a batch of time steps.
+
+    Declination and solar time adjustment only change by date. They are calculated
+    once for each day in the inputs and reused for all the time steps in that day.
+
+    Args:
+        months: A list of months.
+        days: A list of days.
+        hours: A list of hours. Hours are local standard time unless solar_time is set
+            to True.
+        latitude: Site latitude in degrees.
+        longitude: Site longitude in degrees (positive to the west).
+        time_zone: Standard meridian in degrees (positive to the west). For instance
+            use 75 for Eastern Standard Time.
+        solar_time: Set to True if input hours are in local solar time
+            (Default: False).
+
+    Returns:
+        A tuple of three lists for Julian dates, solar altitudes and solar azimuths.
+        Angles are in radians and azimuth is measured from south with positive values
+        to the west.
+    """
+    lat = math.radians(latitude)
+    lon = math.radians(longitude)
+    meridian = math.radians(time_zone)
+    sin_lat, cos_lat = math.sin(lat), math.cos(lat)
+    day_values = {}
+    julian_dates, altitudes, azimuths = [], [], []
+    for month, day, hour in zip(months, days, hours):
+        jd = jdate(int(month), int(day))
+        try:
+            sin_sd, cos_sd, adjust = day_values[jd]
+        except KeyError:
+            sd = sdec(jd)
+            adjust = 0 if solar_time else stadj(jd, lon, meridian)
+            sin_sd, cos_sd = math.sin(sd), math.cos(sd)
+            day_values[jd] = sin_sd, cos_sd, adjust
+        hour_angle = (hour + adjust) * (math.pi / 12)
+        cos_ha = math.cos(hour_angle)
+        julian_dates.append(jd)
+        altitudes.append(math.asin(sin_lat * sin_sd - cos_lat * cos_sd * cos_ha))
+        azimuths.append(
+            -math.atan2(cos_sd * math.sin(hour_angle),
+                        -cos_lat * sin_sd - sin_lat * cos_sd * cos_ha)
+        )
+    return julian_dates, altitudes, azimuths
+
+
+def sky_angles(months, days, hours, latitude, longitude, time_zone,
+               solar_time=False):
+    """Get solar altitude and azimuth in degrees for a batch of time steps.
+
+    The output angles follow the gensky/gendaylit convention and can be used directly
+    with Gensky.from_ang or the -ang option of gendaylit.
+
+    Args:
+        months: A list of months.
+        days: A list of days.
+        hours: A list of hours. Hours are local standard time unless solar_time is set
+            to True.
+        latitude: Site latitude in degrees.
+        longitude: Site longitude in degrees (positive to the west).
+        time_zone: Standard meridian in degrees (positive to the west).
+        solar_time: Set to True if input hours are in local solar time
+            (Default: False).
+
+    Returns:
+        A list of (altitude, azimuth) tuples. Azimuth is measured in degrees west of
+        south.
+    """
+    _, altitudes, azimuths = solar_positions(
+        months, days, hours, latitude, longitude, time_zone, solar_time
+    )
+    return [
+        (math.degrees(alt), math.degrees(azi)) for alt, azi in zip(altitudes, azimuths)
+    ]
+
+
+def sun_vectors(altitudes, azimuths, rotation=0):
+    """Get sun direction vectors in Radiance coordinates (Y to north and X to east).
+
+    Args:
+        altitudes: A list of solar altitudes in radians.
+        azimuths: A list of solar azimuths in radians measured from south with positive
+            values to the west.
+        rotation: Counter-clockwise rotation of the sky around the zenith in degrees
+            (Default: 0).
+
+    Returns:
+        A list of (x, y, z) tuples pointing from the site to the sun.
+    """
+    rotation = math.pi - math.radians(rotation)
+    vectors = []
+    for alt, azi in zip(altitudes, azimuths):
+        azi += rotation
+        cos_alt = math.cos(alt)
+        vectors.append((cos_alt * math.sin(azi), cos_alt * math.cos(azi), math.sin(alt)))
+    return vectors
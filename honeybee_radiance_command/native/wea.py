@@ -0,0 +1,210 @@
+"""Reader for weather tapes in Daysim/Radiance wea format.
+
+A wea file has a short header with the site parameters followed by one line per time
+step with month, day, standard time, and two irradiance (or illuminance) values.
+
+.. code-block:: shell
+
+    place Boston_MA_USA
+    latitude 42.37
+    longitude 71.02
+    time_zone 75
+    site_elevation 6.0
+    weather_data_file_units 1
+    1 1 0.5 0 0
+    1 1 1.5 0 0
+
+Parsing the text of a full annual weather file is much slower than reading the same
+values from a binary file. Use ``Wea.from_file(wea_file, cache=True)`` to keep a binary
+copy of the parsed values next to the wea file. The binary file is keyed on the hash of
+the wea file contents and is only used as long as the wea file doesn't change.
+"""
+import hashlib
+import json
+import os
+import sys
+from array import array
+
+CACHE_EXTENSION = '.cache'
+"""Extension for binary cache files which are written next to the wea files."""
+
+_CACHE_VERSION = b'WEACACHE 1'
+
+
+class Wea(object):
+    """Weather tape data.
+
+    Following the Radiance convention longitude and time zone (standard meridian) are
+    in degrees and positive to the west of Greenwich.
+
+    Args:
+        latitude: Site latitude in degrees.
+        longitude: Site longitude in degrees (positive to the west).
+        time_zone: Standard meridian in degrees (positive to the west).
+        months: List of months for each time step.
+        days: List of days for each time step.
+        hours: List of standard time hours for each time step.
+        direct: List of direct values. Based on units this is direct normal or
+            direct horizontal irradiance or direct normal illuminance.
+        diffuse: List of diffuse horizontal values.
+        units: Weather data file units. 1 for direct normal and diffuse horizontal
+            irradiance, 2 for direct horizontal and diffuse horizontal irradiance and
+            3 for direct normal and diffuse horizontal illuminance (Default: 1).
+        place: Optional name of the site.
+        elevation: Site elevation in meters (Default: 0).
+
+    Properties:
+        * latitude
+        * longitude
+        * time_zone
+        * months
+        * days
+        * hours
+        * direct
+        * diffuse
+        * units
+        * place
+        * elevation
+        * count
+    """
+
+    __slots__ = (
+        'latitude', 'longitude', 'time_zone', 'months', 'days', 'hours', 'direct',
+        'diffuse', 'units', 'place', 'elevation'
+    )
+
+    def __init__(self, latitude, longitude, time_zone, months, days, hours, direct,
+                 diffuse, units=1, place=None, elevation=0):
+        self.latitude = float(latitude)
+        self.longitude = float(longitude)
+        self.time_zone = float(time_zone)
+        self.months = months
+        self.days = days
+        self.hours = hours
+        self.direct = direct
+        self.diffuse = diffuse
+        assert len(set(len(v) for v in (months, days, hours, direct, diffuse))) == 1, \
+            'Wea time step inputs must all have the same length.'
+        if units not in (1, 2, 3):
+            raise ValueError(
+                'Wea units must be 1, 2 or 3. Got {}.'.format(units)
+            )
+        self.units = units
+        self.place = place
+        self.elevation = float(elevation)
+
+    @classmethod
+    def from_file(cls, wea_file, cache=False):
+        """Create a Wea object from a wea file.
+
+        Args:
+            wea_file: Path to a wea file.
+            cache: Set to True to use a binary cache file next to the wea file. If the
+                cache file doesn't exist or is out of date the wea file will be parsed
+                and the cache file will be written for the next time (Default: False).
+        """
+        with open(wea_file, 'rb') as inf:
+            content = inf.read()
+        key = hashlib.sha1(content).hexdigest()
+        cache_file = wea_file + CACHE_EXTENSION
+        if cache:
+            wea = cls._from_cache(cache_file, key)
+            if wea is not None:
+                return wea
+
+        header = {}
+        data = []
+        for line in content.decode('utf-8').splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if line[0].isalpha():
+                values = line.split()
+                header[values[0]] = ' '.join(values[1:])
+            else:
+                data.append(line)
+        values = array('d', [float(v) for v in ' '.join(data).split()])
+        if len(values) % 5 != 0:
+            raise ValueError('Invalid number of values in wea file: %s' % wea_file)
+
+        try:
+            wea = cls(
+                header['latitude'], header['longitude'], header['time_zone'],
+                array('i', [int(v) for v in values[0::5]]),
+                array('i', [int(v) for v in values[1::5]]),
+                values[2::5], values[3::5], values[4::5],
+                int(header.get('weather_data_file_units', 1)), header.get('place'),
+                header.get('site_elevation', 0)
+            )
+        except KeyError as e:
+            raise ValueError(
+                'Missing {} in header of wea file: {}'.format(e, wea_file)
+            )
+        if cache:
+            wea._to_cache(cache_file, key)
+        return wea
+
+    @classmethod
+    def _from_cache(cls, cache_file, key):
+        """Load a Wea from a binary cache file.
+
+        None will be returned if the cache file doesn't exist or doesn't match the key.
+        """
+        try:
+            with open(cache_file, 'rb') as inf:
+                if inf.readline().rstrip() != _CACHE_VERSION:
+                    return None
+                header = json.loads(inf.readline().decode('utf-8'))
+                if header['key'] != key or header['byteorder'] != sys.byteorder:
+                    return None
+                count = header['count']
+                values = array('d')
+                values.fromfile(inf, 5 * count)
+        except (IOError, OSError, ValueError, KeyError, EOFError):
+            return None
+        return cls(
+            header['latitude'], header['longitude'], header['time_zone'],
+            array('i', [int(v) for v in values[:count]]),
+            array('i', [int(v) for v in values[count:2 * count]]),
+            values[2 * count:3 * count], values[3 * count:4 * count],
+            values[4 * count:], header['units'], header['place'], header['elevation']
+        )
+
+    def _to_cache(self, cache_file, key):
+        """Write the values to a binary cache file.
+
+        The file is written to a temporary file first and then moved to the final
+        location. Failing to write the cache file is not an error.
+        """
+        header = {
+            'key': key, 'byteorder': sys.byteorder, 'count': self.count,
+            'latitude': self.latitude, 'longitude': self.longitude,
+            'time_zone': self.time_zone, 'units': self.units, 'place': self.place,
+            'elevation': self.elevation
+        }
+        values = array('d')
+        for column in (self.months, self.days, self.hours, self.direct, self.diffuse):
+            values.extend(array('d', column))
+        temp_file = '%s.%d.tmp' % (cache_file, os.getpid())
+        try:
+            with open(temp_file, 'wb') as outf:
+                outf.write(_CACHE_VERSION + b'\n')
+                outf.write(json.dumps(header).encode('utf-8') + b'\n')
+                values.tofile(outf)
+            if os.path.exists(cache_file):
+                os.remove(cache_file)
+            os.rename(temp_file, cache_file)
+        except (IOError, OSError):
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+
+    @property
+    def count(self):
+        """Number of time steps."""
+        return len(self.months)
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return 'Wea: %s [%d time steps]' % (self.place or 'unnamed', self.count)
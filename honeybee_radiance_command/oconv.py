@@ -94,6 +94,17 @@ class Oconv(Command):
 
         return ' '.join(cmd.split())
 
+    def _argv(self, stdin_input=False):
+        self.validate()
+        argv = [self.command]
+        if self.options:
+            argv.extend(self.options.to_argv())
+        if stdin_input:
+            argv.append('-')
+        else:
+            argv.extend(typing.unquote(f) for f in self.inputs)
+        return argv, None
+
     def validate(self):
         Command.validate(self)
         if len(self.inputs) == 0:
@@ -0,0 +1,321 @@
+"""Shared cache for octree files.
+
+Creating the octree is usually the first step of every Radiance study and the same
+scene is often converted to an octree over and over again for each sensor grid, view or
+study variant. OctreeCache keeps the octrees in a cache folder using a key that is
+calculated from the content of the input files and the oconv options. An octree is only
+built if it doesn't exist in the cache already.
+
+The cache is safe to share between parallel processes. Only one process builds an
+octree and the other processes that ask for the same octree wait for it to be ready.
+
+Usage:
+
+.. code-block:: python
+
+    from honeybee_radiance_command.octree import OctreeCache
+    from honeybee_radiance_command.options.oconv import OconvOptions
+
+    options = OconvOptions()
+    options.f = True
+    cache = OctreeCache('octree_cache')
+    octree = cache.get(['materials.mat', 'scene.rad'], options)
+
+For design iterations where only part of the scene changes use LayeredOctree. The
+static part of the scene is converted to a frozen base octree once and each variant is
+created by adding only the changed files to the base octree using ``oconv -i``.
+
+.. code-block:: python
+
+    from honeybee_radiance_command.octree import LayeredOctree
+
+    layers = LayeredOctree('octree_cache', ['materials.mat', 'building.rad'])
+    octrees = layers.variants([['shade_1.rad'], ['shade_2.rad'], ['shade_3.rad']])
+"""
+import hashlib
+import os
+import time
+
+from .oconv import Oconv
+from .options.oconv import OconvOptions
+import honeybee_radiance_command._typing as typing
+
+
+def _update_hash(hasher, path, cwd=None):
+    """Update a hash object with the content of a file.
+
+    Inputs that start with a '!' are commands and the command itself is added to the hash.
+    Relative paths are resolved against cwd if it is provided.
+    """
+    path = typing.unquote(path)
+    if path.startswith('!'):
+        hasher.update(path.encode('utf-8'))
+        return
+    if cwd:
+        path = os.path.join(cwd, path)
+    with open(path, 'rb') as inf:
+        for chunk in iter(lambda: inf.read(1 << 20), b''):
+            hasher.update(chunk)
+
+
+class OctreeCache(object):
+    """A folder of octrees that are keyed on the content of the scene files.
+
+    Args:
+        folder: Path to the cache folder. The folder will be created if it doesn't
+            exist.
+        timeout: Time in seconds to wait for another process to finish building an
+            octree (Default: 3600).
+        interval: Time in seconds between checks while waiting for another process
+            (Default: 0.1).
+        stale_timeout: Age of a lock file in seconds after which the process that
+            created it is considered dead and the lock is removed. It must be larger
+            than the time it takes to build the largest octree so a lock is never
+            removed while the octree is still being built. By default it is twice the
+            timeout.
+
+    Properties:
+        * folder
+        * timeout
+        * interval
+        * stale_timeout
+
+    .. note::
+
+        Unless the -f option is set, oconv only stores a reference to the scene files
+        in the octree. Use frozen octrees if the cached octrees are used from a
+        different folder or after the scene files are moved.
+    """
+
+    __slots__ = ('_folder', '_timeout', '_interval', '_stale_timeout')
+
+    def __init__(self, folder, timeout=3600, interval=0.1, stale_timeout=None):
+        self._folder = os.path.abspath(folder)
+        if not os.path.isdir(self._folder):
+            try:
+                os.makedirs(self._folder)
+            except OSError:
+                # another process created the folder in the meantime
+                if not os.path.isdir(self._folder):
+                    raise
+        self._timeout = timeout
+        self._interval = interval
+        self._stale_timeout = 2 * timeout if stale_timeout is None else stale_timeout
+        if self._stale_timeout <= timeout:
+            raise ValueError(
+                'stale_timeout (%s) must be larger than timeout (%s).'
+                % (self._stale_timeout, timeout)
+            )
+
+    @property
+    def folder(self):
+        """Path to cache folder."""
+        return self._folder
+
+    @property
+    def timeout(self):
+        """Time in seconds to wait for another process to build an octree."""
+        return self._timeout
+
+    @property
+    def interval(self):
+        """Time in seconds between checks while waiting for another process."""
+        return self._interval
+
+    @property
+    def stale_timeout(self):
+        """Age of a lock file in seconds after which the lock is considered stale."""
+        return self._stale_timeout
+
+    @staticmethod
+    def key(inputs, options=None, cwd=None):
+        """Calculate the cache key for a list of inputs and oconv options.
+
+        The key depends on the order and the content of the input files and not on
+        their names.
+
+        Args:
+            inputs: A list of scene files.
+            options: OconvOptions (Default: None).
+            cwd: Working directory for relative input paths (Default: None).
+
+        Returns:
+            A hexadecimal hash string.
+        """
+        hasher = hashlib.sha1()
+        options = options or OconvOptions()
+        hasher.update(options.canonical.encode('utf-8'))
+        if options.i.is_set:
+            _update_hash(hasher, options.i.value, cwd)
+        for path in inputs:
+            hasher.update(b'\0')
+            _update_hash(hasher, path, cwd)
+        return hasher.hexdigest()
+
+    def path(self, key):
+        """Get the path to the octree for a cache key."""
+        return os.path.join(self._folder, key + '.oct')
+
+    def get(self, inputs, options=None, env=None, cwd=None):
+        """Get the path to the octree for a list of inputs.
+
+        The octree is built using oconv if it doesn't exist in the cache. If another
+        process is building the same octree this method waits for it to finish.
+
+        Args:
+            inputs: A list of scene files.
+            options: OconvOptions (Default: None).
+            env: Environmental variables for running oconv (Default: None).
+            cwd: Working directory for running oconv (Default: None).
+
+        Returns:
+            Path to the octree file in the cache folder.
+        """
+        key = self.key(inputs, options, cwd)
+        octree = self.path(key)
+        lock_file = os.path.join(self._folder, key + '.lock')
+        start = time.time()
+        while not os.path.isfile(octree):
+            if self._acquire(lock_file):
+                try:
+                    if not os.path.isfile(octree):
+                        self._build(octree, inputs, options, env, cwd)
+                finally:
+                    os.remove(lock_file)
+                break
+            if time.time() - start > self._timeout:
+                raise RuntimeError(
+                    'Timed out waiting for octree to be built: %s' % octree
+                )
+            time.sleep(self._interval)
+        return octree
+
+    def _acquire(self, lock_file):
+        """Try to create the lock file. Returns True if the lock is acquired."""
+        try:
+            fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except OSError:
+            try:
+                if time.time() - os.path.getmtime(lock_file) > self._stale_timeout:
+                    # the process that created the lock has most likely died
+                    os.remove(lock_file)
+            except OSError:
+                pass
+            return False
+        os.write(fd, str(os.getpid()).encode('utf-8'))
+        os.close(fd)
+        return True
+
+    @staticmethod
+    def _build(octree, inputs, options=None, env=None, cwd=None):
+        """Build the octree to a temporary file and move it to the cache."""
+        temp_file = '%s.%d.tmp' % (octree, os.getpid())
+        cmd = Oconv(options=options, output=temp_file, inputs=inputs)
+        try:
+            cmd.run(env, cwd)
+            os.rename(temp_file, octree)
+        finally:
+            if os.path.isfile(temp_file):
+                os.remove(temp_file)
+
+    def clear(self):
+        """Remove all the octrees from the cache folder."""
+        for f in os.listdir(self._folder):
+            if f.endswith('.oct'):
+                os.remove(os.path.join(self._folder, f))
+
+    def __contains__(self, key):
+        return os.path.isfile(self.path(key))
+
+    def __repr__(self):
+        return 'OctreeCache: %s' % self._folder
+
+
+class LayeredOctree(object):
+    """Octrees for scene variants that share a static base scene.
+
+    The static inputs are converted to a frozen base octree which is built only once.
+    Each variant is created by adding the variant inputs to the base octree with the
+    oconv -i option. Both the base and the variant octrees are kept in an OctreeCache.
+
+    Args:
+        cache: An OctreeCache or a path to a cache folder.
+        static_inputs: A list of scene files for the static part of the scene. The
+            materials for the variant inputs must be included in the static inputs or
+            in the variant inputs themselves.
+        options: Optional OconvOptions for building the base octree. The -f option is
+            always set for the base octree.
+
+    Properties:
+        * cache
+        * static_inputs
+        * options
+    """
+
+    __slots__ = ('_cache', '_static_inputs', '_options')
+
+    def __init__(self, cache, static_inputs, options=None):
+        if not isinstance(cache, OctreeCache):
+            cache = OctreeCache(cache)
+        self._cache = cache
+        self._static_inputs = list(static_inputs)
+        if options is not None and options.i.is_set:
+            raise ValueError('The -i option cannot be used for the base octree.')
+        base_options = OconvOptions()
+        if options:
+            base_options.update_from_string(options.to_radiance())
+        base_options.f = True
+        self._options = base_options
+
+    @property
+    def cache(self):
+        """OctreeCache for base and variant octrees."""
+        return self._cache
+
+    @property
+    def static_inputs(self):
+        """List of scene files for the static part of the scene."""
+        return self._static_inputs
+
+    @property
+    def options(self):
+        """OconvOptions for the base octree."""
+        return self._options
+
+    def base(self, env=None, cwd=None):
+        """Get the path to the frozen base octree. It will be built if needed."""
+        return self._cache.get(self._static_inputs, self._options, env, cwd)
+
+    def variant(self, inputs, env=None, cwd=None):
+        """Get the path to the octree for a variant of the scene.
+
+        Args:
+            inputs: A list of scene files that will be added to the base octree.
+            env: Environmental variables for running oconv (Default: None).
+            cwd: Working directory for running oconv (Default: None).
+
+        Returns:
+            Path to the variant octree.
+        """
+        options = OconvOptions()
+        options.i = self.base(env, cwd)
+        if self._options.w.is_set:
+            options.w = True
+        return self._cache.get(inputs, options, env, cwd)
+
+    def variants(self, variant_inputs, env=None, cwd=None):
+        """Get the paths to the octrees for several variants of the scene.
+
+        Args:
+            variant_inputs: A list of lists of scene files. Each list will be added to
+                the base octree to create a variant.
+            env: Environmental variables for running oconv (Default: None).
+            cwd: Working directory for running oconv (Default: None).
+
+        Returns:
+            A list of paths to variant octrees.
+        """
+        return [self.variant(inputs, env, cwd) for inputs in variant_inputs]
+
+    def __repr__(self):
+        return 'LayeredOctree: %d static inputs' % len(self._static_inputs)
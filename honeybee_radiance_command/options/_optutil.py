@@ -28,8 +28,11 @@ def _gen_opt_file(command, folder='.'):
     HEADER = '{0}\n\nclass {1}Options(OptionCollection):\n' \
     '    """{2} command options."""\n\n' \
     '    __slots__ = ({3})\n\n' \
+    '    _specs = {{\n'
+
+    INIT = '    }}\n\n' \
     '    def __init__(self):\n' \
-    '        """{2} command options."""\n'
+    '        """{0} command options."""\n' \
     '        OptionCollection.__init__(self)\n' \
 
     # run the command and parse the output
@@ -63,8 +66,8 @@ def _gen_opt_file(command, folder='.'):
             else:
                 comment = raw_comment
 
-        init_line = "\t\tself.%s = BoolOption('%s', '%s')" % (
-            slot.replace("'", ''), parameter, comment)
+        init_line = "\t\t%s: BoolOption.spec('%s', '%s')," % (
+            slot, parameter, comment)
 
         init_line = init_line.replace('\t', '    ')
         return slot, init_line, get_set_property(parameter, comment)
@@ -73,8 +76,8 @@ def _gen_opt_file(command, folder='.'):
         """Parse a Radiance string option documentation."""
         slot = "'_%s'" % parameter
         comment = raw_comment + ' - default: %s%s' % (parameter, value)
-        init_line = "\t\tself.%s = StringOptionJoined('%s', '%s')" % (
-            slot.replace("'", ''), parameter, comment)
+        init_line = "\t\t%s: StringOptionJoined.spec('%s', '%s')," % (
+            slot, parameter, comment)
 
         init_line = init_line.replace('\t', '    ')
         return slot, init_line, get_set_property(parameter, comment)
@@ -87,12 +90,12 @@ def _gen_opt_file(command, folder='.'):
         comment = raw_comment + ' - default: %s' % (value)
         try:
             _ = int(value)
-            init_line = "\t\tself.%s = IntegerOption('%s', '%s')" % (
-                slot.replace("'", ''), parameter, comment)
+            init_line = "\t\t%s: IntegerOption.spec('%s', '%s')," % (
+                slot, parameter, comment)
         except ValueError:
             # float
-            init_line = "\t\tself.%s = NumericOption('%s', '%s')" % (
-                slot.replace("'", ''), parameter, comment)
+            init_line = "\t\t%s: NumericOption.spec('%s', '%s')," % (
+                slot, parameter, comment)
 
         init_line = init_line.replace('\t', '    ')
         return slot, init_line, get_set_property(parameter, comment)
@@ -108,8 +111,8 @@ def _gen_opt_file(command, folder='.'):
             # float
             numtype = 'float'
 
-        init_line = "\t\tself.%s = TupleOption('%s', '%s', %d, %s)" % (
-                slot.replace("'", ''), parameter, comment, len(values), numtype
+        init_line = "\t\t%s: TupleOption.spec('%s', '%s', None, %d, %s)," % (
+                slot, parameter, comment, len(values), numtype
         )
 
         init_line = init_line.replace('\t', '    ')
@@ -162,7 +165,8 @@ def _gen_opt_file(command, folder='.'):
     with open(file_path, 'w') as output:
         output.write(header)
         output.write('\n'.join(inits))
-        output.write('\n        self._on_setattr_check = True')
+        output.write('\n' + INIT.format(command))
+        output.write('        self._on_setattr_check = True')
         output.write('\n\n')
         output.write('\n\n'.join(get_sets))
     print('created %s' % file_path)
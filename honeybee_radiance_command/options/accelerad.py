@@ -10,6 +10,24 @@ class AcceleradOptions(OptionCollection):
 
     __slots__ = ('_g', '_gv', '_al', '_ag', '_az', '_ac', '_an', '_at', '_ax')
 
+    _specs = {
+        '_g': BoolOption.spec('g', 'enable or disable GPU ray tracing - default: on'),
+        '_gv': IntegerOption.spec(
+            'gv', 'verbosity of GPU debugging level - default: 0', min_value=0,
+            max_value=3),
+        '_al': IntegerOption.spec(
+            'al', 'spacing between seed point pixels - default: 0'),
+        '_ag': IntegerOption.spec(
+            'ag', 'ambient divisions for final gather infill - default: -1'),
+        '_az': IntegerOption.spec('az', 'seeds points for ambient samples - default: 0'),
+        '_ac': IntegerOption.spec(
+            'ac', 'k-means clusters for ambient calculation - default: 4096'),
+        '_an': IntegerOption.spec('an', 'maximum k-means iterations - default: 100'),
+        '_at': NumericOption.spec('at', 'k-means threshold - default: 0.05'),
+        '_ax': NumericOption.spec(
+            'ax', 'weighting factor in k-means calculation - default: 1.0'),
+    }
+
     def __init__(self):
         """Accelerad command options.
 
@@ -25,17 +43,6 @@ class AcceleradOptions(OptionCollection):
             -ac 8192 -u-
         """
         OptionCollection.__init__(self)
-        self._g = BoolOption('g', 'enable or disable GPU ray tracing - default: on')
-        self._gv = IntegerOption(
-            'gv', 'verbosity of GPU debugging level - default: 0', min_value=0,
-            max_value=3)
-        self._al = IntegerOption('al', 'spacing between seed point pixels - default: 0')
-        self._ag = IntegerOption('ag', 'ambient divisions for final gather infill - default: -1')
-        self._az = IntegerOption('az', 'seeds points for ambient samples - default: 0')
-        self._ac = IntegerOption('ac', 'k-means clusters for ambient calculation - default: 4096')
-        self._an = IntegerOption('an', 'maximum k-means iterations - default: 100')
-        self._at = NumericOption('at', 'k-means threshold - default: 0.05')
-        self._ax = NumericOption('ax', 'weighting factor in k-means calculation - default: 1.0')
 
     @property
     def g(self):
@@ -27,40 +27,43 @@ class DcglareOptions(OptionCollection):
         "_se",
     )
 
-    def __init__(self):
-        """dcglare command options."""
-
-        OptionCollection.__init__(self)
-        self._l = NumericOption("l", "Limit for glare occurrence")
-        self._b = NumericOption("b", "Threshold factor in cd/m2 - default: 2000")
-        self._vf = FileOption("vf", "View file for DGP calculation")
-        self._vd = TupleOption(
+    _specs = {
+        '_l': NumericOption.spec("l", "Limit for glare occurrence"),
+        '_b': NumericOption.spec("b", "Threshold factor in cd/m2 - default: 2000"),
+        '_vf': FileOption.spec("vf", "View file for DGP calculation"),
+        '_vd': TupleOption.spec(
             "vd", "View forward vector", None, 3, float
-        )
-        self._vu = TupleOption(
+        ),
+        '_vu': TupleOption.spec(
             "vu", "View up vector - default: 0.000000 0.000000 1.000000", None, 3, float
-        )
-        self._vi = StringOptionJoined(
+        ),
+        '_vi': StringOptionJoined.spec(
             "vi",
             "Format of view file - default: via",
             valid_values=["a", "f", "d"],
-            whole=False)
-        self._sf = FileOption("sf", "Occupancy schedule file")
-        self._ss = NumericOption("ss", "Occupancy start hour")
-        self._se = NumericOption("se", "Occupancy end hour")
+            whole=False),
+        '_sf': FileOption.spec("sf", "Occupancy schedule file"),
+        '_ss': NumericOption.spec("ss", "Occupancy start hour"),
+        '_se': NumericOption.spec("se", "Occupancy end hour"),
+    }
+
+    def __init__(self):
+        """dcglare command options."""
+
+        OptionCollection.__init__(self)
         self._on_setattr_check = True
 
     def _on_setattr(self):
         """This method executes after setting each new attribute.
         """
-        if self._vf.is_set and self._vu.is_set:
+        if self._is_set('_vf') and self._is_set('_vu'):
             warnings.warn(
                 'Both -vf and -vu are set. %s will ignore -vu.' % self.command)
-        if self._ss.is_set and not self._l.is_set:
+        if self._is_set('_ss') and not self._is_set('_l'):
             warnings.warn(
                 '-ss is set but -l is not. %s will ignore -ss if -ls is not set.'
                 % self.command)
-        if self._se.is_set and not self._l.is_set:
+        if self._is_set('_se') and not self._is_set('_l'):
             warnings.warn(
                 '-se is set but -l is not. %s will ignore -se if -ls is not set.'
                 % self.command)
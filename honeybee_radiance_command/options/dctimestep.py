@@ -12,33 +12,35 @@ class DctimestepOptions(OptionCollection):
 
     __slots__ = ('_n', '_h', '_o', '_i', '_op_fmt')
 
+    _specs = {
+        '_h': BoolOption.spec('h', 'remove header in output file. default:header is '
+                                   'written'),
+        '_i': StringOptionJoined.spec(
+            'i', 'input data format for the sky vector. "f" indicates float and "d" '
+            'indicates double. Double is efficient for large matrices. This'
+            'option is unnecessary if the sky vector/matrix includes a header',
+            valid_values=['d', 'f'], whole=False),
+        '_o': StringOption.spec('o', 'The -o option may be used to specify a file or '
+                                     'a set of output files to use rather than the '
+                                     'standard output. If the given specification '
+                                     'contains a "%d" format string, this will be '
+                                     'replaced by the time step index, starting from 0.'
+                                     'In this way, multiple output pictures or '
+                                     'separate result vectors may be produced.'),
+        '_op_fmt': StringOptionJoined.spec(
+            'o', 'The -of, -od or -oc option may be used to'
+            'specify IEEE float, double or RGBE (picture) output data, respectively.',
+            valid_values=['f', 'd', 'c']),
+        '_n': IntegerOption.spec('n',
+                                 'The -n option may be used to indicate the number of '
+                                 'time steps, which will be 1 for a sky vector. This '
+                                 'option is unnecessary if the sky vector/matrix '
+                                 'includes a header'),
+    }
+
     def __init__(self):
         """dctimestep command options."""
         OptionCollection.__init__(self)
-        self._h = BoolOption('h', 'remove header in output file. default:header is '
-                                  'written')
-        self._i = StringOptionJoined('i', 'input data format for the sky vector. "f" '
-                                          'indicates float and "d" indicates double. '
-                                          'Double is efficient for large matrices. This'
-                                          'option is unnecessary if the sky vector/matrix '
-                                          'includes a header', valid_values=['d', 'f'],
-                                     whole=False)
-        self._o = StringOption('o', 'The -o option may be used to specify a file or '
-                                    'a set of output files to use rather than the '
-                                    'standard output. If the given specification '
-                                    'contains a "%d" format string, this will be '
-                                    'replaced by the time step index, starting from 0.'
-                                    'In this way, multiple output pictures or '
-                                    'separate result vectors may be produced.')
-        self._op_fmt = StringOptionJoined('o', 'The -of, -od or -oc option may be used to'
-                                          'specify IEEE float, double or RGBE (picture) '
-                                          'output data, respectively.',
-                                          valid_values=['f', 'd', 'c'])
-        self._n = IntegerOption('n',
-                                'The -n option may be used to indicate the number of '
-                                'time steps, which will be 1 for a sky vector. This '
-                                'option is unnecessary if the sky vector/matrix '
-                                'includes a header')
 
     @property
     def h(self):
@@ -43,83 +43,86 @@ class EvalglareOptions(OptionCollection):
         "_Y"
     )
 
-    def __init__(self):
-        """evalglare command options."""
-
-        OptionCollection.__init__(self)
-        self._A = FileOption("A", "Masking file to study a certain area")
-        self._B = NumericOption("B", "Angle to calculate luminance of horizontal band")
-        self._b = NumericOption("b", "Threshold factor in cd/m2 - default: 2000")
-        self._c = FileOption("c", "Output check file path")
-        self._C = StringOption(
+    _specs = {
+        '_A': FileOption.spec("A", "Masking file to study a certain area"),
+        '_B': NumericOption.spec("B", "Angle to calculate luminance of horizontal band"),
+        '_b': NumericOption.spec("b", "Threshold factor in cd/m2 - default: 2000"),
+        '_c': FileOption.spec("c", "Output check file path"),
+        '_C': StringOption.spec(
             "C", "Correction mode - default l+",
             valid_values=["0", "l+", "l-"], whole=True
-        )
-        self._d = BoolOption("d", "Enable detailed output - default: False")
-        self._f = BoolOption("f", "Forcing option for -vtv and black corners")
-        self._g = IntegerOption(
+        ),
+        '_d': BoolOption.spec("d", "Enable detailed output - default: False"),
+        '_f': BoolOption.spec("f", "Forcing option for -vtv and black corners"),
+        '_g': IntegerOption.spec(
             "g", "Cut field of view according to Guth; no eval", min_value=1, max_value=2
-        )
-        self._G = IntegerOption(
+        ),
+        '_G': IntegerOption.spec(
             "G", "Cut field of view according to Guth; eval", min_value=1, max_value=2
-        )
-        self._i = NumericOption("i", "Externally measured vertical illuminance in lux")
-        self._I = TupleOption(
+        ),
+        '_i': NumericOption.spec("i", "Externally measured vertical illuminance in lux"),
+        '_I': TupleOption.spec(
             "I", "Externally measured illuminance as (Ev, y_max, y_min)",
             value=None, length=3, numtype=float
-        )
-        self._l = TupleOption(
+        ),
+        '_l': TupleOption.spec(
             "l", "Circular one zone evaluation as (xpos, ypos, angle)",
             value=None, length=3, numtype=float
-        )
-        self._L = TupleOption(
+        ),
+        '_L': TupleOption.spec(
             "L", "Circular two zone evaluation as (xpos, ypos, angle1, angle2)",
             value=None, length=4, numtype=float
-        )
-        self._N = TupleOption(
+        ),
+        '_N': TupleOption.spec(
             "N", "Pixel replacement during overflow as (xpos, ypos, angle, Ev, fname)",
             value=None, length=5, numtype=str
-        )
-        self._q = IntegerOption(
+        ),
+        '_q': IntegerOption.spec(
             "q", "Background luminance calculation method - default: 0",
             min_value=0, max_value=2
-        )
-        self._r = NumericOption(
+        ),
+        '_r': NumericOption.spec(
             "r", "Search radius (angle) between pixels - default: 0.2 radians"
-        )
-        self._s = BoolOption("s", "Enable smoothing function - default: False")
-        self._t = TupleOption(
+        ),
+        '_s': BoolOption.spec("s", "Enable smoothing function - default: False"),
+        '_t': TupleOption.spec(
             "t", "Task position as (xpos, ypos, angle)",
             value=None, length=3, numtype=float
-        )
-        self._T = TupleOption(
+        ),
+        '_T': TupleOption.spec(
             "T", "Task position (colored blue) as (xpos, ypos, angle)",
             value=None, length=3, numtype=float
-        )
-        self._u = TupleOption(
+        ),
+        '_u': TupleOption.spec(
             "u", "RGB color to color glare sources uniformly",
             value=None, length=3, numtype=float
-        )
-        self._x = BoolOption("x", "Disable peak extraction - default: False")
-        self._y = BoolOption("y", "Enable peak extraction - default: True")
-        self._Y = NumericOption("Y", "Enable peak extraction with value in cd/m2")
+        ),
+        '_x': BoolOption.spec("x", "Disable peak extraction - default: False"),
+        '_y': BoolOption.spec("y", "Enable peak extraction - default: True"),
+        '_Y': NumericOption.spec("Y", "Enable peak extraction with value in cd/m2"),
+    }
+
+    def __init__(self):
+        """evalglare command options."""
+
+        OptionCollection.__init__(self)
         self._on_setattr_check = True
 
     def _on_setattr(self):
         """This method executes after setting each new attribute.
         """
         warn = ' This program can use either of the options but not both.'
-        if self._g.is_set and self._G.is_set:
+        if self._is_set('_g') and self._is_set('_G'):
             raise ValueError('Both -g and -G do not go well together.' + warn)
-        if self._i.is_set and self._I.is_set:
+        if self._is_set('_i') and self._is_set('_I'):
             raise ValueError('Both -i and -I do not go well together.' + warn)
-        if self._l.is_set and self._L.is_set:
+        if self._is_set('_l') and self._is_set('_L'):
             raise ValueError('Both -l and -L do not go well together.' + warn)
-        if self._t.is_set and self._T.is_set:
+        if self._is_set('_t') and self._is_set('_T'):
             raise ValueError('Both -t and -T do not go well together.' + warn)
-        if self._y.is_set and self._Y.is_set:
+        if self._is_set('_y') and self._is_set('_Y'):
             raise ValueError('Both -y and -Y do not go well together.' + warn)
-        if self._A.is_set and (self._l.is_set or self._L.is_set):
+        if self._is_set('_A') and (self._is_set('_l') or self._is_set('_L')):
             raise ValueError('Both -A and -l/-L do not go well together.')
 
     @property
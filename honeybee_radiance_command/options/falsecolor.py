@@ -36,32 +36,35 @@ class FalsecolorOptions(OptionCollection):
         "_odim"
     )
 
-    def __init__(self):
-        """falsecolor command options."""
-
-        OptionCollection.__init__(self)
-        self._pal = StringOption(
+    _specs = {
+        '_pal': StringOption.spec(
             "pal", "Color palette - default: def",
             valid_values=["def", "spec", "hot", "pm3d"], whole=True
-        )
-        self._s = StringOption("s", "Legend scale - default: auto")
-        self._m = NumericOption("m", "Legend multiplier - default: 179")
-        self._log = IntegerOption("log", "Logarithmic mapping intervals")
-        self._l = StringOption("l", "Legend label - default: Nits")
-        self._cl = BoolOption("cl", "Contour lines - default: False")
-        self._p = FileOption("p", "Picture to place countour lines over")
-        self._cb = BoolOption("cb", "Contour bands - default: False")
-        self._n = IntegerOption("n", "Number of contours - default: 8")
-        self._lw = IntegerOption("lw", "Legend width in pixels - default: 100")
-        self._lh = IntegerOption("lh", "Legend width in pixels - default: 200")
-        self._e = BoolOption("e", "Print extrema min/max pixels - default: False")
-        self._r = StringOption("r", "Red channel mapping (expression of 'v')")
-        self._g = StringOption("g", "Green channel mapping (expression of 'v')")
-        self._b = StringOption("b", "Blue channel mapping (expression of 'v')")
-        self._odim = TupleOption(
+        ),
+        '_s': StringOption.spec("s", "Legend scale - default: auto"),
+        '_m': NumericOption.spec("m", "Legend multiplier - default: 179"),
+        '_log': IntegerOption.spec("log", "Logarithmic mapping intervals"),
+        '_l': StringOption.spec("l", "Legend label - default: Nits"),
+        '_cl': BoolOption.spec("cl", "Contour lines - default: False"),
+        '_p': FileOption.spec("p", "Picture to place countour lines over"),
+        '_cb': BoolOption.spec("cb", "Contour bands - default: False"),
+        '_n': IntegerOption.spec("n", "Number of contours - default: 8"),
+        '_lw': IntegerOption.spec("lw", "Legend width in pixels - default: 100"),
+        '_lh': IntegerOption.spec("lh", "Legend width in pixels - default: 200"),
+        '_e': BoolOption.spec("e", "Print extrema min/max pixels - default: False"),
+        '_r': StringOption.spec("r", "Red channel mapping (expression of 'v')"),
+        '_g': StringOption.spec("g", "Green channel mapping (expression of 'v')"),
+        '_b': StringOption.spec("b", "Blue channel mapping (expression of 'v')"),
+        '_odim': TupleOption.spec(
             "odim", "X and Y grid dimensions for value overlay", length=2,
             numtype=int
-        )
+        ),
+    }
+
+    def __init__(self):
+        """falsecolor command options."""
+
+        OptionCollection.__init__(self)
         self._on_setattr_check = True
 
     def _on_setattr(self):
@@ -69,7 +72,7 @@ class FalsecolorOptions(OptionCollection):
 
         Use this method to add checks that are necessary for OptionCollection.
         """
-        if self._cl.is_set and self._cb.is_set:
+        if self._is_set('_cl') and self._is_set('_cb'):
             raise ValueError(
                 'Both cl and cb are set. The program can use either draw contour '
                 'lines or contour bands, but not both.'
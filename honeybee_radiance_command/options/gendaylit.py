@@ -27,38 +27,42 @@ class GendaylitOptions(OptionCollection):
         '_ang'
         )
 
+    _specs = {
+        '_P': TupleOption.spec("P", "Espilon data a.k.a Perez parameters", length=2),
+        '_W': TupleOption.spec("W", "Direct normal irradiance and diffuse"
+                               " horizontal irradiance", length=2, numtype=int),
+        '_L': TupleOption.spec("L", "Direct normal illuminance and"
+                               " diffuse horizontal illuminance", length=2, numtype=int),
+        '_O': IntegerOption.spec("O", "Output", min_value=0, max_value=2),
+        '_s': BoolOption.spec("s", "Generate source description of the sun"),
+        '_g': NumericOption.spec("g", "Average ground reflectance"),
+        '_a': NumericOption.spec("a", "Site latitude", min_value=-90.0, max_value=90.0),
+        '_o': NumericOption.spec(
+            "o", "Site longitude", min_value=-180.0, max_value=180.0),
+        '_m': NumericOption.spec("m", "Standard meridian", min_value=-18.0,
+                                 max_value=18.0),
+        '_ang': TupleOption.spec("ang", "Altitude & azimuth", length=2, numtype=float),
+    }
+
     def __init__(self):
         """Gendaylit command options."""
 
         OptionCollection.__init__(self)
 
-        self._P = TupleOption("P", "Espilon data a.k.a Perez parameters", length=2)
-        self._W = TupleOption("W", "Direct normal irradiance and diffuse"
-                              " horizontal irradiance", length=2, numtype=int)
-        self._L = TupleOption("L", "Direct normal illuminance and"
-                              " diffuse horizontal illuminance", length=2, numtype=int)
-        self._O = IntegerOption("O", "Output", min_value=0, max_value=2)
-        self._s = BoolOption("s", "Generate source description of the sun")
-        self._g = NumericOption("g", "Average ground reflectance")
-        self._a = NumericOption("a", "Site latitude", min_value=-90.0, max_value=90.0)
-        self._o = NumericOption("o", "Site longitude", min_value=-180.0, max_value=180.0)
-        self._m = NumericOption("m", "Standard meridian", min_value=-18.0,
-                                max_value=18.0)
-        self._ang = TupleOption("ang", "Altitude & azimuth", length=2, numtype=float)
         self._on_setattr_check = True
 
     def _on_setattr(self):
         """This method executes after setting each new attribute.
         Use this method to add checks that are necessary for OptionCollection.
         """
-        if self._ang.is_set and (
-                self._a.is_set or self._o.is_set or self._m.is_set):
+        if self._is_set('_ang') and (
+                self._is_set('_a') or self._is_set('_o') or self._is_set('_m')):
             raise ValueError(
                 'Options -a, -o and -m do not apply when -ang is set.'
             )
 
-        params = {'perez': self._P.is_set, 'irradiance_values': self._W.is_set,
-                  'illuminance_values': self._L.is_set}
+        params = {'perez': self._is_set('_P'), 'irradiance_values': self._is_set('_W'),
+                  'illuminance_values': self._is_set('_L')}
         params_requested = [param for param in params if params[param] is True]
 
         if len(params_requested) > 1:
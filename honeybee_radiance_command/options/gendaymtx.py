@@ -17,82 +17,84 @@ class GendaymtxOptions(OptionCollection):
         '_o', '_O'
     )
 
-    def __init__(self):
-        """gendaymtx command options."""
-        OptionCollection.__init__(self)
-        self._on_setattr_check = False
-        self._v = BoolOption('v', 'verbose reporting - default: off')
-        self._h = BoolOption(
+    _specs = {
+        '_v': BoolOption.spec('v', 'verbose reporting - default: off'),
+        '_h': BoolOption.spec(
             'h', 'prevents the output of the usual header information - default: off'
-        )
-        self._A = BoolOption(
+        ),
+        '_A': BoolOption.spec(
             'A', 'tells gendaymtx to generate a single column corresponding to an '
             'average sky computed over all the input time steps, rather than one '
             'column per time step. - default: off'
-        )
-        self._m = IntegerOption('m', 'Set sky resolution - default: 1', min_value=1)
-        self._d = BoolOption(
+        ),
+        '_m': IntegerOption.spec('m', 'Set sky resolution - default: 1', min_value=1),
+        '_d': BoolOption.spec(
             'd', 'produce a sun-only matrix, with no sky contributions, and the ground '
             'patch also set to zero.'
-        )
-        self._s = BoolOption(
+        ),
+        '_s': BoolOption.spec(
             's', 'exclude any direct solar component from the output, with the rest of '
             'the sky and ground patch unaffected.'
-        )
-        self._n = BoolOption(
+        ),
+        '_n': BoolOption.spec(
             'n', 'may be used if no matrix output is desired at all. This may be used '
             'to merely check the input, or in combination with the -D option.'
-        )
-        self._u = BoolOption(
+        ),
+        '_u': BoolOption.spec(
             'u', 'ignores input times when the sun is below the horizon. This is a '
             'convenient way to average daylight hours only with the -A option or to '
             'ensure that matrix entries correspond to solar positions produced with '
             'the -D option'
-        )
-        self._c = TupleOption(
+        ),
+        '_c': TupleOption.spec(
             'c', 'may be used to specify a color for the sky. The gray value should '
             'equal 1 for proper energy balance. The default sky color is -c 0.960 '
             '1.004 1.118', length=3, numtype=float
-        )
-        self._g = TupleOption(
+        ),
+        '_g': TupleOption.spec(
             'g', 'may be used to specify a ground color. The default value is -g 0.2 '
             '0.2 0.2 corresponding to a 20 percent gray', length=3, numtype=float
-        )
-        self._D = FileOption(
+        ),
+        '_D': FileOption.spec(
             'D', 'may be used to specify an output file to contain a list of solar '
             'positions and intensities corresponding to time steps in the weather tape '
             'where the sun has any portion above the horizon. Sun radiance values may '
             'be zero if the direct amount is zero on the input. Sun modifiers and names '
             'will be indexed by the minute, numbered from midnight, January 1st.'
-        )
-        self._M = FileOption(
+        ),
+        '_M': FileOption.spec(
             'M', 'may be used to specify an output file to contain a list of sun '
             'modifiers.'
-        )
-        self._r = NumericOption(
+        ),
+        '_r': NumericOption.spec(
             'r', 'rotates the sky the specified number of degrees counter-clockwise'
             'about the zenith, i.e., west of north.', min_value=-360, max_value=360
-        )
-        self._o = StringOptionJoined(
+        ),
+        '_o': StringOptionJoined.spec(
             'o', 'The -of or -od option may be used to specify binary float or double '
             'output, respectively. This is much faster to write and to read, and is '
             'therefore preferred on systems that support it.', valid_values=['f', 'd'],
             whole=False
-        )
-        self._O = StringOptionJoined(
+        ),
+        '_O': StringOptionJoined.spec(
             'O', 'The -O1 option specifies that output should be total solar radiance '
             'rather than visible radiance - default O0', valid_values=['0', '1'],
             whole=False
-        )
+        ),
+    }
+
+    def __init__(self):
+        """gendaymtx command options."""
+        OptionCollection.__init__(self)
         self._on_setattr_check = True
 
     def _on_setattr(self):
         """This method executes after setting each new attribute."""
-        if self.s.is_set and self.d.is_set:
+        if self._is_set('_s') and self._is_set('_d'):
             raise exceptions.ExclusiveOptionsError(self.command, 's', 'd')
-        if self.s.is_set and self.n.is_set:
+        if self._is_set('_s') and self._is_set('_n'):
             raise exceptions.ExclusiveOptionsError(self.command, 's', 'n')
-        if self.n.is_set and self.d.is_set:
+        if self._is_set('_n') and self._is_set('_d'):
             raise exceptions.ExclusiveOptionsError(self.command, 'n', 'd')
 
     @property
@@ -32,31 +32,34 @@ class GenskyOptions(OptionCollection):
         "_m",
         "_ang")
 
+    _specs = {
+        '_s': ToggleOption.spec("s", "Sunny sky", value=None),
+        '_c': BoolOption.spec("c", "Cloudy sky"),
+        '_i': ToggleOption.spec("i", "Intermediate sky", value=None),
+        '_u': BoolOption.spec("u", "Uniform cloudy sky"),
+        '_g': NumericOption.spec("g", "Average ground reflectance"),
+        '_b': NumericOption.spec("b", "Zenith brightness computed from sun and"
+                                 " sky turbidity."),
+        '_B': NumericOption.spec("B", "Zenith brightness computed from"
+                                 " horizontal diffuse irradiance."),
+        '_r': NumericOption.spec("r", "Solar radiance computed from solar altitude."),
+        '_R': NumericOption.spec("R", "Solar radiance computed from"
+                                 " horizontal direct irradiance."),
+        '_t': NumericOption.spec("t", "Turbuity factor", min_value=1.0),
+        '_a': NumericOption.spec("a", "Site latitude", min_value=-90.0, max_value=90.0),
+        '_o': NumericOption.spec("o", "Site longitude", min_value=-180.0,
+                                 max_value=180.0),
+        '_m': NumericOption.spec("m", "Standard meridian", min_value=-18.0,
+                                 max_value=18.0),
+        '_ang': TupleOption.spec("ang", "Altitude & azimuth", length=2,
+                                 numtype=float),
+    }
+
     def __init__(self):
         """Gensky command options."""
 
         OptionCollection.__init__(self)
 
-        self._s = ToggleOption("s", "Sunny sky", value=None)
-        self._c = BoolOption("c", "Cloudy sky")
-        self._i = ToggleOption("i", "Intermediate sky", value=None)
-        self._u = BoolOption("u", "Uniform cloudy sky")
-        self._g = NumericOption("g", "Average ground reflectance")
-        self._b = NumericOption("b", "Zenith brightness computed from sun and"
-                                " sky turbidity.")
-        self._B = NumericOption("B", "Zenith brightness computed from"
-                                " horizontal diffuse irradiance.")
-        self._r = NumericOption("r", "Solar radiance computed from solar altitude.")
-        self._R = NumericOption("R", "Solar radiance computed from"
-                                " horizontal direct irradiance.")
-        self._t = NumericOption("t", "Turbuity factor", min_value=1.0)
-        self._a = NumericOption("a", "Site latitude", min_value=-90.0, max_value=90.0)
-        self._o = NumericOption("o", "Site longitude", min_value=-180.0,
-                                max_value=180.0)
-        self._m = NumericOption("m", "Standard meridian", min_value=-18.0,
-                                max_value=18.0)
-        self._ang = TupleOption("ang", "Altitude & azimuth", length=2,
-                                numtype=float)
         self._on_setattr_check = True
 
     def _on_setattr(self):
@@ -64,14 +67,16 @@ class GenskyOptions(OptionCollection):
 
         Use this method to add checks that are necessary for OptionCollection.
         """
-        if self._ang.is_set and (
-                self._a.is_set or self._o.is_set or self._m.is_set):
+        if self._is_set('_ang') and (
+                self._is_set('_a') or self._is_set('_o') or self._is_set('_m')):
             warnings.warn(
                 'Options -a, -o and -m do not apply when -ang is set.'
             )
 
-        skies = {'sunny sky': self._s.is_set, 'cloudy sky': self._c.is_set,
-                 'Intermediate sky': self._i.is_set, 'Uniform sky': self._u.is_set}
+        skies = {
+            'sunny sky': self._is_set('_s'), 'cloudy sky': self._is_set('_c'),
+            'Intermediate sky': self._is_set('_i'), 'Uniform sky': self._is_set('_u')
+        }
         skies_requested = [sky for sky in skies if skies[sky] is True]
 
         if len(skies_requested) > 1:
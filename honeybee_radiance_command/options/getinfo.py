@@ -11,12 +11,16 @@ class GetinfoOptions(OptionCollection):
 
     __slots__ = ('_d', '_a')
 
+    _specs = {
+        '_d': BoolOption.spec("d", "Print the dimensions instead - default: False"),
+        '_a': StringOption.spec(
+            "a", "Text to add to the file header", pattern_out='"%s"'),
+    }
+
     def __init__(self):
         """getinfo command options."""
 
         OptionCollection.__init__(self)
-        self._d = BoolOption("d", "Print the dimensions instead - default: False")
-        self._a = StringOption("a", "Text to add to the file header", pattern_out='"%s"')
         self._on_setattr_check = False
 
     @property
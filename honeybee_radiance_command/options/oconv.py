@@ -12,21 +12,24 @@ class OconvOptions(OptionCollection):
 
     __slots__ = ('_i', '_b', '_n', '_r', '_f', '_w')
 
-    def __init__(self):
-        """oconv command options."""
-        OptionCollection.__init__(self)
-        self._i = FileOption('i', 'existing octree file')
-        self._b = TupleOption(
+    _specs = {
+        '_i': FileOption.spec('i', 'existing octree file'),
+        '_b': TupleOption.spec(
             'b', 'bounding box as min_x, min_y, min_z and size', None, 4, float
-        )
-        self._n = IntegerOption(
+        ),
+        '_n': IntegerOption.spec(
             'n', 'maximum surface set size for each voxel - default: 6', min_value=0
-        )
-        self._r = IntegerOption(
+        ),
+        '_r': IntegerOption.spec(
             'r', 'maximum octree resolution - default: 16384', min_value=0
-        )
-        self._f = BoolOption('f', 'frozen octree - default: off')
-        self._w = BoolOption('w', 'warning messages - default: on')
+        ),
+        '_f': BoolOption.spec('f', 'frozen octree - default: off'),
+        '_w': BoolOption.spec('w', 'warning messages - default: on'),
+    }
+
+    def __init__(self):
+        """oconv command options."""
+        OptionCollection.__init__(self)
         self._on_setattr_check = True
 
     def _on_setattr(self):
@@ -36,7 +39,7 @@ class OconvOptions(OptionCollection):
         instance in rtrace option collection -ti and -te are exclusive. You can include a
         check to ensure this is always correct.
         """
-        assert not (self.b.is_set and self.i.is_set), \
+        assert not (self._is_set('_b') and self._is_set('_i')), \
             'The -b and -i options are mutually exclusive.'
 
     @property
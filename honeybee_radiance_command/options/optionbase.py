@@ -3,13 +3,59 @@ import honeybee_radiance_command._typing as typing
 import honeybee_radiance_command.cutil as cutil
 import honeybee_radiance_command._exception as exceptions
 import honeybee_radiance_command.cutil as futil
+import importlib
+import shlex
 import warnings
 import re
 
 
+class OptionSpec(object):
+    """Specification for creating a Radiance option.
+
+    OptionCollection classes keep the specifications for their options in a class-level
+    table and only create the options when they are accessed for the first time.
+
+    Args:
+        option_type: Option class (e.g. IntegerOption).
+        args: Positional arguments for creating the option.
+        kwargs: Keyword arguments for creating the option.
+
+    Properties:
+        * option_type
+        * args
+        * kwargs
+        * name
+        * description
+    """
+
+    __slots__ = ('option_type', 'args', 'kwargs')
+
+    def __init__(self, option_type, args, kwargs):
+        self.option_type = option_type
+        self.args = args
+        self.kwargs = kwargs
+
+    @property
+    def name(self):
+        """Option name."""
+        return self.args[0] if self.args else self.kwargs['name']
+
+    @property
+    def description(self):
+        """Option description."""
+        return self.args[1] if len(self.args) > 1 else self.kwargs['description']
+
+    def create(self):
+        """Create a new option from this specification."""
+        return self.option_type(*self.args, **self.kwargs)
+
+    def __repr__(self):
+        return '%s: -%s' % (self.option_type.__name__, self.name)
+
+
 class Option(object):
     """Radiance Option base class."""
-    __slots__ = ('_name', '_value', '_description')
+    __slots__ = ('_name', '_value', '_description', '_owner')
 
     def __init__(self, name, description, value=None):
         """Create Radiance option.
@@ -19,6 +65,7 @@ class Option(object):
             description: Longer description for Radiance option (e.g. ambient bounces)
             value: Optional value for option (Defult: None).
         """
+        self._owner = None
         self.name = name
         self.description = description
         self.value = value
@@ -46,7 +93,7 @@ class Option(object):
 
     @value.setter
     def value(self, value):
-        self._value = value
+        self._set_value(value)
 
     @property
     def is_set(self):
@@ -60,9 +107,32 @@ class Option(object):
         else:
             return ''
 
+    @classmethod
+    def spec(cls, *args, **kwargs):
+        """Get an OptionSpec for this option type.
+
+        The arguments are the same as the arguments for creating the option.
+        """
+        return OptionSpec(cls, args, kwargs)
+
     def ToString(self):
         return self.__repr__()
 
+    def _set_value(self, value):
+        """Set the value and let the owner collection know that it has changed.
+
+        Value setters must use this method instead of setting _value directly.
+        """
+        owner = self._owner
+        if owner is None:
+            self._value = value
+            return
+        if owner._frozen:
+            raise exceptions.FrozenOptionsError(owner.command)
+        self._value = value
+        # let the collection know that the rendered options are out of date
+        owner._reset_rendered()
+
     def __repr__(self):
         if self.is_set:
             return '%s\t\t# %s' % (self.to_radiance(), self.description)
@@ -103,9 +173,9 @@ class FileOption(Option):
     @value.setter
     def value(self, value):
         if value is None:
-            self._value = value
+            self._set_value(value)
         else:
-            self._value = typing.normpath(value)
+            self._set_value(typing.normpath(value))
 
     def to_radiance(self):
         """Translate option to Radiance format."""
@@ -159,7 +229,7 @@ class StringOption(FileOption):
     @value.setter
     def value(self, value):
         if value is None:
-            self._value = value
+            self._set_value(value)
         else:
             if self.pattern_in is not None:
                 if not re.match(self.pattern_in, value):
@@ -179,7 +249,9 @@ class StringOption(FileOption):
                             raise exceptions.InvalidValueError(self.name, v,
                                                                self.valid_values)
 
-            self._value = value if not self.pattern_out else self.pattern_out % value
+            self._set_value(
+                value if not self.pattern_out else self.pattern_out % value
+            )
 
 
 class StringOptionJoined(StringOption):
@@ -223,10 +295,10 @@ class NumericOption(Option):
     @value.setter
     def value(self, value):
         if value is not None:
-            self._value = typing.float_in_range(
-                value, self.min_value, self.max_value, self.name)
+            self._set_value(typing.float_in_range(
+                value, self.min_value, self.max_value, self.name))
         else:
-            self._value = None
+            self._set_value(None)
 
     def __int__(self):
         return int(self._value)
@@ -299,10 +371,10 @@ class IntegerOption(NumericOption):
     @value.setter
     def value(self, value):
         if value is not None:
-            self._value = typing.int_in_range(
-                value, self.min_value, self.max_value, self.name)
+            self._set_value(typing.int_in_range(
+                value, self.min_value, self.max_value, self.name))
         else:
-            self._value = None
+            self._set_value(None)
 
 
 class BoolOption(Option):
@@ -321,9 +393,9 @@ class BoolOption(Option):
             # this is a special case to handle read from string when + is not used
             # in Radiance -I means -I+ and -h means -h+ and so on.
             value = True if value == '' else value
-            self._value = False if value == '-' else bool(value)
+            self._set_value(False if value == '-' else bool(value))
         else:
-            self._value = None
+            self._set_value(None)
 
     def to_radiance(self):
         """Translate option to Radiance format."""
@@ -361,10 +433,10 @@ class TupleOption(Option):
     @value.setter
     def value(self, value):
         if value is not None:
-            self._value = typing.tuple_with_length(
-                value, self.length, self.numtype, self.name)
+            self._set_value(typing.tuple_with_length(
+                value, self.length, self.numtype, self.name))
         else:
-            self._value = None
+            self._set_value(None)
 
     def to_radiance(self):
         """Translate option to Radiance format."""
@@ -380,14 +452,104 @@ class TupleOption(Option):
         self._value[key] = val
 
 
+# slots for each OptionCollection class and protected options - see slots property
+_SLOTS = {}
+_SLOT_SETS = {}
+# option specifications for each OptionCollection class - see _option_specs
+_SPECS = {}
+# frozen option presets - see OptionCollection.preset
+_PRESETS = {}
+
+
+class _AdditionalOptions(dict):
+    """Dictionary for additional options that resets the rendered options on change."""
+
+    __slots__ = ('_owner',)
+
+    def __init__(self, owner, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self._owner = owner
+
+    def _check_frozen(self):
+        if self._owner._frozen:
+            raise exceptions.FrozenOptionsError(self._owner.command)
+
+    def __setitem__(self, key, value):
+        self._check_frozen()
+        dict.__setitem__(self, key, value)
+        self._owner._reset_rendered()
+
+    def __delitem__(self, key):
+        self._check_frozen()
+        dict.__delitem__(self, key)
+        self._owner._reset_rendered()
+
+    def clear(self):
+        self._check_frozen()
+        dict.clear(self)
+        self._owner._reset_rendered()
+
+    def pop(self, *args):
+        self._check_frozen()
+        value = dict.pop(self, *args)
+        self._owner._reset_rendered()
+        return value
+
+    def popitem(self):
+        self._check_frozen()
+        item = dict.popitem(self)
+        self._owner._reset_rendered()
+        return item
+
+    def setdefault(self, key, default=None):
+        self._check_frozen()
+        value = dict.setdefault(self, key, default)
+        self._owner._reset_rendered()
+        return value
+
+    def update(self, *args, **kwargs):
+        self._check_frozen()
+        dict.update(self, *args, **kwargs)
+        self._owner._reset_rendered()
+
+
 class OptionCollection(object):
     """Collection of Radiance Options.
 
     This is base class for difference Radiance command options.
+
+    Subclasses define their options in a ``_specs`` dictionary which maps the slot name
+    of each option to an OptionSpec. Options are only created when they are accessed or
+    set for the first time and the options that are never used don't take any memory.
+
+    The output of to_radiance is cached and is only recalculated after an option or
+    additional_options changes.
+
+    Two collections are equal if they are of the same class and set the same values.
+    The order of the options and the formatting of the input string don't change the
+    result. See the canonical property.
+
+    Collections can be pickled and only the values of the options that are set are
+    stored. Use to_dict and from_dict to convert them to and from a dictionary.
+
+    Use the preset classmethod to create a frozen collection of options that can be
+    shared between many commands. Commands that use a preset get their own copy of the
+    options using the derive method. A derived collection reads the option values from
+    the preset and only keeps a private copy of the options that are changed.
     """
-    __slots__ = ('additional_options', '_on_setattr_check', '_protected')
+    __slots__ = (
+        'additional_options', '_on_setattr_check', '_protected', '_rendered', '_created',
+        '_frozen', '_preset', '_canonical', '_argv'
+    )
 
     def __init__(self):
+        object.__setattr__(self, '_rendered', None)
+        object.__setattr__(self, '_canonical', None)
+        object.__setattr__(self, '_argv', None)
+        # names of the options that are already created
+        object.__setattr__(self, '_created', set())
+        object.__setattr__(self, '_frozen', False)
+        object.__setattr__(self, '_preset', None)
         # run on_setattr method on every attribute assignment
         # set to False if you are assigning several attributes all together when
         # initiating a new instance.
@@ -399,6 +561,67 @@ class OptionCollection(object):
         # user.
         self._protected = ()
 
+    @classmethod
+    def preset(cls, string=None, **kwargs):
+        """Get a frozen collection of options that can be shared between commands.
+
+        Presets with the same values are only created once and the same object is
+        returned for the same inputs.
+
+        Args:
+            string: Optional Radiance options string (e.g. '-ab 5 -ad 2048').
+            kwargs: Optional option values by name (e.g. ab=5, ad=2048).
+
+        Usage:
+
+        .. code-block:: python
+
+            preset = RtraceOptions.preset('-ab 5 -ad 2048 -lw 2e-05')
+            rtrace = Rtrace(options=preset)
+            # only the rtrace command will have -ab 6
+            rtrace.options.ab = 6
+        """
+        options = cls()
+        if string:
+            options.update_from_string(string)
+        for name, value in sorted(kwargs.items()):
+            setattr(options, name, value)
+        return _freeze(options)
+
+    def derive(self):
+        """Get a new collection of options that uses this frozen preset as a base.
+
+        The new collection can be changed without changing the preset. The options are
+        only copied from the preset when they are accessed or changed.
+        """
+        if not self._frozen:
+            raise ValueError(
+                'Only frozen option presets can be derived. Use preset method to create '
+                'a frozen preset.'
+            )
+        cls = self.__class__
+        options = cls.__new__(cls)
+        object.__setattr__(options, '_rendered', None)
+        object.__setattr__(options, '_canonical', None)
+        object.__setattr__(options, '_argv', None)
+        object.__setattr__(options, '_created', set())
+        object.__setattr__(options, '_frozen', False)
+        object.__setattr__(options, '_preset', self)
+        object.__setattr__(options, '_on_setattr_check', self._on_setattr_check)
+        object.__setattr__(options, '_protected', self._protected)
+        object.__setattr__(options, 'additional_options', _AdditionalOptions(options))
+        return options
+
+    @property
+    def is_frozen(self):
+        """A boolean that indicates if the options are a frozen preset."""
+        return self._frozen
+
+    @property
+    def base_preset(self):
+        """The frozen preset that these options are derived from if any."""
+        return self._preset
+
     @property
     def command(self):
         """Command name."""
@@ -406,27 +629,124 @@ class OptionCollection(object):
 
     @property
     def slots(self):
-        """Return slots including the ones from the baseclass if any."""
+        """Return slots including the ones from the baseclass if any.
+
+        Slots are only collected once for each class and each set of protected
+        options. The output is a sorted tuple which is shared between instances.
+        """
+        key = (self.__class__, tuple(self._protected))
+        try:
+            return _SLOTS[key]
+        except KeyError:
+            pass
         slots = set(self.__slots__)
         for cls in self.__class__.__mro__[1:-2]:
             for s in getattr(cls, '__slots__', tuple()):
                 if s in slots:
                     continue
                 slots.add(s)
-        slots = [s for s in slots if s not in self._protected]
-        slots.sort()
+        slots = tuple(sorted(s for s in slots if s not in self._protected))
+        _SLOTS[key] = slots
+        _SLOT_SETS[key] = frozenset(slots)
         return slots
 
+    @property
+    def _slot_set(self):
+        """Slots as a frozenset for fast look ups."""
+        try:
+            return _SLOT_SETS[(self.__class__, tuple(self._protected))]
+        except KeyError:
+            self.slots
+            return _SLOT_SETS[(self.__class__, tuple(self._protected))]
+
+    @classmethod
+    def _option_specs(cls):
+        """Get all the option specifications for this class including the baseclasses."""
+        try:
+            return _SPECS[cls]
+        except KeyError:
+            pass
+        specs = {}
+        for klass in reversed(cls.__mro__):
+            specs.update(klass.__dict__.get('_specs', {}))
+        _SPECS[cls] = specs
+        return specs
+
+    def _created_option(self, name):
+        """Get an option if it is already created. Otherwise return None.
+
+        For derived options the option from the preset is returned if the option
+        is not changed.
+        """
+        if name in self._created:
+            return object.__getattribute__(self, name)
+        if self._preset is not None:
+            return self._preset._created_option(name)
+        return None
+
+    def _is_set(self, name):
+        """Check if an option is set without creating it.
+
+        Use this method in _on_setattr so checking other options doesn't create them.
+
+        Args:
+            name: Slot name of the option (e.g. _ab).
+        """
+        option = self._created_option(name)
+        return option is not None and option.is_set
+
+    def _option_value(self, name):
+        """Get the value of an option without creating it or None if it is not set.
+
+        Args:
+            name: Slot name of the option (e.g. _ab).
+        """
+        option = self._created_option(name)
+        return None if option is None else option.value
+
+    def _additional_options(self):
+        """Get additional options including the ones from the preset if any."""
+        if self._preset is None or not self._preset.additional_options:
+            return self.additional_options
+        additional_options = dict(self._preset.additional_options)
+        additional_options.update(self.additional_options)
+        return additional_options
+
+    def __getattr__(self, name):
+        # this method is only called for attributes that are not set. Options are
+        # created from their specification the first time that they are accessed.
+        try:
+            spec = self._option_specs()[name]
+        except KeyError:
+            raise AttributeError(
+                '"{}" object has no attribute "{}".'.format(
+                    self.__class__.__name__, name)
+            )
+        option = spec.create()
+        if self._preset is not None:
+            # copy the value from the preset
+            source = self._preset._created_option(name)
+            if source is not None:
+                object.__setattr__(option, '_value', source._value)
+        option._owner = self
+        object.__setattr__(self, name, option)
+        self._created.add(name)
+        return option
+
     @property
     def options(self):
         """Print out list of options."""
         options = []
+        specs = self._option_specs()
         for opt in self.slots:
-            option = getattr(self, opt)
+            option = self._created_option(opt)
+            if option is None and opt in specs:
+                # create a temporary option for printing the description
+                option = specs[opt].create()
             if not isinstance(option, Option):
                 continue
             options.append(str(option))
-        for k, v in self.additional_options.items():
+        for k, v in self._additional_options().items():
             options.append('-%s %s\t\t# additional option with no description' % (k, v))
         return '\n'.join(options)
 
@@ -436,7 +756,7 @@ class OptionCollection(object):
         If the option is not currently part of the collection, it will be added to
         additional_options.
         """
-        slots = self.slots
+        slots = self._slot_set
         opt_dict = cutil.parse_radiance_options(string)
         for p, v in opt_dict.items():
             if '_%s' % p in slots:
@@ -470,20 +790,132 @@ class OptionCollection(object):
                             p, self.__class__.__name__
                         )
                     )
-                # add to additional options
+                # add to additional options and keep the quotes for values with spaces
+                if not isinstance(v, list) and ' ' in v:
+                    v = '{0}{1}{0}'.format(typing.wrapper, v)
                 self.additional_options[p] = v
 
     def to_radiance(self):
         """Translate options to Radiance format."""
-        options = \
-            ' '.join(getattr(self, opt).to_radiance() for opt in self.slots)
+        rendered = self._rendered
+        if rendered is None:
+            if self._preset is not None and not self._created \
+                    and not self.additional_options:
+                # nothing is changed from the preset
+                rendered = self._preset.to_radiance()
+            else:
+                rendered = self._render()
+            object.__setattr__(self, '_rendered', rendered)
+        return rendered
+
+    def to_argv(self):
+        """Translate options to a list of arguments.
+
+        The quotes in the Radiance format are removed and each value is a single
+        argument. The output is cached in the same way as to_radiance.
+        """
+        argv = self._argv
+        if argv is None:
+            argv = shlex.split(self.to_radiance().replace('\\', '/'))
+            object.__setattr__(self, '_argv', argv)
+        return list(argv)
+
+    def _render(self):
+        """Translate options to Radiance format without using the cached output.
+
+        Overwrite this method instead of to_radiance to change the format of the
+        options in subclasses.
+        """
+        options = []
+        for opt in self.slots:
+            option = self._created_option(opt)
+            if option is not None:
+                options.append(option.to_radiance())
+        options = ' '.join(options)
         additional_options = \
-            ' '.join('-%s %s' % (k, v) for k, v in self.additional_options.items())
+            ' '.join('-%s %s' % (k, v) for k, v in self._additional_options().items())
 
         # handle replace %% with % to handle % in both Window and Unix
         return ' '.join(
             ' '.join((options, additional_options)).split()).replace('%%', '%')
 
+    @property
+    def canonical(self):
+        """Options in a canonical format.
+
+        The canonical format only includes the options that are set and sorts them by
+        name. The white space in the values of additional options is also normalized.
+        Options that are set to the same values will always have the same canonical
+        format regardless of the order that they are set in. Use this value as a key for
+        caching the results of a command.
+        """
+        canonical = self._canonical
+        if canonical is None:
+            options = []
+            for opt in self.slots:
+                option = self._created_option(opt)
+                if option is not None and option.is_set:
+                    options.append((option.name, option.to_radiance()))
+            for k, v in self._additional_options().items():
+                v = ' '.join(v) if isinstance(v, (list, tuple)) else str(v)
+                options.append((k, ' '.join(('-%s' % k, v)).strip()))
+            canonical = ' '.join(' '.join(o for _, o in sorted(options)).split()) \
+                .replace('%%', '%')
+            object.__setattr__(self, '_canonical', canonical)
+        return canonical
+
+    def to_dict(self):
+        """Translate options to a dictionary.
+
+        Only the options that are set are included. Options from the preset are included
+        for derived options.
+        """
+        options = {}
+        for opt in self.slots:
+            option = self._created_option(opt)
+            if option is not None and option.is_set:
+                value = option.value
+                options[opt[1:]] = list(value) if isinstance(value, tuple) else value
+        return {
+            'type': self.__class__.__name__,
+            'options': options,
+            'additional_options': dict(self._additional_options())
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create options from a dictionary.
+
+        Args:
+            data: A dictionary in the format of the to_dict output. If this method is
+                called on OptionCollection the class is found based on the type key.
+        """
+        options_type = data['type']
+        if options_type != cls.__name__:
+            # find the class from the module for the command
+            module = importlib.import_module(
+                'honeybee_radiance_command.options.%s' %
+                options_type.replace('Options', '').lower()
+            )
+            cls = getattr(module, options_type)
+        values = dict(('_%s' % k, v) for k, v in data['options'].items())
+        return _restore_options(cls, values, data.get('additional_options'))
+
+    def __reduce__(self):
+        # only keep the values for the options that are set. Options from the preset
+        # are not copied and the preset is pickled only once for all the options that
+        # are derived from it.
+        values = {}
+        for opt in self._created:
+            value = object.__getattribute__(self, opt)._value
+            if value is not None:
+                values[opt] = value
+        additional_options = dict(self.additional_options) or None
+        return (
+            _restore_options,
+            (self.__class__, values, additional_options, self._preset, self._frozen)
+        )
+
     def to_file(self, folder, file_name, mkdir=False):
         """Write options to a file."""
         name = file_name or self.__class__.__name__ + '.opt'
@@ -492,7 +924,30 @@ class OptionCollection(object):
     def __repr__(self):
         return self.options
 
+    def __eq__(self, other):
+        return self.__class__ is other.__class__ and self.canonical == other.canonical
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        # options are mutable and the hash changes when the options change
+        return hash((self.__class__, self.canonical))
+
+    def _reset_rendered(self):
+        """Reset the cached output of to_radiance, to_argv and canonical."""
+        object.__setattr__(self, '_rendered', None)
+        object.__setattr__(self, '_canonical', None)
+        object.__setattr__(self, '_argv', None)
+
     def __setattr__(self, name, value):
+        if self._frozen:
+            raise exceptions.FrozenOptionsError(self.command)
+        if isinstance(value, Option):
+            value._owner = self
+            self._created.add(name)
+        elif name == 'additional_options' and not isinstance(value, _AdditionalOptions):
+            value = _AdditionalOptions(self, value)
         try:
             object.__setattr__(self, name, value)
         except (AttributeError, SystemError):
@@ -507,6 +962,7 @@ class OptionCollection(object):
                         name, self.__class__.__name__)
                 )
         else:
+            self._reset_rendered()
             if self._on_setattr_check:
                 self._on_setattr()
 
@@ -520,6 +976,42 @@ class OptionCollection(object):
         pass
 
 
+def _restore_options(cls, values, additional_options=None, preset=None, frozen=False):
+    """Create an OptionCollection from the output of __reduce__ or to_dict.
+
+    Values are assigned without validation since they are already validated when the
+    options were created.
+
+    Args:
+        cls: OptionCollection class.
+        values: A dictionary of option values by slot name (e.g. {'_ab': 2}).
+        additional_options: Optional dictionary for additional options.
+        preset: Optional frozen preset for derived options.
+        frozen: A boolean to indicate if the options are a frozen preset.
+    """
+    options = preset.derive() if preset is not None else cls()
+    for opt, value in values.items():
+        option = getattr(options, opt)
+        if isinstance(value, list):
+            value = tuple(value)
+        object.__setattr__(option, '_value', value)
+    if additional_options:
+        options.additional_options.update(additional_options)
+    options._reset_rendered()
+    return _freeze(options) if frozen else options
+
+
+def _freeze(options):
+    """Freeze options and return the shared preset for the same values."""
+    key = (options.__class__, options.to_radiance())
+    try:
+        return _PRESETS[key]
+    except KeyError:
+        object.__setattr__(options, '_frozen', True)
+        _PRESETS[key] = options
+        return options
+
+
 class ToggleOption(Option):
     """Toggle radiance option."""
 
@@ -533,12 +1025,12 @@ class ToggleOption(Option):
     @value.setter
     def value(self, val):
         if not val:
-            self._value = None
+            self._set_value(None)
         elif val in ('+', '-'):
             if val == '+':
-                self._value = '+'
+                self._set_value('+')
             else:
-                self._value = '-'
+                self._set_value('-')
         else:
             raise ValueError("The value needs to be either '+' or '-' only.")
 
@@ -29,20 +29,23 @@ class PcombOptions(OptionCollection):
         "_c"
         )
 
+    _specs = {
+        '_h': BoolOption.spec("h", "Reduce information header - default: False"),
+        '_w': BoolOption.spec("w", "Suppress warning messages - default: False"),
+        '_x': IntegerOption.spec("x", "X resolution", min_value=1),
+        '_y': IntegerOption.spec("y", "Y resolution", min_value=1),
+        '_f': FileOption.spec("f", "function file"),
+        '_e': StringOption.spec("e", "Expression"),
+        '_o': BoolOption.spec("o", "Use original pixel values - default: False"),
+        '_s': NumericOption.spec("s", "Factor for linear combination"),
+        '_c': TupleOption.spec("c", "RGB values", length=3, value=None, numtype=float),
+    }
+
     def __init__(self):
         """pcomd command options."""
 
         OptionCollection.__init__(self)
 
-        self._h = BoolOption("h", "Reduce information header - default: False")
-        self._w = BoolOption("w", "Suppress warning messages - default: False")
-        self._x = IntegerOption("x", "X resolution", min_value=1)
-        self._y = IntegerOption("y", "Y resolution", min_value=1)
-        self._f = FileOption("f", "function file")
-        self._e = StringOption("e", "Expression")
-        self._o = BoolOption("o", "Use original pixel values - default: False")
-        self._s = NumericOption("s", "Factor for linear combination")
-        self._c = TupleOption("c", "RGB values", length=3, value=None, numtype=float)
 
     @property
     def h(self):
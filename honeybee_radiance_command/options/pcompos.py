@@ -28,24 +28,28 @@ class PcomposOptions(OptionCollection):
         "_la"
         )
 
+    _specs = {
+        '_a': IntegerOption.spec("a", "Number of columns", min_value=1),
+        '_s': IntegerOption.spec("s", "Spacing between images"),
+        '_o': TupleOption.spec(
+            "o", "Non-zero anchor point for bottom left as (x0, y0)",
+            length=2, value=None, numtype=int
+        ),
+        '_h': BoolOption.spec("h", "Reduce information header - default: False"),
+        '_x': IntegerOption.spec("x", "X resolution - default: 0"),
+        '_y': IntegerOption.spec("y", "Y resolution - default: 0"),
+        '_b': TupleOption.spec(
+            "b", "Background RGB", length=3, value=None, numtype=float),
+        '_l': StringOption.spec("l", "Label for image"),
+        '_lh': IntegerOption.spec("lh", "Label height - default: 24 pixels"),
+        '_la': BoolOption.spec("la", "Label with file name - default: False"),
+    }
+
     def __init__(self):
         """pcompos command options."""
 
         OptionCollection.__init__(self)
 
-        self._a = IntegerOption("a", "Number of columns", min_value=1)
-        self._s = IntegerOption("s", "Spacing between images")
-        self._o = TupleOption(
-            "o", "Non-zero anchor point for bottom left as (x0, y0)",
-            length=2, value=None, numtype=int
-        )
-        self._h = BoolOption("h", "Reduce information header - default: False")
-        self._x = IntegerOption("x", "X resolution - default: 0")
-        self._y = IntegerOption("y", "Y resolution - default: 0")
-        self._b = TupleOption("b", "Background RGB", length=3, value=None, numtype=float)
-        self._l = StringOption("l", "Label for image")
-        self._lh = IntegerOption("lh", "Label height - default: 24 pixels")
-        self._la = BoolOption("la", "Label with file name - default: False")
         self._on_setattr_check = False
 
     @property
@@ -35,25 +35,29 @@ class PcondOptions(OptionCollection):
         "_x"
     )
 
+    _specs = {
+        '_h': BoolOption.spec("h", "Human visual response - default: False"),
+        '_a': BoolOption.spec("a", "Human visual acuity loss - default: False"),
+        '_v': BoolOption.spec("v", "Veiling glare - default: False"),
+        '_s': BoolOption.spec("s", "Human contrast sensitivity - default: False"),
+        '_c': BoolOption.spec("c", "Color visibility loss - default: False"),
+        '_w': BoolOption.spec("w", "Weighted average exposure - default: False"),
+        '_i': IntegerOption.spec("i", "Importance of fixation points -default: 0"),
+        '_I': BoolOption.spec("I", "Precomputed histogram - default: False"),
+        '_l': BoolOption.spec("l", "Linear response function - default: False"),
+        '_e': StringOption.spec("e", "Exposure adjustment"),
+        '_u': IntegerOption.spec("u", "Top of Luminance - default: 100"),
+        '_d': NumericOption.spec("d", "Dynamic range - default: 32"),
+        '_p': TupleOption.spec(
+            "p", "RGB primaries", value=None, length=8, numtype=float),
+        '_f': FileOption.spec("f", "output file from macbethcal"),
+        '_x': FileOption.spec("x", "Output display luminance to mapfile"),
+    }
+
     def __init__(self):
         """pcond command options."""
 
         OptionCollection.__init__(self)
-        self._h = BoolOption("h", "Human visual response - default: False")
-        self._a = BoolOption("a", "Human visual acuity loss - default: False")
-        self._v = BoolOption("v", "Veiling glare - default: False")
-        self._s = BoolOption("s", "Human contrast sensitivity - default: False")
-        self._c = BoolOption("c", "Color visibility loss - default: False")
-        self._w = BoolOption("w", "Weighted average exposure - default: False")
-        self._i = IntegerOption("i", "Importance of fixation points -default: 0")
-        self._I = BoolOption("I", "Precomputed histogram - default: False")
-        self._l = BoolOption("l", "Linear response function - default: False")
-        self._e = StringOption("e", "Exposure adjustment")
-        self._u = IntegerOption("u", "Top of Luminance - default: 100")
-        self._d = NumericOption("d", "Dynamic range - default: 32")
-        self._p = TupleOption("p", "RGB primaries", value=None, length=8, numtype=float)
-        self._f = FileOption("f", "output file from macbethcal")
-        self._x = FileOption("x", "Output display luminance to mapfile")
         self._on_setattr_check = True
 
     def _on_setattr(self):
@@ -64,7 +68,7 @@ class PcondOptions(OptionCollection):
         You can include a check to ensure this is always correct.
         """
 
-        if self._f.is_set and self._p.is_set:
+        if self._is_set('_f') and self._is_set('_p'):
             raise ValueError(
                 'Both -f and -p do not go well together.'
                 ' This program can use either of the options but not both.'
@@ -38,30 +38,33 @@ class PfiltOptions(OptionCollection):
         "_a"
         )
 
+    _specs = {
+        '_x': StringOption.spec("x", "X resolution - default: same as input"),
+        '_y': StringOption.spec("y", "Y resolution - default: same as input"),
+        '_p': NumericOption.spec("p", "Pixel aspect ratio - default: 0"),
+        '_c': BoolOption.spec("c", "Do not write PIXASPECT variable - default: False"),
+        '_e': NumericOption.spec("e", "Exposure adjustment multiplier - default: 1"),
+        '_er': NumericOption.spec("er", "Red exposure adjustment multiplier"),
+        '_eg': NumericOption.spec("eg", "Green exposure adjustment multiplier"),
+        '_eb': NumericOption.spec("eb", "Blue exposure adjustment multiplier"),
+        '_t': StringOption.spec("t", "Fixture type to color balance"),
+        '_f': FileOption.spec("f", "Lamp lookup table file - default lib/lamp.tab"),
+        '_1_': BoolOption.spec("_1", "Use only one pass on the file - default: False"),
+        '_2_': BoolOption.spec("_2", "Use two passes on the file - default: True"),
+        '_b': BoolOption.spec("b", "Use box filtering - default: True"),
+        '_r': NumericOption.spec("r", "Use Gaussian filtering with specified radius"),
+        '_m': NumericOption.spec("m", "Limit given input pixels by a fraction"),
+        '_h': NumericOption.spec("h", "Pixel intensity considered 'hot' - default: 100"),
+        '_n': IntegerOption.spec("n", "Number of points on star patterns - default 0"),
+        '_s': NumericOption.spec("s", "Spread for star patterns - default: .0001"),
+        '_a': BoolOption.spec("a", "Average hot spots - default: False"),
+    }
+
     def __init__(self):
         """pfilt command options."""
 
         OptionCollection.__init__(self)
 
-        self._x = StringOption("x", "X resolution - default: same as input")
-        self._y = StringOption("y", "Y resolution - default: same as input")
-        self._p = NumericOption("p", "Pixel aspect ratio - default: 0")
-        self._c = BoolOption("c", "Do not write PIXASPECT variable - default: False")
-        self._e = NumericOption("e", "Exposure adjustment multiplier - default: 1")
-        self._er = NumericOption("er", "Red exposure adjustment multiplier")
-        self._eg = NumericOption("eg", "Green exposure adjustment multiplier")
-        self._eb = NumericOption("eb", "Blue exposure adjustment multiplier")
-        self._t = StringOption("t", "Fixture type to color balance")
-        self._f = FileOption("f", "Lamp lookup table file - default lib/lamp.tab")
-        self._1_ = BoolOption("_1", "Use only one pass on the file - default: False")
-        self._2_ = BoolOption("_2", "Use two passes on the file - default: True")
-        self._b = BoolOption("b", "Use box filtering - default: True")
-        self._r = NumericOption("r", "Use Gaussian filtering with specified radius")
-        self._m = NumericOption("m", "Limit given input pixels by a fraction")
-        self._h = NumericOption("h", "Pixel intensity considered 'hot' - default: 100")
-        self._n = IntegerOption("n", "Number of points on star patterns - default 0")
-        self._s = NumericOption("s", "Spread for star patterns - default: .0001")
-        self._a = BoolOption("a", "Average hot spots - default: False")
 
     def _on_setattr(self):
         """This method executes after setting each new attribute.
@@ -71,7 +74,8 @@ class PfiltOptions(OptionCollection):
         You can include a check to ensure this is always correct.
         """
 
-        if self._e.is_set and (self._er.is_set or self._eg.is_set or self._eb.is_set):
+        if self._is_set('_e') and \
+                any(self._is_set(name) for name in ('_er', '_eg', '_eb')):
             raise ValueError(
                 'Both -e and -er/-eg/-eb do not go well together.'
                 ' This program can use either of the options but not both.'
@@ -11,13 +11,17 @@ class PflipOptions(OptionCollection):
 
     __slots__ = ('_h', '_v', '_c')
 
+    _specs = {
+        '_h': BoolOption.spec("h", "Flip horizontally - default: False"),
+        '_v': BoolOption.spec("v", "Clip vertically - default: False"),
+        '_c': BoolOption.spec(
+            "c", "Correct improper image orientation - default: False"),
+    }
+
     def __init__(self):
         """pflip command options."""
 
         OptionCollection.__init__(self)
-        self._h = BoolOption("h", "Flip horizontally - default: False")
-        self._v = BoolOption("v", "Clip vertically - default: False")
-        self._c = BoolOption("c", "Correct improper image orientation - default: False")
         self._on_setattr_check = False
 
     @property
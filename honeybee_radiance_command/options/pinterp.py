@@ -28,19 +28,22 @@ class PinterpOptions(OptionCollection):
         "_e",
         )
 
+    _specs = {
+        '_vf': StringOption.spec("vf", "view options"),
+        '_x': IntegerOption.spec("x", "x resolution"),
+        '_y': IntegerOption.spec("y", "y resolution"),
+        '_t': NumericOption.spec("t", "threshold for coincident pixels - default: 0.02"),
+        '_fa': BoolOption.spec("fa", "foreground and background filling"),
+        '_ff': BoolOption.spec("ff", "foreground filling"),
+        '_fb': BoolOption.spec("fb", "background filling"),
+        '_f0': BoolOption.spec("f0", "no fill algorithm"),
+        '_n': BoolOption.spec("n", "z distances along view direction"),
+        '_e': NumericOption.spec("e", "exposure adjustment multiplier - default: 1"),
+    }
+
     def __init__(self):
         """pinterp command options."""
         OptionCollection.__init__(self)
-        self._vf = StringOption("vf", "view options")
-        self._x = IntegerOption("x", "x resolution")
-        self._y = IntegerOption("y", "y resolution")
-        self._t = NumericOption("t", "threshold for coincident pixels - default: 0.02")
-        self._fa = BoolOption("fa", "foreground and background filling")
-        self._ff = BoolOption("ff", "foreground filling")
-        self._fb = BoolOption("fb", "background filling")
-        self._f0 = BoolOption("f0", "no fill algorithm")
-        self._n = BoolOption("n", "z distances along view direction")
-        self._e = NumericOption("e", "exposure adjustment multiplier - default: 1")
 
     @property
     def vf(self):
@@ -31,27 +31,30 @@ class PsignOptions(OptionCollection):
         "_f"
         )
 
+    _specs = {
+        '_cb': TupleOption.spec(
+            "cb", "Background RGB - default: (1, 1, 1)", length=3, value=None,
+            numtype=float),
+        '_cf': TupleOption.spec(
+            "cf", "Foreground RGB - default: (0, 0, 0)", length=3, value=None,
+            numtype=float),
+        '_dr': BoolOption.spec("dr", "Text reads to the right - default: True"),
+        '_du': BoolOption.spec("du", "Text reads upwards - default: False"),
+        '_dl': BoolOption.spec("dl", "Text reads left (upside down) - default: False"),
+        '_dd': BoolOption.spec("dd", "Text reads downwards - default: False"),
+        '_h': IntegerOption.spec("h", "Character height - default: 32 pixels"),
+        '_a': NumericOption.spec("a", "Character aspect ratio (h/w) - default: 1.67"),
+        '_x': IntegerOption.spec("x", "Horizontal image size in pixels"),
+        '_y': IntegerOption.spec("y", "Vertical image size in pixels"),
+        '_s': NumericOption.spec("s", "Character spacing - default: 0"),
+        '_f': FileOption.spec("f", "Font file - default lib/helvet.fnt"),
+    }
+
     def __init__(self):
         """psign command options."""
 
         OptionCollection.__init__(self)
 
-        self._cb = TupleOption(
-            "cb", "Background RGB - default: (1, 1, 1)", length=3, value=None,
-            numtype=float)
-        self._cf = TupleOption(
-            "cf", "Foreground RGB - default: (0, 0, 0)", length=3, value=None,
-            numtype=float)
-        self._dr = BoolOption("dr", "Text reads to the right - default: True")
-        self._du = BoolOption("du", "Text reads upwards - default: False")
-        self._dl = BoolOption("dl", "Text reads left (upside down) - default: False")
-        self._dd = BoolOption("dd", "Text reads downwards - default: False")
-        self._h = IntegerOption("h", "Character height - default: 32 pixels")
-        self._a = NumericOption("a", "Character aspect ratio (h/w) - default: 1.67")
-        self._x = IntegerOption("x", "Horizontal image size in pixels")
-        self._y = IntegerOption("y", "Vertical image size in pixels")
-        self._s = NumericOption("s", "Character spacing - default: 0")
-        self._f = FileOption("f", "Font file - default lib/helvet.fnt")
 
     def _on_setattr(self):
         """This method executes after setting each new attribute.
@@ -60,7 +63,9 @@ class PsignOptions(OptionCollection):
         instance in pcond option collection -f and -p don't go together very well.
         You can include a check to ensure this is always correct.
         """
-        all_orient = [1 for i in (self._dr, self._du, self._dl, self._dd) if i.is_set]
+        all_orient = [
+            1 for name in ('_dr', '_du', '_dl', '_dd') if self._is_set(name)
+        ]
         if sum(all_orient) > 1:
             raise ValueError(
                 'Only one of the -dr, -du, -dl, -dd options can be set at a time.'
@@ -10,17 +10,20 @@ class Ra_GIFOptions(OptionCollection):
     """
     __slots__ = ('_b', '_d', '_c', '_g', '_e', '_n')
 
+    _specs = {
+        '_b': BoolOption.spec("b", "Change image color - default: False"),
+        '_d': BoolOption.spec("d", "Turn off dithering - default: False"),
+        '_c': NumericOption.spec("c", "Fewer colors", min_value=1, max_value=256),
+        '_g': NumericOption.spec("g", "Gamma correction - default: 2.2"),
+        '_e': IntegerOption.spec("e", "Exposure compensation"),
+        '_n': NumericOption.spec("n", "Sampling factor for large images", min_value=1,
+                                 max_value=80),
+    }
+
     def __init__(self):
         """ra_gif command options."""
 
         OptionCollection.__init__(self)
-        self._b = BoolOption("b", "Change image color - default: False")
-        self._d = BoolOption("d", "Turn off dithering - default: False")
-        self._c = NumericOption("c", "Fewer colors", min_value=1, max_value=256)
-        self._g = NumericOption("g", "Gamma correction - default: 2.2")
-        self._e = IntegerOption("e", "Exposure compensation")
-        self._n = NumericOption("n", "Sampling factor for large images", min_value=1,
-                                max_value=80)
 
     @property
     def b(self):
@@ -23,17 +23,20 @@ class Ra_xyzeOptions(OptionCollection):
         "_p"
         )
 
+    _specs = {
+        '_r': BoolOption.spec("r", "produce run-length encoded RGBE"),
+        '_e': NumericOption.spec("e", "exposure adjustment multiplier"),
+        '_o': BoolOption.spec("o", "original units to which exposure is applied"),
+        '_c': BoolOption.spec("c", "produce run-length encoded XYZE"),
+        '_u': BoolOption.spec("u", "produce flat output"),
+        '_p': TupleOption.spec(
+            "p", "override standard Radiance RGB primary colors", None, 8, float
+        ),
+    }
+
     def __init__(self):
         """ra_xyze command options."""
         OptionCollection.__init__(self)
-        self._r = BoolOption("r", "produce run-length encoded RGBE")
-        self._e = NumericOption("e", "exposure adjustment multiplier")
-        self._o = BoolOption("o", "original units to which exposure is applied")
-        self._c = BoolOption("c", "produce run-length encoded XYZE")
-        self._u = BoolOption("u", "produce flat output")
-        self._p = TupleOption(
-            "p", "override standard Radiance RGB primary colors", None, 8, float
-        )
         self._on_setattr_check = True
 
     def _on_setattr(self):
@@ -44,7 +47,7 @@ class Ra_xyzeOptions(OptionCollection):
         You can include a check to ensure this is always correct.
         """
 
-        if self._c.is_set and self._u.is_set:
+        if self._is_set('_c') and self._is_set('_u'):
             raise ValueError(
                 'Both c and u are set. The program can use either c or u but not both.')
 
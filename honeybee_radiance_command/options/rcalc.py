@@ -13,25 +13,28 @@ class RcalcOptions(OptionCollection):
 
     __slots__ = ('_b', '_l', '_p', '_n', '_w', '_u', '_tS', '_i', '_o', '_f', '_e', '_s')
 
+    _specs = {
+        '_tS': StringOption.spec('ts', 'alternative tab character'),
+        '_i': StringOptionJoined.spec(
+            'i', 'alternative input format', pattern_in=r'^[dfDF]\d*$'
+        ),
+        '_o': StringOptionJoined.spec(
+            'o', 'alternative output format', valid_values=['d', 'f', 'D', 'F']
+        ),
+        '_p': BoolOption.spec('p', 'alternative / passive mode for input format'),
+        '_b': BoolOption.spec('b', 'accept exact matches'),
+        '_l': BoolOption.spec('l', 'ignore newlines in the input'),
+        '_w': BoolOption.spec('w', 'warning messages - default: off'),
+        '_u': BoolOption.spec('u', 'flush output after each record - default: off'),
+        '_n': BoolOption.spec('n', 'produce single output record'),
+        '_f': StringOption.spec('f', 'source file'),
+        '_s': StringOption.spec('s', 'assign a string variable a string value'),
+        '_e': StringOption.spec('e', 'expression', pattern_out='"%s"'),
+    }
+
     def __init__(self):
         """rcalc command options."""
         OptionCollection.__init__(self)
-        self._tS = StringOption('ts', 'alternative tab character')
-        self._i = StringOptionJoined(
-            'i', 'alternative input format', valid_values=['d', 'f', 'D', 'F']
-        )
-        self._o = StringOptionJoined(
-            'o', 'alternative output format', valid_values=['d', 'f', 'D', 'F']
-        )
-        self._p = BoolOption('p', 'alternative / passive mode for input format')
-        self._b = BoolOption('b', 'accept exact matches')
-        self._l = BoolOption('l', 'ignore newlines in the input')
-        self._w = BoolOption('w', 'warning messages - default: off')
-        self._u = BoolOption('u', 'flush output after each record - default: off')
-        self._n = BoolOption('n', 'produce single output record')
-        self._f = StringOption('f', 'source file')
-        self._s = StringOption('s', 'assign a string variable a string value')
-        self._e = StringOption('e', 'expression', pattern_out='"%s"')
         self._on_setattr_check = True
 
     def _on_setattr(self):
@@ -41,7 +44,7 @@ class RcalcOptions(OptionCollection):
         instance in rtrace option collection -ti and -te are exclusive. You can include a
         check to ensure this is always correct.
         """
-        if self.p.is_set and not self.i.is_set:
+        if self._is_set('_p') and not self._is_set('_i'):
             warnings.warn('rcalc: -p has no effect unless -i is also specified.')
 
     @property
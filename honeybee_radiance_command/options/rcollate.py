@@ -19,31 +19,34 @@ class RcollateOptions(OptionCollection):
     __slots__ = ('_h', '_w', '_fa', '_ff', '_fd', '_fb', '_t', '_ic', '_ir', '_oc',
                  '_or', '_o')
 
+    _specs = {
+        '_h': StringOptionJoined.spec('h', 'Header availability.',
+                                      valid_values=('', 'i', 'o')),
+        '_w': BoolOption.spec('w', 'Turn off non-fatal warning messages'),
+        '_fa': StringOptionJoined.spec(
+            'fa', 'Number of space-separated words/numbers in '
+            ' each record assumed to be in ASCII format.'),
+        '_ff': StringOptionJoined.spec('ff', 'Number of words in the input,'
+                                             ' each record assumed to be in '
+                                             'floating-point format.'),
+        '_fd': StringOptionJoined.spec('fd', 'Number of words in the input,'
+                                             ' each record assumed to be in double '
+                                             'format.'),
+        '_fb': StringOptionJoined.spec('fb', 'Number of words in the input,'
+                                             ' each record assumed to be in binary '
+                                             'format.'),
+        '_t': BoolOption.spec('t', 'Swap rows and columns in the input.'),
+        '_ic': IntegerOption.spec('ic', 'Input columns'),
+        '_ir': IntegerOption.spec('ir', 'Input rows'),
+        '_oc': IntegerOption.spec('oc', 'Output columns'),
+        # or  is a protected keyword, so using oR
+        '_or': IntegerOption.spec('or', 'Output rows'),
+        '_o': StringOption.spec('o', 'Output matrix shape.'),
+    }
+
     def __init__(self):
         """rcollate command options"""
         OptionCollection.__init__(self)
-        self._on_setattr_check = False
-        self._h = StringOptionJoined('h', 'Header availability.',
-                                     valid_values=('', 'i', 'o'))
-        self._w = BoolOption('w', 'Turn off non-fatal warning messages')
-        self._fa = StringOptionJoined('fa', 'Number of space-separated words/numbers in '
-                                            ' each record assumed to be in ASCII format.')
-        self._ff = StringOptionJoined('ff', 'Number of words in the input,'
-                                            ' each record assumed to be in '
-                                            'floating-point format.')
-        self._fd = StringOptionJoined('fd', 'Number of words in the input,'
-                                            ' each record assumed to be in double '
-                                            'format.')
-        self._fb = StringOptionJoined('fb', 'Number of words in the input,'
-                                            ' each record assumed to be in binary '
-                                            'format.')
-        self._t = BoolOption('t', 'Swap rows and columns in the input.')
-        self._ic = IntegerOption('ic', 'Input columns')
-        self._ir = IntegerOption('ir', 'Input rows')
-        self._oc = IntegerOption('oc', 'Output columns')
-        # or  is a protected keyword, so using oR
-        self._or = IntegerOption('or', 'Output rows')
-        self._o = StringOption('o', 'Output matrix shape.')
         self._on_setattr_check = True
 
     @property
@@ -196,12 +199,15 @@ class RcollateOptions(OptionCollection):
     def _on_setattr(self):
         """This method executes after setting each new attribute.
         """
-        all_formats = [1 for i in (self._fa, self._fb, self._fd, self._ff) if i.is_set]
+        all_formats = [
+            1 for name in ('_fa', '_fb', '_fd', '_ff') if self._is_set(name)
+        ]
         if sum(all_formats) > 1:
             raise ValueError(
                 'Only one of the -fa, -fb, -fd, -ff options can be set at a time.')
 
-        output_shape_set = self._o.is_set and (self._oc.is_set or self._or.is_set)
+        output_shape_set = self._is_set('_o') and \
+            (self._is_set('_oc') or self._is_set('_or'))
         if output_shape_set:
             raise ValueError('The options for setting the output shape .i.e can either '
                              'be set through o or (or and oc). They cannot be set at the'
@@ -21,29 +21,31 @@ class RcontribOptions(RtraceOptions):
         '_o', '_ap', '_t'
     )
 
-    def __init__(self):
-        """rcontrib command options."""
-        RtraceOptions.__init__(self)
-        self._on_setattr_check = False
-        self._c = IntegerOption('c',
-                                'accumulated rays per record - default: 1')
-        self._V = BoolOption('V', 'output coefficients - default: off')
-        self._fo = BoolOption('fo', 'format output - default: off')
-        self._o = StringOption('o', 'output file. it can include ')
-        self._r = BoolOption('r', 'data recovery on existing files')
-        self._f = StringOption('f', 'source file - e.g. klems_ang.cal')
-        self._e = StringOption('e', 'expression')
-        self._p = StringOption('p', 'additional parameters')
+    _specs = {
+        '_c': IntegerOption.spec('c',
+                                 'accumulated rays per record - default: 1'),
+        '_V': BoolOption.spec('V', 'output coefficients - default: off'),
+        '_fo': BoolOption.spec('fo', 'format output - default: off'),
+        '_o': StringOption.spec('o', 'output file. it can include '),
+        '_r': BoolOption.spec('r', 'data recovery on existing files'),
+        '_f': StringOption.spec('f', 'source file - e.g. klems_ang.cal'),
+        '_e': StringOption.spec('e', 'expression'),
+        '_p': StringOption.spec('p', 'additional parameters'),
         # b and bn are tricky as they can be string values like tbin or Ntbins and they
         # can be integer values like 0, 1, etc or as mix like
         # kbin(0.525,0.0136,-0.851,0,0,1)! I leave them to be string for now.
-        self._b = StringOption('b', 'bin numbers')
-        self._bn = StringOption('bn', 'number of bins')
-        self._m = StringOption('m', 'modifier name')
-        self._M = FileOption('M', 'modifiers file')
-        self._ap = FileOption('ap', 'photon map contribution support')
-        self._t = IntegerOption(
-            't', 'optional input for reporting intervals in seconds.')
+        '_b': StringOption.spec('b', 'bin numbers'),
+        '_bn': StringOption.spec('bn', 'number of bins'),
+        '_m': StringOption.spec('m', 'modifier name'),
+        '_M': FileOption.spec('M', 'modifiers file'),
+        '_ap': FileOption.spec('ap', 'photon map contribution support'),
+        '_t': IntegerOption.spec(
+            't', 'optional input for reporting intervals in seconds.'),
+    }
+
+    def __init__(self):
+        """rcontrib command options."""
+        RtraceOptions.__init__(self)
         self._on_setattr_check = True
 
     def _on_setattr(self):
@@ -53,19 +55,17 @@ class RcontribOptions(RtraceOptions):
         instance in rtrace option collection -ti and -te are exclusive. You can include a
         check to ensure this is always correct.
         """
-        if not hasattr(self, 'r'):
-            return  # this happens on init
         # -i and -I cannot both be True.
-        assert not (self.i == True and self.I == True), \
+        assert not (self._option_value('_i') and self._option_value('_I')), \
             'You can either set -i or -I to True not both.'
-        if self.r.is_set and self.fo.is_set:
+        if self._is_set('_r') and self._is_set('_fo'):
             raise exceptions.ExclusiveOptionsError(self.command, 'r', 'fo')
-        if self.m.is_set and self.M.is_set:
+        if self._is_set('_m') and self._is_set('_M'):
             raise exceptions.ExclusiveOptionsError(self.command, 'm', 'M')
-        if self.ar.is_set or (self.aa.is_set and self.aa != 0):
+        if self._is_set('_ar') or self._option_value('_aa') not in (None, 0):
             # warning about aa being set to 0 in rcontrib
             warn = '%s: aa will be set to 0 in rcontrib.' % self.command
-            if self.ar.is_set:
+            if self._is_set('_ar'):
                 warn = ' '.join((
                     warn,
                     'there will be no ambient caching '
@@ -252,7 +252,7 @@ class RcontribOptions(RtraceOptions):
     def t(self, value):
         self._t.value = value
 
-    def to_radiance(self):
+    def _render(self):
         """Translate options to Radiance format."""
 
         positional_options = ('_p', '_b', '_bn', '_o')
@@ -261,19 +261,25 @@ class RcontribOptions(RtraceOptions):
         options = []
         for option_flag in positional_options:
             if option_flag in slots:
-                positional_option_value = getattr(self,
-                                                  option_flag).to_radiance().strip()
+                option = self._created_option(option_flag)
+                if option is None:
+                    continue
+                positional_option_value = option.to_radiance().strip()
                 if positional_option_value:
                     options.append(positional_option_value)
 
-        options.extend([getattr(self, opt).to_radiance() for opt in slots if
-                        opt not in positional_options])
+        for opt in slots:
+            if opt in positional_options:
+                continue
+            option = self._created_option(opt)
+            if option is not None:
+                options.append(option.to_radiance())
 
         options = ' '.join(options)
 
         additional_options = \
             ' '.join(
-                '-%s %s' % (k, v) for k, v in self.additional_options.items())
+                '-%s %s' % (k, v) for k, v in self._additional_options().items())
 
         return ' '.join(
             ' '.join((options, additional_options)).split()).replace('%%', '%')
@@ -11,11 +11,14 @@ class RfluxmtxOptions(RcontribOptions):
 
     __slots__ = ('_v',)
 
+    _specs = {
+        '_v': BoolOption.spec('v', 'verbose report - default: off'),
+    }
+
     def __init__(self):
         """rcontrib command options."""
         RcontribOptions.__init__(self)
         self._on_setattr_check = False
-        self._v = BoolOption('v', 'verbose report - default: off')
         self._protected = ('f', 'e', 'p', 'b', 'bn', 'm', 'M')
         self._on_setattr_check = True
 
@@ -28,7 +31,7 @@ class RfluxmtxOptions(RcontribOptions):
         """
         RcontribOptions._on_setattr(self)
         for opt in self._protected:
-            if getattr(self, opt).is_set:
+            if self._is_set('_' + opt):
                 raise exceptions.ProtectedOptionError('rfluxmtx', opt)
 
     @property
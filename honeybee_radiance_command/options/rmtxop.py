@@ -11,14 +11,17 @@ class RmtxopOptions(OptionCollection):
 
     __slots__ = ('_v', '_f',)
 
+    _specs = {
+        '_v': BoolOption.spec('v', 'Turn on verbose reporting. Defaults to False'),
+        '_f': StringOptionJoined.spec(
+            'f', 'output data format. Set "a" for ASCII, "d" for binary doubles, "f" '
+            'floats and "c" for RGBE colors', valid_values=('a', 'f', 'd', 'c')),
+    }
+
     def __init__(self):
         """rmtxop command options."""
         OptionCollection.__init__(self)
         self._on_setattr_check = False
-        self._v = BoolOption('v', 'Turn on verbose reporting. Defaults to False')
-        self._f = StringOptionJoined('f', 'output data format. Set "a" for ASCII, "d" for'
-                                          ' binary doubles, "f" floats and "c" for RGBE'
-                                          'colors', valid_values=('a', 'f', 'd', 'c'))
 
     @property
     def v(self):
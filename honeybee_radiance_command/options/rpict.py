@@ -72,89 +72,92 @@ class RpictOptions(AcceleradOptions):
         "_am",
     )
 
-    def __init__(self):
-        """rpict command options."""
-        AcceleradOptions.__init__(self)
-        self._vt = StringOptionJoined(
+    _specs = {
+        '_vt': StringOptionJoined.spec(
             "vt",
             "view type - default: vtv",
             valid_values=["v", "l", "c", "h", "a", "s"],
             whole=False
-        )
-        self._vp = TupleOption(
+        ),
+        '_vp': TupleOption.spec(
             "vp", "view point - default: 0.000000 0.000000 0.000000", None, 3, float
-        )
-        self._vd = TupleOption(
+        ),
+        '_vd': TupleOption.spec(
             "vd", "view direction - default: 0.000000 1.000000 0.000000", None, 3, float
-        )
-        self._vu = TupleOption(
+        ),
+        '_vu': TupleOption.spec(
             "vu", "view up - default: 0.000000 0.000000 1.000000", None, 3, float
-        )
-        self._vh = NumericOption("vh", "view horizontal size - default: 45.000000")
-        self._vv = NumericOption("vv", "view vertical size - default: 45.000000")
-        self._vo = NumericOption("vo", "view fore clipping plane - default: 0.000000")
-        self._va = NumericOption("va", "view aft clipping plane - default: 0.000000")
-        self._vs = NumericOption("vs", "view shift - default: 0.000000")
-        self._vl = NumericOption("vl", "view lift - default: 0.000000")
-        self._x = IntegerOption("x", "x resolution - default: 512")
-        self._y = IntegerOption("y", "y resolution - default: 512")
-        self._pa = NumericOption("pa", "pixel aspect ratio - default: 1.000000")
-        self._pj = NumericOption("pj", "pixel jitter - default: 0.670000")
-        self._pm = NumericOption("pm", "pixel motion - default: 0.000000")
-        self._pd = NumericOption("pd", "pixel depth-of-field - default: 0.000000")
-        self._ps = IntegerOption("ps", "pixel sample - default: 4")
-        self._pt = NumericOption("pt", "pixel threshold - default: 0.050000")
-        self._t = IntegerOption("t", "time between reports - default: 0")
-        self._w = BoolOption("w", "warning messages - default: True")
-        self._i = BoolOption("i", "irradiance calculation - default: False")
-        self._u = BoolOption(
+        ),
+        '_vh': NumericOption.spec("vh", "view horizontal size - default: 45.000000"),
+        '_vv': NumericOption.spec("vv", "view vertical size - default: 45.000000"),
+        '_vo': NumericOption.spec("vo", "view fore clipping plane - default: 0.000000"),
+        '_va': NumericOption.spec("va", "view aft clipping plane - default: 0.000000"),
+        '_vs': NumericOption.spec("vs", "view shift - default: 0.000000"),
+        '_vl': NumericOption.spec("vl", "view lift - default: 0.000000"),
+        '_x': IntegerOption.spec("x", "x resolution - default: 512"),
+        '_y': IntegerOption.spec("y", "y resolution - default: 512"),
+        '_pa': NumericOption.spec("pa", "pixel aspect ratio - default: 1.000000"),
+        '_pj': NumericOption.spec("pj", "pixel jitter - default: 0.670000"),
+        '_pm': NumericOption.spec("pm", "pixel motion - default: 0.000000"),
+        '_pd': NumericOption.spec("pd", "pixel depth-of-field - default: 0.000000"),
+        '_ps': IntegerOption.spec("ps", "pixel sample - default: 4"),
+        '_pt': NumericOption.spec("pt", "pixel threshold - default: 0.050000"),
+        '_t': IntegerOption.spec("t", "time between reports - default: 0"),
+        '_w': BoolOption.spec("w", "warning messages - default: True"),
+        '_i': BoolOption.spec("i", "irradiance calculation - default: False"),
+        '_u': BoolOption.spec(
             "u", "correlated quasi-Monte Carlo sampling - default: False"
-        )
-        self._bv = BoolOption("bv", "back face visibility - default: True")
-        self._dt = NumericOption("dt", "direct threshold - default: 0.050000")
-        self._dc = NumericOption("dc", "direct certainty - default: 0.500000")
-        self._dj = NumericOption("dj", "direct jitter - default: 0.000000")
-        self._ds = NumericOption("ds", "direct sampling - default: 0.250000")
-        self._dr = IntegerOption("dr", "direct relays - default: 1")
-        self._dp = IntegerOption("dp", "direct pretest density - default: 512")
-        self._dv = BoolOption("dv", "direct visibility - default: True")
-        self._ss = NumericOption("ss", "specular sampling - default: 1.000000")
-        self._st = NumericOption("st", "specular threshold - default: 0.150000")
-        self._av = TupleOption(
+        ),
+        '_bv': BoolOption.spec("bv", "back face visibility - default: True"),
+        '_dt': NumericOption.spec("dt", "direct threshold - default: 0.050000"),
+        '_dc': NumericOption.spec("dc", "direct certainty - default: 0.500000"),
+        '_dj': NumericOption.spec("dj", "direct jitter - default: 0.000000"),
+        '_ds': NumericOption.spec("ds", "direct sampling - default: 0.250000"),
+        '_dr': IntegerOption.spec("dr", "direct relays - default: 1"),
+        '_dp': IntegerOption.spec("dp", "direct pretest density - default: 512"),
+        '_dv': BoolOption.spec("dv", "direct visibility - default: True"),
+        '_ss': NumericOption.spec("ss", "specular sampling - default: 1.000000"),
+        '_st': NumericOption.spec("st", "specular threshold - default: 0.150000"),
+        '_av': TupleOption.spec(
             "av", "ambient value - default: 0.000000 0.000000 0.000000", None, 3, float
-        )
-        self._aw = IntegerOption("aw", "ambient value weight - default: 0")
-        self._ab = IntegerOption("ab", "ambient bounces - default: 0")
-        self._aa = NumericOption("aa", "ambient accuracy - default: 0.200000")
-        self._ar = IntegerOption("ar", "ambient resolution - default: 64")
-        self._ad = IntegerOption("ad", "ambient divisions - default: 512")
-        self._as = IntegerOption("as_", "ambient super-samples - default: 128")
-        self._af = FileOption('af', 'ambient cache file (.amb)')
-        self._ae = StringOption('ae', 'ambient excluded modifier')
-        self._ai = StringOption('ai', 'ambient included modifier')
-        self._aE = FileOption('aE', 'ambient excluded modifiers file')
-        self._aI = FileOption('aI', 'ambient included modifiers file')
-        self._me = TupleOption(
+        ),
+        '_aw': IntegerOption.spec("aw", "ambient value weight - default: 0"),
+        '_ab': IntegerOption.spec("ab", "ambient bounces - default: 0"),
+        '_aa': NumericOption.spec("aa", "ambient accuracy - default: 0.200000"),
+        '_ar': IntegerOption.spec("ar", "ambient resolution - default: 64"),
+        '_ad': IntegerOption.spec("ad", "ambient divisions - default: 512"),
+        '_as': IntegerOption.spec("as_", "ambient super-samples - default: 128"),
+        '_af': FileOption.spec('af', 'ambient cache file (.amb)'),
+        '_ae': StringOption.spec('ae', 'ambient excluded modifier'),
+        '_ai': StringOption.spec('ai', 'ambient included modifier'),
+        '_aE': FileOption.spec('aE', 'ambient excluded modifiers file'),
+        '_aI': FileOption.spec('aI', 'ambient included modifiers file'),
+        '_me': TupleOption.spec(
             "me",
             "mist extinction coefficient - default: 0.00e+00 0.00e+00 0.00e+00",
             None,
             3,
             float,
-        )
-        self._ma = TupleOption(
+        ),
+        '_ma': TupleOption.spec(
             "ma",
             "mist scattering albedo - default: 0.000000 0.000000 0.000000",
             None,
             3,
             float,
-        )
-        self._mg = NumericOption(
+        ),
+        '_mg': NumericOption.spec(
             "mg", "mist scattering eccentricity - default: 0.000000"
-        )
-        self._ms = NumericOption("ms", "mist sampling distance - default: 0.000000")
-        self._lr = IntegerOption("lr", "limit reflection - default: 7")
-        self._lw = NumericOption("lw", "limit weight - default: 1.00e-03")
-        self._am = NumericOption("am", "max photon search radius - default: 0.0")
+        ),
+        '_ms': NumericOption.spec("ms", "mist sampling distance - default: 0.000000"),
+        '_lr': IntegerOption.spec("lr", "limit reflection - default: 7"),
+        '_lw': NumericOption.spec("lw", "limit weight - default: 1.00e-03"),
+        '_am': NumericOption.spec("am", "max photon search radius - default: 0.0"),
+    }
+
+    def __init__(self):
+        """rpict command options."""
+        AcceleradOptions.__init__(self)
         self._on_setattr_check = True
 
     def _on_setattr(self):
@@ -165,25 +168,25 @@ class RpictOptions(AcceleradOptions):
         You can include a check to ensure this is always correct.
         """
 
-        if self._ai.is_set and self._ae.is_set:
+        if self._is_set('_ai') and self._is_set('_ae'):
             raise ValueError(
                 'Both ai and ae are set. The program can use either an include list or'
                 ' an exclude list, but not both.'
             )
 
-        if self._aI.is_set and self._aE.is_set:
+        if self._is_set('_aI') and self._is_set('_aE'):
             raise ValueError(
                 'Both aI and aE are set. The program can use either an include list or'
                 ' an exclude list, but not both.'
             )
 
-        if self._dj.is_set and self._ps.is_set:
-            if not (self._dj > 0.0 and self._ps != -1):
+        if self._is_set('_dj') and self._is_set('_ps'):
+            if not (self._option_value('_dj') > 0.0 and self._option_value('_ps') != -1):
                 warnings.warn(
                     'It is usually wise to turn off image sampling when using direct'
                     ' jitter.'
                 )
-        if self._i.value and self._dv.value:
+        if self._option_value('_i') and self._option_value('_dv'):
             warnings.warn(
                 'If irradiance values are requested, it is better to keep -dv off'
                 ' so that light sources do not appear with their original radiance'
@@ -16,6 +16,72 @@ class RtraceOptions(AcceleradOptions):
         '_e', '_te', '_tE', '_ti', '_tI', '_af', '_ae', '_ai', '_aE', '_aI'
     )
 
+    _specs = {
+        '_n': IntegerOption.spec('n', 'number of rendering processes - default: 1'),
+        '_x': IntegerOption.spec('x', 'flush interval - default: 0'),
+        '_y': IntegerOption.spec('y', 'y resolution - default: 0'),
+        '_ld': BoolOption.spec('ld', 'limit distance - default: off'),
+        '_h': BoolOption.spec('h', 'output header - default: on'),
+        '_fio': StringOptionJoined.spec(
+            'f', 'format input/output = ascii/ascii - default: faa',
+            valid_values=['a', 'f', 'd', 'c'], whole=False
+        ),
+        '_o': StringOptionJoined.spec(
+            'o', 'output value - default: ov',
+            valid_values=[
+                'o', 'd', 'v', 'V', 'w', 'W', 'l', 'L', 'c', 'p', 'n', 'N',
+                's', 'm', 'M', '~'
+            ], whole=False
+        ),
+        '_w': BoolOption.spec('w', 'warning messages - default: on'),
+        '_i': BoolOption.spec('i', 'irradiance calculation - default: off'),
+        '_I': BoolOption.spec('I', 'irradiance calculation switch - default: off'),
+        '_u': BoolOption.spec('u', 'uncorrelated Monte Carlo sampling - default: on'),
+        '_bv': BoolOption.spec('bv', 'back face visibility - default: on'),
+        '_dt': NumericOption.spec('dt', 'direct threshold - default: 0.030000'),
+        '_dc': NumericOption.spec('dc', 'direct certainty - default: 0.750000'),
+        '_dj': NumericOption.spec('dj', 'direct jitter - default: 0.000000',
+                                  max_value=1.0),
+        '_ds': NumericOption.spec('ds', 'direct sampling - default: 0.200000'),
+        '_dr': IntegerOption.spec('dr', 'direct relays - default: 2'),
+        '_dp': IntegerOption.spec('dp', 'direct pretest density - default: 512'),
+        '_dv': BoolOption.spec('dv', 'direct visibility - default: on'),
+        '_ss': NumericOption.spec('ss', 'specular sampling - default: 1.000000'),
+        '_st': NumericOption.spec('st', 'specular threshold - default: 0.150000'),
+        '_av': TupleOption.spec(
+            'av', 'ambient value - default: 0.000000 0.000000 0.000000', None, 3, float
+        ),
+        '_aw': IntegerOption.spec('aw', 'ambient value weight - default: 0'),
+        '_ab': IntegerOption.spec('ab', 'ambient bounces - default: 0'),
+        '_aa': NumericOption.spec('aa', 'ambient accuracy - default: 0.100000'),
+        '_ar': IntegerOption.spec('ar', 'ambient resolution - default: 256'),
+        '_ad': IntegerOption.spec('ad', 'ambient divisions - default: 1024'),
+        '_as': IntegerOption.spec('as', 'ambient super-samples - default: 512'),
+        '_me': TupleOption.spec(
+            'me',
+            'mist extinction coefficient - default: 0.00e+000 0.00e+000 0.00e+000', None,
+            3, float),
+        '_ma': TupleOption.spec(
+            'ma', 'mist scattering albedo - default: 0.000000 0.000000 0.000000', None,
+            3, float),
+        '_mg': NumericOption.spec(
+            'mg', 'mist scattering eccentricity - default: 0.000000'),
+        '_ms': NumericOption.spec('ms', 'mist sampling distance - default: 0.000000'),
+        '_lr': IntegerOption.spec(
+            'lr', 'limit reflection (Russian roulette) - default: -10'),
+        '_lw': NumericOption.spec('lw', 'limit weight - default: 2.00e-003'),
+        '_te': StringOption.spec('te', 'trace excluded modifier'),
+        '_tE': FileOption.spec('tE', 'trace excluded modifiers file'),
+        '_ti': StringOption.spec('ti', 'trace included modifier'),
+        '_tI': FileOption.spec('tI', 'trace included modifiers file'),
+        '_af': StringOption.spec('af', 'ambient file'),
+        '_ae': StringOption.spec('ae', 'ambient excluded modifier'),
+        '_aE': FileOption.spec('aE', 'ambient excluded modifiers file'),
+        '_ai': StringOption.spec('ai', 'ambient included modifier'),
+        '_aI': FileOption.spec('aI', 'ambient included modifiers file'),
+        '_e': FileOption.spec('e', 'error file'),
+    }
+
     def __init__(self):
         """rtrace command options.
 
@@ -31,69 +97,6 @@ class RtraceOptions(AcceleradOptions):
             -ab 5 -u-
         """
         AcceleradOptions.__init__(self)
-        self._n = IntegerOption('n', 'number of rendering processes - default: 1')
-        self._x = IntegerOption('x', 'flush interval - default: 0')
-        self._y = IntegerOption('y', 'y resolution - default: 0')
-        self._ld = BoolOption('ld', 'limit distance - default: off')
-        self._h = BoolOption('h', 'output header - default: on')
-        self._fio = StringOptionJoined(
-            'f', 'format input/output = ascii/ascii - default: faa',
-            valid_values=['a', 'f', 'd', 'c'], whole=False
-        )
-        self._o = StringOptionJoined(
-            'o', 'output value - default: ov',
-            valid_values=[
-                'o', 'd', 'v', 'V', 'w', 'W', 'l', 'L', 'c', 'p', 'n', 'N',
-                's', 'm', 'M', '~'
-            ], whole=False
-        )
-        self._w = BoolOption('w', 'warning messages - default: on')
-        self._i = BoolOption('i', 'irradiance calculation - default: off')
-        self._I = BoolOption('I', 'irradiance calculation switch - default: off')
-        self._u = BoolOption('u', 'uncorrelated Monte Carlo sampling - default: on')
-        self._bv = BoolOption('bv', 'back face visibility - default: on')
-        self._dt = NumericOption('dt', 'direct threshold - default: 0.030000')
-        self._dc = NumericOption('dc', 'direct certainty - default: 0.750000')
-        self._dj = NumericOption('dj', 'direct jitter - default: 0.000000',
-                                 max_value=1.0)
-        self._ds = NumericOption('ds', 'direct sampling - default: 0.200000')
-        self._dr = IntegerOption('dr', 'direct relays - default: 2')
-        self._dp = IntegerOption('dp', 'direct pretest density - default: 512')
-        self._dv = BoolOption('dv', 'direct visibility - default: on')
-        self._ss = NumericOption('ss', 'specular sampling - default: 1.000000')
-        self._st = NumericOption('st', 'specular threshold - default: 0.150000')
-        self._av = TupleOption(
-            'av', 'ambient value - default: 0.000000 0.000000 0.000000', None, 3, float
-        )
-        self._aw = IntegerOption('aw', 'ambient value weight - default: 0')
-        self._ab = IntegerOption('ab', 'ambient bounces - default: 0')
-        self._aa = NumericOption('aa', 'ambient accuracy - default: 0.100000')
-        self._ar = IntegerOption('ar', 'ambient resolution - default: 256')
-        self._ad = IntegerOption('ad', 'ambient divisions - default: 1024')
-        self._as = IntegerOption('as', 'ambient super-samples - default: 512')
-        self._me = TupleOption(
-            'me',
-            'mist extinction coefficient - default: 0.00e+000 0.00e+000 0.00e+000', None,
-            3, float)
-        self._ma = TupleOption(
-            'ma', 'mist scattering albedo - default: 0.000000 0.000000 0.000000', None,
-            3, float)
-        self._mg = NumericOption(
-            'mg', 'mist scattering eccentricity - default: 0.000000')
-        self._ms = NumericOption('ms', 'mist sampling distance - default: 0.000000')
-        self._lr = IntegerOption(
-            'lr', 'limit reflection (Russian roulette) - default: -10')
-        self._lw = NumericOption('lw', 'limit weight - default: 2.00e-003')
-        self._te = StringOption('te', 'trace excluded modifier')
-        self._tE = FileOption('tE', 'trace excluded modifiers file')
-        self._ti = StringOption('ti', 'trace included modifier')
-        self._tI = FileOption('tI', 'trace included modifiers file')
-        self._af = StringOption('af', 'ambient file')
-        self._ae = StringOption('ae', 'ambient excluded modifier')
-        self._aE = FileOption('aE', 'ambient excluded modifiers file')
-        self._ai = StringOption('ai', 'ambient included modifier')
-        self._aI = FileOption('aI', 'ambient included modifiers file')
-        self._e = FileOption('e', 'error file')
         self._on_setattr_check = True
 
     def _on_setattr(self):
@@ -104,28 +107,29 @@ class RtraceOptions(AcceleradOptions):
         check to ensure this is always correct.
         """
         # -i and -I cannot both be True.
-        assert not (self.i == True and self.I == True), \
+        assert not (self._option_value('_i') and self._option_value('_I')), \
             'You can either set -i or -I to True not both.'
-        assert not (self.ti.is_set and self.te.is_set), \
+        assert not (self._is_set('_ti') and self._is_set('_te')), \
             'Both ti and te are set. The program can use either an include list or ' \
             'an exclude list, but not both.'
-        assert not (self.tI.is_set and self.tE.is_set), \
+        assert not (self._is_set('_tI') and self._is_set('_tE')), \
             'Both tI and tE are set. The program can use either an include list or ' \
             'an exclude list, but not both.'
-        assert not (self.ai.is_set and self.ae.is_set), \
+        assert not (self._is_set('_ai') and self._is_set('_ae')), \
             'Both ai and ae are set. The program can use either an include list or ' \
             'an exclude list, but not both.'
-        assert not (self.aI.is_set and self.aE.is_set), \
+        assert not (self._is_set('_aI') and self._is_set('_aE')), \
             'Both aI and aE are set. The program can use either an include list or ' \
             'an exclude list, but not both.'
 
-        if self.n.is_set and self.n > 1:
-            assert 't' not in self.o.to_radiance().lower(), \
+        processes = self._option_value('_n')
+        if processes is not None and processes > 1:
+            assert 't' not in str(self._option_value('_o') or '').lower(), \
                 'Multiple processes also do not work properly with ray tree output' \
                 ' using any of the `-o*t*` options.'
 
-        if self.n.is_set and self.x.is_set:
-            assert self.n <= self.x, \
+        if processes is not None and self._is_set('_x'):
+            assert processes <= self._option_value('_x'), \
                 'There is no benefit from specifying more processes than the -x ' \
                 'setting, which forces a wait at each flush.'
 
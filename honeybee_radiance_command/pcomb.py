@@ -2,10 +2,12 @@
 
 from .options.pcomb import PcombOptions
 from ._command import Command
+from .native import pcomb, rgbe
 
 import honeybee_radiance_command._exception as exceptions
 import honeybee_radiance_command._typing as typing
-
+import os
+import shlex
 
 
 class Pcomb(Command):
@@ -15,6 +17,10 @@ class Pcomb(Command):
     standard output. By default, the result is just a linear combination of the
     input pictures.
 
+    Use run(native=True) to calculate linear combinations and the common expressions
+    (scale, add, subtract and luminance) in-process when the output is written to a
+    file. See honeybee_radiance_command.native.pcomb for the supported expressions.
+
     Args:
         options: Command options. It will be set to Radiance default values if not
             provided by user.
@@ -96,3 +102,55 @@ class Pcomb(Command):
         Command.validate(self)
         if not stdin_input and not self.input:
             raise exceptions.MissingArgumentError(self.command, 'input')
+
+    def run(self, env=None, cwd=None, native=False):
+        """Run command.
+
+        Args:
+            env: Environmental variables (default: None).
+            cwd: Working directory (Default: '.').
+            native: Set to True to combine the pictures in-process. pcomb is still run
+                as a subprocess if the command is not supported by the native
+                implementation (Default: False).
+
+        Returns:
+            - int: Command return code.
+        """
+        if native and self._run_native(cwd):
+            self.after_run()
+            return 0
+        return Command.run(self, env, cwd)
+
+    def _run_native(self, cwd=None):
+        """Run pcomb in-process and return False if it is not supported."""
+        self.validate()
+        options = self.options
+        if self.pipe_to is not None or not self.output or options.f.is_set \
+                or options.x.is_set or options.y.is_set:
+            return False
+        expression = None
+        if options.e.is_set:
+            try:
+                expression = pcomb.compile_expression(typing.unquote(options.e.value))
+            except ValueError:
+                return False
+
+        def _path(path):
+            path = typing.unquote(path)
+            return os.path.join(cwd, path) if cwd else path
+
+        # posix=False keeps the backslashes in Windows paths
+        pictures = [
+            rgbe.Picture.from_file(_path(path))
+            for path in shlex.split(self.input, posix=False)
+        ]
+        # the options are before the first picture and only apply to that picture
+        coef = list(options.c.value) if options.c.is_set else [1.0, 1.0, 1.0]
+        scale = options.s.value if options.s.is_set else 1.0
+        if options.o.is_set:
+            scale /= pictures[0].exposure
+        coefficients = [[scale * c for c in coef]] + [None] * (len(pictures) - 1)
+        header = [] if options.h.is_set else [' '.join(self._argv()[0])]
+        result = pcomb.combine(pictures, expression, coefficients, header)
+        result.to_file(_path(self.output))
+        return True
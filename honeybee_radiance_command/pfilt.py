@@ -2,8 +2,10 @@
 
 from .options.pfilt import PfiltOptions
 from ._command import Command
+from .native import pfilt
 import honeybee_radiance_command._exception as exceptions
 import honeybee_radiance_command._typing as typing
+import os
 
 
 class Pfilt(Command):
@@ -13,6 +15,10 @@ class Pfilt(Command):
     makes two passes on the picture file in order to set the exposure to the correct
     average value.
 
+    Use run(native=True) to run box and Gaussian filtering with exposure adjustment
+    in-process when the output is written to a file. See
+    honeybee_radiance_command.native.pfilt for the supported options.
+
     Args:
         options: Command options. It will be set to Radiance default values
             if unspecified.
@@ -89,3 +95,38 @@ class Pfilt(Command):
         Command.validate(self)
         if not stdin_input and not self.input:
             raise exceptions.MissingArgumentError(self.command, 'input')
+
+    def run(self, env=None, cwd=None, native=False):
+        """Run command.
+
+        Args:
+            env: Environmental variables (default: None).
+            cwd: Working directory (Default: '.').
+            native: Set to True to filter the picture in-process. pfilt is still run as
+                a subprocess if the options are not supported by the native
+                implementation (Default: False).
+
+        Returns:
+            - int: Command return code.
+        """
+        if native and self._run_native(cwd):
+            self.after_run()
+            return 0
+        return Command.run(self, env, cwd)
+
+    def _run_native(self, cwd=None):
+        """Run pfilt in-process and return False if it is not supported."""
+        self.validate()
+        if self.pipe_to is not None or not self.output \
+                or not pfilt.is_supported(self.options):
+            return False
+
+        def _path(path):
+            path = typing.unquote(path)
+            return os.path.join(cwd, path) if cwd else path
+
+        pfilt.filter_file(
+            _path(self.input), _path(self.output), self.options,
+            [' '.join(self._argv()[0])]
+        )
+        return True
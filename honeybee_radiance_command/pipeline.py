@@ -0,0 +1,258 @@
+"""Pipelines of Radiance commands with fan-out to several consumers.
+
+Command.pipe_to only supports a linear chain of commands. A Pipeline can also send the
+output of a command to several commands and files at the same time. For instance the
+results of rtrace can be saved to a file and post-processed by rcalc in the same run.
+
+The commands are executed without a shell using the output of Command.to_argv and all
+the commands in the pipeline run at the same time. The output of a command that has a
+single consumer is connected to the consumer directly. The output of a command with
+several consumers is copied to each consumer as it is being generated.
+
+Usage:
+
+.. code-block:: python
+
+    from honeybee_radiance_command.pipeline import Pipeline
+
+    pipeline = Pipeline(rtrace)
+    # keep the raw results
+    pipeline.tee('results/grid.dat')
+    # also calculate the illuminance values
+    pipeline.pipe(rcalc)
+    pipeline.run()
+"""
+import errno
+import os
+import subprocess
+import threading
+
+from ._command import Command
+from ._command_util import environment
+
+# error numbers for writing to a pipe that is closed by the consumer. Windows reports
+# EINVAL instead of EPIPE.
+_CLOSED_PIPE = (errno.EPIPE, errno.EINVAL) if os.name == 'nt' else (errno.EPIPE,)
+
+
+class _Stage(object):
+    """A stage in a pipeline.
+
+    Args:
+        argv: List of arguments for the command.
+        source: Index of the stage that sends its output to this stage or None for the
+            first stage.
+    """
+
+    __slots__ = ('argv', 'source', 'files', 'consumers')
+
+    def __init__(self, argv, source=None):
+        self.argv = argv
+        self.source = source
+        self.files = []
+        self.consumers = []
+
+
+class Pipeline(object):
+    """A pipeline of Radiance commands.
+
+    Args:
+        command: The first command in the pipeline. If the command pipes to other
+            commands, they are added to the pipeline as well.
+        stdin: Optional path to a file for the input of the first command. By default
+            the input of the command itself is used (e.g. sensors for rtrace).
+
+    Properties:
+        * stages
+        * stdin
+    """
+
+    __slots__ = ('_stages', '_stdin')
+
+    def __init__(self, command, stdin=None):
+        self._stages = []
+        self._stdin = stdin
+        self._add(command, None)
+
+    @property
+    def stages(self):
+        """A tuple of argument lists for the commands in the pipeline."""
+        return tuple(stage.argv for stage in self._stages)
+
+    @property
+    def stdin(self):
+        """Path to the file for the input of the first command."""
+        return self._stdin
+
+    def pipe(self, command, source=-1):
+        """Send the output of a stage to a command.
+
+        Args:
+            command: A Radiance command. The command reads its input from stdin. If the
+                command pipes to other commands, they are added to the pipeline as well
+                and the output of the command is also added.
+            source: Index of the stage that sends its output to this command. The
+                default is the last stage that is added to the pipeline.
+
+        Returns:
+            Index of the last stage that is added to the pipeline.
+        """
+        return self._add(command, self._index(source))
+
+    def tee(self, path, source=-1):
+        """Write the output of a stage to a file.
+
+        The output is also sent to the other commands and files that use the output
+        of the same stage.
+
+        Args:
+            path: Path to the output file.
+            source: Index of the stage that writes to the file. The default is the last
+                stage that is added to the pipeline.
+        """
+        self._stages[self._index(source)].files.append(path)
+
+    def _index(self, source):
+        """Get a positive index for a stage."""
+        return range(len(self._stages))[source]
+
+    def _add(self, command, source):
+        """Add a command and the commands that it pipes to and return the last index."""
+        if not isinstance(command, Command):
+            raise ValueError('Expected a Command not {}'.format(type(command)))
+        argv = command.to_argv(stdin_input=source is not None)
+        if source is None and self._stdin is None:
+            self._stdin = argv['stdin']
+        for stage_argv in argv['argv']:
+            stage = _Stage(stage_argv, source)
+            self._stages.append(stage)
+            index = len(self._stages) - 1
+            if source is not None:
+                self._stages[source].consumers.append(index)
+            source = index
+        if argv['stdout']:
+            self._stages[source].files.append(argv['stdout'])
+        return source
+
+    def run(self, env=None, cwd=None):
+        """Run the pipeline.
+
+        Args:
+            env: Environmental variables (default: None).
+            cwd: Working directory (Default: '.').
+
+        Returns:
+            - int: Command return code. A RuntimeError is raised if any of the
+                commands fails. If an output file can't be written the error is
+                raised after all the commands are finished.
+        """
+        env = environment(env)
+
+        def _path(path):
+            return os.path.join(cwd, path) if cwd else path
+
+        files = []
+        processes = []
+        tees = []
+        try:
+            stdin = open(_path(self._stdin), 'rb') if self._stdin else None
+            if stdin is not None:
+                files.append(stdin)
+            # stages are always added after their source. The input for each stage is
+            # set when its source is created.
+            inputs = {0: stdin}
+            for index, stage in enumerate(self._stages):
+                outputs = [open(_path(f), 'wb') for f in stage.files]
+                files.extend(outputs)
+                if not outputs and not stage.consumers:
+                    stdout = None
+                elif len(outputs) == 1 and not stage.consumers:
+                    stdout = outputs[0]
+                else:
+                    stdout = subprocess.PIPE
+                process = subprocess.Popen(
+                    stage.argv, stdin=inputs.pop(index), stdout=stdout, env=env, cwd=cwd
+                )
+                processes.append(process)
+                if not outputs and len(stage.consumers) == 1:
+                    # connect the output to the consumer directly
+                    inputs[stage.consumers[0]] = process.stdout
+                elif stdout is subprocess.PIPE:
+                    # copy the output to the files and the consumers
+                    for consumer in stage.consumers:
+                        inputs[consumer] = subprocess.PIPE
+                    tees.append((process, outputs, stage.consumers))
+
+            for stage, process in zip(self._stages, processes):
+                if stage.source is not None and process.stdin is None:
+                    # the consumer owns the pipe now
+                    processes[stage.source].stdout.close()
+
+            threads = []
+            errors = []
+            for process, outputs, consumers in tees:
+                pipes = [processes[c].stdin for c in consumers]
+                thread = threading.Thread(
+                    target=_tee, args=(process.stdout, outputs, pipes, errors)
+                )
+                thread.daemon = True
+                thread.start()
+                threads.append(thread)
+
+            rcs = [process.wait() for process in processes]
+            for thread in threads:
+                thread.join()
+            if errors:
+                raise errors[0]
+        except Exception:
+            for process in processes:
+                if process.poll() is None:
+                    process.kill()
+            raise
+        finally:
+            for f in files:
+                f.close()
+
+        for stage, rc in zip(self._stages, rcs):
+            if rc != 0:
+                raise RuntimeError(
+                    'None zero return code: %d\n\t%s' % (rc, ' '.join(stage.argv))
+                )
+        return 0
+
+    def __repr__(self):
+        lines = ['Pipeline:']
+        for index, stage in enumerate(self._stages):
+            source = '' if stage.source is None else '[%d] | ' % stage.source
+            files = ''.join(' > %s' % f for f in stage.files)
+            lines.append('  [%d] %s%s%s' % (index, source, ' '.join(stage.argv), files))
+        return '\n'.join(lines)
+
+
+def _tee(source, files, pipes, errors, chunk_size=65536):
+    """Copy the content of a stream to several files and pipes.
+
+    The pipes are closed at the end so the consumers know that the input is finished.
+    A pipe that is closed by its consumer is removed and the copy continues for the
+    other targets. Other errors are added to the errors list and the target is removed
+    so the source can still be read to the end.
+    """
+    targets = files + pipes
+    try:
+        for chunk in iter(lambda: source.read(chunk_size), b''):
+            for target in list(targets):
+                try:
+                    target.write(chunk)
+                except (IOError, OSError, ValueError) as e:
+                    targets.remove(target)
+                    if target not in pipes or \
+                            getattr(e, 'errno', None) not in _CLOSED_PIPE:
+                        errors.append(e)
+    finally:
+        source.close()
+        for pipe in pipes:
+            try:
+                pipe.close()
+            except (IOError, OSError, ValueError):
+                # the consumer is already closed
+                pass
@@ -92,5 +92,14 @@ class Rcalc(Command):
 
         return ' '.join(cmd.split())
 
+    def _argv(self, stdin_input=False):
+        self.validate()
+        argv = [self.command]
+        if self.options:
+            argv.extend(self.options.to_argv())
+        if not stdin_input:
+            argv.extend(typing.unquote(f) for f in self.inputs)
+        return argv, None
+
     def validate(self):
         Command.validate(self)
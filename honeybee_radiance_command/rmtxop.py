@@ -3,16 +3,45 @@ from .options.rmtxop import RmtxopOptions
 from ._command import Command
 import honeybee_radiance_command._exception as exceptions
 import honeybee_radiance_command._typing as typing
+import honeybee_radiance_command._matrix_util as matrix_util
 import os
 
+# maximum number of operands in the main rmtxop command. more matrices are split into
+# nested commands.
+MAX_MATRICES = 4
+# operators that can be grouped in any order. None is for concatenation.
+ASSOCIATIVE_OPERATORS = (None, '.', '+', '*')
+
+
+def _nested_command(parts):
+    """Get a nested rmtxop command that can be used as an input for another rmtxop.
+
+    run_command changes all the quotes in a command to the same quote and the
+    backslashes to forward slashes. The nested command can't have quotes or escape
+    characters inside the quotes around it. The multiplication operator is not quoted
+    and the glob expansion is turned off in the shell that rmtxop uses to run the
+    nested command instead.
+    """
+    parts = ['*' if part.strip('\'"') == '*' else part for part in parts]
+    command = ' '.join(['rmtxop', '-fd'] + parts)
+    if os.name == 'posix':
+        if '*' in parts:
+            command = 'set -f; %s' % command
+        return "'!%s'" % command
+    return '"!%s"' % command
+
 
 class Rmtxop(Command):
     """Rmtxop command.
 
-    Concatenate, add, multiply, divide, transpose, scale, and convert matrices. The
-    implementation here allows for matrix operations on upto four matrices at the same
-    time. While the Radiance binary allows for even more, this restriction has been
-    imposed here to keep the code somewhat clean.
+    Concatenate, add, multiply, divide, transpose, scale, and convert matrices. Any
+    number of matrices can be used. If there are more than four matrices the operations
+    are split into four nested rmtxop commands. When the same associative operator
+    (concatenation, addition or multiplication) is used between all the matrices the
+    matrices are split into groups of the same size. Otherwise the first matrices are
+    grouped in one nested command to keep the order of the operations. Nested commands
+    are only one level deep because the quotes around them can't be nested when the
+    command is run with run_command.
 
     In standard Radiance syntax, the entire command is specified in a single line. In
     the implementation here, the matrices and all the corresponding scaling factors,
@@ -256,23 +285,12 @@ class Rmtxop(Command):
             self.matrices = '-'
         self.validate(stdin_input)
 
-        command_parts = [self.command, self.options.to_radiance()]
-
-        transposes = self.transposes
-        transforms = self.transforms
-        scalars = self.scalars
-        operators = self.operators
-
-        for idx, matrix in enumerate(self.matrices):
-            if transposes and transposes[idx]:
-                command_parts.append('-t')
-            if transforms and transforms[idx]:
-                command_parts.extend(['-c'] + ['%s' % val for val in transforms[idx]])
-            if scalars and scalars[idx]:
-                command_parts.extend(['-s'] + ['%s' % val for val in scalars[idx]])
-            command_parts.append(matrix)
-            if operators and idx < (len(self.matrices) - 1):
-                command_parts.append(operators[idx])
+        operands = [
+            self._operand(idx, matrix) for idx, matrix in enumerate(self.matrices)
+        ]
+        operators = self.operators or [None] * (len(operands) - 1)
+        command_parts = [self.command, self.options.to_radiance()] + \
+            self._expression(operands, operators)
 
         cmd = ' '.join(command_parts)
 
@@ -283,6 +301,59 @@ class Rmtxop(Command):
 
         return ' '.join(cmd.split())
 
+    def _operand(self, idx, matrix):
+        """Get the parts of the command for a matrix and its transformations."""
+        parts = []
+        if self.transposes and self.transposes[idx]:
+            parts.append('-t')
+        if self.transforms and self.transforms[idx]:
+            parts.extend(['-c'] + ['%s' % val for val in self.transforms[idx]])
+        if self.scalars and self.scalars[idx]:
+            parts.extend(['-s'] + ['%s' % val for val in self.scalars[idx]])
+        parts.append(matrix)
+        return parts
+
+    @classmethod
+    def _expression(cls, operands, operators):
+        """Get the parts of the command for a list of operands and operators.
+
+        Operands are lists of command parts. If there are more than MAX_MATRICES operands
+        they are split into nested rmtxop commands.
+        """
+        if len(operands) > MAX_MATRICES:
+            count = len(operands)
+            ops = set(op.strip('\'"') if op else None for op in operators)
+            if len(ops) == 1 and ops.pop() in ASSOCIATIVE_OPERATORS:
+                # balanced groups of matrices
+                bounds = [count * i // MAX_MATRICES for i in range(MAX_MATRICES + 1)]
+                groups = [(bounds[i], bounds[i + 1]) for i in range(MAX_MATRICES)]
+            else:
+                # group from left to right to keep the order of operations
+                first = count - MAX_MATRICES + 1
+                groups = [(0, first)] + [(i, i + 1) for i in range(first, count)]
+            new_operands = []
+            new_operators = []
+            for start, end in groups:
+                if end - start == 1:
+                    new_operands.append(operands[start])
+                else:
+                    nested = cls._join(operands[start:end], operators[start:end - 1])
+                    new_operands.append([_nested_command(nested)])
+                if end < count:
+                    new_operators.append(operators[end - 1])
+            operands, operators = new_operands, new_operators
+        return cls._join(operands, operators)
+
+    @staticmethod
+    def _join(operands, operators):
+        """Join the parts of the operands and the operators."""
+        parts = []
+        for idx, operand in enumerate(operands):
+            parts.extend(operand)
+            if idx < len(operators) and operators[idx]:
+                parts.append(operators[idx])
+        return parts
+
     def validate(self, stdin_input=False):
         Command.validate(self)
 
@@ -295,12 +366,7 @@ class Rmtxop(Command):
         # are several checks that rmtxop does at runtime relating to matrix shapes
         # and operator compatibility.
 
-        # Check 1: Number of matrices is less than 5 (for performance reasons).
-        assert len_matrices < 5, \
-            'The number of matrices allowed for calculation has been set to four or ' \
-            'lower. Currently, %s matrices have been specified.' % len_matrices
-
-        # Check 2: If scalars, transforms and transposes are set, then they are declared for
+        # Check 1: If scalars, transforms and transposes are set, then they are declared for
         # every matrix.
         len_dict = {'scalars': len(self.scalars), 'transforms': len(self.transforms),
                     'transposes': len(self.transposes)}
@@ -311,7 +377,7 @@ class Rmtxop(Command):
                     'number of matrices (%s). Currently a list of %s has been specified.' \
                     % (matrix_param, len_matrices, param_list_len)
 
-        # Check 3: If operators are declared, then they are declared for every adjacent
+        # Check 2: If operators are declared, then they are declared for every adjacent
         # matrix operation (i.e. one less than total number of matrices).
         len_operators = len(self.operators)
         if len_operators:
@@ -320,7 +386,7 @@ class Rmtxop(Command):
                 'one less than the number of matrices (%s).' % (
                     len_operators, len_matrices)
 
-        # Check 4: For a given matrix, scalar and transform is not set simultaneously.
+        # Check 3: For a given matrix, scalar and transform is not set simultaneously.
         if len_dict['scalars'] and len_dict['transforms']:
             for idx, scalar in enumerate(self.scalars):
                 transform = self.transforms[idx]
@@ -330,3 +396,64 @@ class Rmtxop(Command):
                           'be specified simultaneously for the same matrix.' % \
                           (idx, transform, scalar)
                     raise Exception(msg)
+
+    def validate_shapes(self, cwd=None):
+        """Check the shape of the matrices before running the command.
+
+        The number of rows, columns and components of each matrix is read from the
+        header of the matrix files and checked against the transposes, transforms,
+        scalars and operators. Matrices without a header and matrices that are created
+        by other commands are not checked. A MatrixShapeError is raised if the shapes
+        are not compatible.
+
+        Args:
+            cwd: The folder that relative paths are relative to (Default: '.').
+
+        Returns:
+            A tuple of number of rows, columns and components of the result. Values that
+            cannot be found from the headers are None.
+        """
+        self.validate()
+        operators = self.operators or [None] * (len(self.matrices) - 1)
+        shape = None
+        for idx, matrix in enumerate(self.matrices):
+            name = 'matrix %d (%s)' % (idx, matrix)
+            nrows, ncols, ncomp = matrix_util.matrix_shape(matrix, cwd)
+            if self.transposes and self.transposes[idx]:
+                nrows, ncols = ncols, nrows
+            transform = self.transforms[idx] if self.transforms else None
+            if transform and ncomp is not None:
+                if len(transform) % ncomp:
+                    raise exceptions.MatrixShapeError(
+                        self.command, 'the number of transform coefficients for %s '
+                        'should be a multiple of %d components.' % (name, ncomp)
+                    )
+                ncomp = len(transform) // ncomp
+            elif transform:
+                ncomp = None
+            scalar = self.scalars[idx] if self.scalars else None
+            if scalar and len(scalar) != 1 and ncomp is not None \
+                    and len(scalar) != ncomp:
+                raise exceptions.MatrixShapeError(
+                    self.command, '%s has %d components but %d scalars are specified.'
+                    % (name, ncomp, len(scalar))
+                )
+            matrix_shape = (nrows, ncols, ncomp)
+            if shape is None:
+                shape = matrix_shape
+                first_name = name
+                continue
+            operator = operators[idx - 1]
+            operator = operator.strip('\'"') if operator else None
+            names = (
+                first_name if idx == 1 else 'the result of matrices 0 to %d' % (idx - 1),
+                name
+            )
+            if operator in (None, '.'):
+                shape = matrix_util.concatenate(self.command, shape, matrix_shape, names)
+            else:
+                shape = matrix_util.elementwise(
+                    self.command, shape, matrix_shape, names,
+                    single_component=operator in ('*', '/')
+                )
+        return shape
@@ -98,6 +98,14 @@ class Rpict(Command):
 
         return ' '.join(cmd.split())
 
+    def _argv(self, stdin_input=False):
+        self.validate(stdin_input)
+        argv = [self.command] + self.options.to_argv()
+        if not stdin_input and self.view:
+            argv.extend(('-vf', typing.unquote(self.view)))
+        argv.append(typing.unquote(self.octree))
+        return argv, None
+
     def validate(self, stdin_input=False):
         Command.validate(self)
         if self.octree is None:
@@ -93,6 +93,12 @@ class Rtrace(Command):
 
         return ' '.join(cmd.split())
 
+    def _argv(self, stdin_input=False):
+        self.validate(stdin_input)
+        argv = [self.command] + self.options.to_argv() + [typing.unquote(self.octree)]
+        stdin = None if stdin_input else typing.unquote(self.sensors)
+        return argv, stdin
+
     def validate(self, stdin_input=False):
         Command.validate(self)
         if self.octree is None:
@@ -0,0 +1,202 @@
+"""Command templates for creating many variants of the same command.
+
+Studies with many sensor grids or views run the same command over and over and only
+change a few inputs such as the sensors and the output file. Creating a new command for
+each grid validates and translates all the options again. A CommandTemplate translates
+the command once and only replaces the values of the fields for each variant.
+
+Usage:
+
+.. code-block:: python
+
+    from honeybee_radiance_command.rtrace import Rtrace
+    from honeybee_radiance_command.template import CommandTemplate
+
+    rtrace = Rtrace(octree='scene.oct')
+    rtrace.options.update_from_string('-ab 2 -ad 5000 -h -I')
+    template = CommandTemplate(rtrace, ['sensors', 'output'])
+    print(template)  # rtrace -I -ab 2 -ad 5000 -h scene.oct < {sensors} > {output}
+    commands = template.to_radiance_list(
+        {'sensors': '%s.pts' % grid, 'output': '%s.res' % grid} for grid in grids
+    )
+"""
+import copy
+import re
+
+from ._command import Command
+from ._command_util import run_command
+import honeybee_radiance_command._exception as exceptions
+import honeybee_radiance_command._typing as typing
+
+
+_FIELD_PATTERN = re.compile('\x00(\\w+)\x00')
+
+
+def _field_value(value):
+    """Prepare a field value to be used in a command.
+
+    This is a lighter version of typing.normpath which doesn't normalize the path.
+    """
+    value = str(value).replace('\\', '/')
+    if ' ' in value:
+        value = '{0}{1}{0}'.format(typing.wrapper, value)
+    return value
+
+
+def _format_pattern(value):
+    """Convert a string with field markers to a pattern for % formatting."""
+    # escape the % characters in the command and use the fields as keys
+    return _FIELD_PATTERN.sub(r'%(\1)s', value.replace('%', '%%'))
+
+
+class CommandTemplate(object):
+    """A command that is translated once and used for many inputs.
+
+    Args:
+        command: A Radiance command with all the inputs that don't change between the
+            variants. The command itself will not be changed and changes to the
+            command after the template is created are not used in the template.
+        fields: A list of input names that change for each variant (e.g. ['sensors',
+            'output']). The fields are the input properties of the command.
+
+    Properties:
+        * command
+        * fields
+        * template
+    """
+
+    __slots__ = ('_command', '_fields', '_template', '_display', '_marked', '_argv')
+
+    def __init__(self, command, fields):
+        if not isinstance(command, Command):
+            raise ValueError('Expected a Command not {}'.format(type(command)))
+        fields = tuple(fields)
+        template = copy.deepcopy(command)
+        for field in fields:
+            if not hasattr(template, '_%s' % field):
+                raise ValueError(
+                    '{} has no input named "{}".'.format(command.command, field)
+                )
+            # set the slot directly to a marker to skip the checks in the setter
+            object.__setattr__(template, '_%s' % field, '\x00%s\x00' % field)
+        rendered = template.to_radiance()
+        for field in fields:
+            if '\x00%s\x00' % field not in rendered:
+                raise ValueError(
+                    '"{}" is not used in the translated command: {}'.format(
+                        field, rendered.replace('\x00', ''))
+                )
+        self._command = command
+        self._fields = fields
+        self._marked = template
+        self._argv = None
+        self._template = _format_pattern(rendered)
+        self._display = _FIELD_PATTERN.sub(r'{\1}', rendered)
+
+    @property
+    def command(self):
+        """The command that is used to create the template."""
+        return self._command
+
+    @property
+    def fields(self):
+        """A tuple of field names that change for each variant."""
+        return self._fields
+
+    @property
+    def template(self):
+        """Translated command with a %(field)s placeholder for each field."""
+        return self._template
+
+    def to_radiance(self, **fields):
+        """Get the command for a set of field values in Radiance format.
+
+        Args:
+            fields: Values for the fields of the template by name.
+        """
+        try:
+            return self._template % dict(
+                (k, _field_value(v)) for k, v in fields.items()
+            )
+        except KeyError as e:
+            raise exceptions.MissingArgumentError(self._command.command, e.args[0])
+
+    def to_radiance_list(self, items, normalize=True):
+        """Get the commands for a list of field values in Radiance format.
+
+        Args:
+            items: A list of dictionaries. Each dictionary includes the values for the
+                fields of the template by name.
+            normalize: A boolean to replace the backslashes in values with forward
+                slashes and to put the values with white space in quotes. Set to False
+                if the values are already normalized to skip this step (Default: True).
+
+        Returns:
+            A list of commands in Radiance format.
+        """
+        template = self._template
+        try:
+            if not normalize:
+                return [template % item for item in items]
+            return [
+                template % dict((k, _field_value(v)) for k, v in item.items())
+                for item in items
+            ]
+        except KeyError as e:
+            raise exceptions.MissingArgumentError(self._command.command, e.args[0])
+
+    def to_argv(self, **fields):
+        """Get the command for a set of field values as lists of arguments.
+
+        See Command.to_argv for the format of the output. The argument lists are
+        created once for the template and the values of the fields are used as they are
+        with the backslashes replaced by forward slashes.
+
+        Args:
+            fields: Values for the fields of the template by name.
+        """
+        if self._argv is None:
+            self._argv = self._argv_template()
+        data, targets = self._argv
+        values = dict((k, str(v).replace('\\', '/')) for k, v in fields.items())
+        argv = [list(stage) for stage in data['argv']]
+        output = {'argv': argv, 'stdin': data['stdin'], 'stdout': data['stdout']}
+        try:
+            for key, index, pattern in targets:
+                value = pattern % values
+                if key == 'argv':
+                    argv[index[0]][index[1]] = value
+                else:
+                    output[key] = value
+        except KeyError as e:
+            raise exceptions.MissingArgumentError(self._command.command, e.args[0])
+        return output
+
+    def _argv_template(self):
+        """Get the argument lists for the template and the position of the fields."""
+        data = self._marked.to_argv()
+        targets = []
+        for i, stage in enumerate(data['argv']):
+            for j, arg in enumerate(stage):
+                if '\x00' in arg:
+                    targets.append(('argv', (i, j), _format_pattern(arg)))
+        for key in ('stdin', 'stdout'):
+            if data[key] and '\x00' in data[key]:
+                targets.append((key, None, _format_pattern(data[key])))
+        return data, targets
+
+    def run(self, env=None, cwd=None, **fields):
+        """Run the command for a set of field values as a subprocess.
+
+        Args:
+            env: Environmental variables (default: None).
+            cwd: Working directory (Default: '.').
+            fields: Values for the fields of the template by name.
+
+        Returns:
+            - int: Command return code.
+        """
+        return run_command(self.to_radiance(**fields), env, cwd)
+
+    def __repr__(self):
+        return self._display
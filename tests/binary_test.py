@@ -0,0 +1,156 @@
+import pytest
+
+from honeybee_radiance_command.rtrace import Rtrace
+from honeybee_radiance_command.rcontrib import Rcontrib
+from honeybee_radiance_command.rcalc import Rcalc
+from honeybee_radiance_command.rcollate import Rcollate
+from honeybee_radiance_command.rmtxop import Rmtxop
+from honeybee_radiance_command.gendaymtx import Gendaymtx
+from honeybee_radiance_command.binary import binary_links
+
+
+def _rtrace():
+    rtrace = Rtrace(octree='scene.oct', sensors='grid.pts')
+    rtrace.options.h = True
+    return rtrace
+
+
+def test_rtrace_rcalc():
+    rtrace = _rtrace()
+    rcalc = Rcalc(output='results.ill')
+    rcalc.options.e = '$1=$1*179'
+    rcalc.options.o = 'd'
+    rtrace.pipe_to = rcalc
+    command = binary_links(rtrace)
+    assert command.to_argv()['argv'] == [
+        ['rtrace', '-faf', '-h', 'scene.oct'],
+        ['rcalc', '-e', '$1=$1*179', '-if3', '-od']
+    ]
+    # the input command is not changed
+    assert not rtrace.options.fio.is_set
+    assert not rcalc.options.i.is_set
+
+
+def test_existing_binary_format():
+    rtrace = _rtrace()
+    rtrace.options.fio = 'ad'
+    rtrace.pipe_to = Rcalc(output='results.ill')
+    command = binary_links(rtrace)
+    assert command.options.fio.value == 'ad'
+    assert command.pipe_to.options.i.value == 'd3'
+
+
+def test_header():
+    # rcalc can't read the header
+    rtrace = Rtrace(octree='scene.oct', sensors='grid.pts')
+    rtrace.pipe_to = Rcalc(output='results.ill')
+    command = binary_links(rtrace)
+    assert command.to_radiance() == rtrace.to_radiance()
+
+    # rmtxop needs the header to find the format
+    rcontrib = Rcontrib(octree='scene.oct', sensors='grid.pts')
+    rcontrib.options.M = 'suns.mod'
+    rcontrib.pipe_to = Rmtxop(output='results.mtx', matrices='sky.mtx')
+    command = binary_links(rcontrib)
+    assert command.options.fio.value == 'af'
+    assert not command.pipe_to.options.f.is_set
+    rcontrib.options.h = True
+    assert binary_links(rcontrib).to_radiance() == rcontrib.to_radiance()
+
+
+def test_rcollate():
+    rtrace = _rtrace()
+    rcollate = Rcollate(input='results.mtx')
+    rcollate.options.oc = 3
+    rtrace.pipe_to = rcollate
+    # the output of rcollate is the final output
+    assert binary_links(rtrace).to_radiance() == rtrace.to_radiance()
+
+    rcollate.options.fa = '3'
+    rcollate.pipe_to = Rcalc(output='results.ill')
+    command = binary_links(rtrace)
+    assert command.options.fio.value == 'af'
+    assert command.pipe_to.options.ff.value == '3'
+    assert not command.pipe_to.options.fa.is_set
+    assert command.pipe_to.pipe_to.options.i.value == 'f3'
+
+
+def test_unsupported():
+    gendaymtx = Gendaymtx(wea='sky.wea')
+    gendaymtx.pipe_to = Rcollate(input='sky.mtx', output='sky_2.mtx')
+    assert binary_links(gendaymtx).to_radiance() == gendaymtx.to_radiance()
+
+
+def _rcontrib():
+    rcontrib = Rcontrib(octree='scene.oct', sensors='grid.pts')
+    rcontrib.options.m = 'sky_glow'
+    rcontrib.options.h = True
+    return rcontrib
+
+
+def _link(*commands):
+    for command, pipe_to in zip(commands[:-1], commands[1:]):
+        command.pipe_to = pipe_to
+    return commands[0]
+
+
+@pytest.mark.parametrize('outputs, argv', [
+    (None, ['rcalc', '-if3']),
+    ('ovw', ['rcalc', '-if7']),
+    ('vl', ['rcalc', '-if4']),
+    # the modifier name is text and can't be read as binary data
+    ('m', ['rcalc'])
+])
+def test_rtrace_record_size(outputs, argv):
+    rtrace = _rtrace()
+    if outputs:
+        rtrace.options.o = outputs
+    command = binary_links(_link(rtrace, Rcalc()))
+    assert command.to_argv()['argv'][-1] == argv
+
+
+def test_record_size():
+    rcontrib = _rcontrib()
+    command = binary_links(_link(rcontrib, Rcalc()))
+    assert command.to_argv()['argv'] == [
+        ['rcontrib', '-faf', '-h', '-m', 'sky_glow', 'scene.oct'], ['rcalc', '-if3']
+    ]
+
+    rcollate = Rcollate(input='results.mtx')
+    rcollate.options.t = True
+    command = binary_links(_link(_rcontrib(), rcollate, Rcalc()))
+    assert command.to_argv()['argv'][1:] == [
+        ['rcollate', '-ff3', '-t'], ['rcalc', '-if3']
+    ]
+
+    # the number of words in rcollate is used for the commands after rcollate
+    rcollate = Rcollate(input='results.mtx')
+    rcollate.options.fa = '6'
+    command = binary_links(_link(_rtrace(), rcollate, Rcalc()))
+    assert command.to_argv()['argv'][1:] == [['rcollate', '-ff6'], ['rcalc', '-if6']]
+
+    # the record size of rcalc output is not known
+    rcalc = Rcalc()
+    rcalc.options.o = 'f'
+    command = binary_links(_link(rcalc, Rcollate(input='results.mtx'), Rcalc()))
+    assert command.to_radiance() == rcalc.to_radiance()
+
+
+@pytest.mark.parametrize('modifiers, bins, argv', [
+    # 3 values for each bin
+    ('m', '145', ['rcalc', '-if435']),
+    # the number of modifiers in the file and the number of bins are not known
+    ('M', None, ['rcalc']),
+    ('m', 'Nrbins', ['rcalc'])
+])
+def test_rcontrib_record_size(modifiers, bins, argv):
+    rcontrib = Rcontrib(octree='scene.oct', sensors='grid.pts')
+    rcontrib.options.h = True
+    if modifiers == 'm':
+        rcontrib.options.m = 'sky_glow'
+    else:
+        rcontrib.options.M = 'suns.mod'
+    if bins:
+        rcontrib.options.bn = bins
+    command = binary_links(_link(rcontrib, Rcalc()))
+    assert command.to_argv()['argv'][-1] == argv
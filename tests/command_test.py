@@ -30,3 +30,91 @@ def test_subclass():
 
     rtrace = Rtrace()
     assert rtrace.command == 'rtrace'
+
+
+def test_canonical():
+    from honeybee_radiance_command.rtrace import Rtrace
+    rtrace_1 = Rtrace(octree='scene.oct', sensors='grid.pts')
+    rtrace_1.options.update_from_string('-h -ab 2 -ad 512')
+    rtrace_2 = Rtrace(octree='scene.oct', sensors='grid.pts')
+    rtrace_2.options.update_from_string('-ad 512 -ab 2 -h')
+    assert rtrace_1 == rtrace_2
+    assert hash(rtrace_1) == hash(rtrace_2)
+    assert len(set([rtrace_1, rtrace_2])) == 1
+
+    rtrace_2.sensors = 'grid_2.pts'
+    assert rtrace_1 != rtrace_2
+    rtrace_2.sensors = 'grid.pts'
+    rtrace_2.pipe_to = Command(output='command.res')
+    assert rtrace_1 != rtrace_2
+    assert rtrace_1 != Command()
+
+
+def test_pickle():
+    import pickle
+    from honeybee_radiance_command.rtrace import Rtrace
+    from honeybee_radiance_command.rcalc import Rcalc
+    rtrace = Rtrace(octree='scene.oct', sensors='grid.pts')
+    rtrace.options.ab = 2
+    rtrace.pipe_to = Rcalc(output='results.ill')
+    new_rtrace = pickle.loads(pickle.dumps(rtrace, 2))
+    assert new_rtrace == rtrace
+    assert new_rtrace.to_radiance() == rtrace.to_radiance()
+    assert new_rtrace.options is not rtrace.options
+
+
+def test_to_from_dict():
+    import json
+    from honeybee_radiance_command.rtrace import Rtrace
+    from honeybee_radiance_command.rcalc import Rcalc
+    rtrace = Rtrace(octree='scene.oct', sensors='grid.pts')
+    rtrace.options.ab = 2
+    rcalc = Rcalc(output='results.ill')
+    rcalc.options.e = '$1=$1*179'
+    rtrace.pipe_to = rcalc
+    data = json.loads(json.dumps(rtrace.to_dict()))
+    assert data['type'] == 'Rtrace'
+    assert data['inputs']['octree'] == 'scene.oct'
+    new_rtrace = Command.from_dict(data)
+    assert isinstance(new_rtrace, Rtrace)
+    assert new_rtrace.to_radiance() == rtrace.to_radiance()
+    assert new_rtrace == rtrace
+
+
+def test_to_argv():
+    cmd = Command(output='command 1.res')
+    assert cmd.to_argv() == \
+        {'argv': [['command']], 'stdin': None, 'stdout': 'command 1.res'}
+
+
+def test_to_argv_subclasses():
+    from honeybee_radiance_command.rtrace import Rtrace
+    from honeybee_radiance_command.rcontrib import Rcontrib
+    from honeybee_radiance_command.rcalc import Rcalc
+    from honeybee_radiance_command.oconv import Oconv
+    from honeybee_radiance_command.rpict import Rpict
+    from honeybee_radiance_command.gendaymtx import Gendaymtx
+    rtrace = Rtrace(octree='scene folder/scene.oct', sensors='grid.pts')
+    rtrace.options.update_from_string('-ab 2 -h -I')
+    rcalc = Rcalc(output='results.ill')
+    rcalc.options.e = '$1=(0.265*$1+0.67*$2+0.065*$3)*179'
+    rtrace.pipe_to = rcalc
+    argv = rtrace.to_argv()
+    assert argv == {
+        'argv': [
+            ['rtrace', '-I', '-ab', '2', '-h', 'scene folder/scene.oct'],
+            ['rcalc', '-e', '$1=(0.265*$1+0.67*$2+0.065*$3)*179']
+        ],
+        'stdin': 'grid.pts',
+        'stdout': 'results.ill'
+    }
+    rcontrib = Rcontrib(octree='scene.oct', sensors='grid.pts')
+    rcontrib.options.M = 'suns.mod'
+    oconv = Oconv(inputs=['sky.rad', 'scene.rad'])
+    rpict = Rpict(octree='scene.oct', view='view.vf')
+    gendaymtx = Gendaymtx(wea='sky.wea')
+    # the arguments that are created directly match the translated commands
+    assert gendaymtx._argv() == Command._argv(gendaymtx)
+    for command in (rtrace, rcalc, rcontrib, oconv, rpict):
+        assert command._argv() == Command._argv(command)
+        assert command._argv(True) == Command._argv(command, True)
@@ -31,4 +31,29 @@ def test_import_view_from_string():
     assert options['y'] == '300'
     assert options['vs'] == '-0.500'
     assert options['vl'] == '-0.500'
-    assert options['vo'] == '100.000'
\ No newline at end of file
+    assert options['vo'] == '100.000'
+
+def test_joined_and_quoted_options():
+    """Test joined options, negative numbers and quoted values."""
+    options = cutil.parse_radiance_options(
+        '-I+ -ld- -faf -vs -0.5 -o "my folder/result.dat" -e \'$1=a-b\' -ab4'
+    )
+    assert options['I'] == '+'
+    assert options['ld'] == '-'
+    assert options['faf'] == ''
+    assert options['vs'] == '-0.5'
+    assert options['o'] == 'my folder/result.dat'
+    assert options['e'] == '$1=a-b'
+    assert options['ab'] == '4'
+    assert cutil.parse_radiance_options('  ') == {}
+
+
+def test_fast_path_matches_tokenizer():
+    """Test strings without quotes are split the same way as the full tokenizer."""
+    strings = [
+        '-I+ -ld- -faf -vs -0.5 -e $1=a-b -ab4 -x 300',
+        'rvu -vtv -vh 29.341 -vl -0.500', '-o result-1.dat -1 -h'
+    ]
+    for string in strings:
+        fast = [cutil._split_token(token) for token in string.split()]
+        assert fast == cutil._token_pattern.findall(string)
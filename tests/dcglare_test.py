@@ -68,3 +68,26 @@ def test_validation():
 
     dcglare.sky_matrix = 'sky_matrix.mtx'
     assert dcglare.to_radiance() == 'dcglare dc_direct.mtx dc_total.mtx sky_matrix.mtx'
+
+
+def _write_matrix(folder, name, nrows, ncols, ncomp=3):
+    path = str(folder.join(name))
+    with open(path, 'w') as outf:
+        outf.write(
+            '#?RADIANCE\nNROWS=%d\nNCOLS=%d\nNCOMP=%d\nFORMAT=ascii\n\n'
+            % (nrows, ncols, ncomp)
+        )
+    return name
+
+
+def test_validate_shapes(tmpdir):
+    cwd = str(tmpdir)
+    dcglare = Dcglare(
+        dc_direct=_write_matrix(tmpdir, 'dc_direct.mtx', 10, 146),
+        dc_total=_write_matrix(tmpdir, 'dc_total.mtx', 10, 146),
+        sky_matrix=_write_matrix(tmpdir, 'sky.smx', 146, 8760)
+    )
+    assert dcglare.validate_shapes(cwd) == (10, 8760, 3)
+    dcglare.dc_total = _write_matrix(tmpdir, 'dc_total_m4.mtx', 10, 578)
+    with pytest.raises(exceptions.MatrixShapeError):
+        dcglare.validate_shapes(cwd)
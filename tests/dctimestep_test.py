@@ -1,4 +1,5 @@
 from honeybee_radiance_command.dctimestep import Dctimestep
+import honeybee_radiance_command._exception as exceptions
 import pytest
 
 
@@ -63,3 +64,48 @@ def test_exclusive_options():
     dctimestep.options.o = 'output%02d.mtx'
     with pytest.raises(Exception):
         dctimestep.to_radiance()
+
+
+def _write_matrix(folder, name, nrows, ncols, ncomp=3):
+    path = str(folder.join(name))
+    with open(path, 'w') as outf:
+        outf.write(
+            '#?RADIANCE\nNROWS=%d\nNCOLS=%d\nNCOMP=%d\nFORMAT=ascii\n\n'
+            % (nrows, ncols, ncomp)
+        )
+    return name
+
+
+def test_validate_shapes(tmpdir):
+    cwd = str(tmpdir)
+    dctimestep = Dctimestep.daylight_coef_calc(
+        day_coef_matrix=_write_matrix(tmpdir, 'dc.mtx', 100, 146),
+        sky_vector=_write_matrix(tmpdir, 'sky.smx', 146, 8760)
+    )
+    assert dctimestep.validate_shapes(cwd) == (100, 8760, 3)
+    dctimestep.sky_vector = _write_matrix(tmpdir, 'sky_m4.smx', 578, 8760)
+    with pytest.raises(exceptions.MatrixShapeError):
+        dctimestep.validate_shapes(cwd)
+
+
+def test_validate_shapes_three_phase(tmpdir):
+    cwd = str(tmpdir)
+    with open(str(tmpdir.join('tmtx.xml')), 'w') as outf:
+        outf.write(
+            '<WindowElement><WavelengthData><WavelengthDataBlock>'
+            '<WavelengthDataDirection>Transmission Front</WavelengthDataDirection>'
+            '<ColumnAngleBasis>LBNL/Klems Full</ColumnAngleBasis>'
+            '<RowAngleBasis>LBNL/Klems Full</RowAngleBasis>'
+            '<ScatteringData>0</ScatteringData>'
+            '</WavelengthDataBlock></WavelengthData></WindowElement>'
+        )
+    dctimestep = Dctimestep.three_phase_calc(
+        view_matrix=_write_matrix(tmpdir, 'view.vmx', 100, 145),
+        t_matrix='tmtx.xml',
+        daylight_matrix=_write_matrix(tmpdir, 'daylight.dmx', 145, 146),
+        sky_vector=_write_matrix(tmpdir, 'sky.smx', 146, 8760)
+    )
+    assert dctimestep.validate_shapes(cwd) == (100, 8760, 3)
+    dctimestep.view_matrix = _write_matrix(tmpdir, 'view_half.vmx', 100, 73)
+    with pytest.raises(exceptions.MatrixShapeError):
+        dctimestep.validate_shapes(cwd)
@@ -1,5 +1,7 @@
 from honeybee_radiance_command.falsecolor import Falsecolor
+from honeybee_radiance_command.native.rgbe import Picture
 import pytest
+from honeybee_radiance_command._command import Command
 import honeybee_radiance_command._exception as exceptions
 
 
@@ -60,3 +62,25 @@ def test_odim():
     falsecolor.output = 'image_odim.hdr'
     falsecolor.options.odim = (5, 5)
     assert falsecolor.to_radiance() == 'falsecolor -odim 5 5 -i image.hdr > image_odim.hdr'
+
+
+def test_run_native(tmpdir):
+    """Test running falsecolor in-process."""
+    Picture(4, 2, [1.0] * 24).to_file(str(tmpdir.join('image.hdr')))
+    falsecolor = Falsecolor(input='image.hdr', output='falsecolor.hdr')
+    falsecolor.options.s = '1000'
+    falsecolor.options.lw = 20
+    falsecolor.options.lh = 40
+    assert falsecolor.run(cwd=str(tmpdir), native=True) == 0
+    result = Picture.from_file(str(tmpdir.join('falsecolor.hdr')))
+    assert (result.width, result.height) == (24, 40)
+    assert 'falsecolor -lh 40 -lw 20 -s 1000 -i image.hdr' in result.header
+
+
+def test_run_subprocess(tmpdir, monkeypatch):
+    """Test falsecolor is run as a subprocess unless native is set to True."""
+    monkeypatch.setattr(Command, 'run', lambda self, env=None, cwd=None: 'subprocess')
+    Picture(2, 2, [1.0] * 12).to_file(str(tmpdir.join('image1.hdr')))
+    falsecolor = Falsecolor(input='image1.hdr', output='falsecolor.hdr')
+    assert falsecolor.run(cwd=str(tmpdir)) == 'subprocess'
+    assert not tmpdir.join('falsecolor.hdr').check()
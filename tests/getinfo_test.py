@@ -1,4 +1,5 @@
 from honeybee_radiance_command.getinfo import Getinfo
+import os
 import pytest
 import honeybee_radiance_command._exception as exceptions
 
@@ -72,3 +73,60 @@ def test_header():
 
     assert getinfo.to_radiance() == 'getinfo - < image1.hdr > headerless.hdr'
     assert getinfo.to_radiance(stdin_input=True) == 'getinfo - > headerless.hdr'
+
+
+def _write_picture(path):
+    with open(path, 'wb') as outf:
+        outf.write(b'#?RADIANCE\nFORMAT=32-bit_rle_rgbe\n\n-Y 2 +X 3\n' + b'\x80' * 24)
+
+
+def test_run_native(tmpdir):
+    """Test running getinfo in-process."""
+    cwd = str(tmpdir)
+    _write_picture(str(tmpdir.join('image.hdr')))
+
+    getinfo = Getinfo(input='image.hdr', output='header.txt')
+    assert getinfo.run(cwd=cwd) == 0
+    with open(str(tmpdir.join('header.txt'))) as inf:
+        assert inf.read() == 'image.hdr:\n\t#?RADIANCE\n\tFORMAT=32-bit_rle_rgbe\n\n'
+
+    getinfo.options.d = True
+    getinfo.run(cwd=cwd)
+    with open(str(tmpdir.join('header.txt'))) as inf:
+        assert inf.read() == 'image.hdr: -Y 2 +X 3\n'
+
+    getinfo = Getinfo.remove_header(input='image.hdr', output='body.hdr')
+    getinfo.run(cwd=cwd)
+    with open(str(tmpdir.join('body.hdr')), 'rb') as inf:
+        assert inf.read() == b'-Y 2 +X 3\n' + b'\x80' * 24
+
+    getinfo = Getinfo(input='image.hdr', output='added.hdr')
+    getinfo.options.a = 'EXPOSURE=2'
+    getinfo.run(cwd=cwd)
+    with open(str(tmpdir.join('added.hdr')), 'rb') as inf:
+        assert inf.read() == b'#?RADIANCE\nFORMAT=32-bit_rle_rgbe\nEXPOSURE=2\n\n' \
+            b'-Y 2 +X 3\n' + b'\x80' * 24
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='backslash is a path separator on Windows')
+def test_run_native_paths(tmpdir):
+    """Test backslashes and quotes in the input that is set in __init__."""
+    cwd = str(tmpdir)
+    _write_picture(str(tmpdir.join('dir\\image.hdr')))
+    tmpdir.mkdir('my folder')
+    _write_picture(str(tmpdir.join('my folder', 'image.hdr')))
+
+    getinfo = Getinfo(
+        input='dir\\image.hdr "my folder/image.hdr"', output='header.txt'
+    )
+    getinfo.options.d = True
+    assert getinfo.run(cwd=cwd) == 0
+    with open(str(tmpdir.join('header.txt'))) as inf:
+        assert inf.read() == 'dir\\image.hdr: -Y 2 +X 3\n' \
+            'my folder/image.hdr: -Y 2 +X 3\n'
+
+
+def test_run_native_missing_file(tmpdir):
+    """Test a missing input returns an error code similar to getinfo."""
+    getinfo = Getinfo(input='missing.hdr', output='header.txt')
+    assert getinfo.run(cwd=str(tmpdir)) == 1
@@ -0,0 +1,35 @@
+from honeybee_radiance_command.native.bsdf import bsdf_shape
+
+BSDF = """<?xml version="1.0" encoding="UTF-8"?>
+<WindowElement xmlns="http://windows.lbl.gov">
+<Optical><Layer>
+<DataDefinition>
+<IncidentDataStructure>Columns</IncidentDataStructure>
+<AngleBasis>
+<AngleBasisName>Custom</AngleBasisName>
+<AngleBasisBlock><Theta>0</Theta><nPhis>1</nPhis></AngleBasisBlock>
+<AngleBasisBlock><Theta>30</Theta><nPhis>8</nPhis></AngleBasisBlock>
+</AngleBasis>
+</DataDefinition>
+<WavelengthData>
+<WavelengthDataBlock>
+<WavelengthDataDirection>Transmission Front</WavelengthDataDirection>
+<ColumnAngleBasis>Custom</ColumnAngleBasis>
+<RowAngleBasis>%s</RowAngleBasis>
+<ScatteringData>0.1, 0.2</ScatteringData>
+</WavelengthDataBlock>
+</WavelengthData>
+</Layer></Optical>
+</WindowElement>
+"""
+
+
+def test_bsdf_shape(tmpdir):
+    path = str(tmpdir.join('custom.xml'))
+    with open(path, 'w') as outf:
+        outf.write(BSDF % 'LBNL/Klems Full')
+    assert bsdf_shape(path) == (145, 9)
+
+    with open(path, 'w') as outf:
+        outf.write(BSDF % 'Unknown')
+    assert bsdf_shape(path) is None
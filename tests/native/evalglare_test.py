@@ -0,0 +1,177 @@
+import math
+import os
+import shutil
+from array import array
+
+import pytest
+
+from honeybee_radiance_command.native.evalglare import evaluate, evaluate_files, \
+    evaluate_pictures, view_table, position_index, is_supported
+from honeybee_radiance_command.native.rgbe import Picture
+from honeybee_radiance_command.options.evalglare import EvalglareOptions
+from honeybee_radiance_command.evalglare import Evalglare
+
+VIEW = '-vta -vh 180 -vv 180'
+
+
+def _picture(size=60, background=100.0, source=None, view=VIEW):
+    """Create a fisheye picture with a uniform luminance and an optional source.
+
+    The source is a (column, row, luminance) tuple for a 2 x 2 pixel square.
+    """
+    values = [background / 179] * (3 * size * size)
+    if source is not None:
+        column, row, luminance = source
+        for y in (row, row + 1):
+            for x in (column, column + 1):
+                start = 3 * (y * size + x)
+                values[start:start + 3] = [luminance / 179] * 3
+    return Picture(size, size, values, header=['VIEW= %s' % view])
+
+
+def test_view_table():
+    table = view_table(60, 60, VIEW)
+    assert view_table(60, 60, '-vta -vv 180 -vh 180') is table
+    assert table.view_type == 'vta'
+    # corners of the picture are outside the fisheye circle
+    assert 0 not in table.pixels
+    assert len(table.pixels) == len(table.solid_angles) == len(table.weights)
+    assert sum(table.solid_angles) == pytest.approx(2 * math.pi, rel=0.01)
+    assert sum(table.weights) == pytest.approx(math.pi, rel=0.01)
+
+    perspective = view_table(40, 40, '-vtv -vh 90 -vv 90')
+    assert len(perspective.pixels) == 1600
+    assert sum(perspective.solid_angles) == pytest.approx(2 * math.pi / 3, rel=0.01)
+
+    with pytest.raises(ValueError):
+        view_table(40, 40, '-vtc -vh 180 -vv 180')
+
+
+def test_position_index():
+    assert position_index(0, 0, 1) == pytest.approx(1.0)
+    # sources above the line of sight are less disturbing than to the side
+    above = position_index(0, math.sin(0.5), math.cos(0.5))
+    side = position_index(math.sin(0.5), 0, math.cos(0.5))
+    assert above > side > 1
+    below = position_index(0, -math.sin(0.5), math.cos(0.5))
+    assert below == pytest.approx(1 + 0.8 * math.tan(0.5))
+    assert position_index(0, 1, 0) == 16
+
+
+def test_uniform_picture():
+    glare = evaluate(_picture(background=1000.0))
+    assert glare.ev == pytest.approx(1000 * math.pi, rel=0.01)
+    assert glare.average_luminance == pytest.approx(1000.0, rel=0.001)
+    assert glare.sources == []
+    assert glare.background_luminance == pytest.approx(1000.0, rel=0.01)
+    ev = glare.ev
+    assert glare.dgp == pytest.approx(5.87e-5 * ev + 0.16)
+    assert glare.dgp_s == pytest.approx(6.22e-5 * ev + 0.184)
+    assert glare.ugr == 0
+
+
+def test_glare_source():
+    options = EvalglareOptions()
+    options.b = 2000
+    glare = evaluate(_picture(source=(29, 29, 20000.0)), options)
+    assert len(glare.sources) == 1
+    luminance, omega, direction, index = glare.sources[0]
+    assert luminance == pytest.approx(20000.0, rel=0.001)
+    assert direction == pytest.approx((0, 0, 1), abs=1e-6)
+    assert index == pytest.approx(1.0)
+    table = view_table(60, 60, VIEW)
+    assert omega == pytest.approx(4 * max(table.solid_angles), rel=0.01)
+
+    ev = glare.ev
+    assert ev < 1000
+    expected = 5.87e-5 * ev + 9.18e-2 * math.log10(
+        1 + luminance ** 2 * omega / ev ** 1.87
+    ) + 0.16
+    factor = math.exp(0.024 * ev - 4)
+    expected *= factor / (1 + factor)
+    assert glare.dgp == pytest.approx(expected)
+    assert glare.ugr > 0
+
+    # without the low light correction
+    options.C = '0'
+    assert evaluate(_picture(source=(29, 29, 20000.0)), options).dgp > glare.dgp
+
+    # a threshold that is larger than the luminance of the source
+    options.b = 200000
+    assert evaluate(_picture(source=(29, 29, 20000.0)), options).sources == []
+
+
+def test_relative_threshold_and_external_illuminance():
+    options = EvalglareOptions()
+    options.b = 5
+    options.i = 2000
+    glare = evaluate(_picture(source=(10, 29, 1000.0)), options)
+    assert glare.ev == 2000
+    assert len(glare.sources) == 1
+    assert glare.sources[0][0] == pytest.approx(1000.0, rel=0.001)
+
+
+def test_merge_and_peak_extraction():
+    picture = _picture(source=(29, 29, 100000.0))
+    # add a dimmer source next to the bright source
+    for x in (31, 32):
+        for y in (29, 30):
+            start = 3 * (y * 60 + x)
+            picture.data[start:start + 3] = array('f', [10000 / 179.0] * 3)
+    assert len(evaluate(picture).sources) == 2
+    options = EvalglareOptions()
+    options.x = True
+    sources = evaluate(picture, options).sources
+    assert len(sources) == 1
+    assert sources[0][0] == pytest.approx(55000, rel=0.01)
+    # the search radius is smaller than the angle between the pixels
+    options.r = 0.01
+    assert len(evaluate(picture, options).sources) == 8
+
+
+def test_evaluate_files(tmpdir):
+    files = []
+    for index, background in enumerate((100.0, 500.0, 1000.0)):
+        path = str(tmpdir.join('view_%d.hdr' % index))
+        _picture(20, background).to_file(path)
+        files.append(path)
+    results = evaluate_files(files, processes=2)
+    expected = evaluate_pictures([Picture.from_file(f) for f in files])
+    assert [r.dgp for r in results] == pytest.approx([r.dgp for r in expected])
+    assert results[0].ev < results[1].ev < results[2].ev
+
+
+def test_unsupported():
+    options = EvalglareOptions()
+    assert is_supported(options)
+    options.t = (10, 10, 0.5)
+    assert not is_supported(options)
+    with pytest.raises(ValueError):
+        evaluate(_picture(), options)
+    with pytest.raises(ValueError):
+        evaluate(Picture(4, 4))
+
+
+@pytest.mark.skipif(
+    shutil.which('evalglare') is None, reason='evalglare is not installed'
+)
+def test_evalglare_binary(tmpdir):
+    options = EvalglareOptions()
+    options.b = 2000
+    picture = _picture(400, 500.0, (240, 160, 20000.0))
+    # grow the source to 20 x 20 pixels
+    for y in range(160, 180):
+        for x in range(240, 260):
+            start = 3 * (y * 400 + x)
+            picture.data[start:start + 3] = array('f', [20000 / 179.0] * 3)
+    picture.to_file(str(tmpdir.join('view.hdr')))
+    Evalglare(options, 'glare.txt', 'view.hdr').run(cwd=str(tmpdir))
+    with open(os.path.join(str(tmpdir), 'glare.txt')) as result:
+        line = [line for line in result if ':' in line][-1]
+    names, values = line.split(':', 1)
+    expected = dict(zip(names.split(','), (float(v) for v in values.split())))
+
+    glare = evaluate(picture, options)
+    assert glare.dgp == pytest.approx(expected['dgp'], abs=0.02)
+    assert glare.ev == pytest.approx(expected['E_v'], rel=0.02)
+    assert glare.average_luminance == pytest.approx(expected['av_lum'], rel=0.02)
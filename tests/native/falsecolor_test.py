@@ -0,0 +1,126 @@
+import pytest
+from array import array
+
+import honeybee_radiance_command.native.falsecolor as falsecolor_module
+from honeybee_radiance_command.native.falsecolor import falsecolor, legend, \
+    palette_table, is_supported
+from honeybee_radiance_command.native.rgbe import Picture
+from honeybee_radiance_command.options.falsecolor import FalsecolorOptions
+
+
+def _picture(width=10, height=2):
+    # luminance increases from 0 to 900 nits from left to right
+    values = []
+    for y in range(height):
+        for x in range(width):
+            v = 100.0 * x / 179
+            values.extend((v, v, v))
+    return Picture(width, height, values)
+
+
+def _options(**kwargs):
+    options = FalsecolorOptions()
+    options.s = '1000'
+    options.lw = 0
+    for name, value in kwargs.items():
+        setattr(options, name, value)
+    return options
+
+
+def test_palette_table():
+    table = palette_table('hot', 16)
+    assert len(table) == 16
+    assert table[0] == (0, 0, 0)
+    assert table[-1] == (1, 1, 1)
+    assert palette_table('hot', 16) is table
+
+
+def test_linear_mapping():
+    result = falsecolor(_picture(), _options(pal='hot'))
+    assert (result.width, result.height) == (10, 2)
+    table = palette_table('hot')
+    last = len(table) - 1
+    for x in range(10):
+        expected = table[int(x / 10.0 * last + 0.5)]
+        assert result.pixel(x, 0) == pytest.approx(expected, abs=0.01)
+
+
+def test_log_mapping_and_auto_scale():
+    result = falsecolor(_picture(), _options(pal='hot', log=1, s='auto'))
+    # the maximum value is mapped to the last color of the palette
+    assert result.pixel(9, 0) == pytest.approx((1, 1, 1), abs=0.01)
+    assert result.pixel(0, 0) == (0, 0, 0)
+    # 100 nits is about one decade below the maximum and is near the bottom
+    red, green, blue = result.pixel(1, 0)
+    assert 0 < red < 0.05
+    assert green == blue == 0
+
+
+def test_exposure():
+    picture = _picture()
+    exposed = Picture(
+        picture.width, picture.height, [v * 2 for v in picture.data], exposure=2
+    )
+    expected = falsecolor(picture, _options())
+    result = falsecolor(exposed, _options())
+    for x in range(10):
+        assert result.pixel(x, 0) == pytest.approx(expected.pixel(x, 0), abs=0.01)
+
+
+def test_bands_and_lines():
+    bands = falsecolor(_picture(), _options(cb=True, n=2))
+    colors = set(bands.pixel(x, 0) for x in range(10))
+    assert len(colors) == 2
+    assert bands.pixel(0, 0) == bands.pixel(4, 0)
+    assert bands.pixel(5, 0) == bands.pixel(9, 0)
+
+    lines = falsecolor(_picture(), _options(cl=True, n=2))
+    assert lines.pixel(4, 0) != (0, 0, 0)
+    for x in (0, 3, 5, 9):
+        assert lines.pixel(x, 0) == (0, 0, 0)
+
+
+def test_legend():
+    options = FalsecolorOptions()
+    options.s = '1000'
+    options.lw = 50
+    options.lh = 90
+    key = legend(options)
+    assert (key.width, key.height) == (50, 90)
+    # a new picture is returned from the cache
+    same = legend(options)
+    assert same is not key and same.data == key.data
+    key.data[0:3] = array('f', [1.0, 2.0, 3.0])
+    assert legend(options).data == same.data
+    options.s = '2000'
+    assert legend(options).data != same.data
+    options.s = '1000'
+    key = legend(options)
+
+    result = falsecolor(_picture(), options)
+    assert (result.width, result.height) == (60, 90)
+    # the legend is at the left and the picture is at the bottom
+    assert result.pixel(0, 0) == key.pixel(0, 0)
+    assert result.pixel(59, 0) == (0, 0, 0)
+
+    options.lh = 0
+    assert legend(options) is None
+
+
+def test_unsupported_options():
+    options = FalsecolorOptions()
+    assert is_supported(options)
+    options.e = True
+    assert not is_supported(options)
+    with pytest.raises(ValueError):
+        falsecolor(_picture(), options)
+
+
+def test_legend_auto_scale():
+    options = FalsecolorOptions()
+    options.s = 'auto'
+    count = len(falsecolor_module._LEGENDS)
+    for maximum in (1, 2, 3):
+        assert legend(options, maximum) is not None
+    # legends for an auto scale are not cached
+    assert len(falsecolor_module._LEGENDS) == count
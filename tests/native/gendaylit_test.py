@@ -0,0 +1,62 @@
+import os
+
+from honeybee_radiance_command.native.gendaylit import SkyBatch, perez_sky
+from honeybee_radiance_command.native.wea import Wea
+from honeybee_radiance_command.options.gendaylit import GendaylitOptions
+from honeybee_radiance_command.options.gensky import GenskyOptions
+
+WEA_FILE = './tests/assets/boston.wea'
+
+
+def test_perez_sky():
+    sky = perez_sky(45, 30, 700, 100)
+    assert 'void light solar' in sky
+    assert 'solar source sun' in sky
+    assert '2 skybright perezlum.cal' in sky
+
+    options = GendaylitOptions()
+    options.s = True
+    sky = perez_sky(45, 30, 700, 100, options=options)
+    assert 'solar source sun' not in sky
+    assert 'skybright perezlum.cal' in sky
+
+
+def test_from_wea():
+    batch = SkyBatch.from_wea(Wea.from_file(WEA_FILE))
+    assert batch.count == len(batch.descriptions())
+    assert all(alt > 0 for alt, _ in batch.angles)
+    assert batch.labels[0].startswith('06_21_')
+    all_steps = SkyBatch.from_wea(Wea.from_file(WEA_FILE), sun_up_hours=False)
+    assert all_steps.count == 48
+
+
+def test_commands():
+    batch = SkyBatch([(30, 0), (60, 45)], [500, 600], [100, 120])
+    options = GendaylitOptions()
+    options.g = 0.3
+    commands = batch.commands(options)
+    assert commands[0].to_radiance() == \
+        'gendaylit -W 500 100 -ang 30.0 0.0 -g 0.3'
+    assert commands[1].options.W.value == (600, 120)
+    # base options must not change
+    assert not options.W.is_set
+
+
+def test_gensky_commands():
+    batch = SkyBatch([(30, 0)])
+    options = GenskyOptions()
+    options.c = True
+    commands = batch.commands(options)
+    assert commands[0].to_radiance() == 'gensky -ang 30.0 0.0 -c'
+
+
+def test_to_folder_and_file(tmpdir):
+    batch = SkyBatch([(30, 0), (60, 45)], [500, 600], [100, 120], labels=['a', 'b'])
+    files = batch.to_folder(str(tmpdir.join('skies')))
+    assert [os.path.basename(f) for f in files] == ['a.sky', 'b.sky']
+    assert all(os.path.isfile(f) for f in files)
+    sky_file = batch.to_file(str(tmpdir.join('skies.sky')))
+    with open(sky_file) as inf:
+        content = inf.read()
+    assert content.count('# sky ') == 2
+    assert content.count('skyfunc') == 2
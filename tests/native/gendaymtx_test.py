@@ -0,0 +1,166 @@
+import math
+import os
+import shutil
+
+import pytest
+
+import honeybee_radiance_command.native.gendaymtx as gendaymtx_module
+from honeybee_radiance_command.native.gendaymtx import SkyMatrix, sky_patches, \
+    gendaymtx
+from honeybee_radiance_command.gendaymtx import Gendaymtx
+from honeybee_radiance_command.native.wea import Wea
+from honeybee_radiance_command.options.gendaymtx import GendaymtxOptions
+
+WEA = './tests/assets/boston.wea'
+
+
+def test_sky_patches():
+    for m, count in ((1, 146), (2, 578), (4, 2306)):
+        alt, azi, dom = sky_patches(m)
+        assert len(alt) == len(azi) == len(dom) == count
+        # sky patches should cover the whole hemisphere
+        assert abs(sum(dom[1:]) - 2 * math.pi) < 1e-5
+    assert sky_patches(1) is sky_patches(1)
+
+
+def test_wea():
+    wea = Wea.from_file(WEA)
+    assert wea.count == 48
+    assert wea.latitude == 42.37
+    assert wea.longitude == 71.02
+    assert wea.time_zone == 75
+    assert wea.direct[12] == 800
+
+
+def test_sky_matrix():
+    sky = SkyMatrix.from_wea(WEA)
+    columns = sky.compute()
+    assert len(columns) == 48
+    assert len(columns[0]) == 146 * 3
+    # night time
+    assert not any(columns[0])
+    # brightest patch should be the one around the sun
+    noon = columns[12]
+    assert max(range(146), key=lambda i: noon[3 * i]) == 134
+
+    # ground is 20% gray
+    options = GendaymtxOptions()
+    options.O = '1'
+    noon = sky.compute(options)[12]
+    ground = (800 * math.sin(sky.altitudes[12]) + 140) * 0.2 / math.pi
+    assert abs(noon[0] - ground) < 1e-3
+
+
+def test_sky_matrix_options():
+    sky = SkyMatrix.from_wea(WEA)
+    options = GendaymtxOptions()
+    options.s = True
+    sky_only = sky.compute(options)[12]
+    options = GendaymtxOptions()
+    options.d = True
+    sun_only = sky.compute(options)[12]
+    total = sky.compute()[12]
+    assert sun_only[0] == 0
+    assert sum(sun_only) > 0
+    for a, b, c in zip(sky_only, sun_only, total):
+        assert abs(a + b - c) <= 1e-4 * max(c, 1)
+
+    options = GendaymtxOptions()
+    options.r = 90
+    rotated = sky.compute(options)[12]
+    assert max(range(146), key=lambda i: rotated[3 * i]) != 134
+    assert abs(rotated[0] - total[0]) < 1e-4
+
+    options = GendaymtxOptions()
+    options.u = True
+    options.m = 2
+    columns = sky.compute(options)
+    assert len(columns) == len([a for a in sky.altitudes if a > -0.0047])
+    assert len(columns[0]) == 578 * 3
+
+
+def test_to_file(tmpdir):
+    output = str(tmpdir.join('sky.mtx'))
+    gendaymtx(WEA, output)
+    with open(output) as inf:
+        content = inf.read()
+    header, body = content.split('\n\n', 1)
+    assert 'NROWS=146' in header
+    assert 'NCOLS=48' in header
+    assert 'FORMAT=ascii' in header
+    assert len(body.split()) == 146 * 48 * 3
+
+    options = GendaymtxOptions()
+    options.o = 'f'
+    options.h = True
+    SkyMatrix.from_wea(WEA).to_file(output, options)
+    assert os.path.getsize(output) == 146 * 48 * 3 * 4
+
+
+def test_suns(tmpdir):
+    sky = SkyMatrix.from_wea(WEA)
+    suns = sky.suns()
+    assert len(suns) == len([a for a in sky.altitudes if a > -0.0047])
+    minute, vector, radiance = suns[7]
+    # 21st of June
+    assert minute // (24 * 60) == 171
+    assert minute % 60 == 30
+    assert vector[1] < 0 and vector[2] > 0
+    assert radiance > 0
+
+    options = GendaymtxOptions()
+    options.D = str(tmpdir.join('suns.rad'))
+    options.M = str(tmpdir.join('suns.mod'))
+    options.n = True
+    assert sky.to_file(str(tmpdir.join('sky.mtx')), options) is None
+    with open(str(tmpdir.join('suns.mod'))) as inf:
+        modifiers = inf.read().split()
+    assert len(modifiers) == len(suns)
+    assert modifiers[7] == 'solar%d' % minute
+    with open(str(tmpdir.join('suns.rad'))) as inf:
+        assert inf.read().count('source') == len(suns)
+
+
+
+@pytest.mark.skipif(gendaymtx_module.np is None, reason='NumPy is not installed')
+def test_numpy(monkeypatch):
+    """NumPy and the pure Python implementation give the same values."""
+    sky = SkyMatrix.from_wea(WEA)
+    options = GendaymtxOptions()
+    options.m = 2
+    options.r = 30
+    options.g = (0.1, 0.2, 0.3)
+    expected = sky.compute(options)
+    monkeypatch.setattr(gendaymtx_module, 'np', None)
+    columns = sky.compute(options)
+    assert len(columns) == len(expected)
+    for column, expected_column in zip(columns, expected):
+        assert list(column) == pytest.approx(list(expected_column), rel=1e-6, abs=1e-9)
+
+
+def _matrix_values(path):
+    with open(path) as inf:
+        return [float(v) for v in inf.read().split('\n\n', 1)[1].split()]
+
+
+@pytest.mark.skipif(
+    not hasattr(shutil, 'which') or shutil.which('gendaymtx') is None,
+    reason='Radiance is not installed'
+)
+def test_gendaymtx_binary(tmpdir):
+    """Compare the sky matrix with the output of gendaymtx -m 1 -O 1.
+
+    gendaymtx writes 3 significant digits. The values should match within 1% or 0.01
+    W/sr/m2.
+    """
+    options = GendaymtxOptions()
+    options.O = '1'
+    wea = os.path.abspath(WEA)
+    reference = str(tmpdir.join('reference.mtx'))
+    assert Gendaymtx(options=options, output=reference, wea=wea).run() == 0
+    output = SkyMatrix.from_wea(wea).to_file(str(tmpdir.join('native.mtx')), options)
+    expected = _matrix_values(reference)
+    values = _matrix_values(output)
+    assert len(values) == len(expected) == 146 * 48 * 3
+    for value, expected_value in zip(values, expected):
+        assert abs(value - expected_value) <= 0.01 * expected_value + 0.01
@@ -0,0 +1,71 @@
+import pytest
+
+from honeybee_radiance_command.native.header import read_header, strip_header
+
+
+def test_matrix_header(tmpdir):
+    path = str(tmpdir.join('daylight.mtx'))
+    header = b'#?RADIANCE\nrfluxmtx -ab 3 -ad 5000\nNROWS=145\nNCOLS=146\nNCOMP=3\n' \
+        b'FORMAT=float\n\n'
+    with open(path, 'wb') as outf:
+        outf.write(header + b'\x00' * 64)
+    size = len(header)
+    header = read_header(path)
+    assert header.magic == '#?RADIANCE'
+    assert header.size == size
+    assert header.format == 'float'
+    assert header.fields['NROWS'] == '145'
+    assert header.shape == (145, 146, 3)
+    assert header.resolution is None
+
+
+def test_picture_header(tmpdir):
+    path = str(tmpdir.join('image.hdr'))
+    with open(path, 'wb') as outf:
+        outf.write(
+            b'#?RADIANCE\nEXPOSURE=2\nEXPOSURE=0.5\nFORMAT=32-bit_rle_rgbe\n\n'
+            b'-Y 40 +X 60\n' + b'\x80' * 64
+        )
+    header = read_header(path)
+    assert header.resolution == '-Y 40 +X 60'
+    assert header.shape == (40, 60, 3)
+    assert header.get('EXPOSURE') == '0.5'
+    assert header.values('EXPOSURE') == ['2', '0.5']
+
+
+def test_no_header(tmpdir):
+    path = str(tmpdir.join('values.txt'))
+    with open(path, 'w') as outf:
+        outf.write('1 2 3\n4 5 6\n')
+    header = read_header(path)
+    assert header.size == 0
+    assert header.magic is None
+    assert header.shape == (None, None, None)
+
+
+def test_max_size(tmpdir):
+    path = str(tmpdir.join('long.mtx'))
+    with open(path, 'wb') as outf:
+        outf.write(b'#?RADIANCE\n' + b'x' * 20000 + b'\n\n')
+    assert read_header(path).size == 20013
+    with pytest.raises(ValueError):
+        read_header(path, max_size=10000)
+
+
+def test_strip_header(tmpdir):
+    path = str(tmpdir.join('values.mtx'))
+    body = bytes(bytearray(range(256))) * 100
+    with open(path, 'wb') as outf:
+        outf.write(b'#?RADIANCE\nNCOMP=1\nFORMAT=float\n\n' + body)
+    output = str(tmpdir.join('values.bin'))
+    header = strip_header(path, output)
+    assert header.format == 'float'
+    with open(output, 'rb') as inf:
+        assert inf.read() == body
+
+    # write to a file object after other content
+    with open(output, 'wb') as outf:
+        outf.write(b'start')
+        strip_header(path, outf)
+    with open(output, 'rb') as inf:
+        assert inf.read() == b'start' + body
@@ -0,0 +1,52 @@
+import pytest
+
+from honeybee_radiance_command.native.pcomb import combine, compile_expression, \
+    LUMINANCE
+from honeybee_radiance_command.native.rgbe import Picture
+
+
+def _picture(value):
+    return Picture(2, 2, [v for _ in range(4) for v in value])
+
+
+def test_linear_combination():
+    pictures = [_picture((1.0, 2.0, 3.0)), _picture((0.5, 0.5, 0.5))]
+    result = combine(pictures, coefficients=[(2, 2, 2), (-1, -1, -1)])
+    assert result.pixel(1, 1) == (1.5, 3.5, 5.5)
+    # the inputs are not changed
+    assert pictures[1].pixel(0, 0) == (0.5, 0.5, 0.5)
+
+
+def test_expression():
+    pictures = [_picture((1.0, 2.0, 3.0)), _picture((0.5, 0.5, 0.5))]
+    result = combine(pictures, 'l=li(1)-li(2);ro=l*WE;go=l*WE;bo=l*WE')
+    expected = sum(c * v for c, v in zip(LUMINANCE, (0.5, 1.5, 2.5))) * 179
+    for value in result.pixel(0, 1):
+        assert value == pytest.approx(expected, rel=1e-6)
+
+    # the channels that are not assigned are the sum of the inputs
+    result = combine(pictures, 'ro=ri(1)/ri(2)-2^2;go=0')
+    assert result.pixel(0, 0) == (-2.0, 0.0, 3.5)
+
+
+@pytest.mark.parametrize(
+    'expression', ['ro=max(ri(1), 1)', 'ro=ri(1)*x', 'ro=if(ri(1)-1, 1, 0)', 'ro=ri(1)>2']
+)
+def test_unsupported(expression):
+    with pytest.raises(ValueError):
+        compile_expression(expression)
+
+
+def test_missing_input():
+    with pytest.raises(ValueError):
+        combine([_picture((1.0, 1.0, 1.0))], 'ro=ri(2);go=gi(2);bo=bi(2)')
+
+
+@pytest.mark.parametrize(
+    'expression', ['ro=(ri(1)-ri(2))^0.5', 'ro=10^400', 'ro=0^-1', 'ro=(0-ri(1))^-0.5']
+)
+def test_invalid_power(expression):
+    # pcomb warns about these values and uses 0
+    pictures = [_picture((1.0, 2.0, 3.0)), _picture((2.0, 2.0, 2.0))]
+    result = combine(pictures, expression)
+    assert result.pixel(0, 0)[0] == 0
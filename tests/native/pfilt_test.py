@@ -0,0 +1,82 @@
+import pytest
+
+from honeybee_radiance_command.native.pfilt import filter_picture, filter_files, \
+    is_supported
+from honeybee_radiance_command.native.rgbe import Picture
+from honeybee_radiance_command.options.pfilt import PfiltOptions
+
+
+def _picture(width=8, height=4):
+    # a checker board of 0 and 2 with a 1x1 period
+    values = []
+    for y in range(height):
+        for x in range(width):
+            v = 2.0 if (x + y) % 2 else 0.0
+            values.extend((v, v, v))
+    return Picture(width, height, values, header=['VIEW= -vtv'])
+
+
+def test_box_filter():
+    options = PfiltOptions()
+    options.x = '/2'
+    options.y = '/2'
+    options.e = 2
+    result = filter_picture(_picture(), options)
+    assert (result.width, result.height) == (4, 2)
+    assert result.exposure == 2
+    assert result.view == '-vtv'
+    for value in result.data:
+        assert value == pytest.approx(2.0)
+
+
+def test_gaussian_filter_and_aspect():
+    options = PfiltOptions()
+    options.x = 2
+    options.r = 0.6
+    options._1 = True
+    result = filter_picture(_picture(), options)
+    assert (result.width, result.height) == (2, 4)
+    assert 'PIXASPECT=0.250000' in result.header
+    for value in result.data:
+        assert 0.5 < value < 1.5
+
+
+def test_default_exposure():
+    result = filter_picture(_picture())
+    # the average brightness is set to 0.5
+    assert result.exposure == pytest.approx(0.5)
+    assert sum(result.data) / len(result.data) == pytest.approx(0.5)
+
+
+def test_exposure_in_f_stops():
+    options = PfiltOptions()
+    options.e = -1
+    result = filter_picture(_picture(), options)
+    # -e -1 is one f-stop down
+    assert result.exposure == pytest.approx(0.5)
+    assert sum(result.data) / len(result.data) == pytest.approx(0.5)
+
+
+def test_unsupported():
+    options = PfiltOptions()
+    assert is_supported(options)
+    options.h = 50
+    assert not is_supported(options)
+    with pytest.raises(ValueError):
+        filter_picture(_picture(), options)
+
+
+def test_filter_files(tmpdir):
+    files = []
+    for i in range(3):
+        path = str(tmpdir.join('view_%d.unf' % i))
+        _picture().to_file(path)
+        files.append((path, str(tmpdir.join('view_%d.hdr' % i))))
+    options = PfiltOptions()
+    options.x = '/4'
+    options.y = '/4'
+    outputs = filter_files(files, options, processes=2)
+    assert outputs == [f[1] for f in files]
+    for output in outputs:
+        picture = Picture.from_file(output)
+        assert (picture.width, picture.height) == (2, 1)
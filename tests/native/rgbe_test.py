@@ -0,0 +1,70 @@
+import struct
+
+import pytest
+
+from honeybee_radiance_command.native.rgbe import Picture, PictureReader, XYZE_FORMAT
+
+
+def _picture(width=40, height=3):
+    values = []
+    for y in range(height):
+        for x in range(width):
+            # runs of the same value and a gradient
+            value = 0.5 if x < 20 else x * (y + 1) * 0.1
+            values.extend((value, value * 0.5, 0.0 if y == 1 else value * 2))
+    return Picture(width, height, values, header=['VIEW= -vta -vh 180'], exposure=2)
+
+
+def _assert_close(values, expected):
+    assert len(values) == len(expected)
+    for i in range(0, len(values), 3):
+        # rgbe keeps 8 bits for the mantissa of the largest component in each pixel
+        tolerance = max(expected[i:i + 3]) / 128.0
+        for v, e in zip(values[i:i + 3], expected[i:i + 3]):
+            assert v == pytest.approx(e, abs=tolerance)
+
+
+@pytest.mark.parametrize('rle', [True, False])
+def test_round_trip(tmpdir, rle):
+    picture = _picture()
+    path = picture.to_file(str(tmpdir.join('image.hdr')), rle=rle)
+    loaded = Picture.from_file(path)
+    assert loaded.width == 40 and loaded.height == 3
+    assert loaded.exposure == 2
+    assert loaded.view == '-vta -vh 180'
+    assert loaded.orientation == ('-Y', '+X')
+    _assert_close(loaded.data, picture.data)
+    _assert_close(loaded.pixel(0, 0), (0.5, 0.25, 1.0))
+
+
+def test_rle_is_smaller(tmpdir):
+    picture = Picture(100, 100, [1.0] * 30000)
+    rle = picture.to_file(str(tmpdir.join('rle.hdr')))
+    flat = picture.to_file(str(tmpdir.join('flat.hdr')), rle=False)
+    assert tmpdir.join('rle.hdr').size() < tmpdir.join('flat.hdr').size() / 10
+    assert Picture.from_file(rle).data == Picture.from_file(flat).data
+
+
+def test_old_rle(tmpdir):
+    path = str(tmpdir.join('old.pic'))
+    with open(path, 'wb') as outf:
+        outf.write(b'#?RADIANCE\nFORMAT=32-bit_rle_xyze\n\n-Y 1 +X 5\n')
+        # one pixel repeated 3 times and one more pixel
+        outf.write(struct.pack('12B', 128, 64, 0, 129, 1, 1, 1, 3, 128, 128, 128, 128))
+    with PictureReader(path) as reader:
+        assert reader.format == XYZE_FORMAT
+        scanlines = list(reader)
+    assert len(scanlines) == 1
+    _assert_close(scanlines[0][:3], (1.0, 0.5, 0.0))
+    _assert_close(scanlines[0][9:12], (1.0, 0.5, 0.0))
+    _assert_close(scanlines[0][12:], (0.5, 0.5, 0.5))
+
+
+def test_streaming(tmpdir):
+    picture = _picture(width=300, height=20)
+    path = picture.to_file(str(tmpdir.join('large.hdr')))
+    with PictureReader(path, chunk_size=512) as reader:
+        assert reader.resolution == '-Y 20 +X 300'
+        for index, scanline in enumerate(reader):
+            _assert_close(scanline, picture.scanline(index))
+    assert index == 19
@@ -0,0 +1,47 @@
+import math
+
+from honeybee_radiance_command.native.sun import jdate, sdec, stadj, salt, sazi, \
+    solar_positions, sky_angles, sun_vectors
+
+
+def test_solar_positions():
+    months = [1, 3, 6, 6, 12]
+    days = [1, 21, 21, 21, 21]
+    hours = [12, 9.5, 6, 12.5, 15]
+    jds, alts, azis = solar_positions(months, days, hours, 42.37, 71.02, 75)
+    assert len(jds) == len(alts) == len(azis) == 5
+    lat, lon, mer = math.radians(42.37), math.radians(71.02), math.radians(75)
+    for month, day, hour, jd, alt, azi in zip(months, days, hours, jds, alts, azis):
+        assert jd == jdate(month, day)
+        sd = sdec(jd)
+        st = hour + stadj(jd, lon, mer)
+        assert abs(alt - salt(lat, sd, st)) < 1e-9
+        assert abs(azi - sazi(lat, sd, st)) < 1e-9
+
+    # summer solstice after noon in Boston
+    assert 68 < math.degrees(alts[3]) < 71
+
+
+def test_solar_time():
+    _, alts, azis = solar_positions([6], [21], [12], 42.37, 71.02, 75, True)
+    assert abs(azis[0]) < 1e-9
+    assert abs(math.degrees(alts[0]) - (90 - 42.37 + 23.45)) < 0.1
+
+
+def test_sky_angles():
+    angles = sky_angles([6, 6], [21, 21], [9, 15], 42.37, 71.02, 75)
+    # morning sun is east of south (negative azimuth)
+    assert angles[0][0] > 0 and angles[0][1] < 0
+    assert angles[1][0] > 0 and angles[1][1] > 0
+
+
+def test_sun_vectors():
+    vectors = sun_vectors([0, 0, math.pi / 4], [0, math.pi / 2, 0])
+    # south, west and 45 degrees south
+    for vector, expected in zip(
+            vectors, [(0, -1, 0), (-1, 0, 0), (0, -0.7071068, 0.7071068)]):
+        for a, b in zip(vector, expected):
+            assert abs(a - b) < 1e-6
+    # rotating the sky counter-clockwise moves south to east
+    vector = sun_vectors([0], [0], rotation=90)[0]
+    assert abs(vector[0] - 1) < 1e-6
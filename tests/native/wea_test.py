@@ -0,0 +1,35 @@
+import os
+import shutil
+
+from honeybee_radiance_command.native.wea import Wea, CACHE_EXTENSION
+
+WEA = './tests/assets/boston.wea'
+
+
+def test_from_file():
+    wea = Wea.from_file(WEA)
+    assert wea.count == 48
+    assert wea.latitude == 42.37
+    assert wea.months[0] == 6 and wea.days[0] == 21
+    assert wea.hours[0] == 0.5
+
+
+def test_cache(tmpdir):
+    wea_file = str(tmpdir.join('boston.wea'))
+    shutil.copy(WEA, wea_file)
+    wea = Wea.from_file(wea_file, cache=True)
+    cache_file = wea_file + CACHE_EXTENSION
+    assert os.path.isfile(cache_file)
+
+    cached = Wea.from_file(wea_file, cache=True)
+    assert cached.place == wea.place
+    assert cached.elevation == wea.elevation
+    for attr in ('months', 'days', 'hours', 'direct', 'diffuse'):
+        assert list(getattr(cached, attr)) == list(getattr(wea, attr))
+
+    # changing the wea file invalidates the cache
+    with open(wea_file, 'a') as outf:
+        outf.write('12 31 23.5 0 0\n')
+    updated = Wea.from_file(wea_file, cache=True)
+    assert updated.count == 49
+    assert Wea.from_file(wea_file, cache=True).count == 49
@@ -0,0 +1,117 @@
+import os
+import threading
+import time
+
+import pytest
+
+from honeybee_radiance_command.octree import OctreeCache, LayeredOctree
+from honeybee_radiance_command.options.oconv import OconvOptions
+
+
+def _write(path, content):
+    with open(path, 'w') as outf:
+        outf.write(content)
+    return path
+
+
+def test_key(tmpdir):
+    mat = _write(str(tmpdir.join('scene.mat')), 'void plastic white 0 0 5 .5 .5 .5 0 0')
+    geo = _write(str(tmpdir.join('scene.rad')), 'white sphere ball 0 0 4 0 0 0 1')
+    copy = _write(str(tmpdir.join('copy.rad')), 'white sphere ball 0 0 4 0 0 0 1')
+    key = OctreeCache.key([mat, geo])
+    assert key == OctreeCache.key([mat, copy])
+    assert key != OctreeCache.key([geo, mat])
+
+    options = OconvOptions()
+    options.f = True
+    assert key != OctreeCache.key([mat, geo], options)
+
+    _write(geo, 'white sphere ball 0 0 4 0 0 0 2')
+    assert key != OctreeCache.key([mat, geo])
+
+
+def test_get_cached(tmpdir):
+    geo = _write(str(tmpdir.join('scene.rad')), 'void sphere ball 0 0 4 0 0 0 1')
+    cache = OctreeCache(str(tmpdir.join('cache')))
+    key = cache.key([geo])
+    assert key not in cache
+    octree = _write(cache.path(key), 'octree')
+    assert key in cache
+    assert cache.get([geo]) == octree
+
+
+def test_wait_for_other_process(tmpdir):
+    geo = _write(str(tmpdir.join('scene.rad')), 'void sphere ball 0 0 4 0 0 0 1')
+    cache = OctreeCache(str(tmpdir.join('cache')), interval=0.01)
+    key = cache.key([geo])
+    lock_file = os.path.join(cache.folder, key + '.lock')
+    _write(lock_file, '0')
+
+    def build():
+        time.sleep(0.1)
+        _write(cache.path(key), 'octree')
+        os.remove(lock_file)
+
+    thread = threading.Thread(target=build)
+    thread.start()
+    assert cache.get([geo]) == cache.path(key)
+    thread.join()
+
+
+def test_stale_lock(tmpdir, monkeypatch):
+    geo = _write(str(tmpdir.join('scene.rad')), 'void sphere ball 0 0 4 0 0 0 1')
+    assert OctreeCache(str(tmpdir.join('cache'))).stale_timeout == 7200
+    with pytest.raises(ValueError):
+        OctreeCache(str(tmpdir.join('cache')), timeout=10, stale_timeout=10)
+    cache = OctreeCache(
+        str(tmpdir.join('cache')), timeout=0.05, interval=0.01, stale_timeout=10
+    )
+    monkeypatch.setattr(
+        OctreeCache, '_build', staticmethod(lambda octree, *args: _write(octree, 'oct'))
+    )
+    key = cache.key([geo])
+    lock_file = _write(os.path.join(cache.folder, key + '.lock'), '0')
+
+    # the lock is older than the wait timeout but another process may still build
+    now = time.time()
+    os.utime(lock_file, (now - 1, now - 1))
+    with pytest.raises(RuntimeError):
+        cache.get([geo])
+    assert os.path.isfile(lock_file)
+
+    os.utime(lock_file, (now - 100, now - 100))
+    assert cache.get([geo]) == cache.path(key)
+    assert not os.path.isfile(lock_file)
+
+
+def test_layered_octree(tmpdir):
+    geo = _write(str(tmpdir.join('scene.rad')), 'void sphere ball 0 0 4 0 0 0 1')
+    shade = _write(str(tmpdir.join('shade.rad')), 'void sphere shade 0 0 4 0 0 2 1')
+    layers = LayeredOctree(str(tmpdir.join('cache')), [geo])
+    assert layers.options.to_radiance() == '-f'
+    cache = layers.cache
+    base = _write(cache.path(cache.key([geo], layers.options)), 'base')
+    assert layers.base() == base
+
+    options = OconvOptions()
+    options.i = base
+    variant = _write(cache.path(cache.key([shade], options)), 'variant')
+    assert layers.variants([[shade]]) == [variant]
+
+
+def test_relative_inputs(tmpdir):
+    _write(str(tmpdir.join('scene.rad')), 'void sphere ball 0 0 4 0 0 0 1')
+    _write(str(tmpdir.join('shade.rad')), 'void sphere shade 0 0 4 0 0 2 1')
+    cwd = str(tmpdir)
+    cache = OctreeCache(str(tmpdir.join('cache')))
+    key = cache.key(['scene.rad'], cwd=cwd)
+    assert key == cache.key([str(tmpdir.join('scene.rad'))])
+    octree = _write(cache.path(key), 'octree')
+    assert cache.get(['scene.rad'], cwd=cwd) == octree
+
+    layers = LayeredOctree(cache, ['scene.rad'])
+    base = _write(cache.path(cache.key(['scene.rad'], layers.options, cwd)), 'base')
+    options = OconvOptions()
+    options.i = base
+    variant = _write(cache.path(cache.key(['shade.rad'], options, cwd)), 'variant')
+    assert layers.variant(['shade.rad'], cwd=cwd) == variant
@@ -141,3 +141,126 @@ def test_collection():
     assert '-o %s.vmtx' in options_test.to_radiance()
     with pytest.raises(AttributeError):
         options_test.ad = 2400
+
+
+def test_collection_cached_output():
+    options_test = OptionsTestClass()
+    options_test.ab = 2
+    assert options_test.to_radiance() == '-ab 2'
+    assert options_test.to_radiance() is options_test.to_radiance()
+
+    # changing the option directly
+    options_test._ab.value = 3
+    assert options_test.to_radiance() == '-ab 3'
+
+    options_test.as_ = 64
+    assert options_test.to_radiance() == '-ab 3 -as 64'
+
+    options_test.additional_options['ad'] = 1024
+    assert options_test.to_radiance() == '-ab 3 -as 64 -ad 1024'
+    del options_test.additional_options['ad']
+    assert options_test.to_radiance() == '-ab 3 -as 64'
+    options_test.additional_options = {'lw': 0.01}
+    assert options_test.to_radiance() == '-ab 3 -as 64 -lw 0.01'
+
+
+def test_lazy_options():
+    from honeybee_radiance_command.options.rtrace import RtraceOptions
+    options = RtraceOptions()
+    assert options._created_option('_ab') is None
+    assert options.to_radiance() == ''
+    assert not options.ab.is_set
+    assert options._created_option('_ab') is not None
+    options.ad = 1024
+    assert options.to_radiance() == '-ad 1024'
+    # descriptions are available for options that are not created yet
+    assert '-lw <unset>' in options.options
+    assert options._created_option('_lw') is None
+
+
+@pytest.mark.parametrize('module, name', [
+    ('rtrace', 'RtraceOptions'), ('rcontrib', 'RcontribOptions'),
+    ('rfluxmtx', 'RfluxmtxOptions'), ('rpict', 'RpictOptions')
+])
+def test_validation_does_not_create_options(module, name):
+    import importlib
+    cls = getattr(
+        importlib.import_module('honeybee_radiance_command.options.%s' % module), name
+    )
+    options = cls()
+    options.ab = 2
+    options.ad = 512
+    assert options._created == set(['_ab', '_ad'])
+
+
+def test_canonical_options():
+    from honeybee_radiance_command.options.rtrace import RtraceOptions
+    options_1 = RtraceOptions()
+    options_1.update_from_string('-ab 2  -ad 1024 -I')
+    options_2 = RtraceOptions()
+    options_2.I = True
+    options_2.ad = 1024.0
+    options_2.ab = '2'
+    # accessing an option without setting it doesn't change the options
+    options_2.lw
+    assert options_1.canonical == '-I -ab 2 -ad 1024'
+    assert options_1 == options_2
+    assert hash(options_1) == hash(options_2)
+    assert len(set([options_1, options_2])) == 1
+
+    options_1.additional_options = {'zz': 'a  b', 'xx': 2}
+    options_2.additional_options['zz'] = 'a b'
+    options_2.additional_options['xx'] = '2'
+    assert options_1.canonical == '-I -ab 2 -ad 1024 -xx 2 -zz a b'
+    assert options_1 == options_2
+
+    options_2.ab = 3
+    assert options_1 != options_2
+    assert options_1 != RtraceOptions()
+
+
+def test_pickle_options():
+    import pickle
+    from honeybee_radiance_command.options.rtrace import RtraceOptions
+    options = RtraceOptions()
+    options.update_from_string('-ab 2 -ad 1024 -I')
+    options.additional_options['xx'] = 2
+    options.lw
+    new_options = pickle.loads(pickle.dumps(options, 2))
+    assert new_options == options
+    assert new_options.to_radiance() == options.to_radiance()
+    # unset options are not stored
+    assert sorted(options.__reduce__()[1][1]) == ['_I', '_ab', '_ad']
+    new_options.ab = 3
+    assert options.ab == 2
+
+    preset = RtraceOptions.preset('-ab 5 -ad 2048')
+    derived = preset.derive()
+    derived.lw = 0.01
+    new_derived = pickle.loads(pickle.dumps(derived, 2))
+    assert new_derived.base_preset is preset
+    assert derived.__reduce__()[1][1] == {'_lw': 0.01}
+    assert new_derived.to_radiance() == '-ab 5 -ad 2048 -lw 0.01'
+    assert pickle.loads(pickle.dumps(preset, 2)) is preset
+
+
+def test_options_dict():
+    import json
+    from honeybee_radiance_command.options.oconv import OconvOptions
+    from honeybee_radiance_command.options.rcalc import RcalcOptions
+    options = OconvOptions()
+    options.b = (0, 0, 0, 10)
+    options.f = True
+    data = options.to_dict()
+    assert data['type'] == 'OconvOptions'
+    assert data['options'] == {'b': [0, 0, 0, 10], 'f': True}
+    new_options = OptionCollection.from_dict(json.loads(json.dumps(data)))
+    assert isinstance(new_options, OconvOptions)
+    assert new_options.b.value == (0, 0, 0, 10)
+    assert new_options == options
+
+    # formatted values are not formatted twice
+    options = RcalcOptions()
+    options.e = '$1=$1*179'
+    new_options = RcalcOptions.from_dict(options.to_dict())
+    assert new_options.to_radiance() == options.to_radiance()
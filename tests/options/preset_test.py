@@ -0,0 +1,56 @@
+import pytest
+
+from honeybee_radiance_command.options.rtrace import RtraceOptions
+from honeybee_radiance_command.options.rcontrib import RcontribOptions
+from honeybee_radiance_command.rtrace import Rtrace
+import honeybee_radiance_command._exception as exceptions
+
+
+def test_preset():
+    preset = RtraceOptions.preset('-ab 5 -ad 2048', lw=2e-05)
+    assert preset.is_frozen
+    assert preset.to_radiance() == '-ab 5 -ad 2048 -lw 2e-05'
+    assert RtraceOptions.preset('-ab 5 -ad 2048', lw=2e-05) is preset
+
+    with pytest.raises(exceptions.FrozenOptionsError):
+        preset.ab = 2
+    with pytest.raises(exceptions.FrozenOptionsError):
+        preset.ab.value = 2
+    with pytest.raises(exceptions.FrozenOptionsError):
+        preset.additional_options['xx'] = 2
+    assert preset.to_radiance() == '-ab 5 -ad 2048 -lw 2e-05'
+
+
+def test_derive():
+    preset = RtraceOptions.preset('-ab 5 -ad 2048 -lw 2e-05')
+    options = preset.derive()
+    assert not options.is_frozen
+    assert options.base_preset is preset
+    assert options.to_radiance() == preset.to_radiance()
+    assert options.ab.value == 5
+
+    options.ab = 6
+    options.I = True
+    assert options.to_radiance() == '-I -ab 6 -ad 2048 -lw 2e-05'
+    assert preset.to_radiance() == '-ab 5 -ad 2048 -lw 2e-05'
+
+    with pytest.raises(ValueError):
+        options.derive()
+
+
+def test_derive_rcontrib():
+    preset = RcontribOptions.preset('-ab 2 -M suns.mod')
+    options = preset.derive()
+    options.c = 4
+    assert options.to_radiance() == '-M suns.mod -ab 2 -c 4'
+    assert preset.to_radiance() == '-M suns.mod -ab 2'
+
+
+def test_command_preset():
+    preset = RtraceOptions.preset('-ab 5 -ad 2048')
+    rtrace_1 = Rtrace(options=preset, octree='scene.oct', sensors='grid.pts')
+    rtrace_2 = Rtrace(options=preset, octree='scene.oct', sensors='grid.pts')
+    assert rtrace_1.options is not rtrace_2.options
+    rtrace_1.options.ab = 1
+    assert rtrace_1.to_radiance() == 'rtrace -ab 1 -ad 2048 scene.oct < grid.pts'
+    assert rtrace_2.to_radiance() == 'rtrace -ab 5 -ad 2048 scene.oct < grid.pts'
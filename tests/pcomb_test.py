@@ -1,5 +1,9 @@
+import os
+
 from honeybee_radiance_command.pcomb import Pcomb
+from honeybee_radiance_command.native.rgbe import Picture
 import pytest
+from honeybee_radiance_command._command import Command
 import honeybee_radiance_command._exception as exceptions
 
 
@@ -54,3 +58,51 @@ def test_validation():
 
     pcomb.input = ['image1.hdr', 'image2.hdr']
     assert pcomb.to_radiance() == 'pcomb image1.hdr image2.hdr'
+
+
+def test_run_native(tmpdir):
+    """Test running pcomb in-process."""
+    cwd = str(tmpdir)
+    Picture(2, 2, [1.0] * 12).to_file(str(tmpdir.join('image1.hdr')))
+    Picture(2, 2, [0.25] * 12).to_file(str(tmpdir.join('image2.hdr')))
+    pcomb = Pcomb(input=['image1.hdr', 'image2.hdr'], output='result.hdr')
+    pcomb.options.s = 2
+    pcomb.options.e = 'ro=ri(1)-ri(2);go=gi(1)+gi(2);bo=bi(1)*bi(2)'
+    assert pcomb.run(cwd=cwd, native=True) == 0
+    result = Picture.from_file(str(tmpdir.join('result.hdr')))
+    assert result.pixel(0, 0) == pytest.approx((1.75, 2.25, 0.5), rel=0.02)
+
+
+def test_run_native_invalid_power(tmpdir):
+    """Test invalid powers are 0 instead of raising an exception."""
+    cwd = str(tmpdir)
+    Picture(2, 2, [0.25] * 12).to_file(str(tmpdir.join('image1.hdr')))
+    pcomb = Pcomb(input=['image1.hdr'], output='result.hdr')
+    pcomb.options.e = 'ro=(ri(1)-1)^0.5;go=0^-1;bo=10^400'
+    assert pcomb.run(cwd=cwd, native=True) == 0
+    result = Picture.from_file(str(tmpdir.join('result.hdr')))
+    assert result.pixel(0, 0) == (0, 0, 0)
+
+
+def test_run_subprocess(tmpdir, monkeypatch):
+    """Test pcomb is run as a subprocess unless native is set to True."""
+    monkeypatch.setattr(Command, 'run', lambda self, env=None, cwd=None: 'subprocess')
+    Picture(2, 2, [1.0] * 12).to_file(str(tmpdir.join('image1.hdr')))
+    pcomb = Pcomb(input=['image1.hdr'], output='result.hdr')
+    assert pcomb.run(cwd=str(tmpdir)) == 'subprocess'
+    assert not tmpdir.join('result.hdr').check()
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='backslash is a path separator on Windows')
+def test_run_native_paths(tmpdir):
+    """Test backslashes and quotes in the input paths."""
+    cwd = str(tmpdir)
+    Picture(2, 2, [1.0] * 12).to_file(str(tmpdir.join('dir\\image1.hdr')))
+    tmpdir.mkdir('my folder')
+    Picture(2, 2, [0.25] * 12).to_file(str(tmpdir.join('my folder', 'image2.hdr')))
+    pcomb = Pcomb(output='result.hdr')
+    # the input setter normalizes the slashes so set the joined input directly
+    pcomb._input = 'dir\\image1.hdr "my folder/image2.hdr"'
+    assert pcomb.run(cwd=cwd, native=True) == 0
+    result = Picture.from_file(str(tmpdir.join('result.hdr')))
+    assert result.pixel(0, 0) == pytest.approx((1.25, 1.25, 1.25), rel=0.02)
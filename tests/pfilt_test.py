@@ -1,5 +1,7 @@
 from honeybee_radiance_command.pfilt import Pfilt
+from honeybee_radiance_command.native.rgbe import Picture
 import pytest
+from honeybee_radiance_command._command import Command
 import honeybee_radiance_command._exception as exceptions
 
 
@@ -47,3 +49,26 @@ def test_validation():
         pfilt.to_radiance()
     pfilt.input = 'image.hdr'
     assert pfilt.to_radiance() == 'pfilt image.hdr'
+
+
+def test_run_native(tmpdir):
+    """Test running pfilt in-process."""
+    Picture(4, 4, [1.0] * 48).to_file(str(tmpdir.join('image.unf')))
+    pfilt = Pfilt(input='image.unf', output='image.hdr')
+    pfilt.options.x = '/2'
+    pfilt.options.y = '/2'
+    pfilt.options.e = 0.5
+    assert pfilt.run(cwd=str(tmpdir), native=True) == 0
+    result = Picture.from_file(str(tmpdir.join('image.hdr')))
+    assert (result.width, result.height) == (2, 2)
+    assert result.exposure == 0.5
+    assert result.pixel(0, 0) == pytest.approx((0.5, 0.5, 0.5), rel=0.01)
+
+
+def test_run_subprocess(tmpdir, monkeypatch):
+    """Test pfilt is run as a subprocess unless native is set to True."""
+    monkeypatch.setattr(Command, 'run', lambda self, env=None, cwd=None: 'subprocess')
+    Picture(2, 2, [1.0] * 12).to_file(str(tmpdir.join('image1.hdr')))
+    pfilt = Pfilt(input='image1.hdr', output='image.hdr')
+    assert pfilt.run(cwd=str(tmpdir)) == 'subprocess'
+    assert not tmpdir.join('image.hdr').check()
@@ -0,0 +1,130 @@
+import errno
+import io
+import os
+import sys
+
+import pytest
+
+from honeybee_radiance_command._command import Command
+from honeybee_radiance_command.pipeline import Pipeline, _tee
+
+
+class Python(Command):
+    """A command that runs a python script to test the pipelines."""
+
+    __slots__ = ('_script',)
+
+    def __init__(self, script, output=None):
+        Command.__init__(self, output=output)
+        self._script = script
+
+    def _argv(self, stdin_input=False):
+        return [sys.executable, '-c', self._script], None
+
+
+SOURCE = 'import sys\nfor i in range(5000): sys.stdout.write("%d\\n" % i)'
+DOUBLE = 'import sys\nfor l in sys.stdin: sys.stdout.write("%d\\n" % (2 * int(l)))'
+COUNT = 'import sys\nprint(len(sys.stdin.readlines()))'
+
+
+def _read(path):
+    with open(path) as inf:
+        return inf.read().split()
+
+
+def test_linear(tmpdir):
+    output = str(tmpdir.join('double.txt'))
+    pipeline = Pipeline(Python(SOURCE))
+    pipeline.pipe(Python(DOUBLE, output=output))
+    assert len(pipeline.stages) == 2
+    assert pipeline.run() == 0
+    assert _read(output) == [str(2 * i) for i in range(5000)]
+
+
+def test_tee(tmpdir):
+    folder = str(tmpdir)
+    pipeline = Pipeline(Python(SOURCE))
+    pipeline.tee('raw.txt')
+    pipeline.pipe(Python(DOUBLE, output='double.txt'))
+    pipeline.pipe(Python(COUNT, output='count.txt'), source=0)
+    # fan-out from the second stage
+    pipeline.tee('double_copy.txt', source=1)
+    pipeline.pipe(Python(COUNT, output='double_count.txt'), source=1)
+    assert pipeline.run(cwd=folder) == 0
+    assert _read(os.path.join(folder, 'raw.txt')) == [str(i) for i in range(5000)]
+    double = _read(os.path.join(folder, 'double.txt'))
+    assert double == [str(2 * i) for i in range(5000)]
+    assert _read(os.path.join(folder, 'double_copy.txt')) == double
+    assert _read(os.path.join(folder, 'count.txt')) == ['5000']
+    assert _read(os.path.join(folder, 'double_count.txt')) == ['5000']
+
+
+def test_stdin(tmpdir):
+    folder = str(tmpdir)
+    with open(os.path.join(folder, 'input.txt'), 'w') as outf:
+        outf.write('1\n2\n3\n')
+    pipeline = Pipeline(Python(DOUBLE), stdin='input.txt')
+    pipeline.tee('first.txt')
+    pipeline.tee('second.txt')
+    pipeline.run(cwd=folder)
+    assert _read(os.path.join(folder, 'first.txt')) == ['2', '4', '6']
+    assert _read(os.path.join(folder, 'second.txt')) == ['2', '4', '6']
+
+
+def test_failure(tmpdir):
+    pipeline = Pipeline(Python(SOURCE))
+    pipeline.pipe(Python('import sys\nsys.exit(2)'))
+    with pytest.raises(RuntimeError):
+        pipeline.run()
+
+
+def test_command_pipes():
+    from honeybee_radiance_command.rtrace import Rtrace
+    from honeybee_radiance_command.rcalc import Rcalc
+    rtrace = Rtrace(octree='scene.oct', sensors='grid.pts')
+    rtrace.pipe_to = Rcalc(output='results.ill')
+    pipeline = Pipeline(rtrace)
+    assert pipeline.stdin == 'grid.pts'
+    assert pipeline.stages == (['rtrace', 'scene.oct'], ['rcalc'])
+    assert 'results.ill' in repr(pipeline)
+
+
+class _Target(object):
+    """A file or pipe that fails with an error."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.data = b''
+
+    def write(self, data):
+        if self.error:
+            raise self.error
+        self.data += data
+
+    def close(self):
+        pass
+
+
+def test_tee_errors():
+    source = io.BytesIO(b'x' * 100)
+    closed_pipe = _Target(IOError(errno.EPIPE, 'Broken pipe'))
+    full_file = _Target(IOError(errno.ENOSPC, 'No space left on device'))
+    output = _Target()
+    errors = []
+    _tee(source, [full_file, output], [closed_pipe], errors, chunk_size=10)
+    # the other targets get all the data
+    assert output.data == b'x' * 100
+    # only the closed pipe is ignored
+    assert len(errors) == 1 and errors[0].errno == errno.ENOSPC
+
+
+@pytest.mark.skipif(not os.path.exists('/dev/full'), reason='/dev/full is not available')
+def test_tee_file_error(tmpdir):
+    source = 'import sys\nfor i in range(50000): sys.stdout.write("%d\\n" % i)'
+    pipeline = Pipeline(Python(source))
+    pipeline.tee('/dev/full')
+    pipeline.pipe(Python(COUNT, output='count.txt'))
+    with pytest.raises((IOError, OSError)):
+        pipeline.run(cwd=str(tmpdir))
+    # the other consumers still get the whole output
+    assert _read(str(tmpdir.join('count.txt'))) == ['50000']
@@ -2,6 +2,8 @@ from honeybee_radiance_command.rmtxop import Rmtxop
 import pytest
 import honeybee_radiance_command._exception as exceptions
 import os
+import shlex
+import subprocess
 
 
 def test_defaults():
@@ -94,12 +96,83 @@ def test_multiplication_operator():
         assert rmtxop.to_radiance() == 'rmtxop dc.mtx * sky.mtx'
 
 
-def test_input_matrix_limit():
-    """More than for matrices are not allowed as inputs."""
-    rmtxop = Rmtxop()
-    rmtxop.matrices = ['dc1.mtx', 'dc2.mtx', 'dc3.mtx', 'dc4.mtx', 'dc5.mtx']
-    with pytest.raises(AssertionError):
-        rmtxop.validate()
+def _flatten(command):
+    """Flatten the nested rmtxop commands to a list of operands and operators.
+
+    The quotes are changed the same way as in run_command before splitting the command.
+    """
+    parts = []
+    for part in shlex.split(command.replace('"', "'"))[1:]:
+        if part.startswith('!'):
+            nested = part[1:]
+            assert not any(q in nested for q in '\'"')
+            if nested.startswith('set -f; '):
+                nested = nested[8:]
+            parts.append(_flatten(nested))
+        elif part != '-fd':
+            parts.append(part)
+    return parts
+
+
+def _depth(parts):
+    nested = [_depth(p) for p in parts if isinstance(p, list)]
+    return 1 + max(nested) if nested else 1
+
+
+def _values(parts):
+    values = []
+    for part in parts:
+        values.extend(_values(part) if isinstance(part, list) else [part])
+    return values
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='quotes are different on Windows')
+def test_input_matrix_nested():
+    """More than four matrices are split into nested commands."""
+    matrices = ['dc%d.mtx' % i for i in range(200)]
+    rmtxop = Rmtxop(
+        matrices=matrices, operators=['+'] * 199, scalars=[-1] + [None] * 199
+    )
+    rmtxop.validate()
+    parts = _flatten(rmtxop.to_radiance())
+    assert len(parts) == 7
+    # balanced tree of nested commands
+    assert _depth(parts) == 2
+    expected = ['-s', '-1.0'] + ' + '.join(matrices).split()
+    assert _values(parts) == expected
+
+    # the order of the operations is kept for other operators
+    operators = ['+', '*', '/', '+', '+', '*']
+    matrices = matrices[:7]
+    rmtxop = Rmtxop(matrices=matrices, operators=operators)
+    parts = _flatten(rmtxop.to_radiance())
+    assert parts[0] == ['dc0.mtx', '+', 'dc1.mtx', '*', 'dc2.mtx', '/', 'dc3.mtx']
+    assert parts[1:] == ['+', 'dc4.mtx', '+', 'dc5.mtx', '*', 'dc6.mtx']
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='the shell is different on Windows')
+def test_input_matrix_nested_shell(tmpdir):
+    """The multiplication operator in nested commands is not expanded by the shell."""
+    # files that match * in the working directory
+    for name in ('a.mtx', 'b.mtx'):
+        tmpdir.join(name).write('')
+    matrices = ['dc%d.mtx' % i for i in range(8)]
+    rmtxop = Rmtxop(matrices=matrices, operators=['*'] * 7)
+    # print the arguments instead of running rmtxop
+    echo = 'rmtxop() { for a in "$@"; do echo "$a"; done; }; '
+
+    def run(command):
+        output = subprocess.check_output(
+            ['sh', '-c', echo + command.replace('"', "'")], cwd=str(tmpdir)
+        )
+        return output.decode('utf-8').splitlines()
+
+    args = run(rmtxop.to_radiance())
+    nested = [arg[1:] for arg in args if arg.startswith('!')]
+    assert len(nested) == 4
+    assert args[1::2] == ['*'] * 3
+    # rmtxop runs the nested commands in a shell
+    assert run(nested[0]) == ['-fd', 'dc0.mtx', '*', 'dc1.mtx']
 
 
 def test_stdin_input():
@@ -144,3 +217,49 @@ def test_from_command_multiple():
         assert rmtxop.to_radiance() == 'rmtxop "!rmtxop total.mtx sky.smx" ' \
             '+ -s -1.0 "!rmtxop direct.mtx direct.smx" ' \
             '+ sun.ill'
+
+
+def _write_matrix(folder, name, nrows, ncols, ncomp=3):
+    path = str(folder.join(name))
+    with open(path, 'w') as outf:
+        outf.write(
+            '#?RADIANCE\nNROWS=%d\nNCOLS=%d\nNCOMP=%d\nFORMAT=ascii\n\n'
+            % (nrows, ncols, ncomp)
+        )
+    return name
+
+
+def test_validate_shapes(tmpdir):
+    cwd = str(tmpdir)
+    view = _write_matrix(tmpdir, 'view.vmx', 100, 145)
+    daylight = _write_matrix(tmpdir, 'daylight.dmx', 145, 146)
+    sky = _write_matrix(tmpdir, 'sky.smx', 146, 8760)
+    rmtxop = Rmtxop(matrices=[view, daylight, sky])
+    assert rmtxop.validate_shapes(cwd) == (100, 8760, 3)
+
+    # sky in the wrong order
+    rmtxop = Rmtxop(matrices=[view, sky, daylight])
+    with pytest.raises(exceptions.MatrixShapeError):
+        rmtxop.validate_shapes(cwd)
+
+    # transpose and transform to a single component
+    rmtxop = Rmtxop(
+        matrices=[sky, daylight], transposes=[True, True],
+        transforms=[None, [0.265, 0.67, 0.065]]
+    )
+    with pytest.raises(exceptions.MatrixShapeError):
+        rmtxop.validate_shapes(cwd)
+    rmtxop.transforms = [[0.265, 0.67, 0.065], [0.265, 0.67, 0.065]]
+    assert rmtxop.validate_shapes(cwd) == (8760, 145, 1)
+
+    # element-wise operations
+    other = _write_matrix(tmpdir, 'other.mtx', 100, 145, 1)
+    rmtxop = Rmtxop(matrices=[view, other], operators='+')
+    with pytest.raises(exceptions.MatrixShapeError):
+        rmtxop.validate_shapes(cwd)
+    rmtxop.operators = '*'
+    assert rmtxop.validate_shapes(cwd) == (100, 145, 3)
+
+    # matrices from other commands are not checked
+    rmtxop = Rmtxop(matrices=[view, Rmtxop(matrices=[sky])])
+    assert rmtxop.validate_shapes(cwd) == (100, None, 3)
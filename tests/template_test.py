@@ -0,0 +1,88 @@
+import pytest
+
+from honeybee_radiance_command.rtrace import Rtrace
+from honeybee_radiance_command.rcalc import Rcalc
+from honeybee_radiance_command.template import CommandTemplate
+import honeybee_radiance_command._exception as exceptions
+
+
+def _rtrace():
+    rtrace = Rtrace(octree='scene.oct')
+    rtrace.options.update_from_string('-ab 2 -ad 5000 -h -I')
+    return rtrace
+
+
+def test_template():
+    rtrace = _rtrace()
+    template = CommandTemplate(rtrace, ['sensors', 'output'])
+    assert template.fields == ('sensors', 'output')
+    assert repr(template) == 'rtrace -I -ab 2 -ad 5000 -h scene.oct < {sensors} > {output}'
+    command = template.to_radiance(sensors='grid_1.pts', output='results/grid_1.res')
+    assert command == 'rtrace -I -ab 2 -ad 5000 -h scene.oct < grid_1.pts > ' \
+        'results/grid_1.res'
+    rtrace.sensors = 'grid_1.pts'
+    rtrace.output = 'results/grid_1.res'
+    assert command == rtrace.to_radiance()
+    # the original command is not changed by the template
+    assert template.command is rtrace
+
+
+def test_template_list():
+    template = CommandTemplate(_rtrace(), ['sensors', 'output'])
+    items = [
+        {'sensors': 'grid\\%d.pts' % i, 'output': 'grid %d.res' % i} for i in range(3)
+    ]
+    commands = template.to_radiance_list(items)
+    assert len(commands) == 3
+    assert commands[1].startswith('rtrace -I -ab 2 -ad 5000 -h scene.oct < grid/1.pts')
+    assert 'grid 1.res' in commands[1]
+    assert 'grid/1.pts' not in template.to_radiance_list(items, normalize=False)[1]
+
+
+def test_template_pipe():
+    rtrace = _rtrace()
+    rtrace.sensors = 'sensors.pts'
+    rcalc = Rcalc()
+    rcalc.options.e = '$1=(0.265*$1+0.67*$2+0.065*$3)*179'
+    rtrace.pipe_to = rcalc
+    template = CommandTemplate(rtrace, ['sensors'])
+    command = template.to_radiance(sensors='grid.pts')
+    assert command == rtrace.to_radiance().replace('sensors.pts', 'grid.pts')
+    assert 'scene.oct < grid.pts | rcalc -e' in command
+
+
+def test_template_errors():
+    with pytest.raises(ValueError):
+        CommandTemplate(_rtrace(), ['view'])
+    template = CommandTemplate(_rtrace(), ['sensors', 'output'])
+    with pytest.raises(exceptions.MissingArgumentError):
+        template.to_radiance(sensors='grid.pts')
+
+
+def test_template_argv():
+    template = CommandTemplate(_rtrace(), ['sensors', 'output'])
+    argv = template.to_argv(sensors='grid 1.pts', output='grid_1.res')
+    assert argv == {
+        'argv': [['rtrace', '-I', '-ab', '2', '-ad', '5000', '-h', 'scene.oct']],
+        'stdin': 'grid 1.pts',
+        'stdout': 'grid_1.res'
+    }
+    argv['argv'][0].append('-x')
+    assert template.to_argv(sensors='a', output='b')['argv'][0][-1] == 'scene.oct'
+
+
+def test_template_snapshot():
+    rtrace = _rtrace()
+    rtrace.sensors = 'sensors.pts'
+    rcalc = Rcalc()
+    rcalc.options.e = '$1=$1*179'
+    rtrace.pipe_to = rcalc
+    template = CommandTemplate(rtrace, ['sensors'])
+    # changes to the command after creating the template are not used
+    rtrace.options.ab = 7
+    rcalc.options.e = '$1=$1'
+    command = template.to_radiance(sensors='grid.pts')
+    assert '-ab 2' in command and '$1=$1*179' in command
+    argv = template.to_argv(sensors='grid.pts')['argv']
+    assert argv[0][argv[0].index('-ab') + 1] == '2'
+    assert argv[1] == ['rcalc', '-e', '$1=$1*179']